@@ -0,0 +1,43 @@
+"""add collection checkpoints
+
+Revision ID: 4b8e2f6d9c13
+Revises: 7d2e4c9a1b58
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "4b8e2f6d9c13"
+down_revision: str | Sequence[str] | None = "7d2e4c9a1b58"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the collection_checkpoints table for incremental CloudTrail collection."""
+    op.create_table(
+        "collection_checkpoints",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("collector", sa.String(length=100), nullable=False),
+        sa.Column("account_id", sa.String(length=64), nullable=False),
+        sa.Column("region", sa.String(length=50), nullable=False),
+        sa.Column("stream", sa.String(length=255), nullable=False),
+        sa.Column("last_event_time", sa.DateTime(), nullable=True),
+        sa.Column("last_event_id", sa.String(length=255), nullable=True),
+        sa.Column("position", sa.JSON(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "collector", "account_id", "region", "stream", name="uq_collection_checkpoint"
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the collection_checkpoints table."""
+    op.drop_table("collection_checkpoints")
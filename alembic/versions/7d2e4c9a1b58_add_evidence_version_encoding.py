@@ -0,0 +1,36 @@
+"""add evidence version encoding
+
+Revision ID: 7d2e4c9a1b58
+Revises: 1f9b8f4a7c31
+Create Date: 2026-10-18 00:00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op  # type: ignore[attr-defined]
+
+# revision identifiers, used by Alembic.
+revision: str = "7d2e4c9a1b58"
+down_revision: str | Sequence[str] | None = "1f9b8f4a7c31"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add keyframe/delta encoding marker to evidence versions.
+
+    Existing rows are full snapshots; run ``auditly db compact-versions`` to
+    re-encode history as keyframes plus deltas.
+    """
+    with op.batch_alter_table("evidence_versions") as batch_op:
+        batch_op.add_column(
+            sa.Column("encoding", sa.String(length=10), nullable=False, server_default="full")
+        )
+
+
+def downgrade() -> None:
+    """Drop the encoding column (compacted history must be expanded first)."""
+    with op.batch_alter_table("evidence_versions") as batch_op:
+        batch_op.drop_column("encoding")
@@ -0,0 +1,233 @@
+"""Buffered evidence access logging.
+
+Validation records which evidence artifacts it read. Writing those audit rows
+inline costs one hash lookup per evidence type and one flush per match before
+validation even starts. ``AccessLogWriter`` buffers access events in memory,
+resolves all hashes with a single ``IN (...)`` query per flush and bulk-inserts
+the log rows, either in a background thread or at the end of a run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import threading
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from .db import get_sync_engine_for_url
+from .db.models import Evidence, EvidenceAccessLog
+
+logger = logging.getLogger(__name__)
+
+# Keep IN (...) lists well under driver parameter limits
+_HASH_CHUNK_SIZE = 500
+
+
+@dataclass
+class AccessEvent:
+    """A pending access event for all evidence rows matching a hash."""
+
+    sha256: str
+    user_id: str
+    action: str
+    ip_address: str | None = None
+    attributes: dict[str, object] = field(default_factory=dict)
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+
+
+class AccessLogWriter:
+    """Buffer evidence access events and write them in batches."""
+
+    def __init__(
+        self,
+        database_url: str | None = None,
+        session_factory: sessionmaker | None = None,
+        max_buffer: int = 5000,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            database_url: Database URL (uses the shared per-URL engine on first flush)
+            session_factory: Optional sync session factory (takes precedence)
+            max_buffer: Buffered events that trigger a background flush
+        """
+        if database_url is None and session_factory is None:
+            raise ValueError("database_url or session_factory is required")
+        self.database_url = database_url
+        self.max_buffer = max_buffer
+        self._session_factory = session_factory
+        self._buffer: list[AccessEvent] = []
+        self._lock = threading.Lock()
+        # Single worker keeps flushes ordered and off the caller's thread
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[Future] = []
+        self.written = 0
+
+    def _get_session(self) -> Session:
+        if self._session_factory is None:
+            _, self._session_factory = get_sync_engine_for_url(self.database_url)
+        return self._session_factory()
+
+    def record(
+        self,
+        sha256: str,
+        user_id: str,
+        action: str,
+        ip_address: str | None = None,
+        attributes: dict[str, object] | None = None,
+    ) -> None:
+        """Buffer an access event for every evidence row with the given hash."""
+        event = AccessEvent(
+            sha256=sha256,
+            user_id=user_id,
+            action=action,
+            ip_address=ip_address,
+            attributes=attributes or {},
+        )
+        with self._lock:
+            self._buffer.append(event)
+            full = len(self._buffer) >= self.max_buffer
+        if full:
+            self.flush_async()
+
+    def record_validation(
+        self,
+        evidence: Mapping[str, object],
+        control_ids: Iterable[str],
+        user_id: str = "validator",
+    ) -> int:
+        """
+        Buffer ``validate`` events for each evidence entry carrying a sha256.
+
+        Returns:
+            Number of events buffered
+        """
+        control_ids = list(control_ids)
+        count = 0
+        for evidence_type, evidence_data in evidence.items():
+            if isinstance(evidence_data, dict) and evidence_data.get("sha256"):
+                self.record(
+                    str(evidence_data["sha256"]),
+                    user_id=user_id,
+                    action="validate",
+                    attributes={"control_ids": control_ids, "evidence_type": evidence_type},
+                )
+                count += 1
+        return count
+
+    def flush(self) -> int:
+        """
+        Write all buffered events synchronously.
+
+        Returns:
+            Number of access log rows inserted
+        """
+        with self._lock:
+            events, self._buffer = self._buffer, []
+        if not events:
+            return 0
+
+        hashes = sorted({e.sha256 for e in events})
+        session = self._get_session()
+        try:
+            ids_by_hash: dict[str, list[int]] = {}
+            for start in range(0, len(hashes), _HASH_CHUNK_SIZE):
+                chunk = hashes[start : start + _HASH_CHUNK_SIZE]
+                rows = session.execute(
+                    select(Evidence.id, Evidence.sha256).where(Evidence.sha256.in_(chunk))
+                )
+                for ev_id, sha in rows:
+                    ids_by_hash.setdefault(sha, []).append(ev_id)
+
+            log_rows = [
+                {
+                    "evidence_id": ev_id,
+                    "user_id": e.user_id,
+                    "action": e.action,
+                    "timestamp": e.timestamp,
+                    "ip_address": e.ip_address,
+                    "attributes": e.attributes,
+                }
+                for e in events
+                for ev_id in ids_by_hash.get(e.sha256, ())
+            ]
+            if log_rows:
+                session.execute(insert(EvidenceAccessLog), log_rows)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        self.written += len(log_rows)
+        return len(log_rows)
+
+    def _flush_logged(self) -> int:
+        try:
+            return self.flush()
+        except Exception as exc:
+            # Access logging must never break validation
+            logger.warning("Evidence access log flush failed: %s", exc)
+            return 0
+
+    def flush_async(self) -> Future:
+        """Schedule a flush on the background worker and return its future."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="auditly-access-log"
+                )
+            future = self._executor.submit(self._flush_logged)
+            self._pending = [f for f in self._pending if not f.done()]
+            self._pending.append(future)
+        return future
+
+    def wait(self, timeout: float | None = None) -> None:
+        """Block until all scheduled background flushes have completed."""
+        with self._lock:
+            pending = list(self._pending)
+        for future in pending:
+            future.result(timeout=timeout)
+
+    def close(self) -> None:
+        """Wait for background flushes, write remaining events and stop the worker."""
+        self.wait()
+        self._flush_logged()
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+_writers: dict[str, AccessLogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def get_access_log_writer(database_url: str) -> AccessLogWriter:
+    """Return the process-wide writer for a database URL."""
+    with _writers_lock:
+        writer = _writers.get(database_url)
+        if writer is None:
+            writer = AccessLogWriter(database_url)
+            _writers[database_url] = writer
+        return writer
+
+
+def close_access_log_writers() -> None:
+    """Flush and close every process-wide writer (call before disposing engines)."""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+atexit.register(close_access_log_writers)
@@ -1,15 +1,43 @@
 """FastAPI application for auditly REST API."""
 
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from .routers import collect_router, evidence_router, report_router, validate_router, webhook_router
+from ..access_log import close_access_log_writers
+from ..db import dispose_engines_async, get_pool_metrics
+from ..manifest_index import manifest_index
+from ..performance import performance_metrics
+from ..reporting.cache import report_cache
+from .compression import CompressionMiddleware
+from .jobs import job_manager
+from .routers import (
+    collect_router,
+    evidence_router,
+    jobs_router,
+    report_router,
+    validate_router,
+    webhook_router,
+)
+from .serialization import FastJSONResponse
+from .webhook_queue import webhook_coalescer
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Flush buffered access logs and release pooled database connections on shutdown."""
+    yield
+    webhook_coalescer.shutdown()
+    job_manager.shutdown(wait=False)
+    close_access_log_writers()
+    await dispose_engines_async()
+
+
 # Create FastAPI app
 
 # Custom OpenAPI description with branding and authentication note
@@ -29,8 +57,13 @@ app = FastAPI(
     version="0.2.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
+# Compress large JSON/HTML responses (brotli when installed, else gzip)
+app.add_middleware(CompressionMiddleware)
+
 
 # Register routers
 
@@ -39,6 +72,7 @@ app.include_router(validate_router)
 app.include_router(report_router)
 app.include_router(evidence_router)
 app.include_router(webhook_router)
+app.include_router(jobs_router)
 
 
 @app.get("/", tags=["health"])
@@ -48,5 +82,24 @@ def root():
         "service": "auditly API",
         "version": "0.2.0",
         "status": "healthy",
-        "endpoints": ["/collect", "/validate", "/report", "/evidence", "/webhook"],
+        "endpoints": [
+            "/collect",
+            "/validate",
+            "/report",
+            "/evidence",
+            "/webhook",
+            "/jobs",
+            "/metrics",
+        ],
+    }
+
+
+@app.get("/metrics", tags=["health"])
+def metrics():
+    """Runtime metrics: timings, report cache, manifest index and database pool usage."""
+    return {
+        "performance": performance_metrics.get_report(),
+        "report_cache": report_cache.stats(),
+        "manifest_index": manifest_index.stats(),
+        "db_pools": get_pool_metrics(),
     }
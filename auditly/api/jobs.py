@@ -0,0 +1,325 @@
+"""Background job subsystem for long-running API work (collection, reports).
+
+Slow work such as cloud collection or report rendering runs on a bounded
+worker pool instead of the request thread pool, so health checks and other
+tenants are not starved. Each job gets an ID that clients can poll
+(``GET /jobs/{id}``) or subscribe to (``GET /jobs/{id}/events``). When the
+target environment has a ``database_url``, a ``JobRun`` row is written for it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from ..db import get_sync_engine_for_url
+from ..db.models import JobRun
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCESS = "success"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+class JobQueueFull(RuntimeError):
+    """Raised when the job queue has reached its pending-job limit."""
+
+
+class JobManagerClosed(RuntimeError):
+    """Raised when work is submitted after the job manager has shut down."""
+
+
+@dataclass
+class Job:
+    """In-memory state of a submitted job."""
+
+    id: str
+    job_type: str
+    environment: str
+    status: str = JOB_PENDING
+    submitted_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    progress: list[dict[str, Any]] = field(default_factory=list)
+    result: Any = None
+    error: str | None = None
+    exception: BaseException | None = field(default=None, repr=False)
+    job_run_id: int | None = None
+    database_url: str | None = field(default=None, repr=False)
+    future: Future | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        """Whether the job has finished (successfully, failed or cancelled)."""
+        return self.status in (JOB_SUCCESS, JOB_FAILED, JOB_CANCELLED)
+
+    def report_progress(self, message: str, **data: Any) -> None:
+        """Append a progress event visible to pollers and subscribers."""
+        self.progress.append({"at": datetime.utcnow().isoformat(), "message": message, **data})
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize job state for API responses."""
+        return {
+            "job_id": self.id,
+            "job_type": self.job_type,
+            "environment": self.environment,
+            "status": self.status,
+            "submitted_at": self.submitted_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "progress": list(self.progress),
+            "result": self.result,
+            "error": self.error,
+            "job_run_id": self.job_run_id,
+        }
+
+
+class JobManager:
+    """Run jobs on a bounded worker pool and track their state."""
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 100, max_history: int = 1000):
+        """
+        Initialize the job manager.
+
+        Args:
+            max_workers: Concurrent jobs
+            max_pending: Queued (not yet running) jobs before submissions are rejected
+            max_history: Finished jobs kept in memory for polling
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._closed = False
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="auditly-job"
+            )
+        return self._executor
+
+    def create(
+        self,
+        job_type: str,
+        environment: str,
+        *,
+        database_url: str | None = None,
+    ) -> Job:
+        """
+        Register a pending job without running it yet (see :meth:`start`).
+
+        Lets callers hand out a job ID before the work is scheduled, e.g. while
+        coalescing several requests into one job.
+
+        Raises:
+            JobQueueFull: If too many jobs are waiting to run
+            JobManagerClosed: If the manager has shut down
+        """
+        job = Job(
+            id=uuid.uuid4().hex,
+            job_type=job_type,
+            environment=environment,
+            database_url=database_url,
+        )
+        with self._lock:
+            if self._closed:
+                raise JobManagerClosed("Job manager is shut down")
+            pending = sum(1 for j in self._jobs.values() if j.status == JOB_PENDING)
+            if pending >= self.max_pending:
+                raise JobQueueFull(f"Job queue full ({pending} pending)")
+            self._jobs[job.id] = job
+            self._evict_history()
+            job.report_progress("queued")
+        return job
+
+    def start(self, job: Job, fn: Callable[[Job], Any]) -> Job:
+        """Schedule ``fn(job)`` for a job created with :meth:`create`.
+
+        Raises:
+            JobManagerClosed: If the manager has shut down (the job is cancelled)
+        """
+        with self._lock:
+            if not self._closed:
+                job.future = self._get_executor().submit(self._run, job, fn)
+                return job
+        self._cancel(job)
+        raise JobManagerClosed("Job manager is shut down")
+
+    def submit(
+        self,
+        job_type: str,
+        environment: str,
+        fn: Callable[[Job], Any],
+        *,
+        database_url: str | None = None,
+    ) -> Job:
+        """
+        Queue ``fn(job)`` for execution.
+
+        Args:
+            job_type: Job type recorded on the JobRun row (collection, report, ...)
+            environment: Target environment
+            fn: Callable receiving the Job (for progress reporting); its return
+                value becomes the job result
+            database_url: Optional database for JobRun persistence
+
+        Returns:
+            The queued Job
+
+        Raises:
+            JobQueueFull: If too many jobs are waiting to run
+            JobManagerClosed: If the manager has shut down
+        """
+        job = self.create(job_type, environment, database_url=database_url)
+        return self.start(job, fn)
+
+    def _evict_history(self) -> None:
+        finished = [jid for jid, j in self._jobs.items() if j.done]
+        for jid in finished[: max(0, len(finished) - self.max_history)]:
+            del self._jobs[jid]
+
+    def _run(self, job: Job, fn: Callable[[Job], Any]) -> Any:
+        job.status = JOB_RUNNING
+        job.started_at = datetime.utcnow()
+        job.report_progress("started")
+        self._persist_start(job)
+        try:
+            result = fn(job)
+        except Exception as exc:
+            job.exception = exc
+            job.error = str(exc)
+            self._finish(job, JOB_FAILED)
+            raise
+        job.result = result
+        self._finish(job, JOB_SUCCESS)
+        return result
+
+    def _finish(self, job: Job, status: str) -> None:
+        job.finished_at = datetime.utcnow()
+        job.report_progress(status)
+        self._persist_finish(job, status)
+        # Flip status last so observers never see a done job with missing fields
+        job.status = status
+
+    def _cancel(self, job: Job) -> None:
+        job.error = "Cancelled: the job manager shut down before the job started"
+        self._finish(job, JOB_CANCELLED)
+
+    def _persist_start(self, job: Job) -> None:
+        if not job.database_url:
+            return
+        try:
+            _, factory = get_sync_engine_for_url(job.database_url)
+            with factory() as session:
+                row = JobRun(
+                    job_type=job.job_type,
+                    environment=job.environment,
+                    status=JOB_RUNNING,
+                    started_at=job.started_at,
+                    attributes={"job_id": job.id, "source": "api"},
+                )
+                session.add(row)
+                session.commit()
+                job.job_run_id = row.id
+        except Exception as exc:
+            logger.warning("Could not persist job %s start: %s", job.id, exc)
+
+    def _persist_finish(self, job: Job, status: str) -> None:
+        if not job.database_url:
+            return
+        try:
+            _, factory = get_sync_engine_for_url(job.database_url)
+            with factory() as session:
+                row = session.get(JobRun, job.job_run_id) if job.job_run_id is not None else None
+                if row is None:
+                    # Cancelled before it started, so no row was written yet
+                    row = JobRun(
+                        job_type=job.job_type,
+                        environment=job.environment,
+                        started_at=job.submitted_at,
+                        attributes={"job_id": job.id, "source": "api"},
+                    )
+                    session.add(row)
+                row.status = status
+                row.error = job.error
+                row.finished_at = job.finished_at
+                row.metrics = (
+                    {"duration_seconds": (job.finished_at - job.started_at).total_seconds()}
+                    if job.started_at
+                    else {}
+                )
+                session.commit()
+                job.job_run_id = row.id
+        except Exception as exc:
+            logger.warning("Could not persist job %s finish: %s", job.id, exc)
+
+    def get(self, job_id: str) -> Job | None:
+        """Look up a job by ID."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(
+        self, status: str | None = None, job_type: str | None = None, limit: int = 50
+    ) -> list[Job]:
+        """List recent jobs, newest first."""
+        with self._lock:
+            jobs = list(self._jobs.values())
+        jobs = [
+            j
+            for j in reversed(jobs)
+            if (status is None or j.status == status)
+            and (job_type is None or j.job_type == job_type)
+        ]
+        return jobs[:limit]
+
+    async def wait(self, job: Job) -> Any:
+        """Await a job's completion from async code; re-raises the job's exception.
+
+        Raises:
+            JobManagerClosed: If the job was cancelled by a shutdown
+        """
+        try:
+            return await asyncio.wrap_future(job.future)
+        except asyncio.CancelledError:
+            if job.future.cancelled():
+                raise JobManagerClosed(job.error or "Job cancelled") from None
+            raise
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and optionally wait for running jobs.
+
+        Jobs that never started (queued work dropped when ``wait`` is False,
+        or jobs created but not started) are marked cancelled so pollers and
+        event streams see them finish.
+        """
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+        with self._lock:
+            stranded = [
+                j
+                for j in self._jobs.values()
+                if j.status == JOB_PENDING and (j.future is None or j.future.cancelled())
+            ]
+        for job in stranded:
+            self._cancel(job)
+
+
+# Global instance used by the API routers
+job_manager = JobManager()
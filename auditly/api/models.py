@@ -177,6 +177,23 @@ class CollectBatchRequest(BaseModel):
         description="Overall timeout per request in seconds.",
         examples=[300],
     )
+    max_concurrency: int = Field(
+        5,
+        ge=1,
+        le=64,
+        description="Maximum requests collected at once across all providers.",
+        examples=[5],
+    )
+    provider_concurrency: dict[str, int] = Field(
+        default_factory=dict,
+        description="Per-provider cap on concurrent requests (defaults to max_concurrency).",
+        examples=[{"github": 2}],
+    )
+    provider_rate_limits: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-provider maximum request starts per second.",
+        examples=[{"github": 1.0}],
+    )
 
 
 class ValidateRequest(BaseModel):
@@ -326,3 +343,37 @@ class ReportResponse(BaseModel):
         description="Optional error message if report generation failed.",
         examples=["No evidence found."],
     )
+
+
+class JobSubmitResponse(BaseModel):
+    """
+    Response for work queued as a background job.
+
+    Returned with HTTP 202 by POST /collect, /collect/batch and /report when
+    ``background=true``.
+    """
+
+    job_id: str = Field(..., description="Job identifier.", examples=["3f2c9a..."])
+    job_type: str = Field(..., description="Job type.", examples=["collection"])
+    status: str = Field(..., description="Job status.", examples=["pending"])
+    status_url: str = Field(
+        ..., description="URL to poll for job status.", examples=["/jobs/3f2c9a..."]
+    )
+
+
+class JobStatusResponse(BaseModel):
+    """Status of a background job, returned by GET /jobs/{job_id}."""
+
+    job_id: str
+    job_type: str
+    environment: str
+    status: str = Field(..., description="pending, running, success or failed.")
+    submitted_at: str
+    started_at: str | None = None
+    finished_at: str | None = None
+    progress: list[dict[str, object]] = Field(default_factory=list)
+    result: dict[str, object] | None = Field(
+        None, description="Endpoint response payload once the job has succeeded."
+    )
+    error: str | None = None
+    job_run_id: int | None = Field(None, description="Persisted JobRun row ID, if any.")
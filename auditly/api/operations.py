@@ -2,25 +2,34 @@
 
 import asyncio
 import datetime
-import tempfile
 import uuid
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import Any
 
+from ..batch_collection import BatchLimits, run_batch
 from ..cli_common import persist_if_db, vault_from_envcfg
 from ..collectors.argo import collect_argo
 from ..collectors.azure import collect_azure
 from ..collectors.github_actions import collect_github_actions
 from ..collectors.gitlab import collect_gitlab
 from ..collectors.terraform import collect_terraform
-from ..config import AppConfig
+from ..config import AppConfig, load_config
 from ..evidence import ArtifactRecord, EvidenceManifest
+from ..manifest_index import DEFAULT_STAGING_DIR, manifest_index
 from ..mapping import ControlMapping, compute_control_coverage, match_evidence_to_controls
-from ..oscal import OscalCatalog, OscalProfile, load_oscal
-from ..performance import parallel_collector
-from ..reporting.report import readiness_summary, write_html
-from ..reporting.validation_reports import generate_auditor_report, generate_engineer_report
-from ..validators import validate_controls
+from ..oscal import catalog_registry
+from ..performance import incremental_validator
+from ..reporting.cache import (
+    CachedReport,
+    file_fingerprint,
+    file_sha256,
+    make_report_key,
+    report_cache,
+)
+from ..reporting.report import readiness_summary, render_html
+from ..reporting.validation_reports import render_auditor_report, render_engineer_report
+from ..validators import get_control_requirement, validate_controls
 from ..waivers import WaiverRegistry
 from .models import ControlStatusResponse, Evidence, EvidenceCreate, EvidenceUpdate
 
@@ -28,6 +37,7 @@ from .models import ControlStatusResponse, Evidence, EvidenceCreate, EvidenceUpd
 
 _EVIDENCE_DB: dict[str, Evidence] = {}
 EVIDENCE_NOT_FOUND_MSG = "Evidence not found"
+REPORT_TYPES = ("readiness", "engineer", "auditor")
 
 
 def create_evidence(evidence: EvidenceCreate) -> Evidence:
@@ -96,34 +106,91 @@ async def collect_evidence_parallel(
     requests: list[dict[str, Any]],
     *,
     timeout: int = 300,
+    limits: BatchLimits | None = None,
 ) -> dict[str, Any]:
     """Collect evidence for multiple providers in parallel.
 
     Each request dict should contain the arguments for ``collect_evidence``.
-    Synchronous collectors run in a thread via ``asyncio.to_thread``.
+    Requests run on a per-run thread pool bounded by ``limits``.
 
-    Returns the parallel collector aggregate payload containing results/errors.
+    Returns the aggregate payload containing results/errors.
     """
+    results: dict[str, Any] = {}
+    errors: dict[str, Any] = {}
+    async for event in run_batch(requests, collect_evidence, limits=limits, timeout=timeout):
+        if event["status"] == "success":
+            results[event["name"]] = event["result"]
+        else:
+            errors[event["name"]] = event["error"]
+    return {"results": results, "errors": errors, "success": len(results), "failed": len(errors)}
 
-    async def _run(req: dict[str, Any]) -> Any:
-        return await asyncio.to_thread(collect_evidence, **req)
 
-    # mypy expects Future[Any] for collect_parallel
-    tasks: dict[str, asyncio.Future[Any]] = {}
-    for idx, req in enumerate(requests):
-        name = req.get("name", f"request-{idx}")
-        tasks[name] = asyncio.ensure_future(_run(req))
+async def collect_evidence_stream(
+    requests: list[dict[str, Any]],
+    *,
+    timeout: int = 300,
+    limits: BatchLimits | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """Collect evidence for multiple providers, yielding each request's outcome as it lands.
 
-    return await parallel_collector.collect_parallel(tasks, timeout=timeout)
+    Every request uploads and persists its own artifacts when it finishes, so
+    nothing is held back until the slowest collector completes.
+
+    Yields:
+        Event dicts with ``name``, ``provider``, ``environment``, ``status``,
+        ``artifacts_uploaded``/``manifest_key``/``message`` (success) or ``error``
+        (failure), ``duration_seconds`` and ``completed``/``total`` counters
+    """
+    by_name = {req.get("name", f"request-{idx}"): req for idx, req in enumerate(requests)}
+    async for event in run_batch(requests, collect_evidence, limits=limits, timeout=timeout):
+        req = by_name.get(event["name"], {})
+        out: dict[str, Any] = {
+            "name": event["name"],
+            "provider": req.get("provider"),
+            "environment": req.get("environment"),
+            "status": event["status"],
+            "duration_seconds": round(event["duration_seconds"], 3),
+            "completed": event["completed"],
+            "total": event["total"],
+        }
+        if event["status"] == "success":
+            artifacts_uploaded, manifest_key, message = event["result"]
+            out.update(
+                artifacts_uploaded=artifacts_uploaded, manifest_key=manifest_key, message=message
+            )
+        else:
+            out["error"] = event["error"]
+        yield out
 
 
 def collect_evidence_batch(
     requests: list[dict[str, Any]],
     *,
     timeout: int = 300,
+    limits: BatchLimits | None = None,
 ) -> dict[str, Any]:
     """Synchronize batch evidence collection for multiple systems."""
-    return asyncio.run(collect_evidence_parallel(requests, timeout=timeout))
+    return asyncio.run(collect_evidence_parallel(requests, timeout=timeout, limits=limits))
+
+
+def iter_collect_evidence_batch(
+    requests: list[dict[str, Any]],
+    *,
+    timeout: int = 300,
+    limits: BatchLimits | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Synchronous counterpart of :func:`collect_evidence_stream` for CLI use."""
+    loop = asyncio.new_event_loop()
+    stream = collect_evidence_stream(requests, timeout=timeout, limits=limits)
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.close()
 
 
 def collect_evidence(
@@ -145,7 +212,7 @@ def collect_evidence(
         ValueError: If provider is unsupported or required params missing
         Exception: Collection errors
     """
-    cfg = AppConfig.load(config_path)
+    cfg = load_config(config_path)
     if environment not in cfg.environments:
         raise ValueError(f"Unknown environment: {environment}")
 
@@ -323,6 +390,9 @@ def collect_evidence(
     else:
         raise ValueError(f"Unsupported provider: {provider}")
 
+    # New evidence landed; cached reports for this environment are stale
+    report_cache.invalidate(environment)
+
     return len(artifacts), manifest_key, f"Collected {len(artifacts)} artifacts from {provider}"
 
 
@@ -344,7 +414,7 @@ def validate_evidence(
     Returns:
         Tuple of (validation_results, summary)
     """
-    cfg = AppConfig.load(config_path)
+    cfg = load_config(config_path)
     if environment not in cfg.environments:
         raise ValueError(f"Unknown environment: {environment}")
 
@@ -352,50 +422,14 @@ def validate_evidence(
 
     # Get control IDs from catalogs if not provided
     if not control_ids:
-        control_ids = []
-        for cat_path in cfg.catalogs.get_all_catalogs().values():
-            oscal_obj = load_oscal(cat_path)
-            if isinstance(oscal_obj, OscalCatalog):
-                control_ids.extend(oscal_obj.control_ids())
-            elif isinstance(oscal_obj, OscalProfile):
-                imported = oscal_obj.imported_control_ids()
-                if imported:
-                    control_ids.extend(imported)
-
-        # Deduplicate
-        seen = set()
-        deduped = []
-        for x in control_ids:
-            if x not in seen:
-                deduped.append(x)
-                seen.add(x)
-        control_ids = deduped
+        control_ids = list(cfg.catalogs.resolve_control_ids())
 
     # Build evidence dict if not provided
     evidence: dict[str, object]
     if evidence_dict is None:
         # Try to load from manifests in staging directory
-        evidence = {}
-        staging = Path(".auditly_manifests")
-        if staging.exists():
-            for p in staging.glob(f"{environment}-*.json"):
-                import json as _json
-
-                data = _json.loads(p.read_text())
-                for artifact in data.get("artifacts", []):
-                    meta = artifact.get("metadata", {}) or {}
-                    kind = meta.get("kind", "unknown")
-                    # Aggregate by kind; preserve last-seen
-                    if isinstance(kind, str):
-                        evidence[kind] = {
-                            "key": artifact.get("key"),
-                            "filename": artifact.get("filename"),
-                            "sha256": artifact.get("sha256"),
-                            "size": artifact.get("size"),
-                            "metadata": meta,
-                            "manifest": str(p),
-                        }
-        # else evidence remains empty
+        # Latest artifact per evidence kind from the staged manifests (empty if none)
+        evidence = manifest_index.latest_artifacts(environment)
     else:
         evidence = evidence_dict  # type: ignore
 
@@ -433,6 +467,117 @@ def validate_evidence(
     return results_dict, summary
 
 
+def affected_control_ids(
+    config_path: str, environment: str, evidence_types: list[str] | set[str]
+) -> list[str]:
+    """
+    Resolve the catalog controls whose requirements reference any of the evidence types.
+
+    Args:
+        config_path: Path to config.yaml
+        environment: Environment key
+        evidence_types: Changed evidence types (e.g. terraform-plan, audit-log)
+
+    Returns:
+        Affected control IDs in catalog order
+    """
+    cfg = load_config(config_path)
+    if environment not in cfg.environments:
+        raise ValueError(f"Unknown environment: {environment}")
+
+    all_ids = cfg.catalogs.resolve_control_ids()
+    for cid in all_ids:
+        req = get_control_requirement(cid)
+        if req:
+            incremental_validator.register_evidence_types(
+                cid, list({*req.required_any, *req.required_all})
+            )
+    affected = incremental_validator.evidence_graph.get_affected_controls(list(evidence_types))
+    return [cid for cid in all_ids if cid.upper() in affected]
+
+
+def report_cache_key(
+    config_path: str,
+    environment: str,
+    report_type: str = "readiness",
+    control_ids: list[str] | None = None,
+    evidence_dict: dict[str, Any] | None = None,
+) -> str:
+    """
+    Compute the cache key (and ETag) for a report without rendering it.
+
+    The key covers the report parameters, the staged manifest set, the catalog
+    fingerprint, the waiver file hash and the mapping/config files. Computing
+    it only reads them, so it is safe on conditional and cached GETs.
+
+    Returns:
+        Hex digest identifying the report inputs
+    """
+    cfg = load_config(config_path)
+    return make_report_key(
+        [
+            report_type,
+            environment,
+            manifest_index.fingerprint(environment),
+            catalog_registry.fingerprint(cfg.catalogs.get_all_catalogs().values()),
+            file_sha256("waivers.yaml"),
+            file_fingerprint("mapping.yaml"),
+            file_fingerprint("mapping.example.yaml"),
+            file_fingerprint(config_path),
+            control_ids,
+            evidence_dict,
+        ]
+    )
+
+
+def get_report(
+    config_path: str,
+    environment: str,
+    report_type: str = "readiness",
+    control_ids: list[str] | None = None,
+    evidence_dict: dict[str, Any] | None = None,
+    *,
+    use_cache: bool = True,
+) -> CachedReport:
+    """
+    Return a report from the cache, rendering and caching it on a miss.
+
+    Args:
+        config_path: Path to config.yaml
+        environment: Environment key
+        report_type: Report type (readiness, engineer, auditor)
+        control_ids: Specific controls for engineer/auditor reports
+        evidence_dict: Override evidence dict for engineer/auditor reports
+        use_cache: Set False to force re-rendering (the result is still cached)
+
+    Returns:
+        CachedReport with HTML, summary and cache key
+    """
+    if report_type not in REPORT_TYPES:
+        raise ValueError(f"Unsupported report type: {report_type}")
+    key = report_cache_key(config_path, environment, report_type, control_ids, evidence_dict)
+    if use_cache:
+        cached = report_cache.get(key)
+        if cached is not None:
+            return cached
+
+    if report_type == "readiness" and _ensure_staged_manifest(environment):
+        # The seeded placeholder is part of the input; key the render by it
+        key = report_cache_key(config_path, environment, report_type, control_ids, evidence_dict)
+    report_path, html, summary = _render_report(
+        config_path, environment, report_type, control_ids, evidence_dict, None
+    )
+    entry = CachedReport(
+        key=key,
+        environment=environment,
+        report_path=report_path,
+        html=html,
+        summary=summary,
+    )
+    report_cache.put(entry)
+    return entry
+
+
 def generate_report(
     config_path: str,
     environment: str,
@@ -444,18 +589,38 @@ def generate_report(
     """
     Generate compliance report (reuses CLI reporting logic).
 
+    Reports without an explicit ``output_path`` are served from the report
+    cache while their inputs are unchanged.
+
     Args:
         config_path: Path to config.yaml
         environment: Environment key
         report_type: Report type (readiness, engineer, auditor)
         control_ids: Specific controls for engineer/auditor reports
         evidence_dict: Override evidence dict for engineer/auditor reports
-        output_path: Custom output path (default: temp file)
+        output_path: Optional path to also write the HTML to (default: not persisted)
 
     Returns:
         Tuple of (report_path, report_html, summary)
     """
-    cfg = AppConfig.load(config_path)
+    if output_path is None:
+        entry = get_report(config_path, environment, report_type, control_ids, evidence_dict)
+        return entry.report_path, entry.html, entry.summary
+    return _render_report(
+        config_path, environment, report_type, control_ids, evidence_dict, output_path
+    )
+
+
+def _render_report(
+    config_path: str,
+    environment: str,
+    report_type: str,
+    control_ids: list[str] | None,
+    evidence_dict: dict[str, Any] | None,
+    output_path: str | None,
+) -> tuple[str | None, str | None, dict[str, Any]]:
+    """Validate and render a report (uncached)."""
+    cfg = load_config(config_path)
     if report_type == "readiness":
         return _generate_readiness_report(cfg, environment, output_path)
     elif report_type == "engineer":
@@ -473,56 +638,45 @@ def generate_report(
         raise ValueError(f"Unsupported report type: {report_type}")
 
 
+def _ensure_staged_manifest(environment: str) -> bool:
+    """Seed a placeholder manifest so readiness reports always have input.
+
+    Returns:
+        True if the placeholder was written
+    """
+    staging = DEFAULT_STAGING_DIR
+    staging.mkdir(exist_ok=True)
+
+    if any(staging.glob(f"{environment}-*.json")):
+        return False
+    dummy = EvidenceManifest.create(
+        environment,
+        [ArtifactRecord(key="noop", filename="noop", sha256="0", size=0, metadata={})],
+    )
+    (staging / f"{environment}-dummy.json").write_text(dummy.to_json())
+    return True
+
+
+def _persist_report(html: str, output_path: str | None) -> str | None:
+    """Write rendered HTML when an output path was requested; return that path."""
+    if not output_path:
+        return None
+    Path(output_path).write_text(html, encoding="utf-8")
+    return output_path
+
+
 def _generate_readiness_report(
     cfg: AppConfig, environment: str, output_path: str | None
-) -> tuple[str, str, dict[str, Any]]:
+) -> tuple[str | None, str, dict[str, Any]]:
     """Generate readiness report (CLI logic)."""
-    staging = Path(".auditly_manifests")
-    staging.mkdir(exist_ok=True)
-
-    if not any(staging.glob(f"{environment}-*.json")):
-        dummy = EvidenceManifest.create(
-            environment,
-            [ArtifactRecord(key="noop", filename="noop", sha256="0", size=0, metadata={})],
-        )
-        (staging / f"{environment}-dummy.json").write_text(dummy.to_json())
-
-    manifests = []
-    for p in staging.glob(f"{environment}-*.json"):
-        import json as _json
-
-        data = _json.loads(p.read_text())
-        m = EvidenceManifest(
-            version=data["version"],
-            environment=data["environment"],
-            created_at=data["created_at"],
-            artifacts=[ArtifactRecord(**a) for a in data["artifacts"]],
-            overall_hash=data.get("overall_hash"),
-            notes=data.get("notes"),
-        )
-        manifests.append(m)
+    _ensure_staged_manifest(environment)
+    manifests = manifest_index.manifests(environment)
 
     summary = readiness_summary(manifests)
 
     # Add control coverage and validation
     try:
-        control_ids = []
-        for cat_path in cfg.catalogs.get_all_catalogs().values():
-            oscal_obj = load_oscal(cat_path)
-            if isinstance(oscal_obj, OscalCatalog):
-                control_ids.extend(oscal_obj.control_ids())
-            elif isinstance(oscal_obj, OscalProfile):
-                imported = oscal_obj.imported_control_ids()
-                if imported:
-                    control_ids.extend(imported)
-
-        seen = set()
-        deduped = []
-        for x in control_ids:
-            if x not in seen:
-                deduped.append(x)
-                seen.add(x)
-        control_ids = deduped
+        control_ids = list(cfg.catalogs.resolve_control_ids())
 
         mapping_path = Path("mapping.yaml")
         if not mapping_path.exists():
@@ -554,16 +708,8 @@ def _generate_readiness_report(
         summary["controls"] = {"error": f"failed to compute coverage: {e}"}
         summary["validation"] = {"error": str(e)}
 
-    # Write HTML
-    if output_path:
-        out = Path(output_path)
-    else:
-        out = Path(tempfile.mktemp(suffix=".html", prefix="auditly-readiness-"))
-
-    write_html(summary, out)
-    html_content = out.read_text()
-
-    return str(out), html_content, summary
+    html_content = render_html(summary)
+    return _persist_report(html_content, output_path), html_content, summary
 
 
 def _generate_engineer_report(
@@ -572,7 +718,7 @@ def _generate_engineer_report(
     control_ids: list[str] | None,
     evidence_dict: dict[str, Any] | None,
     output_path: str | None,
-) -> tuple[str, str, dict[str, Any]]:
+) -> tuple[str | None, str, dict[str, Any]]:
     """Generate engineer report (CLI logic)."""
     if not control_ids:
         # Use sample controls
@@ -583,32 +729,16 @@ def _generate_engineer_report(
             control_ids.extend([f"{family}-{i}" for i in range(1, 26)])
 
     if not evidence_dict:
-        # Try to load from staging
-        staging = Path(".auditly_manifests")
-        evidence_dict2: dict[str, object] = {}
-        if staging.exists():
-            for p in staging.glob(f"{environment}-*.json"):
-                import json as _json
-
-                data = _json.loads(p.read_text())
-                for artifact in data.get("artifacts", []):
-                    kind = artifact.get("metadata", {}).get("kind", "unknown")
-                    if isinstance(kind, str) and kind not in evidence_dict2:
-                        evidence_dict2[kind] = True
-        else:
-            evidence_dict2 = {}
+        # Evidence kinds present in the staged manifests
+        evidence_dict2: dict[str, object] = dict.fromkeys(
+            manifest_index.latest_artifacts(environment), True
+        )
     else:
         evidence_dict2 = evidence_dict  # type: ignore
 
     results = validate_controls(control_ids, evidence_dict2)
 
-    if output_path:
-        out = Path(output_path)
-    else:
-        out = Path(tempfile.mktemp(suffix=".html", prefix="auditly-engineer-"))
-
-    generate_engineer_report(results, evidence_dict2, out)
-    html_content = out.read_text()
+    html_content = render_engineer_report(results, evidence_dict2)
 
     summary = {
         "controls_validated": len(results),
@@ -616,7 +746,7 @@ def _generate_engineer_report(
         "failed": sum(1 for r in results.values() if r.status.value == "fail"),
     }
 
-    return str(out), html_content, summary
+    return _persist_report(html_content, output_path), html_content, summary
 
 
 def _generate_auditor_report(
@@ -625,7 +755,7 @@ def _generate_auditor_report(
     control_ids: list[str] | None,
     evidence_dict: dict[str, Any] | None,
     output_path: str | None,
-) -> tuple[str, str, dict[str, Any]]:
+) -> tuple[str | None, str, dict[str, Any]]:
     """Generate auditor report (CLI logic)."""
     if not control_ids:
         # Use sample controls
@@ -636,32 +766,16 @@ def _generate_auditor_report(
             control_ids.extend([f"{family}-{i}" for i in range(1, 26)])
 
     if not evidence_dict:
-        # Try to load from staging
-        staging = Path(".auditly_manifests")
-        evidence_dict2: dict[str, object] = {}
-        if staging.exists():
-            for p in staging.glob(f"{environment}-*.json"):
-                import json as _json
-
-                data = _json.loads(p.read_text())
-                for artifact in data.get("artifacts", []):
-                    kind = artifact.get("metadata", {}).get("kind", "unknown")
-                    if kind not in evidence_dict2:
-                        evidence_dict2[kind] = True
-        else:
-            evidence_dict2 = {}
+        # Evidence kinds present in the staged manifests
+        evidence_dict2: dict[str, object] = dict.fromkeys(
+            manifest_index.latest_artifacts(environment), True
+        )
     else:
         evidence_dict2 = evidence_dict  # type: ignore
 
     results = validate_controls(control_ids, evidence_dict2)
 
-    if output_path:
-        out = Path(output_path)
-    else:
-        out = Path(tempfile.mktemp(suffix=".html", prefix="auditly-auditor-"))
-
-    generate_auditor_report(results, evidence_dict2, out)
-    html_content = out.read_text()
+    html_content = render_auditor_report(results, evidence_dict2)
 
     summary = {
         "controls_validated": len(results),
@@ -669,4 +783,4 @@ def _generate_auditor_report(
         "failed": sum(1 for r in results.values() if r.status.value == "fail"),
     }
 
-    return str(out), html_content, summary
+    return _persist_report(html_content, output_path), html_content, summary
@@ -2,6 +2,7 @@
 
 from .collect import router as collect_router
 from .evidence import router as evidence_router
+from .jobs import router as jobs_router
 from .report import router as report_router
 from .validate import router as validate_router
 from .webhook import router as webhook_router
@@ -12,4 +13,5 @@ __all__ = [
     "report_router",
     "evidence_router",
     "webhook_router",
+    "jobs_router",
 ]
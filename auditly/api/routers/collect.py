@@ -1,62 +1,154 @@
 """Collection endpoint router."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException
-
-from ..models import CollectBatchRequest, CollectBatchResponse, CollectRequest, CollectResponse
-from ..operations import collect_evidence, collect_evidence_batch
+from fastapi.responses import StreamingResponse
+
+from ...batch_collection import BatchLimits
+from ..jobs import Job
+from ..models import (
+    CollectBatchRequest,
+    CollectBatchResponse,
+    CollectRequest,
+    CollectResponse,
+    JobSubmitResponse,
+)
+from ..operations import collect_evidence, collect_evidence_stream, iter_collect_evidence_batch
+from .jobs import dispatch_job
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/collect", tags=["evidence"])
 
 
-@router.post("/batch", response_model=CollectBatchResponse)
-def collect_batch(request: CollectBatchRequest):
+STREAM_MEDIA_TYPES = {"sse": "text/event-stream", "ndjson": "application/x-ndjson"}
+
+
+def _batch_payload(request: CollectBatchRequest) -> list[dict[str, Any]]:
+    """Convert batch request entries into ``collect_evidence`` keyword arguments."""
+    batch_payload = []
+    for idx, r in enumerate(request.requests):
+        # Build kwargs for operations.collect_evidence
+        provider_params = r.dict(exclude_none=True)
+        provider_params.pop("provider", None)
+        provider_params.pop("environment", None)
+        provider_params.pop("config_path", None)
+
+        batch_payload.append(
+            {
+                "name": f"req-{idx}-{r.provider}",
+                "config_path": r.config_path,
+                "environment": r.environment,
+                "provider": r.provider,
+                **provider_params,
+            }
+        )
+    return batch_payload
+
+
+def _batch_limits(request: CollectBatchRequest) -> BatchLimits:
+    """Build the scheduler limits for a batch request."""
+    try:
+        return BatchLimits(
+            max_concurrency=request.max_concurrency,
+            provider_concurrency=request.provider_concurrency,
+            provider_rate_limits=request.provider_rate_limits,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+async def _stream_batch(
+    batch_payload: list[dict[str, Any]], timeout: int, limits: BatchLimits, fmt: str
+) -> AsyncIterator[str]:
+    """Format per-request completion events as SSE or NDJSON, ending with a summary."""
+
+    def _encode(event: str, data: dict[str, Any]) -> str:
+        if fmt == "sse":
+            return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+        return json.dumps({"event": event, **data}, default=str) + "\n"
+
+    succeeded = failed = 0
+    async for result in collect_evidence_stream(batch_payload, timeout=timeout, limits=limits):
+        if result["status"] == "success":
+            succeeded += 1
+        else:
+            failed += 1
+        yield _encode("result", result)
+    yield _encode("done", {"succeeded": succeeded, "failed": failed})
+
+
+@router.post(
+    "/batch", response_model=CollectBatchResponse, responses={202: {"model": JobSubmitResponse}}
+)
+async def collect_batch(
+    request: CollectBatchRequest,
+    background: bool = False,
+    stream: Literal["sse", "ndjson"] | None = None,
+):
     """Collect evidence from multiple providers concurrently.
 
     Each entry in `requests` mirrors the single-provider payload. Results/errors are keyed by
     request index or provided name (if passed in the request object).
+
+    With `?background=true` the batch is queued and HTTP 202 returns a job ID to poll at
+    `/jobs/{job_id}`. With `?stream=sse` or `?stream=ndjson` one `result` event is sent per
+    request as soon as it completes, followed by a final `done` event with the counts.
     """
-    try:
-        batch_payload = []
-        for idx, r in enumerate(request.requests):
-            # Build kwargs for operations.collect_evidence
-            provider_params = r.dict(exclude_none=True)
-            provider_params.pop("provider", None)
-            provider_params.pop("environment", None)
-            provider_params.pop("config_path", None)
-
-            batch_payload.append(
-                {
-                    "name": f"req-{idx}-{r.provider}",
-                    "config_path": r.config_path,
-                    "environment": r.environment,
-                    "provider": r.provider,
-                    **provider_params,
-                }
-            )
+    batch_payload = _batch_payload(request)
+    limits = _batch_limits(request)
 
-        result = collect_evidence_batch(batch_payload, timeout=request.timeout_seconds)
+    if stream is not None:
+        return StreamingResponse(
+            _stream_batch(batch_payload, request.timeout_seconds, limits, stream),
+            media_type=STREAM_MEDIA_TYPES[stream],
+        )
 
+    def _run(job: Job) -> dict:
+        job.report_progress("collecting", requests=len(batch_payload))
+        results: dict[str, object] = {}
+        errors: dict[str, object] = {}
+        for event in iter_collect_evidence_batch(
+            batch_payload, timeout=request.timeout_seconds, limits=limits
+        ):
+            name = event["name"]
+            if event["status"] == "success":
+                results[name] = (
+                    event["artifacts_uploaded"],
+                    event["manifest_key"],
+                    event["message"],
+                )
+            else:
+                errors[name] = event["error"]
+            job.report_progress(
+                f"{name} {event['status']}", completed=event["completed"], total=event["total"]
+            )
         return CollectBatchResponse(
             success=True,
-            results=result.get("results", {}),
-            errors=result.get("errors", {}),
-            succeeded=result.get("success", 0),
-            failed=result.get("failed", 0),
+            results=results,
+            errors=errors,
+            succeeded=len(results),
+            failed=len(errors),
             message="Batch collection completed",
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except Exception as e:
-        logger.exception(f"Batch collection failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Batch collection failed: {e}") from e
+        ).model_dump()
 
+    first = request.requests[0] if request.requests else None
+    return await dispatch_job(
+        "collection",
+        first.environment if first else "",
+        _run,
+        background=background,
+        config_path=first.config_path if first else "config.yaml",
+        error_label="Batch collection",
+    )
 
-@router.post("", response_model=CollectResponse)
-def collect(request: CollectRequest):
+
+@router.post("", response_model=CollectResponse, responses={202: {"model": JobSubmitResponse}})
+async def collect(request: CollectRequest, background: bool = False):
     """
     Collect evidence from cloud providers or CI/CD systems.
 
@@ -82,43 +174,46 @@ def collect(request: CollectRequest):
         "github_run_id": 12345
     }
     ```
+
+    With `?background=true` the collection is queued and HTTP 202 returns a job ID to poll at
+    `/jobs/{job_id}`.
     """
-    try:
-        logger.info(
-            f"Collecting evidence: environment={request.environment}, provider={request.provider}"
+    logger.info(
+        f"Collecting evidence: environment={request.environment}, provider={request.provider}"
+    )
+
+    # Extract provider-specific params
+    provider_params = {}
+    if request.provider == "terraform":
+        provider_params["terraform_plan_path"] = request.terraform_plan_path
+        provider_params["terraform_apply_path"] = request.terraform_apply_path
+    elif request.provider == "github":
+        provider_params["github_repo"] = request.github_repo
+        provider_params["github_token"] = request.github_token
+        provider_params["github_run_id"] = (
+            str(request.github_run_id) if request.github_run_id is not None else None
         )
-
-        # Extract provider-specific params
-        provider_params = {}
-        if request.provider == "terraform":
-            provider_params["terraform_plan_path"] = request.terraform_plan_path
-            provider_params["terraform_apply_path"] = request.terraform_apply_path
-        elif request.provider == "github":
-            provider_params["github_repo"] = request.github_repo
-            provider_params["github_token"] = request.github_token
-            provider_params["github_run_id"] = (
-                str(request.github_run_id) if request.github_run_id is not None else None
-            )
-            provider_params["github_branch"] = request.github_branch
-        elif request.provider == "gitlab":
-            provider_params["gitlab_base_url"] = request.gitlab_base_url
-            provider_params["gitlab_project_id"] = (
-                str(request.gitlab_project_id) if request.gitlab_project_id is not None else None
-            )
-            provider_params["gitlab_token"] = request.gitlab_token
-            provider_params["gitlab_pipeline_id"] = (
-                str(request.gitlab_pipeline_id) if request.gitlab_pipeline_id is not None else None
-            )
-            provider_params["gitlab_ref"] = request.gitlab_ref
-        elif request.provider == "argo":
-            provider_params["argo_base_url"] = request.argo_base_url
-            provider_params["argo_namespace"] = request.argo_namespace
-            provider_params["argo_workflow_name"] = request.argo_workflow_name
-            provider_params["argo_token"] = request.argo_token
-        elif request.provider == "azure":
-            provider_params["azure_subscription_id"] = request.azure_subscription_id
-            provider_params["azure_resource_group"] = request.azure_resource_group
-
+        provider_params["github_branch"] = request.github_branch
+    elif request.provider == "gitlab":
+        provider_params["gitlab_base_url"] = request.gitlab_base_url
+        provider_params["gitlab_project_id"] = (
+            str(request.gitlab_project_id) if request.gitlab_project_id is not None else None
+        )
+        provider_params["gitlab_token"] = request.gitlab_token
+        provider_params["gitlab_pipeline_id"] = (
+            str(request.gitlab_pipeline_id) if request.gitlab_pipeline_id is not None else None
+        )
+        provider_params["gitlab_ref"] = request.gitlab_ref
+    elif request.provider == "argo":
+        provider_params["argo_base_url"] = request.argo_base_url
+        provider_params["argo_namespace"] = request.argo_namespace
+        provider_params["argo_workflow_name"] = request.argo_workflow_name
+        provider_params["argo_token"] = request.argo_token
+    elif request.provider == "azure":
+        provider_params["azure_subscription_id"] = request.azure_subscription_id
+        provider_params["azure_resource_group"] = request.azure_resource_group
+
+    def _run(job: Job) -> dict:
         artifacts_count, manifest_key, message = collect_evidence(
             config_path=request.config_path,
             environment=request.environment,
@@ -135,11 +230,13 @@ def collect(request: CollectRequest):
             environment=request.environment,
             provider=request.provider,
             message=message,
-        )
-
-    except ValueError as e:
-        logger.error(f"Validation error in collect: {e}")
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except Exception as e:
-        logger.exception(f"Collection failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Collection failed: {e}") from e
+        ).model_dump()
+
+    return await dispatch_job(
+        "collection",
+        request.environment,
+        _run,
+        background=background,
+        config_path=request.config_path,
+        error_label="Collection",
+    )
@@ -0,0 +1,117 @@
+"""Background job status endpoints."""
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from ...config import load_config
+from ..jobs import Job, JobManagerClosed, JobQueueFull, job_manager
+from ..models import JobStatusResponse, JobSubmitResponse
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+# Seconds between progress checks for event subscribers
+EVENT_POLL_INTERVAL = 0.25
+
+
+@router.get("", response_model=list[JobStatusResponse])
+async def list_jobs(status: str | None = None, job_type: str | None = None, limit: int = 50):
+    """List recent background jobs, newest first."""
+    return [j.to_dict() for j in job_manager.list(status=status, job_type=job_type, limit=limit)]
+
+
+@router.get("/{job_id}", response_model=JobStatusResponse)
+async def get_job(job_id: str):
+    """Poll the status, progress and (when finished) result of a job."""
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job.to_dict()
+
+
+@router.get("/{job_id}/events")
+async def job_events(job_id: str):
+    """
+    Subscribe to job progress as Server-Sent Events.
+
+    Emits one ``progress`` event per progress entry and a final ``done`` event
+    carrying the job status.
+    """
+    job = job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    async def _stream():
+        sent = 0
+        while True:
+            done = job.done
+            events = job.progress[sent:]
+            for event in events:
+                yield f"event: progress\ndata: {json.dumps(event, default=str)}\n\n"
+            sent += len(events)
+            if done:
+                yield f"event: done\ndata: {json.dumps(job.to_dict(), default=str)}\n\n"
+                return
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+    return StreamingResponse(_stream(), media_type="text/event-stream")
+
+
+def job_database_url(config_path: str, environment: str) -> str | None:
+    """Return the environment's database URL for JobRun persistence, if configured."""
+    try:
+        envcfg = load_config(config_path).environments.get(environment)
+    except Exception:
+        return None
+    return getattr(envcfg, "database_url", None)
+
+
+async def dispatch_job(
+    job_type: str,
+    environment: str,
+    fn: Callable[[Job], dict],
+    *,
+    background: bool,
+    config_path: str,
+    error_label: str,
+):
+    """
+    Submit ``fn`` to the job pool and either return 202 or await its result.
+
+    Synchronous callers still get the endpoint's normal response, but the work
+    runs on the bounded job pool rather than the request thread pool.
+    """
+    try:
+        job = job_manager.submit(
+            job_type,
+            environment,
+            fn,
+            database_url=job_database_url(config_path, environment),
+        )
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    except JobManagerClosed as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+    if background:
+        payload = JobSubmitResponse(
+            job_id=job.id, job_type=job_type, status=job.status, status_url=f"/jobs/{job.id}"
+        )
+        return JSONResponse(status_code=202, content=payload.model_dump())
+
+    try:
+        return await job_manager.wait(job)
+    except JobManagerClosed as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+    except ValueError as e:
+        logger.error(f"Validation error in {job_type}: {e}")
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(f"{error_label} failed: {e}")
+        raise HTTPException(status_code=500, detail=f"{error_label} failed: {e}") from e
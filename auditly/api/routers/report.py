@@ -1,20 +1,98 @@
 """Reporting endpoint router for generating and exporting compliance reports (HTML/JSON)."""
 
 import logging
+from collections.abc import Iterator
 
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, StreamingResponse
 
-from ..models import ReportRequest, ReportResponse
-from ..operations import generate_report
+from ...reporting.cache import CachedReport, make_report_key, report_cache
+from ..jobs import Job
+from ..models import JobSubmitResponse, ReportRequest, ReportResponse
+from ..operations import generate_report, get_report, report_cache_key
+from ..serialization import FastJSONResponse, parse_fields, project, summarize_report
+from .jobs import dispatch_job
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/report", tags=["reporting"])
 
 
-@router.get("/json", response_class=JSONResponse)
-def report_json(environment: str, report_type: str = "readiness", config_path: str = "config.yaml"):
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header against a strong ETag (weak tags compare equal)."""
+    if not if_none_match:
+        return False
+    tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+    return "*" in tags or etag in tags
+
+
+async def _conditional_report(
+    if_none_match: str | None,
+    config_path: str,
+    environment: str,
+    report_type: str,
+    representation: str,
+    error_label: str,
+) -> tuple[str, CachedReport | None]:
+    """Return the report ETag and, unless the client already holds it, the report.
+
+    Conditional and cached requests are answered inline; only a report that
+    has to be rendered goes through the job queue.
+    """
+    try:
+        key = await run_in_threadpool(report_cache_key, config_path, environment, report_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+    except Exception as e:
+        logger.exception(f"{error_label} failed: {e}")
+        raise HTTPException(status_code=500, detail=f"{error_label} failed: {e}") from e
+    etag = f'"{key}-{representation}"'
+    if _etag_matches(if_none_match, etag):
+        return etag, None
+    report = report_cache.get(key)
+    if report is None:
+
+        def _run(job: Job) -> CachedReport:
+            return get_report(config_path, environment, report_type)
+
+        report = await dispatch_job(
+            "report",
+            environment,
+            _run,
+            background=False,
+            config_path=config_path,
+            error_label=error_label,
+        )
+    return f'"{report.key}-{representation}"', report
+
+
+def _cache_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+
+# Bytes per streamed HTML chunk
+HTML_CHUNK_SIZE = 64 * 1024
+
+
+def _html_chunks(html: str) -> Iterator[bytes]:
+    """Encode an HTML document in fixed-size chunks for streaming."""
+    data = html.encode("utf-8")
+    for start in range(0, len(data), HTML_CHUNK_SIZE):
+        yield data[start : start + HTML_CHUNK_SIZE]
+
+
+@router.get("/json", response_class=FastJSONResponse)
+async def report_json(
+    request: Request,
+    environment: str,
+    report_type: str = "readiness",
+    config_path: str = "config.yaml",
+    fields: str | None = Query(None, description="Comma-separated top-level summary keys."),
+    summary_only: bool = Query(
+        False, description="Omit embedded manifests and per-control ID lists."
+    ),
+):
     """
     Generate and return report summary as JSON (for programmatic export).
 
@@ -22,23 +100,39 @@ def report_json(environment: str, report_type: str = "readiness", config_path: s
     - environment: Environment key
     - report_type: readiness, engineer, or auditor (default: readiness)
     - config_path: Path to config file (default: config.yaml)
+    - fields: Comma-separated top-level keys to return (e.g. `controls,validation`)
+    - summary_only: Drop the embedded manifests and per-control ID lists, keeping counts
 
     Example: `/report/json?environment=production&report_type=readiness`
-    """
-    try:
-        _, _, summary = generate_report(
-            config_path=config_path,
-            environment=environment,
-            report_type=report_type,
-        )
-        return JSONResponse(content=summary)
-    except Exception as e:
-        logger.exception(f"Report JSON generation failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Report JSON generation failed: {e}") from e
 
-
-@router.post("", response_model=ReportResponse)
-def report(request: ReportRequest):
+    Responses carry an `ETag`; send it back in `If-None-Match` to get `304 Not Modified`
+    while no manifest, catalog or waiver has changed.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    summary_fields = parse_fields(fields)
+    # Each projection is its own representation with its own ETag
+    representation = "json"
+    if summary_only:
+        representation += "-summary"
+    if summary_fields:
+        representation += "-" + make_report_key(sorted(summary_fields))[:12]
+
+    etag, report = await _conditional_report(
+        if_none_match,
+        config_path,
+        environment,
+        report_type,
+        representation,
+        "Report JSON generation",
+    )
+    if report is None:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    content = summarize_report(report.summary) if summary_only else report.summary
+    return FastJSONResponse(content=project(content, summary_fields), headers=_cache_headers(etag))
+
+
+@router.post("", response_model=ReportResponse, responses={202: {"model": JobSubmitResponse}})
+async def report(request: ReportRequest, background: bool = False):
     """
     Generate compliance reports.
 
@@ -64,13 +158,13 @@ def report(request: ReportRequest):
     }
     ```
 
-    Returns HTML report that can be viewed in a browser or saved to a file.
+    Returns HTML report that can be viewed in a browser or saved to a file. With
+    `?background=true` the report is queued and HTTP 202 returns a job ID to poll at
+    `/jobs/{job_id}`.
     """
-    try:
-        logger.info(
-            f"Generating report: environment={request.environment}, type={request.report_type}"
-        )
+    logger.info(f"Generating report: environment={request.environment}, type={request.report_type}")
 
+    def _run(job: Job) -> dict:
         report_path, report_html, summary = generate_report(
             config_path=request.config_path,
             environment=request.environment,
@@ -79,7 +173,7 @@ def report(request: ReportRequest):
             evidence_dict=request.evidence_dict,
         )
 
-        logger.info(f"Report generated: {report_path}")
+        logger.info(f"Report generated: {report_path or 'in memory'}")
 
         return ReportResponse(
             success=True,
@@ -89,18 +183,25 @@ def report(request: ReportRequest):
             report_html=report_html,
             summary=summary,
             message=f"Generated {request.report_type} report",
-        )
+        ).model_dump()
 
-    except ValueError as e:
-        logger.error(f"Validation error in report: {e}")
-        raise HTTPException(status_code=400, detail=str(e)) from e
-    except Exception as e:
-        logger.exception(f"Report generation failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Report generation failed: {e}") from e
+    return await dispatch_job(
+        "report",
+        request.environment,
+        _run,
+        background=background,
+        config_path=request.config_path,
+        error_label="Report generation",
+    )
 
 
 @router.get("/html", response_class=HTMLResponse)
-def report_html(environment: str, report_type: str = "readiness", config_path: str = "config.yaml"):
+async def report_html(
+    request: Request,
+    environment: str,
+    report_type: str = "readiness",
+    config_path: str = "config.yaml",
+):
     """
     Generate and return HTML report directly (for browser viewing).
 
@@ -110,14 +211,19 @@ def report_html(environment: str, report_type: str = "readiness", config_path: s
     - config_path: Path to config file (default: config.yaml)
 
     Example: `/report/html?environment=production&report_type=readiness`
+
+    The document is streamed from memory in chunks. Supports conditional requests via
+    `ETag`/`If-None-Match` like `/report/json`.
     """
-    try:
-        _, report_html, _ = generate_report(
-            config_path=config_path,
-            environment=environment,
-            report_type=report_type,
-        )
-        return HTMLResponse(content=report_html)
-    except Exception as e:
-        logger.exception(f"Report HTML generation failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Report HTML generation failed: {e}") from e
+    if_none_match = request.headers.get("if-none-match")
+
+    etag, report = await _conditional_report(
+        if_none_match, config_path, environment, report_type, "html", "Report HTML generation"
+    )
+    if report is None:
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return StreamingResponse(
+        _html_chunks(report.html),
+        media_type="text/html; charset=utf-8",
+        headers=_cache_headers(etag),
+    )
@@ -2,18 +2,25 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
-from ..models import ValidateRequest, ValidateResponse, ValidationResultResponse
+from ..models import ValidateRequest, ValidateResponse
 from ..operations import validate_evidence
+from ..serialization import FastJSONResponse, parse_fields, project
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/validate", tags=["validation"])
 
 
-@router.post("", response_model=ValidateResponse)
-def validate(request: ValidateRequest):
+@router.post("", response_model=ValidateResponse, response_class=FastJSONResponse)
+def validate(
+    request: ValidateRequest,
+    fields: str | None = Query(
+        None, description="Comma-separated result fields to return (control_id is always kept)."
+    ),
+    summary_only: bool = Query(False, description="Return counts only, without results."),
+):
     """
     Validate controls against collected evidence.
 
@@ -29,6 +36,9 @@ def validate(request: ValidateRequest):
     ```
 
     If control_ids is omitted, validates all controls from configured catalogs.
+
+    Large result sets can be trimmed with `?fields=status,message` (per-control fields)
+    or `?summary_only=true` (no per-control results).
     """
     try:
         logger.info(
@@ -43,10 +53,15 @@ def validate(request: ValidateRequest):
             evidence_dict=request.evidence_dict,
         )
 
-        # Convert to response models
-        results_response = {}
-        for cid, result in results_dict.items():
-            results_response[cid] = ValidationResultResponse(**result)
+        result_fields = parse_fields(fields)
+        results_response = (
+            {}
+            if summary_only
+            else {
+                cid: project(result, result_fields, keep=("control_id",))
+                for cid, result in results_dict.items()
+            }
+        )
 
         logger.info(
             f"Validation complete: {summary['passed']} passed, "
@@ -54,13 +69,18 @@ def validate(request: ValidateRequest):
             f"{summary['insufficient']} insufficient"
         )
 
-        return ValidateResponse(
-            success=True,
-            environment=request.environment,
-            controls_validated=len(results_dict),
-            results=results_response,
-            summary=summary,
-            message=f"Validated {len(results_dict)} controls",
+        # Results are plain dicts from operations; serialize them directly rather
+        # than building one response model per control
+        return FastJSONResponse(
+            {
+                "success": True,
+                "environment": request.environment,
+                "controls_validated": len(results_dict),
+                "results": results_response,
+                "summary": summary,
+                "message": f"Validated {len(results_dict)} controls",
+                "error": None,
+            }
         )
 
     except ValueError as e:
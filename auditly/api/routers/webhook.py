@@ -5,7 +5,9 @@ import logging
 from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel, Field
 
-from auditly.api.operations import validate_evidence
+from ..jobs import JobManagerClosed, JobQueueFull
+from ..webhook_queue import webhook_coalescer
+from .jobs import job_database_url
 
 logger = logging.getLogger(__name__)
 
@@ -47,8 +49,24 @@ class WebhookEvent(BaseModel):
     )
 
 
-@router.post("", status_code=status.HTTP_202_ACCEPTED)
-async def webhook_handler(event: WebhookEvent):
+class WebhookResponse(BaseModel):
+    """Acknowledgement for a queued webhook event."""
+
+    success: bool
+    job_id: str
+    status: str
+    status_url: str
+    coalesced_events: int = Field(..., description="Events merged into this validation job so far.")
+    evidence_types: list[str] = Field(
+        default_factory=list, description="Changed evidence types collected for the job."
+    )
+    full_validation: bool = Field(
+        ..., description="Whether the job validates all controls instead of affected ones."
+    )
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED, response_model=WebhookResponse)
+async def webhook_handler(event: WebhookEvent, config_path: str = "config.yaml"):
     """
     Handle webhook events to auto-trigger validation on evidence or environment changes.
 
@@ -58,19 +76,35 @@ async def webhook_handler(event: WebhookEvent):
     - **event_type**: Type of event (e.g., 'evidence_changed', 'environment_changed').
     - **environment**: Target environment key (e.g., 'production').
     - **evidence_id**: Optional evidence ID if the event relates to a specific evidence item.
-    - **payload**: Optional event-specific data.
+    - **payload**: Optional event-specific data. Changed evidence types are read from
+      `evidence_types`, `evidence_type` or manifest-style `artifacts[].metadata.kind`.
 
-    Returns HTTP 202 Accepted if the event is processed.
+    Events for the same environment are debounced and merged: one validation job runs for the
+    whole burst, limited to the controls affected by the changed evidence types (or all controls
+    when an event does not say what changed). Returns HTTP 202 Accepted immediately with the
+    shared job handle; poll `/jobs/{job_id}` for the result.
     """
     logger.info(f"Received webhook event: {event.event_type} for env={event.environment}")
     try:
-        # For now, always trigger full validation for the environment
-        _, summary = validate_evidence(
-            config_path="config.yaml",
-            environment=event.environment,
+        batch = webhook_coalescer.submit(
+            event.environment,
+            event_type=event.event_type,
+            evidence_id=event.evidence_id,
+            payload=event.payload,
+            config_path=config_path,
+            database_url=job_database_url(config_path, event.environment),
         )
-        logger.info(f"Validation triggered by webhook: {summary}")
-        return {"success": True, "summary": summary}
-    except Exception as e:
-        logger.error(f"Webhook validation failed: {e}")
-        raise HTTPException(status_code=500, detail=f"Validation failed: {e}") from e
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e)) from e
+    except JobManagerClosed as e:
+        raise HTTPException(status_code=503, detail=str(e)) from e
+
+    return WebhookResponse(
+        success=True,
+        job_id=batch.job.id,
+        status=batch.job.status,
+        status_url=f"/jobs/{batch.job.id}",
+        coalesced_events=batch.events,
+        evidence_types=sorted(batch.evidence_types),
+        full_validation=batch.full,
+    )
@@ -0,0 +1,109 @@
+"""Fast JSON serialization and response projection for large API payloads.
+
+Validation and report responses can carry thousands of controls, each with
+its own metadata, plus every staged manifest. ``orjson`` serializes these
+several times faster than the stdlib encoder; when it is not installed the
+stdlib encoder with compact separators is used instead. Clients that only
+need part of a response can ask for a projection (``fields=``) or just the
+summary (``summary_only=true``) so the large parts are never encoded.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+from datetime import date, datetime, time
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> Any:
+    """Fallback for values an encoder does not handle natively.
+
+    Datetimes and dataclasses are converted the way orjson does natively, so
+    responses are the same whichever encoder is installed.
+    """
+    if isinstance(obj, datetime | date | time):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, set | frozenset):
+        return sorted(obj, key=str)
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if hasattr(obj, "value"):
+        return obj.value
+    return str(obj)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    Serialize content to compact UTF-8 JSON.
+
+    Args:
+        content: JSON-compatible data; datetimes, dataclasses and pydantic models are converted
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        """Encode the response body."""
+        return dumps(content)
+
+
+def parse_fields(fields: str | None) -> list[str] | None:
+    """Split a comma-separated ``fields`` query parameter (None or empty means all)."""
+    if not fields:
+        return None
+    names = [f.strip() for f in fields.split(",") if f.strip()]
+    return names or None
+
+
+def project(data: dict[str, Any], fields: list[str] | None, keep: tuple[str, ...] = ()) -> dict:
+    """
+    Keep only the requested keys of a dict.
+
+    Args:
+        data: Dict to project
+        fields: Keys to keep (None keeps everything)
+        keep: Keys always kept, e.g. identifiers
+
+    Returns:
+        The projected dict (``data`` itself when no projection is requested)
+    """
+    if fields is None:
+        return data
+    wanted = set(fields) | set(keep)
+    return {k: v for k, v in data.items() if k in wanted}
+
+
+# Readiness summary keys that grow with the number of manifests and controls
+_REPORT_DETAIL_KEYS = ("manifests",)
+_COVERAGE_DETAIL_KEYS = ("covered_ids", "uncovered_ids", "control_evidence")
+
+
+def summarize_report(summary: dict[str, Any]) -> dict[str, Any]:
+    """Drop per-manifest and per-control detail from a report summary, keeping the counts."""
+    slim = {k: v for k, v in summary.items() if k not in _REPORT_DETAIL_KEYS}
+    controls = slim.get("controls")
+    if isinstance(controls, dict):
+        slim["controls"] = {k: v for k, v in controls.items() if k not in _COVERAGE_DETAIL_KEYS}
+    return slim
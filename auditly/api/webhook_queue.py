@@ -0,0 +1,251 @@
+"""Debounced, coalescing queue for webhook-triggered validation.
+
+CI systems tend to fire webhooks in bursts (one per job, artifact or
+pipeline stage). Rather than validating the whole environment for each
+event, events for the same environment that arrive within a short debounce
+window are merged into a single pending batch. When the window closes, one
+validation job runs, limited to the controls that depend on the changed
+evidence types. Every event in a batch is answered with the same job handle.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import select
+
+from ..db import get_sync_engine_for_url
+from ..db.models import Evidence
+from .jobs import Job, JobManager, JobManagerClosed, job_manager
+from .operations import affected_control_ids, validate_evidence
+
+logger = logging.getLogger(__name__)
+
+# Quiet period after the last event before a batch is validated
+DEFAULT_DEBOUNCE_SECONDS = 2.0
+# Upper bound on how long a continuous stream of events can delay validation
+DEFAULT_MAX_DELAY_SECONDS = 10.0
+
+
+def event_evidence_types(payload: dict[str, Any] | None) -> set[str]:
+    """
+    Extract the changed evidence types from a webhook payload.
+
+    Recognizes ``evidence_types`` (list), ``evidence_type`` (str) and
+    manifest-style ``artifacts`` entries carrying ``metadata.kind``.
+    """
+    if not payload:
+        return set()
+    types: set[str] = set()
+    listed = payload.get("evidence_types")
+    if isinstance(listed, list):
+        types.update(str(t) for t in listed if t)
+    single = payload.get("evidence_type")
+    if isinstance(single, str) and single:
+        types.add(single)
+    for artifact in payload.get("artifacts") or []:
+        if isinstance(artifact, dict):
+            kind = (artifact.get("metadata") or {}).get("kind")
+            if isinstance(kind, str) and kind:
+                types.add(kind)
+    return types
+
+
+def _evidence_types_for_ids(database_url: str, evidence_ids: set[str]) -> set[str] | None:
+    """Look up evidence types for database evidence IDs; None if any cannot be resolved."""
+    if not all(eid.isdigit() for eid in evidence_ids):
+        return None
+    ids = {int(eid) for eid in evidence_ids}
+    try:
+        _, factory = get_sync_engine_for_url(database_url)
+        with factory() as session:
+            rows = session.execute(
+                select(Evidence.id, Evidence.evidence_type).where(Evidence.id.in_(ids))
+            ).all()
+    except Exception as exc:
+        logger.warning(f"Could not resolve webhook evidence IDs: {exc}")
+        return None
+    if len(rows) != len(ids):
+        return None
+    return {evidence_type for _, evidence_type in rows}
+
+
+@dataclass
+class WebhookBatch:
+    """Webhook events for one environment waiting to be validated together."""
+
+    environment: str
+    config_path: str
+    job: Job
+    first_event_at: float = field(default_factory=time.monotonic)
+    events: int = 0
+    evidence_types: set[str] = field(default_factory=set)
+    evidence_ids: set[str] = field(default_factory=set)
+    full: bool = False
+    timer: threading.Timer | None = field(default=None, repr=False)
+
+
+class WebhookCoalescer:
+    """Debounce webhook events per environment into single incremental validation jobs."""
+
+    def __init__(
+        self,
+        manager: JobManager,
+        debounce_seconds: float = DEFAULT_DEBOUNCE_SECONDS,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+    ):
+        """
+        Initialize the coalescer.
+
+        Args:
+            manager: Job manager that runs the validation jobs
+            debounce_seconds: Quiet period after the last event before validating
+            max_delay_seconds: Maximum time between a batch's first event and its validation
+        """
+        self.manager = manager
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self._pending: dict[tuple[str, str], WebhookBatch] = {}
+        self._running: dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        environment: str,
+        *,
+        event_type: str,
+        evidence_id: str | None = None,
+        payload: dict[str, Any] | None = None,
+        config_path: str = "config.yaml",
+        database_url: str | None = None,
+    ) -> WebhookBatch:
+        """
+        Add an event to the environment's pending batch, creating one if needed.
+
+        Events that name neither evidence types nor an evidence ID make the
+        batch fall back to a full validation of the environment.
+
+        Returns:
+            The batch the event joined (its ``job`` is the shared handle)
+
+        Raises:
+            JobQueueFull: If a new batch is needed and the job queue is full
+            JobManagerClosed: If a new batch is needed after the job manager shut down
+        """
+        types = event_evidence_types(payload)
+        key = (environment, config_path)
+        with self._lock:
+            batch = self._pending.get(key)
+            if batch is None:
+                job = self.manager.create("validation", environment, database_url=database_url)
+                batch = WebhookBatch(environment=environment, config_path=config_path, job=job)
+                self._pending[key] = batch
+            batch.events += 1
+            batch.evidence_types.update(types)
+            if evidence_id:
+                batch.evidence_ids.add(evidence_id)
+            if not types and not evidence_id:
+                batch.full = True
+            batch.job.report_progress("event", event_type=event_type, events=batch.events)
+            self._arm(batch)
+        return batch
+
+    def _arm(self, batch: WebhookBatch, delay: float | None = None) -> None:
+        """(Re)start the batch timer; caller holds the lock."""
+        if batch.timer is not None:
+            batch.timer.cancel()
+        if delay is None:
+            remaining = batch.first_event_at + self.max_delay_seconds - time.monotonic()
+            delay = max(0.0, min(self.debounce_seconds, remaining))
+        batch.timer = threading.Timer(delay, self._fire, args=(batch,))
+        batch.timer.daemon = True
+        batch.timer.start()
+
+    def _fire(self, batch: WebhookBatch) -> None:
+        key = (batch.environment, batch.config_path)
+        with self._lock:
+            if self._pending.get(key) is not batch:
+                # Superseded timer of a batch that already started
+                return
+            running = self._running.get(batch.environment)
+            if running is not None and not running.done:
+                # One validation per environment at a time; keep collecting events
+                self._arm(batch, delay=self.debounce_seconds)
+                return
+            del self._pending[key]
+            batch.timer = None
+            self._running[batch.environment] = batch.job
+        try:
+            self.manager.start(batch.job, lambda job: self._validate(job, batch))
+        except JobManagerClosed:
+            # start() already marked the job cancelled
+            logger.info("Dropping webhook batch for %s: job manager shut down", batch.environment)
+
+    def _validate(self, job: Job, batch: WebhookBatch) -> dict[str, Any]:
+        """Run one validation covering every event in the batch."""
+        types = set(batch.evidence_types)
+        full = batch.full
+        if batch.evidence_ids and not full:
+            resolved = (
+                _evidence_types_for_ids(job.database_url, batch.evidence_ids)
+                if job.database_url
+                else None
+            )
+            if resolved is None:
+                full = True
+            else:
+                types |= resolved
+
+        control_ids = None
+        if not full:
+            control_ids = affected_control_ids(batch.config_path, batch.environment, types)
+            if not control_ids:
+                job.report_progress("no affected controls", evidence_types=sorted(types))
+                return {
+                    "mode": "incremental",
+                    "events": batch.events,
+                    "evidence_types": sorted(types),
+                    "control_ids": [],
+                    "summary": {"passed": 0, "failed": 0, "insufficient": 0, "unknown": 0},
+                }
+
+        mode = "full" if full else "incremental"
+        job.report_progress(
+            "validating",
+            mode=mode,
+            events=batch.events,
+            controls=len(control_ids) if control_ids else None,
+        )
+        results, summary = validate_evidence(
+            config_path=batch.config_path,
+            environment=batch.environment,
+            control_ids=control_ids,
+        )
+        logger.info(
+            f"Webhook validation for {batch.environment} ({mode}, {batch.events} events): "
+            f"{summary}"
+        )
+        return {
+            "mode": mode,
+            "events": batch.events,
+            "evidence_types": sorted(types),
+            "control_ids": list(results),
+            "summary": summary,
+        }
+
+    def shutdown(self) -> None:
+        """Cancel pending debounce timers (their batches are not validated)."""
+        with self._lock:
+            batches = list(self._pending.values())
+            self._pending.clear()
+        for batch in batches:
+            if batch.timer is not None:
+                batch.timer.cancel()
+
+
+# Global instance used by the webhook router
+webhook_coalescer = WebhookCoalescer(job_manager)
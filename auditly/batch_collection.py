@@ -0,0 +1,223 @@
+"""Bounded scheduler for batch evidence collection.
+
+Each batch run gets its own thread pool, sized by the global concurrency
+limit, plus per-provider concurrency caps and start-rate limits. Requests
+are only turned into running work when a slot is free, so a 500-request
+batch starts at most ``max_concurrency`` threads and keeps the remaining
+requests as plain dicts until their turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_MAX_CONCURRENCY = 5
+
+
+@dataclass
+class BatchLimits:
+    """Concurrency and rate limits for one batch run."""
+
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    # provider -> max requests running at once (defaults to max_concurrency)
+    provider_concurrency: dict[str, int] = field(default_factory=dict)
+    # provider -> max request starts per second (unlimited if absent)
+    provider_rate_limits: dict[str, float] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Reject limits that would stall the scheduler."""
+        if self.max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        for provider, limit in self.provider_concurrency.items():
+            if limit < 1:
+                raise ValueError(f"Concurrency for {provider} must be at least 1")
+        for provider, rate in self.provider_rate_limits.items():
+            if rate <= 0:
+                raise ValueError(f"Rate limit for {provider} must be positive")
+
+    def concurrency_for(self, provider: str) -> int:
+        """Maximum concurrent requests for a provider."""
+        return min(
+            self.max_concurrency, self.provider_concurrency.get(provider, self.max_concurrency)
+        )
+
+
+def parse_provider_limits(value: str | None, cast: Callable[[str], Any] = int) -> dict[str, Any]:
+    """
+    Parse ``provider=value`` pairs from a comma-separated CLI option.
+
+    Args:
+        value: e.g. ``"github=2,gitlab=1"``
+        cast: Converter for the values (int for concurrency, float for rates)
+
+    Returns:
+        Dict of provider -> converted value
+
+    Raises:
+        ValueError: If an entry is malformed
+    """
+    limits: dict[str, Any] = {}
+    for item in (value or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        provider, sep, raw = item.partition("=")
+        if not sep or not provider.strip():
+            raise ValueError(f"Expected provider=value, got {item!r}")
+        limits[provider.strip().lower()] = cast(raw.strip())
+    return limits
+
+
+class _StartRateLimiter:
+    """Spaces out request starts for one provider."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate
+        self.next_start = 0.0
+
+    def wait_time(self, now: float) -> float:
+        return max(0.0, self.next_start - now)
+
+    def consume(self, now: float) -> None:
+        self.next_start = max(now, self.next_start) + self.interval
+
+
+async def run_batch(
+    requests: list[dict[str, Any]],
+    fn: Callable[..., Any],
+    *,
+    limits: BatchLimits | None = None,
+    timeout: float = 300,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Run ``fn(**request)`` for each request under the batch limits.
+
+    Requests are started in submission order whenever their provider has a free
+    slot and rate allowance. The ``name`` key of a request is used for events
+    (default ``request-<index>``) and is passed through to ``fn``.
+
+    Args:
+        requests: Keyword arguments for ``fn``, each with a ``provider`` key
+        fn: Blocking callable run on the batch's thread pool
+        limits: Concurrency and rate limits (defaults to BatchLimits())
+        timeout: Seconds each request may run before it is reported as failed
+
+    Yields:
+        Dicts with ``name``, ``status`` (success/failed), ``result`` or ``error``,
+        ``duration_seconds`` and ``completed``/``total`` counters, in completion order
+    """
+    limits = limits or BatchLimits()
+    total = len(requests)
+    if not total:
+        return
+
+    queues: dict[str, deque[tuple[int, dict[str, Any]]]] = {}
+    for idx, req in enumerate(requests):
+        queues.setdefault(str(req.get("provider", "")), deque()).append((idx, req))
+    running_per_provider = dict.fromkeys(queues, 0)
+    limiters = {
+        p: _StartRateLimiter(rate) for p, rate in limits.provider_rate_limits.items() if p in queues
+    }
+
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(
+        max_workers=min(limits.max_concurrency, total), thread_name_prefix="auditly-collect"
+    )
+
+    def _call(req: dict[str, Any], started: asyncio.Future) -> Any:
+        now = time.perf_counter()
+        try:
+            loop.call_soon_threadsafe(lambda: started.done() or started.set_result(now))
+        except RuntimeError:
+            # The batch was abandoned and its loop closed
+            pass
+        return fn(**req)
+
+    async def _report(
+        idx: int, req: dict[str, Any], work: asyncio.Future, started: asyncio.Future
+    ) -> dict[str, Any]:
+        name = req.get("name", f"request-{idx}")
+        event: dict[str, Any] = {"name": name}
+        # The timeout runs from when a worker thread picks the request up
+        start = await started
+        await asyncio.wait({work}, timeout=max(0.0, timeout - (time.perf_counter() - start)))
+        if not work.done():
+            event["status"] = "failed"
+            event["error"] = f"Timeout after {timeout}s"
+        elif work.exception() is not None:
+            event["status"] = "failed"
+            event["error"] = str(work.exception())
+        else:
+            event["status"] = "success"
+            event["result"] = work.result()
+        event["duration_seconds"] = time.perf_counter() - start
+        return event
+
+    # Event tasks, and the worker futures holding concurrency slots. A timed-out
+    # request is reported at once but keeps its slot until its thread returns,
+    # so the limits bound the threads actually running.
+    running: dict[asyncio.Task, str] = {}
+    occupied: dict[asyncio.Future, str] = {}
+    completed = 0
+    try:
+        while queues or running:
+            now = loop.time()
+            next_ready: float | None = None
+            while len(occupied) < limits.max_concurrency:
+                # Oldest queued request among providers that can start now
+                candidate = None
+                for provider, queue in queues.items():
+                    if running_per_provider[provider] >= limits.concurrency_for(provider):
+                        continue
+                    limiter = limiters.get(provider)
+                    if limiter is not None and (wait := limiter.wait_time(now)) > 0:
+                        next_ready = wait if next_ready is None else min(next_ready, wait)
+                        continue
+                    if candidate is None or queue[0][0] < queues[candidate][0][0]:
+                        candidate = provider
+                if candidate is None:
+                    break
+                idx, req = queues[candidate].popleft()
+                if not queues[candidate]:
+                    del queues[candidate]
+                if candidate in limiters:
+                    limiters[candidate].consume(now)
+                running_per_provider[candidate] += 1
+                started = loop.create_future()
+                work = loop.run_in_executor(executor, _call, req, started)
+                occupied[work] = candidate
+                running[asyncio.ensure_future(_report(idx, req, work, started))] = candidate
+
+            if not running and not occupied:
+                # Everything left is rate limited
+                await asyncio.sleep(next_ready or 0)
+                continue
+
+            done, _ = await asyncio.wait(
+                set(running) | set(occupied),
+                timeout=next_ready,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+            for work in done & occupied.keys():
+                running_per_provider[occupied.pop(work)] -= 1
+                if not work.cancelled():
+                    # Marks errors of timed-out requests as seen; they were reported already
+                    work.exception()
+            for task in done & running.keys():
+                del running[task]
+                completed += 1
+                event = task.result()
+                event["completed"] = completed
+                event["total"] = total
+                yield event
+    finally:
+        for task in running:
+            task.cancel()
+        # Threads that are still running finish in the background; queued work is dropped
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -71,12 +71,14 @@ def check_catalogs(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed catalog info"),
 ):
     """Validate configured OSCAL catalogs and profiles."""
-    from .oscal import OscalCatalog, OscalProfile, load_oscal
+    from .oscal import OscalCatalog, OscalProfile, catalog_registry
 
     console = Console()
 
     try:
-        cfg = AppConfig.load(config)
+        # Catalog contents are validated per file below, so one bad catalog
+        # is reported in the table instead of failing the whole config load
+        cfg = AppConfig.load(config, defer_catalog_validation=True)
     except Exception as e:
         console.print(f"[red]Error loading config:[/red] {e}")
         raise typer.Exit(code=1) from e
@@ -99,7 +101,7 @@ def check_catalogs(
 
     for name, path in catalogs_dict.items():
         try:
-            oscal_obj = load_oscal(path)
+            oscal_obj = catalog_registry.load(path)
             if oscal_obj is None:
                 table.add_row(name, "Unknown", "[red]Invalid[/red]", "Could not load", "—")
                 total_invalid += 1
@@ -231,7 +233,7 @@ def check_validator_coverage(
     profile: str | None = typer.Option(None, help="Specific profile to check (e.g., fedramp_high)"),
 ):
     """Check validator coverage across all controls in configured catalogs."""
-    from .oscal import OscalCatalog, OscalProfile, load_oscal
+    from .oscal import OscalCatalog, OscalProfile, catalog_registry
 
     console = Console()
 
@@ -262,7 +264,7 @@ def check_validator_coverage(
     table.add_column("Method", style="dim")
 
     for name, path in catalogs_dict.items():
-        oscal_obj = load_oscal(path)
+        oscal_obj = catalog_registry.load(path)
         if oscal_obj is None:
             continue
 
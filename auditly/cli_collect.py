@@ -2,80 +2,389 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
 import typer
 
-from .api.operations import collect_evidence_batch
-from .cli_common import persist_if_db, vault_from_envcfg
+from .batch_collection import DEFAULT_MAX_CONCURRENCY, BatchLimits, parse_provider_limits
+from .cli_common import get_db_session, persist_if_db, vault_from_envcfg
+from .collection_checkpoints import CheckpointStore
 from .collectors.argo import collect_argo
+from .collectors.aws.throttle import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_RETRY_MODE,
+    total_calls,
+)
 from .collectors.azure import collect_azure
+from .collectors.common import CanonicalJSONStream, GzipNDJSONStream
 from .collectors.github_actions import collect_github_actions
 from .collectors.gitlab import collect_gitlab
+from .collectors.registry import CollectorSpec, collector_registry
 from .collectors.terraform import collect_terraform
 from .config import AppConfig
 from .evidence import ArtifactRecord
+from .performance import performance_metrics
 
-# Import AWS collectors
-try:
-    from .collectors.aws import (
-        AWSClient,
-        CloudTrailCollector,
-        EC2Collector,
-        IAMCollector,
-        KMSCollector,
-        RDSCollector,
-        S3Collector,
-        VPCCollector,
-    )
+collect_app = typer.Typer(help="Collect CI/IaC evidence into vault")
 
-    AWS_AVAILABLE = True
-except ImportError:
-    AWSClient = None  # type: ignore
-    CloudTrailCollector = None  # type: ignore
-    EC2Collector = None  # type: ignore
-    IAMCollector = None  # type: ignore
-    KMSCollector = None  # type: ignore
-    RDSCollector = None  # type: ignore
-    S3Collector = None  # type: ignore
-    VPCCollector = None  # type: ignore
-    AWS_AVAILABLE = False
-
-# Import GCP collectors
-try:
-    from .collectors.gcp import (
-        CloudSQLCollector,
-        ComputeCollector,
-        GCPClient,
-        LoggingCollector,
-        StorageCollector,
-    )
-    from .collectors.gcp import (
-        IAMCollector as GCPIAMCollector,
+
+def object_metadata(metadata: dict[str, Any]) -> dict[str, str]:
+    """Vault object metadata from artifact metadata.
+
+    Object stores only accept string values, so nested values (such as API
+    call counters) are kept in the manifest only.
+    """
+    return {k: str(v) for k, v in metadata.items() if not isinstance(v, dict | list)}
+
+
+# Enough workers to collect every AWS service at once
+DEFAULT_SERVICE_WORKERS = 7
+
+AWS_INSTALL_HINT = "boto3 not installed. Install with: pip install boto3"
+GCP_INSTALL_HINT = (
+    "google-cloud libraries not installed. Install with: "
+    "pip install google-cloud-compute google-cloud-storage google-cloud-iam "
+    "google-cloud-logging google-cloud-sql google-cloud-kms"
+)
+
+
+def selected_collectors(provider: str, services: str, install_hint: str) -> list[CollectorSpec]:
+    """Collector specs for a comma-separated service list.
+
+    Only the specs are looked up; collector modules are imported when run.
+
+    Args:
+        provider: Registry provider (e.g. "aws")
+        services: Comma-separated service names from the command line
+        install_hint: Message shown when a collector's SDK is not installed
+
+    Returns:
+        One spec per distinct service, in the order given
+
+    Raises:
+        typer.Exit: If a service is unknown or its SDK is not installed
+    """
+    service_list = list(dict.fromkeys(s.strip().lower() for s in services.split(",")))
+    valid_services = collector_registry.services(provider)
+    invalid_services = [s for s in service_list if s not in valid_services]
+    if invalid_services:
+        typer.echo(
+            f"Error: Invalid services {invalid_services}. Valid: {', '.join(valid_services)}",
+            err=True,
+        )
+        raise typer.Exit(code=1)
+
+    specs = [collector_registry.get(provider, s) for s in service_list]
+    if any(spec.missing_requirements() for spec in specs):
+        typer.echo(f"Error: {install_hint}", err=True)
+        raise typer.Exit(code=1)
+    return specs
+
+
+def previous_evidence(vault: Any, key: str) -> dict[str, Any] | None:
+    """Previous evidence stored at ``key``, or None if there is none to build on.
+
+    Evidence uploaded as partial (calls failed after exhausting retries) may
+    lack resources that an incremental run would never re-describe, so it is
+    not built on either.
+    """
+    try:
+        stored = vault.get_metadata(key).get("metadata") or {}
+        evidence = vault.get_json(key)
+    except Exception:
+        return None
+    # S3 returns user metadata by name, MinIO with its x-amz-meta- header prefix
+    flags = {str(k).lower().removeprefix("x-amz-meta-"): v for k, v in stored.items()}
+    if str(flags.get("partial", "")).lower() == "true":
+        return None
+    return evidence if isinstance(evidence, dict) and "metadata" in evidence else None
+
+
+def _put_stream(
+    vault: Any,
+    key: str,
+    chunks: Iterable[bytes],
+    metadata: dict[str, Any],
+    local_path: Path | None,
+    content_type: str,
+    content_encoding: str | None = None,
+) -> None:
+    """Stream chunks to the vault, also writing them to ``local_path`` if given."""
+    local_file = None
+    if local_path is not None:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_file = local_path.open("wb")
+
+        def _tee(source: Iterable[bytes]) -> Iterator[bytes]:
+            for chunk in source:
+                local_file.write(chunk)
+                yield chunk
+
+        chunks = _tee(chunks)
+    try:
+        vault.put_stream(
+            key,
+            chunks,
+            metadata=object_metadata(metadata),
+            content_type=content_type,
+            content_encoding=content_encoding,
+        )
+    finally:
+        if local_file is not None:
+            local_file.close()
+
+
+def upload_event_stream(
+    vault: Any,
+    key: str,
+    events: Iterable[dict[str, Any]],
+    metadata: dict[str, Any],
+    local_path: Path | None = None,
+) -> ArtifactRecord:
+    """Stream events to the vault as gzip-compressed NDJSON.
+
+    Events are encoded, compressed and hashed chunk by chunk on their way to a
+    multipart upload, so memory stays flat however many events there are.
+
+    Args:
+        vault: Evidence vault to upload to
+        key: Object key (conventionally ending in ``.ndjson.gz``)
+        events: Event dicts, consumed lazily
+        metadata: Artifact metadata (``records`` and ``content_sha256`` are added)
+        local_path: Also write the compressed stream to this file (optional)
+
+    Returns:
+        ArtifactRecord for the uploaded object
+    """
+    stream = GzipNDJSONStream(events)
+    _put_stream(
+        vault,
+        key,
+        stream,
+        metadata,
+        local_path,
+        content_type="application/x-ndjson",
+        content_encoding="gzip",
     )
-    from .collectors.gcp import (
-        KMSCollector as GCPKMSCollector,
+
+    artifact_metadata = {
+        **metadata,
+        "records": stream.records,
+        "content_sha256": stream.content_sha256,
+        "content_encoding": "gzip",
+    }
+    if local_path is not None:
+        artifact_metadata["_local_path"] = str(local_path)
+    return ArtifactRecord(
+        key=key,
+        filename=Path(key).name,
+        sha256=stream.sha256,
+        size=stream.size,
+        metadata=artifact_metadata,
     )
-    from .collectors.gcp import (
-        VPCCollector as GCPVPCCollector,
+
+
+def upload_evidence_json(
+    vault: Any,
+    key: str,
+    evidence: dict[str, Any],
+    metadata: dict[str, Any],
+    local_path: Path | None = None,
+    filename: str | None = None,
+) -> ArtifactRecord:
+    """Upload an evidence document as canonical JSON in a single pass.
+
+    The document is encoded once, chunk by chunk, into both the upload and
+    the local copy, so no full-size JSON string is built and the artifact
+    hash covers exactly the bytes stored.
+
+    Args:
+        vault: Evidence vault to upload to
+        key: Object key
+        evidence: Evidence document (from ``finalize_evidence`` or a GCP collector)
+        metadata: Artifact metadata
+        local_path: Also write the document to this file (optional)
+        filename: Artifact filename (default: last component of ``key``)
+
+    Returns:
+        ArtifactRecord for the uploaded object
+    """
+    stream = CanonicalJSONStream(evidence)
+    _put_stream(vault, key, stream, metadata, local_path, content_type="application/json")
+
+    artifact_metadata = dict(metadata)
+    if local_path is not None:
+        artifact_metadata["_local_path"] = str(local_path)
+    return ArtifactRecord(
+        key=key,
+        filename=filename or Path(key).name,
+        sha256=stream.sha256,
+        size=stream.size,
+        metadata=artifact_metadata,
     )
 
-    GCP_AVAILABLE = True
 
-except ImportError:
-    GCPIAMCollector = None  # type: ignore
-    ComputeCollector = None  # type: ignore
-    StorageCollector = None  # type: ignore
-    CloudSQLCollector = None  # type: ignore
-    GCPVPCCollector = None  # type: ignore
-    GCPKMSCollector = None  # type: ignore
-    LoggingCollector = None  # type: ignore
-    GCPClient = None  # type: ignore
-    GCP_AVAILABLE = False
+def cloudtrail_event_sink(
+    collector: Any,
+    vault: Any,
+    env: str,
+    account_id: str,
+    region: str,
+    artifacts: list[ArtifactRecord],
+    checkpoints: dict[str, Any],
+    store: CheckpointStore | None = None,
+    output_dir: Path | None = None,
+    days: int = 7,
+) -> Callable[[str, Iterator[dict[str, Any]]], dict[str, Any]]:
+    """Build the ``event_sink`` for ``CloudTrailCollector.collect_all``.
+
+    Each stream's new events are uploaded as a time-partitioned artifact
+    (``.../<stream>/<start>-<end>.ndjson.gz``) and the stream's checkpoint is
+    advanced once the upload has succeeded. Streams without new events upload
+    nothing.
+
+    Args:
+        collector: CloudTrailCollector producing the streams
+        vault: Evidence vault to upload to
+        env: Environment key
+        account_id: AWS account ID
+        region: AWS region
+        artifacts: List the uploaded artifact records are appended to
+        checkpoints: Stream -> EventCursor of the previous run
+        store: Checkpoint store to advance (None disables checkpointing)
+        output_dir: Also write each partition here (optional)
+        days: Window start for streams without a checkpoint
+
+    Returns:
+        Sink returning a reference to the uploaded partition
+    """
 
-collect_app = typer.Typer(help="Collect CI/IaC evidence into vault")
+    def _sink(stream: str, events: Iterator[dict[str, Any]]) -> dict[str, Any]:
+        from .collectors.aws.cloudtrail import EVENT_HISTORY_STREAM, LATE_DELIVERY_WINDOW
+
+        since = checkpoints.get(stream)
+        window_end = datetime.utcnow()
+        if since is not None and since.event_time is not None:
+            window_start = since.event_time
+            if stream == EVENT_HISTORY_STREAM:
+                # The history is re-read from before the cursor for late events
+                window_start -= LATE_DELIVERY_WINDOW
+        else:
+            window_start = window_end - timedelta(days=days)
+
+        events = iter(events)
+        first = next(events, None)
+        record = None
+        if first is not None:
+            name = f"{window_start:%Y%m%dT%H%M%SZ}-{window_end:%Y%m%dT%H%M%SZ}.ndjson.gz"
+            key = f"evidence/{env}/aws/cloudtrail-events/{account_id}/{region}/{stream}/{name}"
+            record = upload_event_stream(
+                vault,
+                key,
+                itertools.chain([first], events),
+                metadata={
+                    "kind": "aws-cloudtrail-events",
+                    "service": "cloudtrail",
+                    "account_id": account_id,
+                    "region": region,
+                    "stream": stream,
+                    "window_start": window_start.isoformat(),
+                    "window_end": window_end.isoformat(),
+                    "collected_at": window_end.isoformat(),
+                },
+                local_path=output_dir / f"aws-cloudtrail-{stream}-{name}" if output_dir else None,
+            )
+            artifacts.append(record)
+
+        # The collector only records a cursor once the stream was read completely
+        cursor = collector.cursors.get(stream)
+        if store is not None and cursor is not None:
+            store.save(
+                "aws-cloudtrail",
+                account_id,
+                region,
+                stream,
+                last_event_time=cursor.event_time,
+                last_event_id=cursor.event_id,
+                position=cursor.to_position(),
+            )
+        if record is None:
+            return {"records": 0}
+        # The evidence references the event partition instead of embedding it
+        return {
+            "key": record.key,
+            "sha256": record.sha256,
+            "records": record.metadata["records"],
+        }
+
+    return _sink
+
+
+@contextmanager
+def cloudtrail_stream_options(
+    collector: Any,
+    vault: Any,
+    envcfg: Any,
+    env: str,
+    account_id: str,
+    region: str,
+    artifacts: list[ArtifactRecord],
+    output_dir: Path | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Open the ``collect_all`` arguments that resume CloudTrail's event streams.
+
+    Loads the checkpoints of the (account, region)'s streams from the database
+    (if configured) and yields them with a ``cloudtrail_event_sink`` that
+    uploads each stream and advances its checkpoint. The database session is
+    closed on exit.
+
+    Args:
+        collector: CloudTrailCollector to collect with
+        vault: Evidence vault to upload to
+        envcfg: Environment config (database)
+        env: Environment key
+        account_id: AWS account ID
+        region: AWS region
+        artifacts: List the uploaded event partitions are appended to
+        output_dir: Also write each partition here (optional)
+    """
+    from .collectors.aws.cloudtrail import EventCursor
+
+    db_session = get_db_session(envcfg)
+    store = CheckpointStore(db_session) if db_session is not None else None
+    checkpoints = {}
+    try:
+        if store is not None:
+            checkpoints = {
+                cp.stream: EventCursor.from_checkpoint(cp)
+                for cp in store.list_streams("aws-cloudtrail", account_id, region)
+            }
+        yield {
+            "event_sink": cloudtrail_event_sink(
+                collector,
+                vault,
+                env,
+                account_id,
+                region,
+                artifacts,
+                checkpoints,
+                store=store,
+                output_dir=output_dir,
+            ),
+            "checkpoints": checkpoints,
+        }
+    finally:
+        if db_session is not None:
+            db_session.close()
 
 
 @collect_app.command(
@@ -86,9 +395,23 @@ def collect_batch_cmd(
         ..., exists=True, help="Path to JSON file containing list of collect requests"
     ),
     timeout: int = typer.Option(300, help="Timeout per request in seconds"),
+    json_lines: bool = typer.Option(
+        False, "--json-lines", help="Print one JSON object per completed request (NDJSON)"
+    ),
+    max_concurrency: int = typer.Option(
+        DEFAULT_MAX_CONCURRENCY, min=1, help="Maximum requests collected at once"
+    ),
+    provider_concurrency: str = typer.Option(
+        "", help="Per-provider concurrency caps, e.g. 'github=2,gitlab=1'"
+    ),
+    rate_limit: str = typer.Option(
+        "", help="Per-provider request starts per second, e.g. 'github=0.5'"
+    ),
 ):
     """Run multiple collection requests concurrently using the new batch helper.
 
+    Each request's outcome is printed as soon as it completes; a summary line follows.
+
     The input file must be a JSON list of objects matching the /collect schema. Example:
     [
         {"config_path": "config.yaml", "environment": "prod", "provider": "terraform", "terraform_plan_path": "plan.json"},
@@ -103,13 +426,40 @@ def collect_batch_cmd(
     if not isinstance(payload, list) or not payload:
         raise typer.BadParameter("requests file must be a non-empty JSON list")
 
-    result = collect_evidence_batch(payload, timeout=timeout)
+    try:
+        limits = BatchLimits(
+            max_concurrency=max_concurrency,
+            provider_concurrency=parse_provider_limits(provider_concurrency, int),
+            provider_rate_limits=parse_provider_limits(rate_limit, float),
+        )
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+
+    # Imported here: the API package loads the FastAPI app
+    from .api.operations import iter_collect_evidence_batch
+
+    succeeded = failed = 0
+    for event in iter_collect_evidence_batch(payload, timeout=timeout, limits=limits):
+        if event["status"] == "success":
+            succeeded += 1
+        else:
+            failed += 1
+        if json_lines:
+            typer.echo(json.dumps(event, default=str))
+        elif event["status"] == "success":
+            typer.echo(
+                f"[{event['completed']}/{event['total']}] {event['name']}: "
+                f"{event['artifacts_uploaded']} artifacts -> {event['manifest_key']} "
+                f"({event['duration_seconds']:.1f}s)"
+            )
+        else:
+            typer.echo(
+                f"[{event['completed']}/{event['total']}] {event['name']}: FAILED "
+                f"{event['error']} ({event['duration_seconds']:.1f}s)",
+                err=True,
+            )
 
-    typer.echo(f"Succeeded: {result.get('success', 0)} | Failed: {result.get('failed', 0)}")
-    if result.get("errors"):
-        typer.echo(f"Errors: {result['errors']}")
-    if result.get("results"):
-        typer.echo(f"Results keys: {list(result['results'].keys())}")
+    typer.echo(f"Succeeded: {succeeded} | Failed: {failed}")
 
 
 @collect_app.command("terraform", help="Upload Terraform plan/apply and write manifest")
@@ -336,20 +686,52 @@ def collect_aws_cmd(
         "iam,ec2,s3,cloudtrail,vpc,rds,kms", help="Comma-separated services to collect"
     ),
     output_dir: Path | None = typer.Option(None, help="Output directory for evidence files"),
+    iam_bulk: bool = typer.Option(
+        False,
+        help="Collect IAM from account authorization details and the credential report "
+        "(a few calls instead of several per user/role/group)",
+    ),
+    max_pool_connections: int = typer.Option(
+        DEFAULT_MAX_POOL_CONNECTIONS,
+        help="HTTP connections per AWS service client (bounds concurrent detail calls)",
+    ),
+    service_concurrency: str | None = typer.Option(
+        None, help="Per-service concurrent call limits, e.g. s3=16,kms=4"
+    ),
+    max_attempts: int = typer.Option(
+        DEFAULT_MAX_ATTEMPTS, help="Attempts per AWS API call before giving up"
+    ),
+    retry_mode: str = typer.Option(
+        DEFAULT_RETRY_MODE, help="botocore retry mode: adaptive, standard or legacy"
+    ),
+    rate_limits: str | None = typer.Option(
+        None, help="Per-service API calls per second across all threads, e.g. iam=5,ec2=20"
+    ),
+    cloudtrail_source: str = typer.Option(
+        "api",
+        help="CloudTrail event source: api (LookupEvents) or s3 (each trail's log objects, "
+        "read in parallel)",
+    ),
+    incremental: bool = typer.Option(
+        False,
+        help="For ec2, vpc, rds and kms, re-describe only resources AWS Config reports as "
+        "changed since the previous evidence and merge them into it",
+    ),
+    service_workers: int = typer.Option(
+        DEFAULT_SERVICE_WORKERS, help="AWS services collected concurrently (1: one at a time)"
+    ),
 ):
     """Collect evidence from AWS services.
 
     Supported services: iam, ec2, s3, cloudtrail, vpc, rds, kms
     """
-    if not AWS_AVAILABLE:
-        typer.echo("Error: boto3 not installed. Install with: pip install boto3", err=True)
-        raise typer.Exit(code=1)
+    specs = {spec.service: spec for spec in selected_collectors("aws", services, AWS_INSTALL_HINT)}
+    service_list = list(specs)
 
-    import json
-    import tempfile
     from datetime import datetime
 
-    from .evidence import ArtifactRecord, EvidenceManifest
+    from .collectors.aws.client import AWSClient
+    from .evidence import EvidenceManifest
 
     cfg = AppConfig.load(config)
     if env not in cfg.environments:
@@ -357,153 +739,148 @@ def collect_aws_cmd(
     envcfg = cfg.environments[env]
     vault = vault_from_envcfg(envcfg)
 
-    # Parse services
-    service_list = [s.strip().lower() for s in services.split(",")]
-    valid_services = ["iam", "ec2", "s3", "cloudtrail", "vpc", "rds", "kms"]
-    invalid_services = [s for s in service_list if s not in valid_services]
-    if invalid_services:
-        typer.echo(
-            f"Error: Invalid services {invalid_services}. Valid: {', '.join(valid_services)}",
-            err=True,
-        )
-        raise typer.Exit(code=1)
+    try:
+        concurrency = parse_provider_limits(service_concurrency, int)
+        rates = parse_provider_limits(rate_limits, float)
+    except ValueError as e:
+        raise typer.BadParameter(str(e)) from e
+    if cloudtrail_source not in ("api", "s3"):
+        raise typer.BadParameter("cloudtrail-source must be 'api' or 's3'")
 
     # Initialize AWS client
     try:
-        if AWSClient is not None:
-            client = AWSClient(region=region, profile_name=profile)
-        else:
-            raise RuntimeError("AWSClient is not available")
+        client = AWSClient(
+            region=region,
+            profile_name=profile,
+            max_pool_connections=max_pool_connections,
+            service_concurrency=concurrency,
+            max_attempts=max_attempts,
+            retry_mode=retry_mode,
+            rate_limits=rates,
+        )
         account_id = client.get_account_id()
         typer.echo(f"Connected to AWS account: {account_id} (region: {region})")
     except Exception as e:
         typer.echo(f"Error connecting to AWS: {e}", err=True)
         raise typer.Exit(code=1) from e
 
-    # Collect evidence
+    # Collect evidence. Services are independent, so they run concurrently;
+    # call scopes keep each service's API call counters apart.
     artifacts: list[ArtifactRecord] = []
     collected_at = datetime.utcnow().isoformat()
-
-    for service in service_list:
-        typer.echo(f"Collecting evidence from AWS {service}...")
-
-        evidence = None
-        summary = None
-        try:
-            if service == "iam":
-                if IAMCollector is not None:
-                    iam_collector = IAMCollector(client)
-                else:
-                    raise RuntimeError("IAMCollector is not available")
-                evidence = iam_collector.collect_all()
-                summary = (
-                    f"users={len(evidence.get('users', []))}, "
-                    f"roles={len(evidence.get('roles', []))}, "
-                    f"policies={len(evidence.get('policies', []))}"
-                )
-
-            elif service == "ec2":
-                if EC2Collector is not None:
-                    ec2_collector = EC2Collector(client)
-                else:
-                    raise RuntimeError("EC2Collector is not available")
-                evidence = ec2_collector.collect_all()
-                summary = (
-                    f"instances={len(evidence.get('instances', []))}, "
-                    f"sg={len(evidence.get('security_groups', []))}, "
-                    f"volumes={len(evidence.get('volumes', []))}"
-                )
-
-            elif service == "s3":
-                if S3Collector is not None:
-                    s3_collector = S3Collector(client)
-                else:
-                    raise RuntimeError("S3Collector is not available")
-                evidence = s3_collector.collect_all()
-                summary = (
-                    f"buckets={len(evidence.get('buckets', []))}, "
-                    f"policies={len(evidence.get('policies', []))}"
-                )
-
-            elif service == "cloudtrail":
-                if CloudTrailCollector is not None:
-                    cloudtrail_collector = CloudTrailCollector(client)
-                else:
-                    raise RuntimeError("CloudTrailCollector is not available")
-                evidence = cloudtrail_collector.collect_all()
+    # CloudTrail uploads event streams (and advances checkpoints) while collecting
+    stream_artifacts: dict[str, list[ArtifactRecord]] = {s: [] for s in service_list}
+
+    def collect_service(service: str) -> tuple[Any, str | None, Any, float]:
+        spec = specs[service]
+        previous = None
+        if incremental and spec.incremental:
+            previous = previous_evidence(vault, f"evidence/{env}/{spec.kind}-{account_id}.json")
+        start = time.perf_counter()
+        with client.call_scope(service):
+            # The collector module (and its SDK) is imported on first use
+            collector_cls = spec.load()
+            if service == "cloudtrail":
+                cloudtrail_collector = collector_cls(client)
+                # Resume each event stream after the previous run's checkpoint
+                with cloudtrail_stream_options(
+                    cloudtrail_collector,
+                    vault,
+                    envcfg,
+                    env,
+                    account_id,
+                    region,
+                    stream_artifacts[service],
+                    output_dir=output_dir,
+                ) as options:
+                    evidence = cloudtrail_collector.collect_all(source=cloudtrail_source, **options)
+                history = evidence["event_history"]
+                streams = history.values() if cloudtrail_source == "s3" else [history]
                 summary = (
                     f"trails={len(evidence.get('trails', []))}, "
-                    f"events={len(evidence.get('events', []))}"
-                )
-
-            elif service == "vpc":
-                if VPCCollector is not None:
-                    vpc_collector = VPCCollector(client)
-                else:
-                    raise RuntimeError("VPCCollector is not available")
-                evidence = vpc_collector.collect_all()
-                summary = (
-                    f"flow_logs={len(evidence.get('flow_logs', []))}, "
-                    f"nacls={len(evidence.get('nacls', []))}"
-                )
-
-            elif service == "rds":
-                if RDSCollector is not None:
-                    rds_collector = RDSCollector(client)
-                else:
-                    raise RuntimeError("RDSCollector is not available")
-                evidence = rds_collector.collect_all()
-                summary = (
-                    f"instances={len(evidence.get('instances', []))}, "
-                    f"clusters={len(evidence.get('clusters', []))}"
-                )
-
-            elif service == "kms":
-                if KMSCollector is not None:
-                    kms_collector = KMSCollector(client)
-                else:
-                    raise RuntimeError("KMSCollector is not available")
-                evidence = kms_collector.collect_all()
-                summary = (
-                    f"keys={len(evidence.get('keys', []))}, "
-                    f"policies={len(evidence.get('policies', []))}"
+                    f"new_events={sum(h['records'] for h in streams)}"
                 )
+                return evidence, summary, None, time.perf_counter() - start
 
-            if evidence is not None:
-                # Save evidence to temp file or output dir
-                if output_dir:
-                    output_dir.mkdir(parents=True, exist_ok=True)
-                    evidence_file = output_dir / f"aws-{service}-{collected_at}.json"
-                    evidence_file.write_text(json.dumps(evidence, indent=2, default=str))
-                else:
-                    evidence_file = Path(tempfile.mktemp(suffix=".json"))
-                    evidence_file.write_text(json.dumps(evidence, indent=2, default=str))
-
-                # Create artifact record
-                artifact = ArtifactRecord(
-                    key=f"evidence/{env}/aws-{service}-{account_id}.json",
-                    filename=evidence_file.name,
-                    sha256=evidence["metadata"]["sha256"],
-                    size=evidence_file.stat().st_size,
-                    metadata={
-                        "kind": f"aws-{service}",
+            collector = (
+                collector_cls(client, bulk=iam_bulk) if service == "iam" else collector_cls(client)
+            )
+            if spec.incremental:
+                evidence = collector.collect_all(previous=previous)
+            else:
+                evidence = collector.collect_all()
+            changes = getattr(collector, "changes", None)
+        return evidence, spec.summarize(evidence), changes, time.perf_counter() - start
+
+    workers = max(1, min(service_workers, len(service_list)))
+    if workers > 1:
+        performance_metrics.record_parallel_collection()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auditly-collect") as pool:
+        futures = {}
+        for service in service_list:
+            typer.echo(f"Collecting evidence from AWS {service}...")
+            futures[service] = pool.submit(collect_service, service)
+
+        # Results are recorded in service order so the manifest is deterministic
+        for service, future in futures.items():
+            try:
+                try:
+                    evidence, summary, changes, duration = future.result()
+                finally:
+                    # Event streams uploaded before a failure still belong in the manifest
+                    artifacts.extend(stream_artifacts[service])
+                performance_metrics.record_collection(f"aws-{service}", duration)
+
+                if evidence is not None:
+                    # Calls that exhausted their retries were skipped by the collector
+                    calls = total_calls(client.call_stats(service))
+                    partial = calls["exhausted"] > 0
+
+                    metadata: dict[str, Any] = {
+                        "kind": specs[service].kind,
                         "service": service,
                         "account_id": account_id,
                         "region": region,
                         "collected_at": collected_at,
-                        "_local_path": str(evidence_file),
-                    },
-                )
-                artifacts.append(artifact)
-
-                # Upload to vault
-                vault.put_json(artifact.key, json.dumps(evidence), metadata=artifact.metadata)
-                if summary is not None:
-                    typer.echo(f"  ✓ {summary}")
-
-        except Exception as e:
-            typer.echo(f"  ✗ Error collecting {service}: {e}", err=True)
-            continue
+                        "partial": partial,
+                        "api_calls": calls,
+                    }
+                    if changes is not None:
+                        metadata["incremental"] = True
+                        metadata["changed_resources"] = changes.count()
+
+                    # One serialization pass writes the local copy (if any) and the upload
+                    evidence_file = None
+                    if output_dir:
+                        evidence_file = output_dir / f"aws-{service}-{collected_at}.json"
+                    artifacts.append(
+                        upload_evidence_json(
+                            vault,
+                            f"evidence/{env}/{specs[service].kind}-{account_id}.json",
+                            evidence,
+                            metadata,
+                            local_path=evidence_file,
+                        )
+                    )
+                    typer.echo(f"  ✓ {service}: {summary} ({duration:.1f}s)")
+                    if changes is not None:
+                        typer.echo(
+                            f"    incremental: {changes.count()} changed resource(s) re-described"
+                        )
+                    if calls["throttles"]:
+                        typer.echo(
+                            f"    throttled {calls['throttles']} time(s), "
+                            f"{calls['retries']} retr{'y' if calls['retries'] == 1 else 'ies'}"
+                        )
+                    if partial:
+                        typer.echo(
+                            f"  ⚠ Partial evidence: {calls['exhausted']} {service} call(s) "
+                            "failed after exhausting retries",
+                            err=True,
+                        )
+            except Exception as e:
+                typer.echo(f"  ✗ Error collecting {service}: {e}", err=True)
+                continue
 
     if not artifacts:
         typer.echo("No evidence collected.", err=True)
@@ -533,6 +910,141 @@ def collect_aws_cmd(
         typer.echo(f"✓ Evidence files: {output_dir}")
 
 
+@collect_app.command("aws-org", help="Collect AWS evidence across accounts and regions")
+def collect_aws_org_cmd(
+    config: Path = typer.Option(..., exists=True, help="Path to config.yaml"),
+    env: str = typer.Option(..., help="Environment key (e.g., production)"),
+    accounts: str = typer.Option(
+        "org", help="Comma-separated account IDs, or 'org' for every active organization account"
+    ),
+    role_name: str = typer.Option(
+        "OrganizationAccountAccessRole", help="Role to assume in each account"
+    ),
+    external_id: str | None = typer.Option(None, help="External ID for the assumed role"),
+    regions: str | None = typer.Option(
+        None, help="Comma-separated regions (default: every enabled region per account)"
+    ),
+    region: str = typer.Option("us-east-1", help="Home region for STS and global services"),
+    profile: str | None = typer.Option(None, help="AWS CLI profile of the caller"),
+    services: str = typer.Option(
+        "iam,ec2,s3,cloudtrail,vpc,rds,kms", help="Comma-separated services to collect"
+    ),
+    max_concurrency: int = typer.Option(
+        16, help="Partitions (account x region) collected at once across the sweep"
+    ),
+    output_dir: Path | None = typer.Option(None, help="Also write partition evidence here"),
+):
+    """Sweep AWS accounts and regions, uploading each partition as it completes.
+
+    Regional services (ec2, vpc, rds, kms, cloudtrail) are collected per
+    (account, region); iam and s3 once per account. Each partition becomes one
+    artifact keyed evidence/<env>/aws/<account>/<region>.json. CloudTrail events
+    are uploaded as event stream partitions and resume from their checkpoints,
+    as with ``collect aws``.
+    """
+    service_list = [spec.service for spec in selected_collectors("aws", services, AWS_INSTALL_HINT)]
+
+    from datetime import datetime
+
+    from .collectors.aws.client import AWSClient
+    from .collectors.aws.org import list_organization_accounts, sweep
+    from .evidence import EvidenceManifest
+
+    cfg = AppConfig.load(config)
+    if env not in cfg.environments:
+        raise typer.BadParameter(f"Unknown environment: {env}")
+    envcfg = cfg.environments[env]
+    vault = vault_from_envcfg(envcfg)
+
+    region_list = [r.strip() for r in regions.split(",") if r.strip()] if regions else None
+
+    try:
+        client = AWSClient(region=region, profile_name=profile)
+        if accounts.strip().lower() == "org":
+            account_ids = list_organization_accounts(client)
+        else:
+            account_ids = [a.strip() for a in accounts.split(",") if a.strip()]
+    except Exception as e:
+        typer.echo(f"Error connecting to AWS: {e}", err=True)
+        raise typer.Exit(code=1) from e
+    typer.echo(f"Sweeping {len(account_ids)} account(s), services: {', '.join(service_list)}")
+
+    artifacts: list[ArtifactRecord] = []
+    failed = 0
+    collected_at = datetime.utcnow().isoformat()
+    # Event stream partitions uploaded by each sweep partition's CloudTrail collector
+    stream_artifacts: dict[str, list[ArtifactRecord]] = {}
+
+    def collect_options(service: str, collector: Any, partition: Any):
+        if service != "cloudtrail":
+            return nullcontext({})
+        return cloudtrail_stream_options(
+            collector,
+            vault,
+            envcfg,
+            env,
+            partition.account_id,
+            partition.region,
+            stream_artifacts.setdefault(partition.key, []),
+            output_dir=output_dir,
+        )
+
+    for result in sweep(
+        client,
+        account_ids,
+        service_list,
+        role_name=role_name,
+        external_id=external_id,
+        regions=region_list,
+        max_concurrency=max_concurrency,
+        collect_options=collect_options,
+    ):
+        part = result.partition
+        progress = f"[{result.completed}/{result.total}] {part.key}"
+        # Event streams uploaded before a failure still belong in the manifest
+        artifacts.extend(stream_artifacts.pop(part.key, []))
+        if result.evidence is None:
+            failed += 1
+            typer.echo(f"  ✗ {progress}: {'; '.join(result.errors.values())}", err=True)
+            continue
+
+        filename = f"aws-{part.account_id}-{part.region}.json"
+        # Upload now so the partition's evidence can be released
+        artifact = upload_evidence_json(
+            vault,
+            f"evidence/{env}/aws/{part.account_id}/{part.region}.json",
+            result.evidence,
+            {
+                "kind": "aws-partition",
+                "services": sorted(result.evidence["services"]),
+                "account_id": part.account_id,
+                "region": part.region,
+                "collected_at": collected_at,
+            },
+            local_path=output_dir / filename if output_dir else None,
+            filename=filename,
+        )
+        artifacts.append(artifact)
+        errors = f" (errors: {', '.join(result.errors)})" if result.errors else ""
+        typer.echo(f"  ✓ {progress} in {result.duration_seconds:.1f}s{errors}")
+
+    if not artifacts:
+        typer.echo("No evidence collected.", err=True)
+        raise typer.Exit(code=1)
+
+    manifest = EvidenceManifest.create(
+        env,
+        artifacts,
+        notes=f"AWS organization sweep: {len(account_ids)} accounts, {', '.join(service_list)}",
+    )
+    manifest_key = f"manifests/{env}/aws-org-manifest.json"
+    vault.put_json(manifest_key, manifest.to_json(), metadata={"kind": "evidence-manifest"})
+    persist_if_db(envcfg, env, manifest, artifacts)
+
+    typer.echo(f"\n✓ Uploaded {len(artifacts)} partition(s), {failed} failed")
+    typer.echo(f"✓ Manifest: {manifest_key}")
+
+
 @collect_app.command("gcp", help="Collect GCP evidence (IAM, Compute, Storage, etc.)")
 def collect_gcp_cmd(
     config: Path = typer.Option(..., exists=True, help="Path to config.yaml"),
@@ -552,20 +1064,13 @@ def collect_gcp_cmd(
 
     Supported services: iam, compute, storage, sql, vpc, kms, logging
     """
-    if not GCP_AVAILABLE:
-        typer.echo(
-            "Error: google-cloud libraries not installed. Install with: "
-            "pip install google-cloud-compute google-cloud-storage google-cloud-iam "
-            "google-cloud-logging google-cloud-sql google-cloud-kms",
-            err=True,
-        )
-        raise typer.Exit(code=1)
+    specs = selected_collectors("gcp", services, GCP_INSTALL_HINT)
+    service_list = [spec.service for spec in specs]
 
-    import json
-    import tempfile
     from datetime import datetime
 
-    from .evidence import ArtifactRecord, EvidenceManifest
+    from .collectors.gcp.client import GCPClient
+    from .evidence import EvidenceManifest
 
     cfg = AppConfig.load(config)
     if env not in cfg.environments:
@@ -573,26 +1078,12 @@ def collect_gcp_cmd(
     envcfg = cfg.environments[env]
     vault = vault_from_envcfg(envcfg)
 
-    # Parse services
-    service_list = [s.strip().lower() for s in services.split(",")]
-    valid_services = ["iam", "compute", "storage", "sql", "vpc", "kms", "logging"]
-    invalid_services = [s for s in service_list if s not in valid_services]
-    if invalid_services:
-        typer.echo(
-            f"Error: Invalid services {invalid_services}. Valid: {', '.join(valid_services)}",
-            err=True,
-        )
-        raise typer.Exit(code=1)
-
     # Initialize GCP client
     try:
-        if GCPClient is not None:
-            client = GCPClient(
-                project_id=project_id,
-                credentials_path=str(credentials_path) if credentials_path else None,
-            )
-        else:
-            raise RuntimeError("GCPClient is not available")
+        client = GCPClient(
+            project_id=project_id,
+            credentials_path=str(credentials_path) if credentials_path else None,
+        )
         project_id = client.project_id
         typer.echo(f"Connected to GCP project: {project_id}")
     except Exception as e:
@@ -603,115 +1094,35 @@ def collect_gcp_cmd(
     artifacts: list[ArtifactRecord] = []
     collected_at = datetime.utcnow().isoformat()
 
-    for service in service_list:
+    for spec in specs:
+        service = spec.service
         typer.echo(f"Collecting evidence from GCP {service}...")
 
-        evidence = None
-        summary = None
         try:
-            # Use separate variables for each collector type to avoid type conflicts
-            if service == "iam":
-                if GCPIAMCollector is not None:
-                    gcp_iam_collector = GCPIAMCollector(client)
-                else:
-                    raise RuntimeError("GCPIAMCollector is not available")
-                evidence = gcp_iam_collector.collect_all()
-                summary = (
-                    f"service_accounts={len(evidence.get('service_accounts', []))}, "
-                    f"roles={len(evidence.get('custom_roles', []))}"
-                )
-
-            elif service == "compute":
-                if ComputeCollector is not None:
-                    compute_collector = ComputeCollector(client)
-                else:
-                    raise RuntimeError("ComputeCollector is not available")
-                evidence = compute_collector.collect_all()
-                summary = (
-                    f"instances={len(evidence.get('instances', []))}, "
-                    f"disks={len(evidence.get('disks', []))}, "
-                    f"firewalls={len(evidence.get('firewalls', []))}"
-                )
-
-            elif service == "storage":
-                if StorageCollector is not None:
-                    storage_collector = StorageCollector(client)
-                else:
-                    raise RuntimeError("StorageCollector is not available")
-                evidence = storage_collector.collect_all()
-                summary = f"buckets={len(evidence.get('buckets', []))}"
-
-            elif service == "sql":
-                if CloudSQLCollector is not None:
-                    sql_collector = CloudSQLCollector(client)
-                else:
-                    raise RuntimeError("CloudSQLCollector is not available")
-                evidence = sql_collector.collect_all()
-                summary = f"instances={len(evidence.get('instances', []))}"
-
-            elif service == "vpc":
-                if GCPVPCCollector is not None:
-                    gcp_vpc_collector = GCPVPCCollector(client)
-                else:
-                    raise RuntimeError("GCPVPCCollector is not available")
-                evidence = gcp_vpc_collector.collect_all()
-                summary = (
-                    f"networks={len(evidence.get('networks', []))}, "
-                    f"subnets={len(evidence.get('subnetworks', []))}"
-                )
-
-            elif service == "kms":
-                if GCPKMSCollector is not None:
-                    gcp_kms_collector = GCPKMSCollector(client)
-                else:
-                    raise RuntimeError("GCPKMSCollector is not available")
-                evidence = gcp_kms_collector.collect_all()
-                summary = (
-                    f"key_rings={len(evidence.get('key_rings', []))}, "
-                    f"keys={len(evidence.get('crypto_keys', []))}"
-                )
-
-            elif service == "logging":
-                if LoggingCollector is not None:
-                    logging_collector = LoggingCollector(client)
-                else:
-                    raise RuntimeError("LoggingCollector is not available")
-                evidence = logging_collector.collect_all()
-                summary = (
-                    f"sinks={len(evidence.get('sinks', []))}, "
-                    f"metrics={len(evidence.get('metrics', []))}"
-                )
+            # The collector module (and its SDK) is imported on first use
+            evidence = spec.load()(client).collect_all()
+            summary = spec.summarize(evidence)
 
             if evidence is not None:
-                # Save evidence to temp file or output dir
+                # One serialization pass writes the local copy (if any) and the upload
+                evidence_file = None
                 if output_dir:
-                    output_dir.mkdir(parents=True, exist_ok=True)
                     evidence_file = output_dir / f"gcp-{service}-{collected_at}.json"
-                    evidence_file.write_text(json.dumps(evidence, indent=2, default=str))
-                else:
-                    evidence_file = Path(tempfile.mktemp(suffix=".json"))
-                    evidence_file.write_text(json.dumps(evidence, indent=2, default=str))
-
-                # Create artifact record
-                artifact = ArtifactRecord(
-                    key=f"evidence/{env}/gcp-{service}-{project_id}.json",
-                    filename=f"gcp-{service}-{project_id}.json",
-                    sha256=evidence["metadata"]["sha256"],
-                    size=evidence_file.stat().st_size,
-                    metadata={
-                        "kind": f"gcp-{service}",
-                        "service": service,
-                        "project_id": project_id,
-                        "collected_at": collected_at,
-                        "_local_path": str(evidence_file),
-                    },
+                artifacts.append(
+                    upload_evidence_json(
+                        vault,
+                        f"evidence/{env}/{spec.kind}-{project_id}.json",
+                        evidence,
+                        {
+                            "kind": spec.kind,
+                            "service": service,
+                            "project_id": project_id,
+                            "collected_at": collected_at,
+                        },
+                        local_path=evidence_file,
+                    )
                 )
-                artifacts.append(artifact)
-
-                # Upload to vault
-                vault.put_json(artifact.key, json.dumps(evidence), metadata=artifact.metadata)
-                if summary is not None:
-                    typer.echo(f"  ✓ {summary}")
+                typer.echo(f"  ✓ {summary}")
 
         except Exception as e:
             typer.echo(f"  ✗ Error collecting {service}: {e}", err=True)
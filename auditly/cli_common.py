@@ -5,19 +5,22 @@ from __future__ import annotations
 from collections.abc import Iterable
 
 from rich import print
-from sqlalchemy import func
 
 from .config import MinioStorageConfig, S3StorageConfig
 from .db import get_sync_session, init_db_sync
-from .db.models import Evidence, EvidenceManifestEntry, EvidenceVersion, System
+from .db.models import Evidence, EvidenceManifestEntry, System
 from .db.models import EvidenceManifest as DBManifest
-from .storage.minio_backend import MinioEvidenceVault
-from .storage.s3_backend import S3EvidenceVault
+from .evidence_versions import EvidenceVersionStore
 
 
 def vault_from_envcfg(envcfg):
-    """Return a storage vault instance based on the environment config."""
+    """Return a storage vault instance based on the environment config.
+
+    Only the selected backend's client library (minio or boto3) is imported.
+    """
     if isinstance(envcfg.storage, MinioStorageConfig):
+        from .storage.minio_backend import MinioEvidenceVault
+
         return MinioEvidenceVault(
             endpoint=envcfg.storage.endpoint,
             bucket=envcfg.storage.bucket,
@@ -26,6 +29,8 @@ def vault_from_envcfg(envcfg):
             secure=envcfg.storage.secure,
         )
     if isinstance(envcfg.storage, S3StorageConfig):
+        from .storage.s3_backend import S3EvidenceVault
+
         return S3EvidenceVault(
             bucket=envcfg.storage.bucket,
             region=envcfg.storage.region,
@@ -39,7 +44,7 @@ def get_db_session(envcfg):
     if not getattr(envcfg, "database_url", None):
         return None
     try:
-        init_db_sync(envcfg.database_url)
+        init_db_sync(envcfg.database_url, **envcfg.database_pool.model_dump())
         return get_sync_session()
     except Exception as exc:
         print(f"[yellow]Database not available; continuing without DB persistence: {exc}")
@@ -79,13 +84,6 @@ def persist_manifest_and_artifacts(
         session.add(ev)
         session.flush()
 
-        next_version = (
-            session.query(func.coalesce(func.max(EvidenceVersion.version), 0))
-            .filter(EvidenceVersion.evidence_id == ev.id)
-            .scalar()
-            or 0
-        ) + 1
-
         version_payload = {
             "key": a.key,
             "filename": a.filename,
@@ -94,15 +92,13 @@ def persist_manifest_and_artifacts(
             "metadata": cleaned_metadata,
         }
 
-        version = EvidenceVersion(
-            evidence=ev,
-            version=next_version,
-            data=version_payload,
-            collected_at=collected_dt,
+        EvidenceVersionStore(session).add_version(
+            ev,
+            version_payload,
             collector_version=getattr(manifest, "version", None),
+            collected_at=collected_dt,
             attributes={"source": "cli_collect", "environment": env},
         )
-        session.add(version)
         evidence_rows.append(ev)
 
     db_manifest = DBManifest(
@@ -37,3 +37,37 @@ def db_migrate_from_files(
         manifest_dir, env="default", database_url=database_url, env_description=None
     )
     print(f"[green]Migrated {count} manifests to database")
+
+
+@db_app.command(
+    "compact-versions", help="Re-encode evidence version history as keyframes plus deltas"
+)
+def db_compact_versions(
+    database_url: str = typer.Option(..., help="Database URL for connection"),
+    keyframe_interval: int = typer.Option(10, min=1, help="Store a full snapshot every N versions"),
+    evidence_id: int | None = typer.Option(None, help="Only compact this evidence record"),
+    dry_run: bool = typer.Option(False, help="Report savings without writing changes"),
+):
+    """Compact stored evidence versions and report the storage reduction."""
+    from .db import get_sync_session, init_db_sync
+    from .evidence_versions import EvidenceVersionStore
+
+    init_db_sync(database_url)
+    with get_sync_session() as session:
+        stats = EvidenceVersionStore(session, keyframe_interval=keyframe_interval).compact(
+            evidence_id=evidence_id
+        )
+        if dry_run:
+            session.rollback()
+        else:
+            session.commit()
+
+    print(
+        f"[green]{'Would compact' if dry_run else 'Compacted'} {stats['versions']} versions "
+        f"across {stats['evidence_records']} evidence records "
+        f"({stats['keyframes']} keyframes, {stats['deltas']} deltas)"
+    )
+    print(
+        f"Payload bytes: {stats['bytes_before']} -> {stats['bytes_after']} "
+        f"({stats['reduction_percent']}% reduction)"
+    )
@@ -8,8 +8,8 @@ import typer
 
 from .config import AppConfig
 from .evidence import ArtifactRecord, EvidenceManifest
+from .manifest_index import DEFAULT_STAGING_DIR, manifest_index
 from .mapping import ControlMapping, compute_control_coverage, match_evidence_to_controls
-from .oscal import OscalCatalog, OscalProfile, load_oscal
 from .reporting.report import control_coverage_placeholder, readiness_summary, write_html
 from .reporting.validation_reports import generate_auditor_report, generate_engineer_report
 from .validators import validate_controls
@@ -25,7 +25,7 @@ def report_readiness(
     out: Path = typer.Option(Path("report.html"), help="Output HTML path"),
 ):
     """Generate an HTML readiness report for compliance evidence in the given environment."""
-    staging = Path(".auditly_manifests")
+    staging = DEFAULT_STAGING_DIR
     staging.mkdir(exist_ok=True)
     if not any(staging.glob(f"{env}-*.json")):
         dummy = EvidenceManifest.create(
@@ -33,41 +33,12 @@ def report_readiness(
         )
         (staging / f"{env}-dummy.json").write_text(dummy.to_json())
 
-    manifests = []
-    for p in staging.glob(f"{env}-*.json"):
-        import json as _json
-
-        data = _json.loads(p.read_text())
-        m = EvidenceManifest(
-            version=data["version"],
-            environment=data["environment"],
-            created_at=data["created_at"],
-            artifacts=[ArtifactRecord(**a) for a in data["artifacts"]],
-            overall_hash=data.get("overall_hash"),
-            notes=data.get("notes"),
-        )
-        manifests.append(m)
+    manifests = manifest_index.manifests(env, staging)
 
     summary = readiness_summary(manifests)
     try:
         cfg = AppConfig.load(config)
-        control_ids = []
-        for _, cat_path in cfg.catalogs.get_all_catalogs().items():
-            oscal_obj = load_oscal(cat_path)
-            if isinstance(oscal_obj, OscalCatalog):
-                control_ids.extend(oscal_obj.control_ids())
-            elif isinstance(oscal_obj, OscalProfile):
-                imported = oscal_obj.imported_control_ids()
-                if imported:
-                    control_ids.extend(imported)
-
-        seen = set()
-        deduped = []
-        for x in control_ids:
-            if x not in seen:
-                deduped.append(x)
-                seen.add(x)
-        control_ids = deduped
+        control_ids = list(cfg.catalogs.resolve_control_ids())
 
         mapping_path = Path("mapping.yaml")
         if not mapping_path.exists():
@@ -7,7 +7,7 @@ from rich import print
 from rich.table import Table
 
 from .config import AppConfig
-from .db import get_async_session, init_db_async
+from .db import dispose_async_engine, get_async_session, init_db_async
 from .db.repository import Repository
 from .scheduler import runner
 
@@ -37,6 +37,49 @@ def once(
     print("[green]Validation job completed[/green]")
 
 
+@scheduler_app.command("plan")
+def plan(
+    config: str = typer.Option("config.yaml", help="Path to config file"),
+    env: str = typer.Option("production", help="Environment name"),
+    default_days: int | None = typer.Option(
+        None, help="Override default staleness threshold in days for unlisted evidence types"
+    ),
+    json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
+):
+    """Show which evidence is overdue for recollection, most stale first."""
+    from .scheduler.core import build_recollection_plan
+
+    try:
+        result = build_recollection_plan(config, env, default_threshold_days=default_days)
+    except ValueError as exc:
+        print(f"[yellow]{exc}[/yellow]")
+        raise typer.Exit(code=1) from exc
+
+    if json_output:
+        import json
+
+        print(json.dumps(result, indent=2))
+        return
+
+    table = Table(title=f"Recollection Plan ({env})", show_lines=False)
+    table.add_column("System", style="cyan")
+    table.add_column("Evidence Type", style="magenta")
+    table.add_column("Last Collected", style="white")
+    table.add_column("Age (days)", justify="right", style="red")
+    table.add_column("Threshold", justify="right", style="white")
+    table.add_column("Priority", justify="right", style="green")
+    for item in result["items"]:
+        table.add_row(
+            item["system_name"],
+            item["evidence_type"],
+            item["last_collected_at"],
+            str(item["age_days"]),
+            str(item["threshold_days"]),
+            f"{item['priority']:.2f}",
+        )
+    print(table)
+
+
 @scheduler_app.command("runs")
 def list_runs(
     config: str = typer.Option("config.yaml", help="Path to config file"),
@@ -57,7 +100,7 @@ def list_runs(
         print("[yellow]No database_url configured; cannot read job runs[/yellow]")
         raise typer.Exit(code=1)
 
-    init_db_async(envcfg.database_url)
+    init_db_async(envcfg.database_url, **envcfg.database_pool.model_dump())
 
     async def _list():
         session_gen = get_async_session()
@@ -106,6 +149,7 @@ def list_runs(
             print(table)
 
         await session.close()
+        await dispose_async_engine(envcfg.database_url)
 
     import asyncio
 
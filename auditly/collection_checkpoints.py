@@ -0,0 +1,96 @@
+"""Persisted checkpoints for incremental collection.
+
+Append-only sources such as CloudTrail are collected incrementally: each run
+records how far it read, per (collector, account, region, stream), and the
+next run fetches only what came after. A checkpoint is saved only after the
+events it covers were uploaded, so a failed run is simply re-read next time.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .db.models import CollectionCheckpoint
+
+
+class CheckpointStore:
+    """Read and advance collection checkpoints."""
+
+    def __init__(self, session: Session):
+        """
+        Initialize the checkpoint store.
+
+        Args:
+            session: Sync SQLAlchemy session
+        """
+        self.session = session
+
+    def get(
+        self, collector: str, account_id: str, region: str, stream: str
+    ) -> CollectionCheckpoint | None:
+        """Return the checkpoint for a stream, or None if it was never collected."""
+        return self.session.execute(
+            select(CollectionCheckpoint).where(
+                CollectionCheckpoint.collector == collector,
+                CollectionCheckpoint.account_id == account_id,
+                CollectionCheckpoint.region == region,
+                CollectionCheckpoint.stream == stream,
+            )
+        ).scalar_one_or_none()
+
+    def list_streams(
+        self, collector: str, account_id: str, region: str
+    ) -> list[CollectionCheckpoint]:
+        """Return every stream checkpoint of a collector in one account and region."""
+        return list(
+            self.session.execute(
+                select(CollectionCheckpoint).where(
+                    CollectionCheckpoint.collector == collector,
+                    CollectionCheckpoint.account_id == account_id,
+                    CollectionCheckpoint.region == region,
+                )
+            ).scalars()
+        )
+
+    def save(
+        self,
+        collector: str,
+        account_id: str,
+        region: str,
+        stream: str,
+        *,
+        last_event_time: datetime | None,
+        last_event_id: str | None = None,
+        position: dict[str, Any] | None = None,
+    ) -> CollectionCheckpoint:
+        """
+        Create or advance the checkpoint for a stream and commit it.
+
+        Args:
+            collector: Collector name (e.g. "aws-cloudtrail")
+            account_id: Cloud account ID
+            region: Region of the stream
+            stream: Stream name within the account and region (e.g. trail name)
+            last_event_time: Time of the newest event collected
+            last_event_id: ID of the newest event collected (optional)
+            position: Source-specific cursor state (optional)
+
+        Returns:
+            The saved checkpoint
+        """
+        checkpoint = self.get(collector, account_id, region, stream)
+        if checkpoint is None:
+            checkpoint = CollectionCheckpoint(
+                collector=collector, account_id=account_id, region=region, stream=stream
+            )
+            self.session.add(checkpoint)
+        checkpoint.last_event_time = last_event_time
+        checkpoint.last_event_id = last_event_id
+        checkpoint.position = dict(position or {})
+        checkpoint.updated_at = datetime.utcnow()
+        self.session.commit()
+        return checkpoint
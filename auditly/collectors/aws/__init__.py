@@ -8,24 +8,33 @@ This package provides collectors for AWS services including:
 - VPC (flow logs, network ACLs, route tables)
 - RDS (instance configs, encryption, backups)
 - KMS (key policies, rotation status)
+
+Collectors are imported on first access, so importing this package (or its
+throttle and retry defaults) does not import boto3.
 """
 
-from .client import AWSClient
-from .cloudtrail import CloudTrailCollector
-from .ec2 import EC2Collector
-from .iam import IAMCollector
-from .kms import KMSCollector
-from .rds import RDSCollector
-from .s3 import S3Collector
-from .vpc import VPCCollector
+import importlib
+from typing import Any
+
+# Public name -> defining submodule
+_EXPORTS = {
+    "AWSClient": ".client",
+    "IAMCollector": ".iam",
+    "EC2Collector": ".ec2",
+    "S3Collector": ".s3",
+    "CloudTrailCollector": ".cloudtrail",
+    "VPCCollector": ".vpc",
+    "RDSCollector": ".rds",
+    "KMSCollector": ".kms",
+    "fan_out": ".fanout",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "AWSClient",
-    "IAMCollector",
-    "EC2Collector",
-    "S3Collector",
-    "CloudTrailCollector",
-    "VPCCollector",
-    "RDSCollector",
-    "KMSCollector",
-]
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
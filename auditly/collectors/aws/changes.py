@@ -0,0 +1,292 @@
+"""Change-aware AWS collection driven by AWS Config.
+
+A full EC2/VPC/RDS/KMS collection describes every resource on every run. For
+large, stable accounts almost all of those calls return what the previous run
+already stored. When AWS Config records a resource type, its advanced query
+(``select_resource_config``) lists the resources whose configuration changed
+after a given time; an incremental run re-describes only those and merges them
+into the previous evidence, producing the same full document.
+
+Sections whose resource type Config does not record (or records only daily),
+that have no Config
+equivalent (key pairs, snapshots, aliases, ...) or that are cheap to list are
+always collected in full. Attributes Config does not capture (such as KMS
+grants) are refreshed when the resource itself changes, or by a full run.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+try:
+    from botocore.exceptions import BotoCoreError, ClientError
+except ImportError:
+    BotoCoreError = ClientError = Exception  # type: ignore
+
+# Config delivers configuration items a few minutes after the change; query
+# from before the previous run so late items are not missed
+CHANGE_WINDOW_OVERLAP = timedelta(minutes=15)
+
+# Values per describe filter (EC2 accepts 200, RDS 100)
+FILTER_VALUE_LIMIT = 100
+
+
+@dataclass(frozen=True)
+class TrackedSection:
+    """An evidence section that can be refreshed from AWS Config changes.
+
+    Attributes:
+        section: Evidence key (e.g. "instances")
+        resource_type: AWS Config resource type (e.g. "AWS::EC2::Instance")
+        id_field: Record field holding the resource identifier
+        config_field: Config query field matching ``id_field`` (resourceId or resourceName)
+    """
+
+    section: str
+    resource_type: str
+    id_field: str
+    config_field: str = "resourceId"
+
+
+@dataclass
+class ChangeSet:
+    """Resources AWS Config reported as changed since a point in time."""
+
+    since: datetime
+    recorded: set[str] = field(default_factory=set)
+    changed: dict[str, set[str]] = field(default_factory=dict)
+
+    def count(self) -> int:
+        """Number of changed resources across all types."""
+        return sum(len(ids) for ids in self.changed.values())
+
+
+def filter_chunks(
+    name: str, ids: list[str] | None, param: str = "Filters"
+) -> Iterator[dict[str, Any]]:
+    """Keyword arguments restricting a describe call to ``ids``.
+
+    Args:
+        name: Filter name (e.g. "instance-id")
+        ids: Resource identifiers, or None for every resource
+        param: Request parameter carrying the filters ("Filter" for some EC2 calls)
+
+    Yields:
+        One kwargs dict per batch of at most FILTER_VALUE_LIMIT identifiers,
+        or a single empty dict when ``ids`` is None
+    """
+    if ids is None:
+        yield {}
+        return
+    for start in range(0, len(ids), FILTER_VALUE_LIMIT):
+        yield {param: [{"Name": name, "Values": ids[start : start + FILTER_VALUE_LIMIT]}]}
+
+
+def filtered_pages(
+    paginator: Any, name: str, ids: list[str] | None, param: str = "Filters", **kwargs: Any
+) -> Iterator[dict[str, Any]]:
+    """Paginate a describe call, optionally restricted to ``ids`` via a filter."""
+    for filters in filter_chunks(name, ids, param):
+        yield from paginator.paginate(**filters, **kwargs)
+
+
+def _daily_types(recorder: dict[str, Any], wanted: set[str]) -> set[str]:
+    """Types of ``wanted`` a recorder snapshots daily rather than on each change."""
+    mode = recorder.get("recordingMode") or {}
+    frequency = {t: mode.get("recordingFrequency", "CONTINUOUS") for t in wanted}
+    for override in mode.get("recordingModeOverrides", []):
+        for resource_type in set(override.get("resourceTypes", [])) & wanted:
+            frequency[resource_type] = override.get("recordingFrequency", "CONTINUOUS")
+    return {t for t, f in frequency.items() if f == "DAILY"}
+
+
+def recorded_resource_types(config: Any, wanted: set[str], since: datetime) -> set[str]:
+    """Resource types Config has recorded continuously since ``since``.
+
+    Types recorded at DAILY frequency are left out: their configuration items
+    can lag a change by up to a day, well beyond ``CHANGE_WINDOW_OVERLAP``.
+
+    Args:
+        config: boto3 Config client
+        wanted: Resource types of interest
+        since: Start of the change window (timezone-aware)
+
+    Returns:
+        Subset of ``wanted`` whose changes a query can be trusted to list
+    """
+    status = {
+        s.get("name"): s
+        for s in config.describe_configuration_recorder_status().get(
+            "ConfigurationRecordersStatus", []
+        )
+    }
+    recorded: set[str] = set()
+    for recorder in config.describe_configuration_recorders().get("ConfigurationRecorders", []):
+        state = status.get(recorder.get("name"), {})
+        started = state.get("lastStartTime")
+        # A recorder stopped or restarted inside the window may have missed changes
+        if not state.get("recording") or (started is not None and started > since):
+            continue
+        group = recorder.get("recordingGroup", {})
+        strategy = group.get("recordingStrategy", {}).get("useOnly")
+        continuous = wanted - _daily_types(recorder, wanted)
+        if group.get("allSupported", strategy == "ALL_SUPPORTED_RESOURCE_TYPES"):
+            recorded |= continuous
+        elif strategy == "EXCLUSION_BY_RESOURCE_TYPES":
+            excluded = group.get("exclusionByResourceTypes", {}).get("resourceTypes", [])
+            recorded |= continuous - set(excluded)
+        else:
+            recorded |= continuous & set(group.get("resourceTypes", []))
+    return recorded
+
+
+def query_changes(config: Any, tracked: tuple[TrackedSection, ...], since: datetime) -> ChangeSet:
+    """List resources of the tracked types changed since ``since``.
+
+    Args:
+        config: boto3 Config client
+        tracked: Sections to query
+        since: Start of the change window (timezone-aware)
+
+    Returns:
+        ChangeSet over the types Config records; other types are absent from ``recorded``
+    """
+    changes = ChangeSet(since=since)
+    changes.recorded = recorded_resource_types(config, {t.resource_type for t in tracked}, since)
+    if not changes.recorded:
+        return changes
+
+    id_fields = {t.resource_type: t.config_field for t in tracked}
+    types = ", ".join(f"'{t}'" for t in sorted(changes.recorded))
+    expression = (
+        "SELECT resourceId, resourceName, resourceType "
+        f"WHERE resourceType IN ({types}) "
+        f"AND configurationItemCaptureTime >= '{since.strftime('%Y-%m-%dT%H:%M:%S.000Z')}'"
+    )
+    paginator = config.get_paginator("select_resource_config")
+    for page in paginator.paginate(Expression=expression):
+        for result in page.get("Results", []):
+            item = json.loads(result)
+            resource_id = item.get(id_fields.get(item.get("resourceType"), "resourceId"))
+            if resource_id:
+                changes.changed.setdefault(item["resourceType"], set()).add(resource_id)
+    return changes
+
+
+def merge_section(
+    previous: list[dict[str, Any]],
+    fresh: list[dict[str, Any]],
+    id_field: str,
+    touched: set[str],
+) -> list[dict[str, Any]]:
+    """Merge re-described records into a previous section.
+
+    Records in ``fresh`` replace their previous version in place; touched
+    resources the describe call no longer returns were deleted and are
+    dropped; new resources are appended.
+
+    Args:
+        previous: Records from the previous evidence
+        fresh: Records just described for the touched resources
+        id_field: Record field holding the resource identifier
+        touched: Identifiers Config reported as changed
+
+    Returns:
+        The merged section
+    """
+    fresh_by_id = {record.get(id_field): record for record in fresh}
+    merged = []
+    for record in previous:
+        resource_id = record.get(id_field)
+        if resource_id in fresh_by_id:
+            merged.append(fresh_by_id.pop(resource_id))
+        elif resource_id not in touched:
+            merged.append(record)
+    merged.extend(fresh_by_id.values())
+    return merged
+
+
+def collect_sections(collector: Any, previous: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Collect a collector's sections, incrementally when possible.
+
+    Without previous evidence, or when it belongs to another account or region,
+    or when Config cannot be queried, every section is collected in full. The
+    ChangeSet used (or None for a full collection) is left on
+    ``collector.changes``.
+
+    Section methods must raise, rather than log and return what they have,
+    when called with ``ids``: resources missing from the result are taken as
+    deleted. A section whose re-describe fails is collected in full instead.
+
+    Args:
+        collector: Collector exposing ``sections()``, ``TRACKED_SECTIONS`` and ``client``
+        previous: Evidence from the collector's previous run
+
+    Returns:
+        Section name -> records, ready for ``finalize_evidence``
+    """
+    sections: dict[str, Callable[..., list[dict[str, Any]]]] = collector.sections()
+    collector.changes = changes = _changes_since(collector, previous)
+    if changes is None:
+        return {name: collect() for name, collect in sections.items()}
+
+    tracked = {t.section: t for t in collector.TRACKED_SECTIONS}
+    data = {}
+    for name, collect in sections.items():
+        section = tracked.get(name)
+        if section is None or section.resource_type not in changes.recorded or name not in previous:
+            data[name] = collect()
+            continue
+        touched = changes.changed.get(section.resource_type, set())
+        try:
+            fresh = collect(ids=sorted(touched)) if touched else []
+        except (ClientError, BotoCoreError) as e:
+            logger.warning("Re-describing changed %s failed, collecting in full: %s", name, e)
+            data[name] = collect()
+            continue
+        data[name] = merge_section(previous[name], fresh, section.id_field, touched)
+    logger.info(
+        "Incremental collection: %d changed resource(s) since %s",
+        changes.count(),
+        changes.since.isoformat(),
+    )
+    return data
+
+
+def _changes_since(collector: Any, previous: dict[str, Any] | None) -> ChangeSet | None:
+    if not previous or not collector.TRACKED_SECTIONS:
+        return None
+    metadata = previous.get("metadata", {})
+    client = collector.client
+    if (
+        metadata.get("region") != client.region
+        or metadata.get("account_id") != client.get_account_id()
+    ):
+        return None
+    try:
+        collected_at = datetime.fromisoformat(metadata["collected_at"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if collected_at.tzinfo is None:
+        collected_at = collected_at.replace(tzinfo=UTC)
+
+    try:
+        changes = query_changes(
+            client.get_client("config"),
+            collector.TRACKED_SECTIONS,
+            collected_at - CHANGE_WINDOW_OVERLAP,
+        )
+    except (ClientError, BotoCoreError) as e:
+        logger.warning("AWS Config query failed, collecting in full: %s", e)
+        return None
+    if not changes.recorded:
+        logger.info("AWS Config does not record these resource types, collecting in full")
+        return None
+    return changes
@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
+import copy
 import logging
+import threading
+from contextlib import AbstractContextManager
 from typing import Any
 
+from .throttle import (
+    DEFAULT_MAX_ATTEMPTS,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_RETRY_MODE,
+    CallTracker,
+)
+
 logger = logging.getLogger(__name__)
 
 try:
     import boto3
+    import botocore.session
+    from botocore.config import Config
+    from botocore.credentials import RefreshableCredentials
     from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 except ImportError:
     boto3 = None  # type: ignore
+    Config = None  # type: ignore
+    RefreshableCredentials = None  # type: ignore
     BotoCoreError = Exception  # type: ignore
     ClientError = Exception  # type: ignore
     NoCredentialsError = Exception  # type: ignore
@@ -25,7 +40,9 @@ class AWSClient:
     - Credential management (profile, access key, session token)
     - Multi-region support
     - Client caching for performance
-    - Error handling and retries
+    - Connection pool sizing and per-service concurrency limits
+    - Cross-account role assumption and per-region views
+    - Adaptive retries, per-service rate limits and throttle accounting
     """
 
     def __init__(
@@ -35,6 +52,12 @@ class AWSClient:
         access_key_id: str | None = None,
         secret_access_key: str | None = None,
         session_token: str | None = None,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        service_concurrency: dict[str, int] | None = None,
+        session: Any = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_mode: str = DEFAULT_RETRY_MODE,
+        rate_limits: dict[str, float] | None = None,
     ):
         """Initialize AWS client.
 
@@ -44,6 +67,17 @@ class AWSClient:
             access_key_id: AWS access key ID (optional)
             secret_access_key: AWS secret access key (optional)
             session_token: AWS session token for temporary credentials (optional)
+            max_pool_connections: HTTP connections per service client; also the
+                upper bound on concurrent detail calls per collector
+            service_concurrency: Lower per-service limits on concurrent calls,
+                e.g. {"s3": 4} (optional)
+            session: Pre-built boto3 session, e.g. with assumed-role credentials
+                (overrides the credential options)
+            max_attempts: Attempts per API call before botocore gives up
+            retry_mode: botocore retry mode ("adaptive", "standard" or "legacy");
+                adaptive mode also slows a client down after throttling
+            rate_limits: Per-service maximum calls per second shared by all
+                threads, e.g. {"iam": 5} (optional)
         """
         if boto3 is None:
             raise ImportError(
@@ -52,10 +86,23 @@ class AWSClient:
 
         self.region = region
         self.profile_name = profile_name
+        self.max_pool_connections = max_pool_connections
+        self.service_concurrency = dict(service_concurrency or {})
+        self.max_attempts = max_attempts
+        self.retry_mode = retry_mode
+        self.rate_limits = dict(rate_limits or {})
+        self.calls = CallTracker(self.rate_limits)
         self._clients: dict[str, Any] = {}
+        # boto3 sessions are not thread-safe; client creation is serialized
+        self._clients_lock = threading.Lock()
+        # STS caller identity, fetched once and shared with region views
+        self._identity: dict[str, str] = {}
+        self._identity_lock = threading.Lock()
 
         # Create boto3 session
-        if profile_name:
+        if session is not None:
+            self.session = session
+        elif profile_name:
             self.session = boto3.Session(profile_name=profile_name, region_name=region)
         elif access_key_id and secret_access_key:
             self.session = boto3.Session(
@@ -87,21 +134,173 @@ class AWSClient:
         region = region or self.region
         cache_key = f"{service}:{region}"
 
-        if cache_key not in self._clients:
-            try:
-                self._clients[cache_key] = self.session.client(service, region_name=region)
-                logger.debug("Created boto3 client for %s in %s", service, region)
-            except NoCredentialsError:
-                logger.error("No AWS credentials found. Configure via AWS CLI or env vars.")
-                raise
-            except (ClientError, BotoCoreError) as e:
-                logger.error("Failed to create AWS client for %s: %s", service, e)
-                raise
+        with self._clients_lock:
+            if cache_key not in self._clients:
+                try:
+                    client = self.session.client(
+                        service,
+                        region_name=region,
+                        config=Config(
+                            max_pool_connections=self.max_pool_connections,
+                            retries={
+                                "mode": self.retry_mode,
+                                "total_max_attempts": self.max_attempts,
+                            },
+                        ),
+                    )
+                    self.calls.instrument(client, service)
+                    self._clients[cache_key] = client
+                    logger.debug("Created boto3 client for %s in %s", service, region)
+                except NoCredentialsError:
+                    logger.error("No AWS credentials found. Configure via AWS CLI or env vars.")
+                    raise
+                except (ClientError, BotoCoreError) as e:
+                    logger.error("Failed to create AWS client for %s: %s", service, e)
+                    raise
+
+            return self._clients[cache_key]
+
+    def for_region(self, region: str) -> AWSClient:
+        """Return a view of this client whose default region is ``region``.
+
+        The view shares the session, credentials, client cache and call
+        tracker, so collectors can be pointed at another region without
+        re-authenticating or escaping the rate limits.
+
+        Args:
+            region: AWS region for the view
+
+        Returns:
+            AWSClient bound to the region
+        """
+        view = copy.copy(self)
+        view.region = region
+        return view
+
+    def assume_role(
+        self,
+        role_arn: str,
+        session_name: str = "auditly",
+        external_id: str | None = None,
+        duration_seconds: int = 3600,
+    ) -> AWSClient:
+        """Assume an IAM role and return a client acting with its credentials.
+
+        Credentials are refreshed automatically before they expire, so long
+        collection runs keep working past the session duration.
+
+        Args:
+            role_arn: ARN of the role to assume
+            session_name: Role session name recorded in CloudTrail
+            external_id: External ID required by the role's trust policy (optional)
+            duration_seconds: Lifetime of each set of temporary credentials
+
+        Returns:
+            AWSClient for the role's account
+
+        Raises:
+            ClientError: If the role cannot be assumed
+        """
+        sts = self.get_client("sts")
+        params: dict[str, Any] = {
+            "RoleArn": role_arn,
+            "RoleSessionName": session_name,
+            "DurationSeconds": duration_seconds,
+        }
+        if external_id:
+            params["ExternalId"] = external_id
+
+        def _fetch() -> dict[str, str]:
+            creds = sts.assume_role(**params)["Credentials"]
+            return {
+                "access_key": creds["AccessKeyId"],
+                "secret_key": creds["SecretAccessKey"],
+                "token": creds["SessionToken"],
+                "expiry_time": creds["Expiration"].isoformat(),
+            }
+
+        botocore_session = botocore.session.get_session()
+        botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+            metadata=_fetch(), refresh_using=_fetch, method="sts-assume-role"
+        )
+        assumed = AWSClient(
+            region=self.region,
+            max_pool_connections=self.max_pool_connections,
+            service_concurrency=self.service_concurrency,
+            max_attempts=self.max_attempts,
+            retry_mode=self.retry_mode,
+            rate_limits=self.rate_limits,
+            session=boto3.Session(botocore_session=botocore_session, region_name=self.region),
+        )
+        # The account is part of the role ARN: arn:aws:iam::<account>:role/<name>
+        assumed._identity["Account"] = role_arn.split(":")[4]
+        logger.info("Assumed role %s", role_arn)
+        return assumed
+
+    def concurrency_for(self, service: str) -> int:
+        """Maximum concurrent detail calls for a service (bounded by the connection pool).
+
+        Args:
+            service: AWS service name (e.g., 's3', 'kms')
+
+        Returns:
+            Number of worker threads collectors may use for the service
+        """
+        limit = self.service_concurrency.get(service, self.max_pool_connections)
+        return max(1, min(limit, self.max_pool_connections))
+
+    def call_stats(self, scope: str | None = None) -> dict[str, dict[str, Any]]:
+        """API call, retry and throttle counters per service.
+
+        A service with ``exhausted`` calls gave up on at least one request
+        after all retries, so its evidence is incomplete.
+
+        Args:
+            scope: Only count calls made inside ``call_scope(scope)`` (optional)
+
+        Returns:
+            Service -> {calls, retries, throttles, exhausted, rate_limited_seconds}
+        """
+        return self.calls.stats(scope)
+
+    def call_scope(self, name: str) -> AbstractContextManager[None]:
+        """Attribute API calls made inside the block to ``name``.
+
+        Lets concurrently running collectors report their own calls even
+        when they share boto3 services.
 
-        return self._clients[cache_key]
+        Args:
+            name: Scope name, e.g. the collector service ("vpc")
+
+        Returns:
+            Context manager
+        """
+        return self.calls.scope(name)
+
+    def get_caller_identity(self) -> dict[str, str]:
+        """Get the STS caller identity, calling STS at most once per client.
+
+        Returns:
+            Dictionary with Account, Arn and UserId
+
+        Raises:
+            ClientError: If the identity cannot be determined
+        """
+        with self._identity_lock:
+            if "Arn" not in self._identity:
+                try:
+                    response = self.get_client("sts").get_caller_identity()
+                except ClientError as e:
+                    logger.error("Failed to get AWS caller identity: %s", e)
+                    raise
+                self._identity.update(
+                    {k: response[k] for k in ("Account", "Arn", "UserId") if k in response}
+                )
+                logger.debug("AWS Account ID: %s", self._identity.get("Account"))
+            return dict(self._identity)
 
     def get_account_id(self) -> str:
-        """Get AWS account ID using STS.
+        """Get AWS account ID using STS (cached).
 
         Returns:
             AWS account ID
@@ -109,15 +308,11 @@ class AWSClient:
         Raises:
             ClientError: If unable to determine account ID
         """
-        try:
-            sts = self.get_client("sts")
-            response = sts.get_caller_identity()
-            account_id = response["Account"]
-            logger.debug("AWS Account ID: %s", account_id)
+        # Assumed-role clients know their account without calling STS
+        account_id = self._identity.get("Account")
+        if account_id is not None:
             return account_id
-        except ClientError as e:
-            logger.error("Failed to get AWS account ID: %s", e)
-            raise
+        return self.get_caller_identity()["Account"]
 
     def list_regions(self, service: str = "ec2") -> list[str]:
         """List available AWS regions for a service.
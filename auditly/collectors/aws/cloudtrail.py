@@ -5,16 +5,25 @@ Collects CloudTrail evidence including:
 - Event history (management events, data events)
 - CloudTrail status
 - S3 bucket logging configuration
+
+Event history can be collected incrementally: pass the ``EventCursor`` saved
+by the previous run and only newer events are read, either from the
+LookupEvents API or, for trails, from the log objects in their S3 bucket.
 """
 
 from __future__ import annotations
 
+import gzip
+import json
 import logging
-from datetime import datetime, timedelta
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from ..common import finalize_evidence
 from .client import AWSClient
+from .fanout import fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +32,93 @@ try:
 except ImportError:
     ClientError = Exception  # type: ignore
 
+# Stream name of the LookupEvents history (trails use their own names)
+EVENT_HISTORY_STREAM = "event-history"
+# LookupEvents only returns the last 90 days
+EVENT_HISTORY_RETENTION_DAYS = 90
+# CloudTrail can deliver an event to LookupEvents some minutes after its event
+# time, so a resumed read starts this far before the cursor and skips the
+# events it already read by ID
+LATE_DELIVERY_WINDOW = timedelta(minutes=20)
+# Trail log objects fetched per fan-out batch, per worker
+LOG_OBJECT_BATCH_PER_WORKER = 4
+
+
+@dataclass
+class EventCursor:
+    """Position of the newest event read from a CloudTrail stream."""
+
+    event_time: datetime | None = None
+    event_id: str | None = None
+    # ID -> event time of the events already read within LATE_DELIVERY_WINDOW
+    # of event_time
+    seen_ids: dict[str, datetime] = field(default_factory=dict)
+    # Last log object read, for trail (S3) streams
+    last_key: str | None = None
+    # Log objects already read on the days a resumed trail listing re-reads
+    read_keys: set[str] = field(default_factory=set)
+
+    def to_position(self) -> dict[str, Any]:
+        """Source-specific state for ``CollectionCheckpoint.position``."""
+        return {
+            "seen_ids": {event_id: at.isoformat() for event_id, at in self.seen_ids.items()},
+            "last_key": self.last_key,
+            "read_keys": sorted(self.read_keys),
+        }
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: Any) -> EventCursor:
+        """Build a cursor from a ``CollectionCheckpoint`` row."""
+        position = checkpoint.position or {}
+        seen = position.get("seen_ids") or {}
+        if isinstance(seen, list):
+            # Older checkpoints only kept the IDs at last_event_time
+            seen_ids = dict.fromkeys(seen, checkpoint.last_event_time)
+        else:
+            seen_ids = {event_id: datetime.fromisoformat(at) for event_id, at in seen.items()}
+        return cls(
+            event_time=checkpoint.last_event_time,
+            event_id=checkpoint.last_event_id,
+            seen_ids=seen_ids,
+            last_key=position.get("last_key"),
+            read_keys=set(position.get("read_keys") or ()),
+        )
+
+
+def _listing_start(prefix: str, at: datetime) -> str:
+    """``StartAfter`` for a trail log listing that includes the day of ``at``.
+
+    Keys are ``<prefix>YYYY/MM/DD/<file>``, so this is anything after the
+    day before.
+    """
+    return prefix + (at - timedelta(days=1)).strftime("%Y/%m/%d/~")
+
+
+def _resume_start(prefix: str, cursor: EventCursor) -> str | None:
+    """``StartAfter`` that re-lists the late delivery window before ``cursor``.
+
+    Log objects can land in S3 after later ones were listed, with keys that
+    sort before the cursor's last key, so a resumed listing starts at the day
+    ``LATE_DELIVERY_WINDOW`` before the newest event (or the last key's day).
+    """
+    at = cursor.event_time
+    if at is None and cursor.last_key and cursor.last_key.startswith(prefix):
+        try:
+            at = datetime.strptime(cursor.last_key[len(prefix) :][:10], "%Y/%m/%d")
+        except ValueError:
+            at = None
+    if at is None:
+        return cursor.last_key
+    start = _listing_start(prefix, at - LATE_DELIVERY_WINDOW)
+    return min(start, cursor.last_key) if cursor.last_key else start
+
+
+def _utc_naive(value: datetime) -> datetime:
+    """Normalize to a naive UTC datetime (as stored in the database)."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return value
+
 
 class CloudTrailCollector:
     """Collector for AWS CloudTrail evidence."""
@@ -36,19 +132,52 @@ class CloudTrailCollector:
         self.client = client
         self.cloudtrail = client.get_client("cloudtrail")
         self.logs = client.get_client("logs")
+        # Stream -> cursor after the newest event, set once a stream was read completely
+        self.cursors: dict[str, EventCursor] = {}
 
-    def collect_all(self) -> dict[str, Any]:
+    def collect_all(
+        self,
+        event_sink: Callable[[str, Iterator[dict[str, Any]]], Any] | None = None,
+        checkpoints: dict[str, EventCursor] | None = None,
+        source: str = "api",
+    ) -> dict[str, Any]:
         """Collect all CloudTrail evidence.
 
+        Args:
+            event_sink: Consumer for event streams (optional). It is called with
+                the stream name and the lazy event iterator, e.g. to stream the
+                events to the vault, and its return value (such as a reference
+                to the uploaded object) is stored in ``event_history`` instead
+                of the events themselves.
+            checkpoints: Stream -> cursor of the previous run; only newer
+                events are read (optional)
+            source: "api" reads the LookupEvents history; "s3" reads each
+                trail's log objects from its bucket (requires ``event_sink``)
+
         Returns:
             Dictionary containing CloudTrail evidence
         """
         logger.info("Starting AWS CloudTrail evidence collection")
+        checkpoints = checkpoints or {}
 
-        data = {
-            "trails": self.collect_trails(),
-            "event_history": self.collect_event_history(),
-        }
+        trails = self.collect_trails()
+        if event_sink is None:
+            event_history: Any = self.collect_event_history()
+        elif source == "s3":
+            event_history = {
+                trail["trail_name"]: event_sink(
+                    trail["trail_name"],
+                    self.iter_trail_log_events(trail, since=checkpoints.get(trail["trail_name"])),
+                )
+                for trail in trails
+                if trail.get("s3_bucket_name")
+            }
+        else:
+            event_history = event_sink(
+                EVENT_HISTORY_STREAM,
+                self.iter_event_history(since=checkpoints.get(EVENT_HISTORY_STREAM)),
+            )
+        data = {"trails": trails, "event_history": event_history}
         evidence = finalize_evidence(
             data,
             collector="aws-cloudtrail",
@@ -66,11 +195,18 @@ class CloudTrailCollector:
 
         try:
             response = self.cloudtrail.describe_trails(includeShadowTrails=True)
-            for trail in response.get("trailList", []):
+            trail_list = response.get("trailList", [])
+            statuses = fan_out(
+                self._get_trail_status,
+                [trail.get("Name") for trail in trail_list],
+                self.client.concurrency_for("cloudtrail"),
+            )
+            for trail, is_logging in zip(trail_list, statuses, strict=True):
                 trail_config = {
                     "trail_name": trail.get("Name"),
                     "trail_arn": trail.get("TrailARN"),
                     "s3_bucket_name": trail.get("S3BucketName"),
+                    "s3_key_prefix": trail.get("S3KeyPrefix"),
                     "include_global_events": trail.get("IncludeGlobalServiceEvents"),
                     "is_multi_region_trail": trail.get("IsMultiRegionTrail"),
                     "is_organization_trail": trail.get("IsOrganizationTrail"),
@@ -80,7 +216,7 @@ class CloudTrailCollector:
                     "sns_topic_arn": trail.get("SNSTopicARN"),
                     "cloud_watch_logs_group_arn": trail.get("CloudWatchLogsGroupArn"),
                     "cloud_watch_logs_role_arn": trail.get("CloudWatchLogsRoleArn"),
-                    "is_logging": self._get_trail_status(trail.get("Name")),
+                    "is_logging": is_logging,
                 }
 
                 trails.append(trail_config)
@@ -94,48 +230,181 @@ class CloudTrailCollector:
     def collect_event_history(self, days: int = 7) -> list[dict[str, Any]]:
         """Collect recent CloudTrail events.
 
+        Holds every event in memory; use ``iter_event_history`` for busy accounts.
+
         Args:
             days: Number of days to look back (default: 7)
 
         Returns:
             List of recent CloudTrail events
         """
-        events = []
+        return list(self.iter_event_history(days))
+
+    def iter_event_history(
+        self, days: int = 7, since: EventCursor | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield recent CloudTrail events one page at a time, newest first.
+
+        When the history has been read completely, the cursor of the newest
+        event is stored in ``self.cursors[EVENT_HISTORY_STREAM]``.
+
+        Args:
+            days: Number of days to look back when there is no cursor (default: 7)
+            since: Cursor of the previous run; events it has not read are
+                yielded, including ones delivered late (up to
+                ``LATE_DELIVERY_WINDOW`` before the cursor)
+
+        Yields:
+            CloudTrail event dicts
+        """
+        count = 0
+        newest_time: datetime | None = None
+        newest_id: str | None = None
+        # Event IDs read by the previous run and this one, for deduplication
+        seen = dict(since.seen_ids) if since is not None else {}
+        resume = since is not None and since.event_time is not None
+        oldest_available = datetime.utcnow() - timedelta(days=EVENT_HISTORY_RETENTION_DAYS)
 
         try:
-            start_time = datetime.utcnow() - timedelta(days=days)
+            if resume:
+                # Re-read the late delivery window; events read before are skipped by ID
+                start_time = max(since.event_time - LATE_DELIVERY_WINDOW, oldest_available)
+            else:
+                start_time = datetime.utcnow() - timedelta(days=days)
 
             paginator = self.cloudtrail.get_paginator("lookup_events")
             for page in paginator.paginate(StartTime=start_time):
                 for event in page.get("Events", []):
-                    events.append(
-                        {
-                            "event_id": event.get("EventId"),
-                            "event_name": event.get("EventName"),
-                            "event_time": (
-                                event.get("EventTime", "").isoformat()
-                                if event.get("EventTime")
-                                else None
-                            ),
-                            "username": event.get("Username"),
-                            "resources": [
-                                {
-                                    "resource_type": r.get("ResourceType"),
-                                    "resource_name": r.get("ResourceName"),
-                                }
-                                for r in event.get("Resources", [])
-                            ],
-                            "event_source": event.get("EventSource"),
-                            "access_key_id": event.get("AccessKeyId"),
-                            "cloud_trail_event": event.get("CloudTrailEvent"),
-                        }
-                    )
-
-            logger.debug("Collected %d CloudTrail events (last %d days)", len(events), days)
+                    event_time = event.get("EventTime")
+                    event_id = event.get("EventId")
+                    at = _utc_naive(event_time) if event_time else None
+                    if event_id in seen:
+                        continue
+                    if resume and event_id is None and (at is None or at <= since.event_time):
+                        # Without an ID a repeated event cannot be told apart
+                        continue
+                    if at is not None:
+                        if event_id:
+                            seen[event_id] = at
+                        if newest_time is None or at > newest_time:
+                            newest_time, newest_id = at, event_id
+                    count += 1
+                    yield {
+                        "event_id": event.get("EventId"),
+                        "event_name": event.get("EventName"),
+                        "event_time": (
+                            event.get("EventTime", "").isoformat()
+                            if event.get("EventTime")
+                            else None
+                        ),
+                        "username": event.get("Username"),
+                        "resources": [
+                            {
+                                "resource_type": r.get("ResourceType"),
+                                "resource_name": r.get("ResourceName"),
+                            }
+                            for r in event.get("Resources", [])
+                        ],
+                        "event_source": event.get("EventSource"),
+                        "access_key_id": event.get("AccessKeyId"),
+                        "cloud_trail_event": event.get("CloudTrailEvent"),
+                    }
+
+            logger.debug("Collected %d CloudTrail events since %s", count, start_time)
+            if resume and (newest_time is None or newest_time <= since.event_time):
+                # Late events older than the cursor do not move it
+                newest_time, newest_id = since.event_time, since.event_id
+            if newest_time is None:
+                cursor = since or EventCursor()
+            else:
+                horizon = newest_time - LATE_DELIVERY_WINDOW
+                cursor = EventCursor(
+                    newest_time,
+                    newest_id,
+                    {event_id: at for event_id, at in seen.items() if at >= horizon},
+                )
+            self.cursors[EVENT_HISTORY_STREAM] = cursor
         except ClientError as e:
             logger.error("Failed to collect CloudTrail events: %s", e)
 
-        return events
+    def iter_trail_log_events(
+        self, trail: dict[str, Any], days: int = 7, since: EventCursor | None = None
+    ) -> Iterator[dict[str, Any]]:
+        """Yield events from a trail's log objects in S3, oldest object first.
+
+        Log objects are listed from the day of the cursor's late delivery
+        window (keys sort by date), skipping the ones it already read, and
+        downloaded concurrently in batches, which avoids the LookupEvents
+        rate limit. When the listing has been read completely,
+        the cursor is stored in ``self.cursors[trail_name]``.
+
+        Args:
+            trail: Trail config as returned by ``collect_trails``
+            days: Number of days to look back when there is no cursor (default: 7)
+            since: Cursor of the previous run; only log objects it has not read
+                are read, including ones delivered late
+
+        Yields:
+            CloudTrail event dicts (same shape as ``iter_event_history``)
+        """
+        s3 = self.client.get_client("s3")
+        bucket = trail["s3_bucket_name"]
+        key_prefix = f"{trail['s3_key_prefix']}/" if trail.get("s3_key_prefix") else ""
+        prefix = (
+            f"{key_prefix}AWSLogs/{self.client.get_account_id()}/CloudTrail/{self.client.region}/"
+        )
+        if since is not None and since.read_keys:
+            start_after = _resume_start(prefix, since)
+        elif since is not None and since.last_key:
+            # Older checkpoints did not record the keys they read
+            start_after = since.last_key
+        else:
+            start_after = _listing_start(prefix, datetime.utcnow() - timedelta(days=days))
+
+        def _read(key: str) -> list[dict[str, Any]]:
+            body = s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+            return json.loads(gzip.decompress(body)).get("Records", [])
+
+        cursor = EventCursor(
+            since.event_time if since else None,
+            since.event_id if since else None,
+            dict(since.seen_ids) if since else {},
+            max(start_after, since.last_key or "") if since else start_after,
+            set(since.read_keys) if since else set(),
+        )
+        batch_size = self.client.concurrency_for("s3") * LOG_OBJECT_BATCH_PER_WORKER
+        batch: list[str] = []
+
+        def _flush() -> Iterator[dict[str, Any]]:
+            for key, records in zip(
+                batch, fan_out(_read, batch, self.client.concurrency_for("s3")), strict=True
+            ):
+                for record in records:
+                    event_time = record.get("eventTime")
+                    if event_time:
+                        at = _utc_naive(datetime.fromisoformat(event_time.replace("Z", "+00:00")))
+                        if cursor.event_time is None or at >= cursor.event_time:
+                            cursor.event_time, cursor.event_id = at, record.get("eventID")
+                    yield _log_record_event(record)
+                cursor.last_key = max(cursor.last_key or "", key)
+                cursor.read_keys.add(key)
+            batch.clear()
+
+        try:
+            paginator = s3.get_paginator("list_objects_v2")
+            for page in paginator.paginate(Bucket=bucket, Prefix=prefix, StartAfter=start_after):
+                for obj in page.get("Contents", []):
+                    if obj["Key"].endswith(".json.gz") and obj["Key"] not in cursor.read_keys:
+                        batch.append(obj["Key"])
+                    if len(batch) >= batch_size:
+                        yield from _flush()
+            yield from _flush()
+            # Only keys the next resumed listing will see again need to be kept
+            horizon = _resume_start(prefix, cursor) or ""
+            cursor.read_keys = {key for key in cursor.read_keys if key > horizon}
+            self.cursors[trail["trail_name"]] = cursor
+        except ClientError as e:
+            logger.error("Failed to read CloudTrail logs for %s: %s", trail["trail_name"], e)
 
     def _get_trail_status(self, trail_name: str) -> bool:
         """Get whether a trail is currently logging."""
@@ -144,3 +413,21 @@ class CloudTrailCollector:
             return response.get("IsLogging", False)
         except ClientError:
             return False
+
+
+def _log_record_event(record: dict[str, Any]) -> dict[str, Any]:
+    """Convert a CloudTrail log file record to the LookupEvents event shape."""
+    identity = record.get("userIdentity") or {}
+    return {
+        "event_id": record.get("eventID"),
+        "event_name": record.get("eventName"),
+        "event_time": record.get("eventTime"),
+        "username": identity.get("userName") or identity.get("arn"),
+        "resources": [
+            {"resource_type": r.get("type"), "resource_name": r.get("ARN")}
+            for r in record.get("resources") or []
+        ],
+        "event_source": record.get("eventSource"),
+        "access_key_id": identity.get("accessKeyId"),
+        "cloud_trail_event": json.dumps(record),
+    }
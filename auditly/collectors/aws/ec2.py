@@ -11,9 +11,11 @@ Collects EC2 evidence including:
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from ..common import finalize_evidence
+from .changes import TrackedSection, collect_sections, filtered_pages
 from .client import AWSClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,15 @@ except ImportError:
 class EC2Collector:
     """Collector for AWS EC2 evidence."""
 
+    TRACKED_SECTIONS = (
+        TrackedSection("instances", "AWS::EC2::Instance", "instance_id"),
+        TrackedSection("security_groups", "AWS::EC2::SecurityGroup", "group_id"),
+        TrackedSection("volumes", "AWS::EC2::Volume", "volume_id"),
+        TrackedSection("vpcs", "AWS::EC2::VPC", "vpc_id"),
+        TrackedSection("subnets", "AWS::EC2::Subnet", "subnet_id"),
+        TrackedSection("network_acls", "AWS::EC2::NetworkAcl", "network_acl_id"),
+    )
+
     def __init__(self, client: AWSClient):
         """Initialize EC2 collector.
 
@@ -35,25 +46,34 @@ class EC2Collector:
         """
         self.client = client
         self.ec2 = client.get_client("ec2")
+        self.changes = None
+
+    def sections(self) -> dict[str, Callable[..., list[dict[str, Any]]]]:
+        """Evidence section name -> collect method."""
+        return {
+            "instances": self.collect_instances,
+            "security_groups": self.collect_security_groups,
+            "volumes": self.collect_volumes,
+            "snapshots": self.collect_snapshots,
+            "key_pairs": self.collect_key_pairs,
+            "vpcs": self.collect_vpcs,
+            "subnets": self.collect_subnets,
+            "network_acls": self.collect_network_acls,
+        }
 
-    def collect_all(self) -> dict[str, Any]:
+    def collect_all(self, previous: dict[str, Any] | None = None) -> dict[str, Any]:
         """Collect all EC2 evidence.
 
+        Args:
+            previous: Evidence from the previous run; when given, only resources
+                AWS Config reports as changed since then are described again
+
         Returns:
             Dictionary containing EC2 evidence
         """
         logger.info("Starting AWS EC2 evidence collection")
 
-        data = {
-            "instances": self.collect_instances(),
-            "security_groups": self.collect_security_groups(),
-            "volumes": self.collect_volumes(),
-            "snapshots": self.collect_snapshots(),
-            "key_pairs": self.collect_key_pairs(),
-            "vpcs": self.collect_vpcs(),
-            "subnets": self.collect_subnets(),
-            "network_acls": self.collect_network_acls(),
-        }
+        data = collect_sections(self, previous)
         evidence = finalize_evidence(
             data,
             collector="aws-ec2",
@@ -70,13 +90,13 @@ class EC2Collector:
 
         return evidence
 
-    def collect_instances(self) -> list[dict[str, Any]]:
-        """Collect EC2 instances with security configuration."""
+    def collect_instances(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect EC2 instances with security configuration (only ``ids`` when given)."""
         instances = []
 
         try:
             paginator = self.ec2.get_paginator("describe_instances")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "instance-id", ids):
                 for reservation in page["Reservations"]:
                     for instance in reservation["Instances"]:
                         instances.append(
@@ -118,17 +138,19 @@ class EC2Collector:
 
             logger.debug("Collected %d EC2 instances", len(instances))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect EC2 instances: %s", e)
 
         return instances
 
-    def collect_security_groups(self) -> list[dict[str, Any]]:
-        """Collect security groups with ingress/egress rules."""
+    def collect_security_groups(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect security groups with ingress/egress rules (only ``ids`` when given)."""
         security_groups = []
 
         try:
             paginator = self.ec2.get_paginator("describe_security_groups")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "group-id", ids):
                 for sg in page["SecurityGroups"]:
                     security_groups.append(
                         {
@@ -149,17 +171,19 @@ class EC2Collector:
 
             logger.debug("Collected %d security groups", len(security_groups))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect security groups: %s", e)
 
         return security_groups
 
-    def collect_volumes(self) -> list[dict[str, Any]]:
-        """Collect EBS volumes with encryption status."""
+    def collect_volumes(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect EBS volumes with encryption status (only ``ids`` when given)."""
         volumes = []
 
         try:
             paginator = self.ec2.get_paginator("describe_volumes")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "volume-id", ids):
                 for volume in page["Volumes"]:
                     volumes.append(
                         {
@@ -186,6 +210,8 @@ class EC2Collector:
 
             logger.debug("Collected %d EBS volumes", len(volumes))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect EBS volumes: %s", e)
 
         return volumes
@@ -244,13 +270,13 @@ class EC2Collector:
 
         return key_pairs
 
-    def collect_vpcs(self) -> list[dict[str, Any]]:
-        """Collect VPC configurations."""
+    def collect_vpcs(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect VPC configurations (only ``ids`` when given)."""
         vpcs = []
 
         try:
             paginator = self.ec2.get_paginator("describe_vpcs")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "vpc-id", ids):
                 for vpc in page["Vpcs"]:
                     vpcs.append(
                         {
@@ -265,17 +291,19 @@ class EC2Collector:
 
             logger.debug("Collected %d VPCs", len(vpcs))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect VPCs: %s", e)
 
         return vpcs
 
-    def collect_subnets(self) -> list[dict[str, Any]]:
-        """Collect VPC subnets."""
+    def collect_subnets(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect VPC subnets (only ``ids`` when given)."""
         subnets = []
 
         try:
             paginator = self.ec2.get_paginator("describe_subnets")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "subnet-id", ids):
                 for subnet in page["Subnets"]:
                     subnets.append(
                         {
@@ -291,17 +319,19 @@ class EC2Collector:
 
             logger.debug("Collected %d subnets", len(subnets))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect subnets: %s", e)
 
         return subnets
 
-    def collect_network_acls(self) -> list[dict[str, Any]]:
-        """Collect network ACLs."""
+    def collect_network_acls(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect network ACLs (only ``ids`` when given)."""
         nacls = []
 
         try:
             paginator = self.ec2.get_paginator("describe_network_acls")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "network-acl-id", ids):
                 for nacl in page["NetworkAcls"]:
                     nacls.append(
                         {
@@ -324,6 +354,8 @@ class EC2Collector:
 
             logger.debug("Collected %d network ACLs", len(nacls))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect network ACLs: %s", e)
 
         return nacls
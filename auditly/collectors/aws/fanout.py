@@ -0,0 +1,45 @@
+"""Bounded concurrent fan-out for per-resource AWS detail calls.
+
+Collectors list resources with one paginated call and then fetch details
+(encryption, policies, status, ...) per resource. Those detail calls are
+independent, so they run on a thread pool whose size never exceeds the
+botocore connection pool of the client (extra threads would only queue for a
+connection) and honours any per-service limit configured on the AWSClient.
+Each task runs in a copy of the caller's context, so its calls are counted
+in the caller's call-tracking scope.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fan_out(fn: Callable[[T], R], items: Iterable[T], max_workers: int) -> list[R]:
+    """
+    Apply ``fn`` to every item concurrently, preserving input order.
+
+    Args:
+        fn: Per-item call (boto3 clients are thread-safe)
+        items: Resources to process
+        max_workers: Upper bound on concurrent calls; 1 runs serially
+
+    Returns:
+        Results in the same order as ``items``
+
+    Raises:
+        Exception: The first exception raised by ``fn`` (remaining items still finish)
+    """
+    items = list(items)
+    workers = min(max(1, max_workers), len(items))
+    if workers <= 1:
+        return [fn(item) for item in items]
+    # One context per task: a context cannot be entered by two threads at once
+    contexts = [copy_context() for _ in items]
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auditly-aws") as pool:
+        return list(pool.map(lambda ctx, item: ctx.run(fn, item), contexts, items))
@@ -7,11 +7,19 @@ Collects IAM evidence including:
 - Groups (membership, attached policies)
 - Password policy
 - Account summary
+
+Two collection modes produce the same evidence shape. The default makes
+several API calls per user, role and group. Bulk mode reads everything from
+paginated ``GetAccountAuthorizationDetails`` plus the IAM credential report,
+which keeps large accounts to a handful of calls.
 """
 
 from __future__ import annotations
 
+import csv
+import io
 import logging
+import time
 from typing import Any
 
 from ..common import finalize_evidence
@@ -24,17 +32,24 @@ try:
 except ImportError:
     ClientError = Exception  # type: ignore
 
+# Credential report values meaning "no timestamp"
+_REPORT_EMPTY_VALUES = {"", "N/A", "no_information", "not_supported"}
+
 
 class IAMCollector:
     """Collector for AWS IAM evidence."""
 
-    def __init__(self, client: AWSClient):
+    def __init__(self, client: AWSClient, bulk: bool = False):
         """Initialize IAM collector.
 
         Args:
             client: AWSClient instance for API calls
+            bulk: Collect users, roles, groups and policies from account
+                authorization details and the credential report instead of
+                per-entity calls
         """
         self.client = client
+        self.bulk = bulk
         self.iam = client.get_client("iam")
 
     def collect_all(self) -> dict[str, Any]:
@@ -52,16 +67,19 @@ class IAMCollector:
                 "metadata": {...}
             }
         """
-        logger.info("Starting AWS IAM evidence collection")
-
-        data = {
-            "users": self.collect_users(),
-            "roles": self.collect_roles(),
-            "policies": self.collect_policies(),
-            "groups": self.collect_groups(),
-            "password_policy": self.collect_password_policy(),
-            "account_summary": self.collect_account_summary(),
-        }
+        logger.info("Starting AWS IAM evidence collection (bulk=%s)", self.bulk)
+
+        if self.bulk:
+            data: dict[str, Any] = self.collect_authorization_details()
+        else:
+            data = {
+                "users": self.collect_users(),
+                "roles": self.collect_roles(),
+                "policies": self.collect_policies(),
+                "groups": self.collect_groups(),
+            }
+        data["password_policy"] = self.collect_password_policy()
+        data["account_summary"] = self.collect_account_summary()
         evidence = finalize_evidence(
             data,
             collector="aws-iam",
@@ -255,6 +273,128 @@ class IAMCollector:
 
         return groups
 
+    def collect_authorization_details(self) -> dict[str, list[dict[str, Any]]]:
+        """Collect users, roles, groups and customer managed policies in bulk.
+
+        Reads paginated ``get_account_authorization_details`` for entities and
+        their policies, the credential report for MFA, password and access key
+        state, and ``list_virtual_mfa_devices``/``list_roles`` for MFA serial
+        numbers and session durations. The result matches the per-entity
+        collectors, except that ``access_key_id`` is None (the credential report
+        omits key IDs) and hardware MFA devices are not listed in ``mfa_devices``.
+
+        Returns:
+            Dictionary with "users", "roles", "policies" and "groups" lists
+        """
+        users_raw: list[dict[str, Any]] = []
+        roles_raw: list[dict[str, Any]] = []
+        groups_raw: list[dict[str, Any]] = []
+        policies_raw: list[dict[str, Any]] = []
+        try:
+            paginator = self.iam.get_paginator("get_account_authorization_details")
+            for page in paginator.paginate(Filter=["User", "Role", "Group", "LocalManagedPolicy"]):
+                users_raw.extend(page.get("UserDetailList", []))
+                roles_raw.extend(page.get("RoleDetailList", []))
+                groups_raw.extend(page.get("GroupDetailList", []))
+                policies_raw.extend(page.get("Policies", []))
+        except ClientError as e:
+            logger.error("Failed to get IAM account authorization details: %s", e)
+            return {"users": [], "roles": [], "policies": [], "groups": []}
+
+        report = self._get_credential_report()
+        virtual_mfa = self._get_virtual_mfa_devices()
+        session_durations = self._get_role_session_durations()
+
+        users = []
+        members: dict[str, list[str]] = {}
+        for user in users_raw:
+            user_name = user["UserName"]
+            row = report.get(user_name) if report is not None else None
+            mfa_devices = virtual_mfa.get(user_name, [])
+            if row is not None:
+                access_keys = self._report_access_keys(row)
+                mfa_enabled = row.get("mfa_active") == "true" or bool(mfa_devices)
+                password_last_used = self._report_time(row.get("password_last_used"))
+            else:
+                # No credential report: fall back to per-user lookups for these fields
+                mfa_devices = self._get_mfa_devices(user_name)
+                access_keys = self._get_access_keys(user_name)
+                mfa_enabled = len(mfa_devices) > 0
+                password_last_used = None
+            for group_name in user.get("GroupList", []):
+                members.setdefault(group_name, []).append(user_name)
+            users.append(
+                {
+                    "user_name": user_name,
+                    "user_id": user["UserId"],
+                    "arn": user["Arn"],
+                    "create_date": user["CreateDate"].isoformat(),
+                    "password_last_used": password_last_used,
+                    "mfa_enabled": mfa_enabled,
+                    "mfa_devices": mfa_devices,
+                    "access_keys": access_keys,
+                    "attached_policies": self._attached(user),
+                    "inline_policies": [p["PolicyName"] for p in user.get("UserPolicyList", [])],
+                    "groups": list(user.get("GroupList", [])),
+                }
+            )
+
+        roles = [
+            {
+                "role_name": role["RoleName"],
+                "role_id": role["RoleId"],
+                "arn": role["Arn"],
+                "create_date": role["CreateDate"].isoformat(),
+                "assume_role_policy": role.get("AssumeRolePolicyDocument"),
+                "max_session_duration": session_durations.get(role["RoleName"]),
+                "attached_policies": self._attached(role),
+                "inline_policies": [p["PolicyName"] for p in role.get("RolePolicyList", [])],
+            }
+            for role in roles_raw
+        ]
+
+        groups = [
+            {
+                "group_name": group["GroupName"],
+                "group_id": group["GroupId"],
+                "arn": group["Arn"],
+                "create_date": group["CreateDate"].isoformat(),
+                "members": members.get(group["GroupName"], []),
+                "attached_policies": self._attached(group),
+                "inline_policies": [p["PolicyName"] for p in group.get("GroupPolicyList", [])],
+            }
+            for group in groups_raw
+        ]
+
+        policies = []
+        for policy in policies_raw:
+            default_version = next(
+                (v for v in policy.get("PolicyVersionList", []) if v.get("IsDefaultVersion")),
+                None,
+            )
+            policies.append(
+                {
+                    "policy_name": policy["PolicyName"],
+                    "policy_id": policy["PolicyId"],
+                    "arn": policy["Arn"],
+                    "create_date": policy["CreateDate"].isoformat(),
+                    "update_date": policy["UpdateDate"].isoformat(),
+                    "attachment_count": policy["AttachmentCount"],
+                    "is_attachable": policy["IsAttachable"],
+                    "default_version_id": policy["DefaultVersionId"],
+                    "policy_document": default_version.get("Document") if default_version else None,
+                }
+            )
+
+        logger.debug(
+            "Collected IAM authorization details: %d users, %d roles, %d groups, %d policies",
+            len(users),
+            len(roles),
+            len(groups),
+            len(policies),
+        )
+        return {"users": users, "roles": roles, "policies": policies, "groups": groups}
+
     def collect_password_policy(self) -> dict[str, Any] | None:
         """Collect account password policy.
 
@@ -417,3 +557,87 @@ class IAMCollector:
             return response["PolicyVersion"]["Document"]
         except ClientError:
             return None
+
+    def _get_credential_report(
+        self, timeout: float = 60.0, poll_interval: float = 2.0
+    ) -> dict[str, dict[str, str]] | None:
+        """Generate (if needed) and download the credential report, keyed by user name."""
+        deadline = time.monotonic() + timeout
+        try:
+            while self.iam.generate_credential_report()["State"] != "COMPLETE":
+                if time.monotonic() >= deadline:
+                    logger.warning("Timed out waiting for IAM credential report")
+                    return None
+                time.sleep(poll_interval)
+            content = self.iam.get_credential_report()["Content"]
+        except ClientError as e:
+            logger.warning("Failed to get IAM credential report: %s", e)
+            return None
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return {row["user"]: row for row in csv.DictReader(io.StringIO(content))}
+
+    def _get_virtual_mfa_devices(self) -> dict[str, list[dict[str, str]]]:
+        """Get assigned virtual MFA devices, keyed by user name."""
+        devices: dict[str, list[dict[str, str]]] = {}
+        try:
+            paginator = self.iam.get_paginator("list_virtual_mfa_devices")
+            for page in paginator.paginate(AssignmentStatus="Assigned"):
+                for device in page.get("VirtualMFADevices", []):
+                    user_name = (device.get("User") or {}).get("UserName")
+                    if user_name and device.get("EnableDate"):
+                        devices.setdefault(user_name, []).append(
+                            {
+                                "serial_number": device["SerialNumber"],
+                                "enable_date": device["EnableDate"].isoformat(),
+                            }
+                        )
+        except ClientError as e:
+            logger.warning("Failed to list virtual MFA devices: %s", e)
+        return devices
+
+    def _get_role_session_durations(self) -> dict[str, int | None]:
+        """Get MaxSessionDuration per role (not part of the authorization details)."""
+        durations: dict[str, int | None] = {}
+        try:
+            paginator = self.iam.get_paginator("list_roles")
+            for page in paginator.paginate():
+                for role in page["Roles"]:
+                    durations[role["RoleName"]] = role.get("MaxSessionDuration")
+        except ClientError as e:
+            logger.warning("Failed to list IAM roles: %s", e)
+        return durations
+
+    @staticmethod
+    def _attached(entity: dict[str, Any]) -> list[dict[str, str]]:
+        """Attached managed policies from an authorization details entry."""
+        return [
+            {"policy_name": p["PolicyName"], "policy_arn": p["PolicyArn"]}
+            for p in entity.get("AttachedManagedPolicies", [])
+        ]
+
+    @staticmethod
+    def _report_time(value: str | None) -> str | None:
+        """Credential report timestamp, or None for N/A-style values."""
+        if value is None or value in _REPORT_EMPTY_VALUES:
+            return None
+        return value
+
+    @classmethod
+    def _report_access_keys(cls, row: dict[str, str]) -> list[dict[str, Any]]:
+        """Access keys from a credential report row (key IDs are not reported)."""
+        keys = []
+        for n in (1, 2):
+            created = cls._report_time(row.get(f"access_key_{n}_last_rotated"))
+            if created is None:
+                continue
+            keys.append(
+                {
+                    "access_key_id": None,
+                    "status": "Active"
+                    if row.get(f"access_key_{n}_active") == "true"
+                    else "Inactive",
+                    "create_date": created,
+                }
+            )
+        return keys
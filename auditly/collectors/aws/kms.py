@@ -11,10 +11,14 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Callable
+from functools import partial
 from typing import Any
 
 from ..common import finalize_evidence
+from .changes import TrackedSection, collect_sections
 from .client import AWSClient
+from .fanout import fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +31,8 @@ except ImportError:
 class KMSCollector:
     """Collector for AWS KMS evidence."""
 
+    TRACKED_SECTIONS = (TrackedSection("keys", "AWS::KMS::Key", "key_id"),)
+
     def __init__(self, client: AWSClient):
         """Initialize KMS collector.
 
@@ -35,19 +41,25 @@ class KMSCollector:
         """
         self.client = client
         self.kms = client.get_client("kms")
+        self.changes = None
+
+    def sections(self) -> dict[str, Callable[..., list[dict[str, Any]]]]:
+        """Evidence section name -> collect method."""
+        return {"keys": self.collect_keys, "aliases": self.collect_aliases}
 
-    def collect_all(self) -> dict[str, Any]:
+    def collect_all(self, previous: dict[str, Any] | None = None) -> dict[str, Any]:
         """Collect all KMS evidence.
 
+        Args:
+            previous: Evidence from the previous run; when given, only keys
+                AWS Config reports as changed since then are described again
+
         Returns:
             Dictionary containing KMS evidence
         """
         logger.info("Starting AWS KMS evidence collection")
 
-        data = {
-            "keys": self.collect_keys(),
-            "aliases": self.collect_aliases(),
-        }
+        data = collect_sections(self, previous)
         evidence = finalize_evidence(
             data,
             collector="aws-kms",
@@ -59,26 +71,40 @@ class KMSCollector:
 
         return evidence
 
-    def collect_keys(self) -> list[dict[str, Any]]:
-        """Collect KMS key configurations."""
+    def collect_keys(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect KMS key configurations (only ``ids`` when given)."""
         keys = []
 
         try:
-            paginator = self.kms.get_paginator("list_keys")
-            for page in paginator.paginate():
-                for key_id in [k.get("KeyId") for k in page.get("Keys", [])]:
-                    key_metadata = self._get_key_metadata(key_id)
-                    if key_metadata:
-                        keys.append(key_metadata)
+            key_ids = ids
+            if key_ids is None:
+                paginator = self.kms.get_paginator("list_keys")
+                key_ids = [
+                    k.get("KeyId") for page in paginator.paginate() for k in page.get("Keys", [])
+                ]
+            # Describe, policy, rotation and grant calls run concurrently per key
+            for key_metadata in fan_out(
+                partial(self._get_key_metadata, strict=ids is not None),
+                key_ids,
+                self.client.concurrency_for("kms"),
+            ):
+                if key_metadata:
+                    keys.append(key_metadata)
 
             logger.debug("Collected %d KMS keys", len(keys))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect KMS keys: %s", e)
 
         return keys
 
-    def _get_key_metadata(self, key_id: str) -> dict[str, Any] | None:
-        """Get detailed metadata for a KMS key."""
+    def _get_key_metadata(self, key_id: str, strict: bool = False) -> dict[str, Any] | None:
+        """Get detailed metadata for a KMS key.
+
+        Returns None if the key cannot be described. With ``strict`` that is
+        only the case for a deleted key; other errors are raised.
+        """
         try:
             desc_response = self.kms.describe_key(KeyId=key_id)
             key_metadata = desc_response.get("KeyMetadata", {})
@@ -115,6 +141,8 @@ class KMSCollector:
                 "grants": grants,
             }
         except ClientError as e:
+            if strict and e.response.get("Error", {}).get("Code") != "NotFoundException":
+                raise
             logger.warning("Failed to get metadata for key %s: %s", key_id, e)
             return None
 
@@ -0,0 +1,253 @@
+"""Organization-wide AWS collection across accounts and regions.
+
+A sweep assumes a role into every target account, resolves the regions to
+visit, and splits the work into partitions: one per (account, region) for
+regional services and one ``global`` partition per account for the services
+whose collector spec is marked ``global_service`` (IAM and S3).
+Partitions run on a thread pool sized by a global concurrency budget and are
+yielded as soon as each one finishes, so callers can upload the evidence
+and drop it rather than holding a whole organization in memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import AbstractContextManager
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..common import finalize_evidence
+from ..registry import collector_registry
+from .client import AWSClient
+from .fanout import fan_out
+
+logger = logging.getLogger(__name__)
+
+GLOBAL_REGION = "global"
+DEFAULT_ROLE_NAME = "OrganizationAccountAccessRole"
+DEFAULT_MAX_CONCURRENCY = 16
+
+
+@dataclass
+class Partition:
+    """One unit of sweep work: a set of services in one account and region."""
+
+    account_id: str
+    region: str
+    services: list[str]
+
+    @property
+    def key(self) -> str:
+        """Stable identifier, e.g. ``123456789012/us-east-1``."""
+        return f"{self.account_id}/{self.region}"
+
+
+@dataclass
+class PartitionResult:
+    """Evidence (or failure) for one partition."""
+
+    partition: Partition
+    evidence: dict[str, Any] | None
+    errors: dict[str, str] = field(default_factory=dict)
+    duration_seconds: float = 0.0
+    completed: int = 0
+    total: int = 0
+
+
+# (service, collector, partition) -> context yielding extra ``collect_all`` arguments,
+# e.g. CloudTrail's event sink and checkpoints; it is exited once the collector returns
+CollectOptions = Callable[[str, Any, "Partition"], AbstractContextManager[dict[str, Any]]]
+
+
+def role_arn(account_id: str, role_name: str = DEFAULT_ROLE_NAME) -> str:
+    """Build the ARN of the role to assume in an account."""
+    return f"arn:aws:iam::{account_id}:role/{role_name}"
+
+
+def list_organization_accounts(client: AWSClient) -> list[str]:
+    """List the IDs of active accounts in the caller's AWS Organization.
+
+    Args:
+        client: AWSClient for the organization's management (or delegated admin) account
+
+    Returns:
+        Sorted account IDs
+    """
+    paginator = client.get_client("organizations").get_paginator("list_accounts")
+    return sorted(
+        account["Id"]
+        for page in paginator.paginate()
+        for account in page.get("Accounts", [])
+        if account.get("Status") == "ACTIVE"
+    )
+
+
+def plan_partitions(
+    account_regions: dict[str, list[str]], services: Iterable[str]
+) -> list[Partition]:
+    """Split a sweep into partitions.
+
+    Args:
+        account_regions: Account ID -> regions to collect regional services from
+        services: Registered AWS collector service names
+
+    Returns:
+        A ``global`` partition per account (if any global service is requested)
+        followed by one partition per (account, region) for regional services
+    """
+    services = list(services)
+    account_wide = {s for s in services if collector_registry.get("aws", s).global_service}
+    global_services = [s for s in services if s in account_wide]
+    regional_services = [s for s in services if s not in account_wide]
+    partitions = []
+    for account_id, regions in account_regions.items():
+        if global_services:
+            partitions.append(Partition(account_id, GLOBAL_REGION, global_services))
+        if regional_services:
+            partitions.extend(Partition(account_id, r, regional_services) for r in regions)
+    return partitions
+
+
+def collect_partition(
+    client: AWSClient, partition: Partition, collect_options: CollectOptions | None = None
+) -> PartitionResult:
+    """Run every service collector of a partition and merge their evidence.
+
+    Args:
+        client: AWSClient for the partition's account, bound to its region
+            (the account's home region for the ``global`` partition)
+        partition: Partition to collect
+        collect_options: Extra ``collect_all`` arguments per service (optional)
+
+    Returns:
+        PartitionResult whose evidence holds one entry per successful service
+    """
+    start = time.perf_counter()
+    services: dict[str, Any] = {}
+    errors: dict[str, str] = {}
+    for service in partition.services:
+        try:
+            collector = collector_registry.get("aws", service).load()(client)
+            if collect_options is None:
+                services[service] = collector.collect_all()
+            else:
+                with collect_options(service, collector, partition) as options:
+                    services[service] = collector.collect_all(**options)
+        except Exception as e:
+            logger.warning("Failed to collect %s for %s: %s", service, partition.key, e)
+            errors[service] = str(e)
+    evidence = None
+    if services:
+        evidence = finalize_evidence(
+            {"services": services, "errors": errors},
+            collector="aws-org",
+            account_id=partition.account_id,
+            region=partition.region,
+        )
+    return PartitionResult(partition, evidence, errors, time.perf_counter() - start)
+
+
+def sweep(
+    base_client: AWSClient,
+    account_ids: list[str],
+    services: Iterable[str],
+    *,
+    role_name: str = DEFAULT_ROLE_NAME,
+    external_id: str | None = None,
+    regions: list[str] | None = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    collect_options: CollectOptions | None = None,
+) -> Iterator[PartitionResult]:
+    """Collect evidence across accounts and regions, yielding partitions as they finish.
+
+    Roles are assumed (and enabled regions listed, when ``regions`` is None)
+    for all accounts concurrently first. Accounts whose role cannot be assumed
+    are yielded as a failed ``global`` partition and skipped.
+
+    Args:
+        base_client: Client for the account that can assume the target roles
+        account_ids: Accounts to sweep
+        services: Service names to collect
+        role_name: Role name to assume in every account
+        external_id: External ID for the role trust policy (optional)
+        regions: Regions to visit (default: every region enabled in each account)
+        max_concurrency: Partitions collected at once across the whole sweep
+        collect_options: Extra ``collect_all`` arguments per service and
+            partition (optional)
+
+    Yields:
+        PartitionResult per partition, in completion order
+    """
+    services = list(services)
+    known = collector_registry.services("aws")
+    unknown = [s for s in services if s not in known]
+    if unknown:
+        raise ValueError(f"Unknown AWS services: {', '.join(unknown)}")
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+
+    def _connect(account_id: str) -> tuple[str, AWSClient | None, list[str], str | None]:
+        try:
+            client = base_client.assume_role(
+                role_arn(account_id, role_name), external_id=external_id
+            )
+            return account_id, client, regions or client.list_regions(), None
+        except Exception as e:
+            logger.warning("Cannot access account %s: %s", account_id, e)
+            return account_id, None, [], str(e)
+
+    connected = fan_out(_connect, account_ids, max_concurrency)
+    clients = {account_id: client for account_id, client, _, _ in connected if client}
+    partitions = plan_partitions(
+        {
+            account_id: account_regions
+            for account_id, client, account_regions, _ in connected
+            if client
+        },
+        services,
+    )
+    failures = [
+        PartitionResult(Partition(account_id, GLOBAL_REGION, services), None, {"account": error})
+        for account_id, client, _, error in connected
+        if client is None
+    ]
+    total = len(partitions) + len(failures)
+    completed = 0
+    for result in failures:
+        completed += 1
+        result.completed, result.total = completed, total
+        yield result
+
+    def _run(partition: Partition) -> PartitionResult:
+        client = clients[partition.account_id]
+        if partition.region != GLOBAL_REGION:
+            client = client.for_region(partition.region)
+        return collect_partition(client, partition, collect_options)
+
+    pending = iter(partitions)
+    running: set[Future] = set()
+    with ThreadPoolExecutor(
+        max_workers=max_concurrency, thread_name_prefix="auditly-sweep"
+    ) as pool:
+        try:
+            while True:
+                # Submit lazily so at most max_concurrency partitions are queued or running
+                while len(running) < max_concurrency:
+                    partition = next(pending, None)
+                    if partition is None:
+                        break
+                    running.add(pool.submit(_run, partition))
+                if not running:
+                    break
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    completed += 1
+                    result = future.result()
+                    result.completed, result.total = completed, total
+                    yield result
+        finally:
+            for future in running:
+                future.cancel()
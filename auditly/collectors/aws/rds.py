@@ -11,9 +11,11 @@ Collects RDS evidence including:
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from ..common import finalize_evidence
+from .changes import TrackedSection, collect_sections, filtered_pages
 from .client import AWSClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,16 @@ except ImportError:
 class RDSCollector:
     """Collector for AWS RDS evidence."""
 
+    # Config identifies RDS resources by DbiResourceId; the identifier is the resource name
+    TRACKED_SECTIONS = (
+        TrackedSection(
+            "db_instances", "AWS::RDS::DBInstance", "db_instance_identifier", "resourceName"
+        ),
+        TrackedSection(
+            "db_clusters", "AWS::RDS::DBCluster", "db_cluster_identifier", "resourceName"
+        ),
+    )
+
     def __init__(self, client: AWSClient):
         """Initialize RDS collector.
 
@@ -35,21 +47,30 @@ class RDSCollector:
         """
         self.client = client
         self.rds = client.get_client("rds")
+        self.changes = None
+
+    def sections(self) -> dict[str, Callable[..., list[dict[str, Any]]]]:
+        """Evidence section name -> collect method."""
+        return {
+            "db_instances": self.collect_db_instances,
+            "db_clusters": self.collect_db_clusters,
+            "parameter_groups": self.collect_parameter_groups,
+            "subnet_groups": self.collect_subnet_groups,
+        }
 
-    def collect_all(self) -> dict[str, Any]:
+    def collect_all(self, previous: dict[str, Any] | None = None) -> dict[str, Any]:
         """Collect all RDS evidence.
 
+        Args:
+            previous: Evidence from the previous run; when given, only resources
+                AWS Config reports as changed since then are described again
+
         Returns:
             Dictionary containing RDS evidence
         """
         logger.info("Starting AWS RDS evidence collection")
 
-        data = {
-            "db_instances": self.collect_db_instances(),
-            "db_clusters": self.collect_db_clusters(),
-            "parameter_groups": self.collect_parameter_groups(),
-            "subnet_groups": self.collect_subnet_groups(),
-        }
+        data = collect_sections(self, previous)
         evidence = finalize_evidence(
             data,
             collector="aws-rds",
@@ -61,13 +82,13 @@ class RDSCollector:
 
         return evidence
 
-    def collect_db_instances(self) -> list[dict[str, Any]]:
-        """Collect RDS DB instance configurations."""
+    def collect_db_instances(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect RDS DB instance configurations (only ``ids`` when given)."""
         instances = []
 
         try:
             paginator = self.rds.get_paginator("describe_db_instances")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "db-instance-id", ids):
                 for instance in page.get("DBInstances", []):
                     instances.append(
                         {
@@ -120,17 +141,19 @@ class RDSCollector:
 
             logger.debug("Collected %d RDS instances", len(instances))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect RDS instances: %s", e)
 
         return instances
 
-    def collect_db_clusters(self) -> list[dict[str, Any]]:
-        """Collect RDS DB cluster configurations."""
+    def collect_db_clusters(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect RDS DB cluster configurations (only ``ids`` when given)."""
         clusters = []
 
         try:
             paginator = self.rds.get_paginator("describe_db_clusters")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "db-cluster-id", ids):
                 for cluster in page.get("DBClusters", []):
                     clusters.append(
                         {
@@ -169,6 +192,8 @@ class RDSCollector:
 
             logger.debug("Collected %d RDS clusters", len(clusters))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect RDS clusters: %s", e)
 
         return clusters
@@ -16,6 +16,7 @@ from typing import Any
 
 from ..common import finalize_evidence
 from .client import AWSClient
+from .fanout import fan_out
 
 logger = logging.getLogger(__name__)
 
@@ -58,29 +59,19 @@ class S3Collector:
         return evidence
 
     def collect_buckets(self) -> list[dict[str, Any]]:
-        """Collect S3 buckets with detailed configuration."""
+        """Collect S3 buckets with detailed configuration.
+
+        Per-bucket detail calls run concurrently (see ``AWSClient.concurrency_for``).
+        """
         buckets = []
 
         try:
             response = self.s3.list_buckets()
-            for bucket in response.get("Buckets", []):
-                bucket_name = bucket["Name"]
-
-                bucket_config = {
-                    "name": bucket_name,
-                    "creation_date": bucket["CreationDate"].isoformat(),
-                    "region": self._get_bucket_region(bucket_name),
-                    "versioning": self._get_bucket_versioning(bucket_name),
-                    "encryption": self._get_bucket_encryption(bucket_name),
-                    "public_access_block": self._get_public_access_block(bucket_name),
-                    "acl": self._get_bucket_acl(bucket_name),
-                    "policy": self._get_bucket_policy(bucket_name),
-                    "logging": self._get_bucket_logging(bucket_name),
-                    "lifecycle": self._get_lifecycle_rules(bucket_name),
-                    "tags": self._get_bucket_tags(bucket_name),
-                }
-
-                buckets.append(bucket_config)
+            buckets = fan_out(
+                self._collect_bucket,
+                response.get("Buckets", []),
+                self.client.concurrency_for("s3"),
+            )
 
             logger.debug("Collected %d S3 buckets", len(buckets))
         except ClientError as e:
@@ -88,6 +79,23 @@ class S3Collector:
 
         return buckets
 
+    def _collect_bucket(self, bucket: dict[str, Any]) -> dict[str, Any]:
+        """Get the detailed configuration of one bucket."""
+        bucket_name = bucket["Name"]
+        return {
+            "name": bucket_name,
+            "creation_date": bucket["CreationDate"].isoformat(),
+            "region": self._get_bucket_region(bucket_name),
+            "versioning": self._get_bucket_versioning(bucket_name),
+            "encryption": self._get_bucket_encryption(bucket_name),
+            "public_access_block": self._get_public_access_block(bucket_name),
+            "acl": self._get_bucket_acl(bucket_name),
+            "policy": self._get_bucket_policy(bucket_name),
+            "logging": self._get_bucket_logging(bucket_name),
+            "lifecycle": self._get_lifecycle_rules(bucket_name),
+            "tags": self._get_bucket_tags(bucket_name),
+        }
+
     def _get_bucket_region(self, bucket_name: str) -> str | None:
         """Get bucket region."""
         try:
@@ -0,0 +1,229 @@
+"""Client-side rate budgets and throttle accounting for AWS API calls.
+
+Collectors log and skip ``ClientError`` so one failing resource does not
+abort a whole service. Under throttling that silently yields incomplete
+evidence, so every boto3 client created by ``AWSClient`` reports its calls
+here: how many were retried, how many responses were throttled, and how many
+gave up after exhausting their retries. A service with exhausted calls
+produced partial evidence.
+
+Collectors that run concurrently share boto3 services (the EC2 and VPC
+collectors both call ``ec2``), so calls are also counted per scope: code
+running inside ``CallTracker.scope(name)``, including the fan-out threads it
+starts, is attributed to ``name``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, fields
+from typing import Any
+
+# botocore's default HTTP connection pool size per client
+DEFAULT_MAX_POOL_CONNECTIONS = 10
+# Attempts per API call (initial call + retries) under the retry mode
+DEFAULT_MAX_ATTEMPTS = 10
+DEFAULT_RETRY_MODE = "adaptive"
+
+# Error codes botocore's retry handlers treat as throttling
+THROTTLE_ERROR_CODES = frozenset(
+    {
+        "Throttling",
+        "ThrottlingException",
+        "ThrottledException",
+        "RequestThrottledException",
+        "TooManyRequestsException",
+        "ProvisionedThroughputExceededException",
+        "TransactionInProgressException",
+        "RequestLimitExceeded",
+        "BandwidthLimitExceeded",
+        "LimitExceededException",
+        "RequestThrottled",
+        "SlowDown",
+        "PriorRequestNotComplete",
+        "EC2ThrottledException",
+    }
+)
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting calls per second.
+
+    Tokens accrue at ``rate`` per second up to ``burst``; each call takes one
+    and blocks until one is available.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        """Initialize the bucket.
+
+        Args:
+            rate: Sustained calls per second (> 0)
+            burst: Maximum tokens held (default: max(1, rate))
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve the token now; a negative balance queues later callers behind us
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+
+@dataclass
+class ServiceCallStats:
+    """API call counters for one AWS service."""
+
+    calls: int = 0
+    retries: int = 0
+    throttles: int = 0
+    exhausted: int = 0
+    rate_limited_seconds: float = 0.0
+
+
+# Scope the calls of the current thread (or fan-out task) are attributed to
+_CALL_SCOPE: ContextVar[str | None] = ContextVar("auditly_aws_call_scope", default=None)
+
+
+class CallTracker:
+    """Rate-limits and counts API calls per service, shared by all client threads."""
+
+    def __init__(self, rate_limits: dict[str, float] | None = None) -> None:
+        """Initialize the tracker.
+
+        Args:
+            rate_limits: Service -> maximum calls per second, e.g. {"iam": 5}
+        """
+        self._buckets = {
+            service: TokenBucket(rate) for service, rate in (rate_limits or {}).items()
+        }
+        self._stats: dict[str, ServiceCallStats] = {}
+        self._scoped: dict[str, dict[str, ServiceCallStats]] = {}
+        self._lock = threading.Lock()
+
+    def _record(self, service: str, **deltas: float) -> None:
+        scope = _CALL_SCOPE.get()
+        with self._lock:
+            targets = [self._stats.setdefault(service, ServiceCallStats())]
+            if scope is not None:
+                targets.append(
+                    self._scoped.setdefault(scope, {}).setdefault(service, ServiceCallStats())
+                )
+            for stats in targets:
+                for name, delta in deltas.items():
+                    setattr(stats, name, getattr(stats, name) + delta)
+
+    @contextmanager
+    def scope(self, name: str) -> Iterator[None]:
+        """Attribute calls made inside the block to ``name``.
+
+        Args:
+            name: Scope name, e.g. the collector service ("vpc")
+        """
+        token = _CALL_SCOPE.set(name)
+        try:
+            yield
+        finally:
+            _CALL_SCOPE.reset(token)
+
+    def instrument(self, client: Any, service: str) -> None:
+        """Register rate limiting and accounting hooks on a boto3 client.
+
+        Args:
+            client: boto3 service client
+            service: Service name the client was created for
+        """
+        bucket = self._buckets.get(service)
+        events = client.meta.events
+
+        if bucket is not None:
+
+            def _before_send(**kwargs: Any) -> None:
+                # Fires once per HTTP attempt, so retries spend budget too
+                waited = bucket.acquire()
+                if waited:
+                    self._record(service, rate_limited_seconds=waited)
+
+            events.register("before-send", _before_send)
+
+        def _needs_retry(response: Any = None, **kwargs: Any) -> None:
+            if response is not None and _error_code(response[1]) in THROTTLE_ERROR_CODES:
+                self._record(service, throttles=1)
+
+        def _after_call(parsed: Any = None, **kwargs: Any) -> None:
+            parsed = parsed or {}
+            meta = parsed.get("ResponseMetadata", {})
+            # botocore also flags a success on the final attempt, so require an error
+            exhausted = "Error" in parsed and meta.get("MaxAttemptsReached", False)
+            self._record(
+                service,
+                calls=1,
+                retries=meta.get("RetryAttempts", 0),
+                exhausted=1 if exhausted else 0,
+            )
+
+        def _after_call_error(**kwargs: Any) -> None:
+            # Connection errors surface only once botocore has stopped retrying
+            self._record(service, calls=1, exhausted=1)
+
+        events.register("needs-retry", _needs_retry)
+        events.register("after-call", _after_call)
+        events.register("after-call-error", _after_call_error)
+
+    def stats(self, scope: str | None = None) -> dict[str, dict[str, Any]]:
+        """Snapshot of the counters.
+
+        Args:
+            scope: Only count calls made inside this scope (optional)
+
+        Returns:
+            Service -> counters dict
+        """
+        with self._lock:
+            source = self._stats if scope is None else self._scoped.get(scope, {})
+            return {service: asdict(stats) for service, stats in sorted(source.items())}
+
+
+def total_calls(stats: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Sum ``CallTracker.stats`` counters over services.
+
+    Args:
+        stats: Service -> counters dict
+
+    Returns:
+        Summed counters
+    """
+    totals = ServiceCallStats()
+    for counters in stats.values():
+        for f in fields(totals):
+            setattr(totals, f.name, getattr(totals, f.name) + counters.get(f.name, 0))
+    return asdict(totals)
+
+
+def _error_code(parsed: Any) -> str | None:
+    if not isinstance(parsed, dict):
+        return None
+    return parsed.get("Error", {}).get("Code")
@@ -11,9 +11,11 @@ Collects VPC evidence including:
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from ..common import finalize_evidence
+from .changes import TrackedSection, collect_sections, filter_chunks, filtered_pages
 from .client import AWSClient
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,14 @@ except ImportError:
 class VPCCollector:
     """Collector for AWS VPC evidence."""
 
+    TRACKED_SECTIONS = (
+        TrackedSection("flow_logs", "AWS::EC2::FlowLog", "flow_log_id"),
+        TrackedSection("route_tables", "AWS::EC2::RouteTable", "route_table_id"),
+        TrackedSection("nat_gateways", "AWS::EC2::NatGateway", "nat_gateway_id"),
+        TrackedSection("vpn_connections", "AWS::EC2::VPNConnection", "vpn_connection_id"),
+        TrackedSection("vpc_endpoints", "AWS::EC2::VPCEndpoint", "vpc_endpoint_id"),
+    )
+
     def __init__(self, client: AWSClient):
         """Initialize VPC collector.
 
@@ -35,22 +45,31 @@ class VPCCollector:
         """
         self.client = client
         self.ec2 = client.get_client("ec2")
+        self.changes = None
+
+    def sections(self) -> dict[str, Callable[..., list[dict[str, Any]]]]:
+        """Evidence section name -> collect method."""
+        return {
+            "flow_logs": self.collect_flow_logs,
+            "route_tables": self.collect_route_tables,
+            "nat_gateways": self.collect_nat_gateways,
+            "vpn_connections": self.collect_vpn_connections,
+            "vpc_endpoints": self.collect_vpc_endpoints,
+        }
 
-    def collect_all(self) -> dict[str, Any]:
+    def collect_all(self, previous: dict[str, Any] | None = None) -> dict[str, Any]:
         """Collect all VPC evidence.
 
+        Args:
+            previous: Evidence from the previous run; when given, only resources
+                AWS Config reports as changed since then are described again
+
         Returns:
             Dictionary containing VPC evidence
         """
         logger.info("Starting AWS VPC evidence collection")
 
-        data = {
-            "flow_logs": self.collect_flow_logs(),
-            "route_tables": self.collect_route_tables(),
-            "nat_gateways": self.collect_nat_gateways(),
-            "vpn_connections": self.collect_vpn_connections(),
-            "vpc_endpoints": self.collect_vpc_endpoints(),
-        }
+        data = collect_sections(self, previous)
         evidence = finalize_evidence(
             data,
             collector="aws-vpc",
@@ -62,13 +81,13 @@ class VPCCollector:
 
         return evidence
 
-    def collect_flow_logs(self) -> list[dict[str, Any]]:
-        """Collect VPC Flow Logs configurations."""
+    def collect_flow_logs(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect VPC Flow Logs configurations (only ``ids`` when given)."""
         flow_logs = []
 
         try:
             paginator = self.ec2.get_paginator("describe_flow_logs")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "flow-log-id", ids, param="Filter"):
                 for log in page.get("FlowLogs", []):
                     flow_logs.append(
                         {
@@ -92,17 +111,19 @@ class VPCCollector:
 
             logger.debug("Collected %d VPC Flow Logs", len(flow_logs))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect VPC Flow Logs: %s", e)
 
         return flow_logs
 
-    def collect_route_tables(self) -> list[dict[str, Any]]:
-        """Collect route table configurations."""
+    def collect_route_tables(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect route table configurations (only ``ids`` when given)."""
         route_tables = []
 
         try:
             paginator = self.ec2.get_paginator("describe_route_tables")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "route-table-id", ids):
                 for rt in page.get("RouteTables", []):
                     route_tables.append(
                         {
@@ -135,17 +156,19 @@ class VPCCollector:
 
             logger.debug("Collected %d route tables", len(route_tables))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect route tables: %s", e)
 
         return route_tables
 
-    def collect_nat_gateways(self) -> list[dict[str, Any]]:
-        """Collect NAT Gateway configurations."""
+    def collect_nat_gateways(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect NAT Gateway configurations (only ``ids`` when given)."""
         nat_gateways = []
 
         try:
             paginator = self.ec2.get_paginator("describe_nat_gateways")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "nat-gateway-id", ids, param="Filter"):
                 for nat in page.get("NatGateways", []):
                     nat_gateways.append(
                         {
@@ -168,17 +191,22 @@ class VPCCollector:
 
             logger.debug("Collected %d NAT Gateways", len(nat_gateways))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect NAT Gateways: %s", e)
 
         return nat_gateways
 
-    def collect_vpn_connections(self) -> list[dict[str, Any]]:
-        """Collect VPN connection configurations."""
+    def collect_vpn_connections(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect VPN connection configurations (only ``ids`` when given)."""
         vpn_connections = []
 
         try:
-            response = self.ec2.describe_vpn_connections()
-            for vpn in response.get("VpnConnections", []):
+            responses = (
+                self.ec2.describe_vpn_connections(**filters)
+                for filters in filter_chunks("vpn-connection-id", ids)
+            )
+            for vpn in (v for response in responses for v in response.get("VpnConnections", [])):
                 vpn_connections.append(
                     {
                         "vpn_connection_id": vpn.get("VpnConnectionId"),
@@ -199,17 +227,19 @@ class VPCCollector:
 
             logger.debug("Collected %d VPN connections", len(vpn_connections))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect VPN connections: %s", e)
 
         return vpn_connections
 
-    def collect_vpc_endpoints(self) -> list[dict[str, Any]]:
-        """Collect VPC endpoint configurations."""
+    def collect_vpc_endpoints(self, ids: list[str] | None = None) -> list[dict[str, Any]]:
+        """Collect VPC endpoint configurations (only ``ids`` when given)."""
         endpoints = []
 
         try:
             paginator = self.ec2.get_paginator("describe_vpc_endpoints")
-            for page in paginator.paginate():
+            for page in filtered_pages(paginator, "vpc-endpoint-id", ids):
                 for endpoint in page.get("VpcEndpoints", []):
                     endpoints.append(
                         {
@@ -233,6 +263,8 @@ class VPCCollector:
 
             logger.debug("Collected %d VPC endpoints", len(endpoints))
         except ClientError as e:
+            if ids is not None:
+                raise
             logger.error("Failed to collect VPC endpoints: %s", e)
 
         return endpoints
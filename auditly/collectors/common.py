@@ -4,9 +4,20 @@ from __future__ import annotations
 
 import hashlib
 import json
+import zlib
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from json.encoder import encode_basestring_ascii
 from typing import Any
 
+# Compressed bytes buffered before a chunk is handed to the uploader
+NDJSON_CHUNK_SIZE = 1024 * 1024
+# Encoded bytes buffered before a canonical JSON chunk is handed on
+CANONICAL_CHUNK_SIZE = 256 * 1024
+
+# Canonical evidence encoding: the same bytes as json.dumps(sort_keys=True, default=str)
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
 
 def finalize_evidence(
     data: dict[str, Any],
@@ -29,6 +40,153 @@ def finalize_evidence(
         "version": version,
     }
 
-    evidence_json = json.dumps(evidence, sort_keys=True, default=str)
-    evidence["metadata"]["sha256"] = hashlib.sha256(evidence_json.encode()).hexdigest()
+    evidence["metadata"]["sha256"] = canonical_sha256(evidence)
     return evidence
+
+
+def iter_canonical_json(obj: Any, _depth: int = 0) -> Iterator[str]:
+    """Yield the canonical JSON encoding of ``obj`` in pieces.
+
+    The pieces join to ``json.dumps(obj, sort_keys=True, default=str)``. The
+    evidence document and its sections are walked; anything deeper (one
+    resource record) is encoded in a single C-encoder call, so no string much
+    larger than a record is ever built.
+    """
+    if _depth < 2 and isinstance(obj, dict) and obj and all(isinstance(k, str) for k in obj):
+        separator = "{"
+        for key in sorted(obj):
+            yield f"{separator}{encode_basestring_ascii(key)}: "
+            yield from iter_canonical_json(obj[key], _depth + 1)
+            separator = ", "
+        yield "}"
+    elif _depth < 2 and isinstance(obj, list | tuple) and obj:
+        separator = "["
+        for item in obj:
+            yield separator
+            yield from iter_canonical_json(item, _depth + 1)
+            separator = ", "
+        yield "]"
+    else:
+        yield _CANONICAL_ENCODER.encode(obj)
+
+
+class CanonicalJSONStream:
+    """Encode evidence as canonical JSON chunks, hashing while writing.
+
+    One pass produces what is written to disk or uploaded, and ``sha256`` and
+    ``size`` describe exactly those bytes once iteration finishes.
+    """
+
+    def __init__(self, obj: Any, chunk_size: int = CANONICAL_CHUNK_SIZE) -> None:
+        """Initialize the stream.
+
+        Args:
+            obj: JSON-serializable evidence (non-JSON values are encoded with ``str``)
+            chunk_size: Target size of each chunk in bytes
+        """
+        self._obj = obj
+        self.chunk_size = chunk_size
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        """Hex sha256 of the bytes yielded so far."""
+        return self._hash.hexdigest()
+
+    def _emit(self, pieces: list[str]) -> bytes:
+        # ensure_ascii output: one byte per character
+        chunk = "".join(pieces).encode("ascii")
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield encoded chunks; the stream can be iterated only once."""
+        pending: list[str] = []
+        pending_size = 0
+        for piece in iter_canonical_json(self._obj):
+            pending.append(piece)
+            pending_size += len(piece)
+            if pending_size >= self.chunk_size:
+                yield self._emit(pending)
+                pending, pending_size = [], 0
+        if pending:
+            yield self._emit(pending)
+
+
+def canonical_sha256(obj: Any) -> str:
+    """Hex sha256 of the canonical JSON encoding of ``obj``, computed in one pass."""
+    stream = CanonicalJSONStream(obj)
+    for _ in stream:
+        pass
+    return stream.sha256
+
+
+class GzipNDJSONStream:
+    """Encode records as gzip-compressed NDJSON chunks, hashing while writing.
+
+    Iterating the stream pulls records lazily and yields compressed chunks of
+    about ``chunk_size`` bytes, so memory use is independent of the number of
+    records. Once iteration finishes, ``sha256`` and ``size`` describe the
+    compressed object (what the vault stores) and ``content_sha256`` the
+    uncompressed NDJSON.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[dict[str, Any]],
+        chunk_size: int = NDJSON_CHUNK_SIZE,
+        compresslevel: int = 6,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            records: JSON-serializable records, consumed once
+            chunk_size: Target size of each compressed chunk in bytes
+            compresslevel: gzip compression level (1-9)
+        """
+        self._records = records
+        self.chunk_size = chunk_size
+        self.compresslevel = compresslevel
+        self.records = 0
+        self.size = 0
+        self.content_size = 0
+        self._hash = hashlib.sha256()
+        self._content_hash = hashlib.sha256()
+
+    @property
+    def sha256(self) -> str:
+        """Hex sha256 of the compressed bytes yielded so far."""
+        return self._hash.hexdigest()
+
+    @property
+    def content_sha256(self) -> str:
+        """Hex sha256 of the uncompressed NDJSON encoded so far."""
+        return self._content_hash.hexdigest()
+
+    def _emit(self, chunk: bytes) -> bytes:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Yield compressed chunks; the stream can be iterated only once."""
+        # wbits=31 produces a gzip container
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 31)
+        pending: list[bytes] = []
+        pending_size = 0
+        for record in self._records:
+            line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode()
+            self.records += 1
+            self.content_size += len(line)
+            self._content_hash.update(line)
+            compressed = compressor.compress(line)
+            if compressed:
+                pending.append(compressed)
+                pending_size += len(compressed)
+                if pending_size >= self.chunk_size:
+                    yield self._emit(b"".join(pending))
+                    pending, pending_size = [], 0
+        pending.append(compressor.flush())
+        yield self._emit(b"".join(pending))
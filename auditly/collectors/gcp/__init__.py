@@ -8,24 +8,32 @@ This package provides collectors for Google Cloud Platform services including:
 - VPC (networks, subnets, firewall rules, VPN)
 - Cloud KMS (keys, key rings, rotation)
 - Cloud Logging (sinks, metrics, audit logs)
+
+Collectors are imported on first access, so importing this package does not
+import the google-cloud libraries.
 """
 
-from .client import GCPClient
-from .compute import ComputeCollector
-from .iam import IAMCollector
-from .kms import KMSCollector
-from .logging import LoggingCollector
-from .sql import CloudSQLCollector
-from .storage import StorageCollector
-from .vpc import VPCCollector
+import importlib
+from typing import Any
+
+# Public name -> defining submodule
+_EXPORTS = {
+    "GCPClient": ".client",
+    "IAMCollector": ".iam",
+    "ComputeCollector": ".compute",
+    "StorageCollector": ".storage",
+    "CloudSQLCollector": ".sql",
+    "VPCCollector": ".vpc",
+    "KMSCollector": ".kms",
+    "LoggingCollector": ".logging",
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    "GCPClient",
-    "IAMCollector",
-    "ComputeCollector",
-    "StorageCollector",
-    "CloudSQLCollector",
-    "VPCCollector",
-    "KMSCollector",
-    "LoggingCollector",
-]
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -10,12 +10,12 @@ Collects evidence about:
 
 from __future__ import annotations
 
-import hashlib
-import json
 import logging
 from datetime import datetime
 from typing import Any
 
+from ..common import canonical_sha256
+
 logger = logging.getLogger(__name__)
 
 # type: ignore[import-untyped]
@@ -74,8 +74,7 @@ class IAMCollector:
         }
 
         # Compute evidence checksum
-        evidence_json = json.dumps(evidence, sort_keys=True, default=str)
-        evidence["metadata"]["sha256"] = hashlib.sha256(evidence_json.encode()).hexdigest()
+        evidence["metadata"]["sha256"] = canonical_sha256(evidence)
 
         return evidence
 
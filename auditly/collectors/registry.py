@@ -0,0 +1,271 @@
+"""Registry of cloud service collectors, imported only when selected.
+
+Each collector is described by a ``CollectorSpec``: its provider and service
+name, the evidence kind it produces, the SDK modules it needs and hints for
+running it alongside other collectors. Specs are plain data, so listing,
+validating and checking the dependencies of collectors costs no SDK import;
+the collector module (and boto3 or the google-cloud libraries behind it) is
+imported by ``CollectorSpec.load()`` when a run selects that service.
+
+Built-in collectors are registered below. Other packages add collectors by
+exposing a ``CollectorSpec`` (or an iterable of them) under the
+``auditly.collectors`` entry point group::
+
+    [project.entry-points."auditly.collectors"]
+    acme = "acme_auditly.specs:COLLECTORS"
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import threading
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "auditly.collectors"
+
+
+@dataclass(frozen=True)
+class CollectorSpec:
+    """Metadata describing a collector without importing it.
+
+    Attributes:
+        provider: Cloud provider (e.g. "aws")
+        service: Service name selected on the command line (e.g. "ec2")
+        target: Collector class as "module:ClassName"
+        kind: Evidence kind of the uploaded artifact (e.g. "aws-ec2")
+        requires: Modules the collector needs, checked without importing them
+        summary: Label -> evidence section counted in the progress summary
+        incremental: Whether ``collect_all`` accepts the previous evidence
+        global_service: Whether the service's API is account-wide rather than
+            regional, so a sweep collects it once per account
+        api_services: SDK clients the collector calls; collectors sharing one
+            share its connection pool, concurrency and rate limits
+    """
+
+    provider: str
+    service: str
+    target: str
+    kind: str
+    requires: tuple[str, ...] = ()
+    summary: dict[str, str] = field(default_factory=dict)
+    incremental: bool = False
+    global_service: bool = False
+    api_services: tuple[str, ...] = ()
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Registry key: (provider, service)."""
+        return self.provider, self.service
+
+    def missing_requirements(self) -> list[str]:
+        """Required modules that are not installed."""
+        missing = []
+        for module in self.requires:
+            try:
+                found = importlib.util.find_spec(module) is not None
+            except ModuleNotFoundError:
+                found = False
+            if not found:
+                missing.append(module)
+        return missing
+
+    def load(self) -> type:
+        """Import and return the collector class.
+
+        Raises:
+            ImportError: If the collector module or its SDK cannot be imported
+        """
+        module_name, _, attr = self.target.partition(":")
+        module = importlib.import_module(module_name)
+        try:
+            return getattr(module, attr)
+        except AttributeError as e:
+            raise ImportError(f"{module_name} has no collector {attr!r}") from e
+
+    def summarize(self, evidence: dict[str, Any]) -> str:
+        """One-line count of the summary sections of ``evidence``."""
+        return ", ".join(
+            f"{label}={len(evidence.get(section, []))}" for label, section in self.summary.items()
+        )
+
+
+class CollectorRegistry:
+    """Collector specs by provider and service.
+
+    Entry point plugins are discovered on first lookup; a plugin that fails to
+    load is logged and skipped so one broken package cannot disable collection.
+    """
+
+    def __init__(self, group: str | None = ENTRY_POINT_GROUP):
+        """Initialize an empty registry.
+
+        Args:
+            group: Entry point group to discover plugins from (None: builtins only)
+        """
+        self.group = group
+        self._specs: dict[tuple[str, str], CollectorSpec] = {}
+        self._discovered = group is None
+        self._lock = threading.Lock()
+
+    def register(self, spec: CollectorSpec) -> None:
+        """Add a collector spec.
+
+        Registering an identical spec again is a no-op.
+
+        Raises:
+            ValueError: If a different spec is registered for the same service
+        """
+        existing = self._specs.get(spec.key)
+        if existing is not None and existing != spec:
+            raise ValueError(f"Collector {spec.provider}/{spec.service} is already registered")
+        self._specs[spec.key] = spec
+
+    def get(self, provider: str, service: str) -> CollectorSpec:
+        """Spec of one collector.
+
+        Raises:
+            KeyError: If no collector is registered for the service
+        """
+        self._discover()
+        try:
+            return self._specs[provider, service]
+        except KeyError:
+            raise KeyError(f"No {provider} collector for service {service!r}") from None
+
+    def specs(self, provider: str | None = None) -> list[CollectorSpec]:
+        """Registered specs in registration order, optionally for one provider."""
+        self._discover()
+        return [s for s in self._specs.values() if provider is None or s.provider == provider]
+
+    def services(self, provider: str) -> list[str]:
+        """Service names registered for a provider."""
+        return [s.service for s in self.specs(provider)]
+
+    def _discover(self) -> None:
+        if self._discovered:
+            return
+        with self._lock:
+            if self._discovered:
+                return
+            for ep in entry_points(group=self.group):
+                try:
+                    loaded = ep.load()
+                    for spec in [loaded] if isinstance(loaded, CollectorSpec) else loaded:
+                        self.register(spec)
+                except Exception as e:
+                    logger.warning("Skipping collector plugin %s: %s", ep.name, e)
+            self._discovered = True
+
+
+def _aws(service: str, cls: str, summary: dict[str, str], **hints: Any) -> CollectorSpec:
+    hints.setdefault("api_services", (service,))
+    return CollectorSpec(
+        provider="aws",
+        service=service,
+        target=f"auditly.collectors.aws.{service}:{cls}",
+        kind=f"aws-{service}",
+        requires=("boto3",),
+        summary=summary,
+        **hints,
+    )
+
+
+def _gcp(service: str, module: str, cls: str, sdk: str, summary: dict[str, str]) -> CollectorSpec:
+    return CollectorSpec(
+        provider="gcp",
+        service=service,
+        target=f"auditly.collectors.gcp.{module}:{cls}",
+        kind=f"gcp-{service}",
+        requires=("google.auth", sdk),
+        summary=summary,
+        api_services=(sdk.rsplit(".", 1)[-1],),
+    )
+
+
+BUILTIN_COLLECTORS: tuple[CollectorSpec, ...] = (
+    _aws(
+        "iam",
+        "IAMCollector",
+        {"users": "users", "roles": "roles", "policies": "policies"},
+        global_service=True,
+    ),
+    _aws(
+        "ec2",
+        "EC2Collector",
+        {"instances": "instances", "sg": "security_groups", "volumes": "volumes"},
+        incremental=True,
+        api_services=("ec2", "config"),
+    ),
+    _aws("s3", "S3Collector", {"buckets": "buckets"}, global_service=True),
+    # Summarized from the event streams it uploads
+    _aws("cloudtrail", "CloudTrailCollector", {}, api_services=("cloudtrail", "logs", "s3")),
+    _aws(
+        "vpc",
+        "VPCCollector",
+        {"flow_logs": "flow_logs", "route_tables": "route_tables"},
+        incremental=True,
+        api_services=("ec2", "config"),
+    ),
+    _aws(
+        "rds",
+        "RDSCollector",
+        {"instances": "db_instances", "clusters": "db_clusters"},
+        incremental=True,
+        api_services=("rds", "config"),
+    ),
+    _aws(
+        "kms",
+        "KMSCollector",
+        {"keys": "keys", "aliases": "aliases"},
+        incremental=True,
+        api_services=("kms", "config"),
+    ),
+    _gcp(
+        "iam",
+        "iam",
+        "IAMCollector",
+        "google.cloud.iam_admin_v1",
+        {"service_accounts": "service_accounts", "roles": "custom_roles"},
+    ),
+    _gcp(
+        "compute",
+        "compute",
+        "ComputeCollector",
+        "google.cloud.compute_v1",
+        {"instances": "instances", "disks": "disks", "firewalls": "firewalls"},
+    ),
+    _gcp("storage", "storage", "StorageCollector", "google.cloud.storage", {"buckets": "buckets"}),
+    _gcp("sql", "sql", "CloudSQLCollector", "google.cloud.sql_v1", {"instances": "instances"}),
+    _gcp(
+        "vpc",
+        "vpc",
+        "VPCCollector",
+        "google.cloud.compute_v1",
+        {"networks": "networks", "subnets": "subnetworks"},
+    ),
+    _gcp(
+        "kms",
+        "kms",
+        "KMSCollector",
+        "google.cloud.kms_v1",
+        {"key_rings": "key_rings", "keys": "crypto_keys"},
+    ),
+    _gcp(
+        "logging",
+        "logging",
+        "LoggingCollector",
+        "google.cloud.logging_v2",
+        {"sinks": "sinks", "metrics": "metrics"},
+    ),
+)
+
+# Global registry instance
+collector_registry = CollectorRegistry()
+for _spec in BUILTIN_COLLECTORS:
+    collector_registry.register(_spec)
@@ -1,18 +1,222 @@
 """Database layer for auditly."""
 
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
 from sqlalchemy import create_engine
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+logger = logging.getLogger(__name__)
 
 # Declarative base for all ORM models
 Base = declarative_base()
 
-# Session factories (lazy-loaded in config)
+# Defaults mirror SQLAlchemy's QueuePool, plus recycling to survive server-side idle timeouts
+DEFAULT_POOL_SIZE = 5
+DEFAULT_MAX_OVERFLOW = 10
+DEFAULT_POOL_RECYCLE = 1800
+DEFAULT_POOL_TIMEOUT = 30.0
+
+# Active session factories (set by init_db_*; engines are cached per URL below)
 _async_engine = None
 _async_session_factory = None
 _sync_engine = None
 _sync_session_factory = None
 
+_engines_lock = threading.Lock()
+_sync_engines: dict[str, tuple[Engine, sessionmaker]] = {}
+_async_engines: dict[str, tuple[AsyncEngine, sessionmaker]] = {}
+# ("sync"/"async", url) -> pool options the cached engine was created with
+_pool_options: dict[tuple[str, str], dict[str, object]] = {}
+
+
+@dataclass
+class PoolStats:
+    """Connection acquisition counters for one engine's pool."""
+
+    checkouts: int = 0
+    wait_time_total: float = 0.0
+    wait_time_max: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record the time spent waiting for a pooled connection."""
+        self.checkouts += 1
+        self.wait_time_total += seconds
+        self.wait_time_max = max(self.wait_time_max, seconds)
+
+
+class _TimedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = getattr(self, "_auditly_stats", None)
+            if stats is not None:
+                stats.record_wait(time.perf_counter() - start)
+
+
+class _TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            stats = getattr(self, "_auditly_stats", None)
+            if stats is not None:
+                stats.record_wait(time.perf_counter() - start)
+
+
+def _engine_kwargs(
+    database_url: str,
+    poolclass: type,
+    pool_size: int | None,
+    max_overflow: int | None,
+    pool_recycle: int | None,
+    pool_timeout: float | None,
+) -> dict[str, object]:
+    kwargs: dict[str, object] = {"echo": False, "pool_pre_ping": True}
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite needs its per-thread/static pool; sizing does not apply
+        return kwargs
+    kwargs.update(
+        poolclass=poolclass,
+        **_resolved_pool_options(
+            _pool_request(pool_size, max_overflow, pool_recycle, pool_timeout)
+        ),
+    )
+    return kwargs
+
+
+def _pool_request(
+    pool_size: int | None,
+    max_overflow: int | None,
+    pool_recycle: int | None,
+    pool_timeout: float | None,
+) -> dict[str, object]:
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": pool_recycle,
+        "pool_timeout": pool_timeout,
+    }
+
+
+def _resolved_pool_options(requested: dict[str, object]) -> dict[str, object]:
+    defaults = {
+        "pool_size": DEFAULT_POOL_SIZE,
+        "max_overflow": DEFAULT_MAX_OVERFLOW,
+        "pool_recycle": DEFAULT_POOL_RECYCLE,
+        "pool_timeout": DEFAULT_POOL_TIMEOUT,
+    }
+    return {name: defaults[name] if value is None else value for name, value in requested.items()}
+
+
+def _warn_on_pool_mismatch(kind: str, database_url: str, requested: dict[str, object]) -> None:
+    """Log when a cached engine is reused with pool options it was not built with."""
+    created = _pool_options.get((kind, database_url), {})
+    ignored = {
+        name: value
+        for name, value in requested.items()
+        if value is not None and created.get(name) != value
+    }
+    if ignored:
+        logger.warning(
+            "Reusing the %s engine for %s created with %s; ignoring %s "
+            "(call dispose_engines() to rebuild it)",
+            kind,
+            make_url(database_url).render_as_string(hide_password=True),
+            created,
+            ignored,
+        )
+
+
+def get_sync_engine_for_url(
+    database_url: str,
+    *,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int | None = None,
+    pool_timeout: float | None = None,
+) -> tuple[Engine, sessionmaker]:
+    """
+    Return the cached sync engine and session factory for a URL, creating them once.
+
+    Pool options only apply when the engine is first created; a later call
+    passing different ones logs a warning. Call :func:`dispose_engines` to
+    rebuild with different settings.
+    """
+    requested = _pool_request(pool_size, max_overflow, pool_recycle, pool_timeout)
+    with _engines_lock:
+        cached = _sync_engines.get(database_url)
+        if cached is not None:
+            _warn_on_pool_mismatch("sync", database_url, requested)
+        else:
+            engine = create_engine(
+                database_url,
+                **_engine_kwargs(
+                    database_url,
+                    _TimedQueuePool,
+                    pool_size,
+                    max_overflow,
+                    pool_recycle,
+                    pool_timeout,
+                ),
+            )
+            engine.pool._auditly_stats = PoolStats()
+            cached = (engine, sessionmaker(engine))
+            _sync_engines[database_url] = cached
+            _pool_options[("sync", database_url)] = _resolved_pool_options(requested)
+        return cached
+
+
+def get_async_engine_for_url(
+    database_url: str,
+    *,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    pool_recycle: int | None = None,
+    pool_timeout: float | None = None,
+) -> tuple[AsyncEngine, sessionmaker]:
+    """Return the cached async engine and session factory for a URL, creating them once.
+
+    Like :func:`get_sync_engine_for_url`, pool options only apply on creation.
+    """
+    requested = _pool_request(pool_size, max_overflow, pool_recycle, pool_timeout)
+    with _engines_lock:
+        cached = _async_engines.get(database_url)
+        if cached is not None:
+            _warn_on_pool_mismatch("async", database_url, requested)
+        else:
+            engine = create_async_engine(
+                database_url,
+                **_engine_kwargs(
+                    database_url,
+                    _TimedAsyncQueuePool,
+                    pool_size,
+                    max_overflow,
+                    pool_recycle,
+                    pool_timeout,
+                ),
+            )
+            engine.sync_engine.pool._auditly_stats = PoolStats()
+            cached = (engine, sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+            _async_engines[database_url] = cached
+            _pool_options[("async", database_url)] = _resolved_pool_options(requested)
+        return cached
+
 
 async def get_async_session() -> AsyncSession:
     """Get an async database session."""
@@ -31,20 +235,16 @@ def get_sync_session():
     return _sync_session_factory()
 
 
-def init_db_async(database_url: str):
-    """Initialize async database engine and session factory."""
+def init_db_async(database_url: str, **pool_options):
+    """Initialize async database engine and session factory (reused per URL)."""
     global _async_engine, _async_session_factory
-    _async_engine = create_async_engine(database_url, echo=False, pool_pre_ping=True)
-    _async_session_factory = sessionmaker(
-        _async_engine, class_=AsyncSession, expire_on_commit=False
-    )
+    _async_engine, _async_session_factory = get_async_engine_for_url(database_url, **pool_options)
 
 
-def init_db_sync(database_url: str):
-    """Initialize sync database engine and session factory."""
+def init_db_sync(database_url: str, **pool_options):
+    """Initialize sync database engine and session factory (reused per URL)."""
     global _sync_engine, _sync_session_factory
-    _sync_engine = create_engine(database_url, echo=False, pool_pre_ping=True)
-    _sync_session_factory = sessionmaker(_sync_engine)
+    _sync_engine, _sync_session_factory = get_sync_engine_for_url(database_url, **pool_options)
 
 
 def get_async_engine():
@@ -61,3 +261,88 @@ def get_sync_engine():
     if _sync_engine is None:
         raise RuntimeError("Sync database not initialized. Call init_db_sync() first.")
     return _sync_engine
+
+
+def _pool_metrics(pool) -> dict[str, object]:
+    stats = getattr(pool, "_auditly_stats", None) or PoolStats()
+    metrics: dict[str, object] = {
+        "pool_class": type(pool).__name__,
+        "checkouts": stats.checkouts,
+        "wait_time_total": stats.wait_time_total,
+        "wait_time_max": stats.wait_time_max,
+        "wait_time_avg": stats.wait_time_total / stats.checkouts if stats.checkouts else 0.0,
+    }
+    # Only queue pools expose sizing counters
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        fn = getattr(pool, name, None)
+        if callable(fn):
+            metrics[name] = fn()
+    if "checkedout" in metrics:
+        metrics["checked_out"] = metrics.pop("checkedout")
+        metrics["checked_in"] = metrics.pop("checkedin")
+    return metrics
+
+
+def get_pool_metrics() -> dict[str, dict[str, object]]:
+    """
+    Report connection pool usage for every cached engine.
+
+    Returns:
+        Dict keyed by ``sync:<url>`` / ``async:<url>`` (passwords masked) with
+        pool size, checked-out/checked-in connections, overflow and wait times
+    """
+    with _engines_lock:
+        engines = [("sync", url, engine) for url, (engine, _) in _sync_engines.items()]
+        engines += [
+            ("async", url, engine.sync_engine) for url, (engine, _) in _async_engines.items()
+        ]
+    return {
+        f"{kind}:{make_url(url).render_as_string(hide_password=True)}": _pool_metrics(engine.pool)
+        for kind, url, engine in engines
+    }
+
+
+def _forget_engines():
+    global _sync_engine, _sync_session_factory, _async_engine, _async_session_factory
+    with _engines_lock:
+        sync_engines = [engine for engine, _ in _sync_engines.values()]
+        async_engines = [engine for engine, _ in _async_engines.values()]
+        _sync_engines.clear()
+        _async_engines.clear()
+        _pool_options.clear()
+        _sync_engine = _sync_session_factory = None
+        _async_engine = _async_session_factory = None
+    return sync_engines, async_engines
+
+
+def dispose_engines() -> None:
+    """Dispose all cached engines and close their pooled connections (sync context)."""
+    sync_engines, async_engines = _forget_engines()
+    for engine in sync_engines:
+        engine.dispose()
+    for engine in async_engines:
+        # Drops pool references without awaiting driver-level close
+        engine.sync_engine.dispose(close=False)
+
+
+async def dispose_engines_async() -> None:
+    """Dispose all cached engines, awaiting async connection shutdown."""
+    sync_engines, async_engines = _forget_engines()
+    for engine in sync_engines:
+        engine.dispose()
+    for engine in async_engines:
+        await engine.dispose()
+
+
+async def dispose_async_engine(database_url: str) -> None:
+    """Close the pooled connections of one URL's cached async engine.
+
+    Async connections belong to the event loop that opened them, so call this
+    before that loop closes (e.g. at the end of ``asyncio.run``). The engine
+    stays cached and opens new connections on its next use; sync engines, other
+    URLs and the active session factories are left untouched.
+    """
+    with _engines_lock:
+        cached = _async_engines.get(database_url)
+    if cached is not None:
+        await cached[0].dispose()
@@ -94,4 +94,5 @@ def migrate_manifests(
         migrated += 1
 
     session.commit()
+    session.close()
     return migrated
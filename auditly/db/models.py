@@ -274,6 +274,8 @@ class EvidenceVersion(Base):
     id = Column(Integer, primary_key=True)
     evidence_id = Column(Integer, ForeignKey("evidence.id"), nullable=False, index=True)
     version = Column(Integer, nullable=False)
+    # "full" keyframe payload or "delta" JSON Patch against the previous version
+    encoding = Column(String(10), default="full", server_default="full", nullable=False)
     data = Column(JSON, nullable=False)
     collected_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     collector_version = Column(String(50), nullable=True)
@@ -329,3 +331,32 @@ class JobRun(Base):
     def __repr__(self):
         """Return string representation of JobRun."""
         return f"<JobRun(id={self.id}, type={self.job_type}, env={self.environment}, status={self.status})>"
+
+
+class CollectionCheckpoint(Base):
+    """Resume point for incremental collection from an append-only event source."""
+
+    __tablename__ = "collection_checkpoints"
+
+    id = Column(Integer, primary_key=True)
+    collector = Column(String(100), nullable=False)  # e.g. aws-cloudtrail
+    account_id = Column(String(64), nullable=False)
+    region = Column(String(50), nullable=False)
+    stream = Column(String(255), nullable=False)  # trail name, or "event-history" for the API
+    last_event_time = Column(DateTime, nullable=True)
+    last_event_id = Column(String(255), nullable=True)
+    position = Column(JSON, default=dict, nullable=False)  # source-specific cursor state
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "collector", "account_id", "region", "stream", name="uq_collection_checkpoint"
+        ),
+    )
+
+    def __repr__(self):
+        """Return string representation of CollectionCheckpoint."""
+        return (
+            f"<CollectionCheckpoint(collector={self.collector}, account={self.account_id}, "
+            f"region={self.region}, stream={self.stream})>"
+        )
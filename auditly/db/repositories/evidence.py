@@ -5,9 +5,10 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ...evidence_versions import DEFAULT_KEYFRAME_INTERVAL, EvidenceVersionStore
 from ..models import (
     Evidence,
     EvidenceAccessLog,
@@ -95,51 +96,55 @@ class EvidenceRepository:
             self.session.add(entry)
         await self.session.flush()
 
-        async def add_evidence_version(
-            self,
-            evidence: Evidence,
-            data: dict,
-            collector_version: str | None = None,
-            signature: str | None = None,
-            collected_at: datetime | None = None,
-            attributes: dict | None = None,
-        ) -> EvidenceVersion:
-            """Create a new version record for an evidence row."""
-            stmt = select(func.coalesce(func.max(EvidenceVersion.version), 0)).where(
-                EvidenceVersion.evidence_id == evidence.id
-            )
-            res = await self.session.execute(stmt)
-            next_version = (res.scalar_one() or 0) + 1
-
-            version = EvidenceVersion(
-                evidence=evidence,
-                version=next_version,
-                data=data,
-                collected_at=collected_at or datetime.utcnow(),
+    async def add_evidence_version(
+        self,
+        evidence: Evidence,
+        data: dict,
+        collector_version: str | None = None,
+        signature: str | None = None,
+        collected_at: datetime | None = None,
+        attributes: dict | None = None,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ) -> EvidenceVersion:
+        """Create a new version record for an evidence row (keyframe or delta encoded)."""
+
+        def _add(sync_session) -> EvidenceVersion:
+            store = EvidenceVersionStore(sync_session, keyframe_interval=keyframe_interval)
+            return store.add_version(
+                evidence,
+                data,
                 collector_version=collector_version,
                 signature=signature,
-                attributes=attributes or {},
+                collected_at=collected_at,
+                attributes=attributes,
             )
-            self.session.add(version)
-            await self.session.flush()
-            return version
-
-        async def log_access(
-            self,
-            evidence: Evidence,
-            user_id: str,
-            action: str,
-            ip_address: str | None = None,
-            attributes: dict | None = None,
-        ) -> EvidenceAccessLog:
-            """Log access to evidence for auditability."""
-            entry = EvidenceAccessLog(
-                evidence=evidence,
-                user_id=user_id,
-                action=action,
-                ip_address=ip_address,
-                attributes=attributes or {},
+
+        return await self.session.run_sync(_add)
+
+    async def get_evidence_version_data(self, evidence_id: int, version: int) -> dict | None:
+        """Return the reconstructed payload of an evidence version."""
+        return await self.session.run_sync(
+            lambda sync_session: EvidenceVersionStore(sync_session).get_version_data(
+                evidence_id, version
             )
-            self.session.add(entry)
-            await self.session.flush()
-            return entry
+        )
+
+    async def log_access(
+        self,
+        evidence: Evidence,
+        user_id: str,
+        action: str,
+        ip_address: str | None = None,
+        attributes: dict | None = None,
+    ) -> EvidenceAccessLog:
+        """Log access to evidence for auditability."""
+        entry = EvidenceAccessLog(
+            evidence=evidence,
+            user_id=user_id,
+            action=action,
+            ip_address=ip_address,
+            attributes=attributes or {},
+        )
+        self.session.add(entry)
+        await self.session.flush()
+        return entry
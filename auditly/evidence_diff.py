@@ -0,0 +1,282 @@
+"""Structural, identity-aware JSON diff for evidence drift analysis.
+
+Evidence documents (IAM users, EC2 instances, KMS keys, ...) are mostly lists of
+records with a natural key. Comparing them positionally or as whole values
+produces noisy, huge diffs, so list elements are matched by the first identity
+key present on every element (``arn``, ``user_name``, ``instance_id``, ...).
+
+Changes are yielded lazily as path-level records; callers can stop early or
+stream them without materializing a full delta.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+# Ordered by preference: the first key present (and unique) on every element wins
+DEFAULT_IDENTITY_KEYS: tuple[str, ...] = (
+    "arn",
+    "key_arn",
+    "trail_arn",
+    "policy_arn",
+    "user_name",
+    "role_name",
+    "group_name",
+    "policy_name",
+    "instance_id",
+    "volume_id",
+    "snapshot_id",
+    "group_id",
+    "vpc_id",
+    "subnet_id",
+    "key_id",
+    "access_key_id",
+    "db_instance_identifier",
+    "db_cluster_identifier",
+    "trail_name",
+    "alias_name",
+    "name",
+    "id",
+)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class IdentitySelector:
+    """Path segment selecting a list element by its natural key."""
+
+    key: str
+    value: Any
+
+    def __str__(self) -> str:
+        """Render as ``[key=value]``."""
+        return f"[{self.key}={self.value}]"
+
+
+PathSegment = str | int | IdentitySelector
+
+
+@dataclass(frozen=True)
+class ChangeRecord:
+    """A single path-level difference between two documents."""
+
+    path: tuple[PathSegment, ...]
+    change_type: str  # added, removed, modified
+    old: Any = None
+    new: Any = None
+
+    @property
+    def path_str(self) -> str:
+        """Render the path as ``users[user_name=alice].mfa_enabled``."""
+        return format_path(self.path)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to a compact dict (omits the side that does not exist)."""
+        record: dict[str, Any] = {"path": self.path_str, "change_type": self.change_type}
+        if self.change_type != "added":
+            record["old"] = self.old
+        if self.change_type != "removed":
+            record["new"] = self.new
+        return record
+
+
+def format_path(path: Sequence[PathSegment]) -> str:
+    """Render path segments as a dotted path with list selectors."""
+    out = ""
+    for seg in path:
+        if isinstance(seg, IdentitySelector):
+            out += str(seg)
+        elif isinstance(seg, int):
+            out += f"[{seg}]"
+        else:
+            out += f".{seg}" if out else str(seg)
+    return out or "$"
+
+
+def _identity_key(old: list, new: list, identity_keys: Sequence[str]) -> str | None:
+    """Pick the first identity key present and unique on all dict elements of both lists."""
+    if not old and not new:
+        return None
+    for item in old:
+        if not isinstance(item, dict):
+            return None
+    for item in new:
+        if not isinstance(item, dict):
+            return None
+
+    for key in identity_keys:
+        ok = True
+        for items in (old, new):
+            seen = set()
+            for item in items:
+                value = item.get(key, _MISSING)
+                if value is _MISSING or value is None or isinstance(value, dict | list):
+                    ok = False
+                    break
+                if value in seen:
+                    ok = False
+                    break
+                seen.add(value)
+            if not ok:
+                break
+        if ok:
+            return key
+    return None
+
+
+def _is_scalar_list(items: list) -> bool:
+    return all(not isinstance(i, dict | list) for i in items)
+
+
+def iter_changes(
+    old: Any,
+    new: Any,
+    *,
+    identity_keys: Sequence[str] = DEFAULT_IDENTITY_KEYS,
+    path: tuple[PathSegment, ...] = (),
+) -> Iterator[ChangeRecord]:
+    """
+    Yield path-level changes between ``old`` and ``new``.
+
+    Args:
+        old: Previous document (any JSON-compatible value)
+        new: Current document
+        identity_keys: Candidate natural keys for matching list elements
+        path: Path prefix (used for recursion)
+
+    Yields:
+        ChangeRecord for each added, removed or modified leaf/subtree
+    """
+    if old is new:
+        return
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, old_val in old.items():
+            new_val = new.get(key, _MISSING)
+            if new_val is _MISSING:
+                yield ChangeRecord(path + (key,), "removed", old=old_val)
+            elif old_val != new_val:
+                yield from iter_changes(
+                    old_val, new_val, identity_keys=identity_keys, path=path + (key,)
+                )
+        for key, new_val in new.items():
+            if key not in old:
+                yield ChangeRecord(path + (key,), "added", new=new_val)
+        return
+
+    if isinstance(old, list) and isinstance(new, list):
+        yield from _iter_list_changes(old, new, identity_keys, path)
+        return
+
+    if old != new:
+        yield ChangeRecord(path, "modified", old=old, new=new)
+
+
+def _iter_list_changes(
+    old: list,
+    new: list,
+    identity_keys: Sequence[str],
+    path: tuple[PathSegment, ...],
+) -> Iterator[ChangeRecord]:
+    key = _identity_key(old, new, identity_keys)
+    if key is not None:
+        # Index only the old side; new elements are streamed against it
+        old_by_id = {item[key]: item for item in old}
+        seen = set()
+        for item in new:
+            ident = item[key]
+            seen.add(ident)
+            selector = IdentitySelector(key, ident)
+            previous = old_by_id.get(ident, _MISSING)
+            if previous is _MISSING:
+                yield ChangeRecord(path + (selector,), "added", new=item)
+            elif previous != item:
+                yield from iter_changes(
+                    previous, item, identity_keys=identity_keys, path=path + (selector,)
+                )
+        for ident, item in old_by_id.items():
+            if ident not in seen:
+                yield ChangeRecord(path + (IdentitySelector(key, ident),), "removed", old=item)
+        return
+
+    if _is_scalar_list(old) and _is_scalar_list(new):
+        # Treat scalar lists (group names, operations, ...) as multisets
+        old_counts = Counter(old)
+        new_counts = Counter(new)
+        for value in (old_counts - new_counts).elements():
+            yield ChangeRecord(path + (IdentitySelector("value", value),), "removed", old=value)
+        for value in (new_counts - old_counts).elements():
+            yield ChangeRecord(path + (IdentitySelector("value", value),), "added", new=value)
+        return
+
+    # Positional fallback
+    for idx in range(min(len(old), len(new))):
+        if old[idx] != new[idx]:
+            yield from iter_changes(
+                old[idx], new[idx], identity_keys=identity_keys, path=path + (idx,)
+            )
+    for idx in range(len(new), len(old)):
+        yield ChangeRecord(path + (idx,), "removed", old=old[idx])
+    for idx in range(len(old), len(new)):
+        yield ChangeRecord(path + (idx,), "added", new=new[idx])
+
+
+def diff_documents(
+    old: Any,
+    new: Any,
+    *,
+    identity_keys: Sequence[str] = DEFAULT_IDENTITY_KEYS,
+    max_changes: int | None = None,
+) -> dict[str, Any]:
+    """
+    Compute a compact delta between two evidence documents.
+
+    Args:
+        old: Previous document
+        new: Current document
+        identity_keys: Candidate natural keys for matching list elements
+        max_changes: Optional cap on returned change records
+
+    Returns:
+        Dict with ``changes`` (list of records), per-top-level-key ``summary``,
+        ``change_count`` and ``truncated`` flag
+    """
+    changes_iter = iter_changes(old, new, identity_keys=identity_keys)
+    records: list[dict[str, Any]] = []
+    summary: dict[str, dict[str, Any]] = {}
+    total = 0
+
+    limited = islice(changes_iter, max_changes) if max_changes is not None else changes_iter
+    for change in limited:
+        total += 1
+        records.append(change.to_dict())
+        _summarize(summary, change)
+
+    truncated = False
+    if max_changes is not None:
+        # Keep counting (without storing) so the summary stays accurate
+        for change in changes_iter:
+            truncated = True
+            total += 1
+            _summarize(summary, change)
+
+    return {
+        "changes": records,
+        "summary": summary,
+        "change_count": total,
+        "truncated": truncated,
+    }
+
+
+def _summarize(summary: dict[str, dict[str, Any]], change: ChangeRecord) -> None:
+    top = str(change.path[0]) if change.path else "$"
+    entry = summary.setdefault(top, {"change_type": change.change_type, "change_count": 0})
+    entry["change_count"] += 1
+    if len(change.path) > 1 or entry["change_type"] != change.change_type:
+        # Nested or mixed changes mean the top-level value itself was modified
+        entry["change_type"] = "modified"
@@ -2,12 +2,49 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import case, func, select
 from sqlalchemy.orm import Session
 
-from .db.models import Evidence, EvidenceAccessLog, EvidenceVersion
+from .db.models import Evidence, EvidenceAccessLog, EvidenceVersion, System
+from .evidence_diff import diff_documents
+from .evidence_versions import EvidenceVersionStore
+
+
+@dataclass
+class RecollectionPlanItem:
+    """A (system, evidence type) pair whose newest evidence is past its threshold."""
+
+    system_id: int
+    system_name: str
+    environment: str
+    evidence_type: str
+    last_collected_at: datetime
+    age_days: int
+    threshold_days: int
+    artifact_count: int
+
+    @property
+    def priority(self) -> float:
+        """Staleness relative to threshold (1.0 = exactly at threshold)."""
+        return self.age_days / max(self.threshold_days, 1)
+
+    def to_dict(self) -> dict[str, object]:
+        """Serialize the plan item for JSON output or collector dispatch."""
+        return {
+            "system_id": self.system_id,
+            "system_name": self.system_name,
+            "environment": self.environment,
+            "evidence_type": self.evidence_type,
+            "last_collected_at": self.last_collected_at.isoformat(),
+            "age_days": self.age_days,
+            "threshold_days": self.threshold_days,
+            "artifact_count": self.artifact_count,
+            "priority": round(self.priority, 3),
+        }
 
 
 class EvidenceLifecycleManager:
@@ -47,6 +84,82 @@ class EvidenceLifecycleManager:
         result = self.session.execute(query)
         return list(result.scalars().all())
 
+    def plan_recollection(
+        self,
+        thresholds: dict[str, int] | None = None,
+        default_threshold_days: int = 30,
+        environment: str | None = None,
+        system_ids: Iterable[int] | None = None,
+        now: datetime | None = None,
+    ) -> list[RecollectionPlanItem]:
+        """
+        Build a fleet-wide recollection plan in a single aggregated query.
+
+        The newest ``collected_at`` is computed per (system, evidence_type) and
+        compared in SQL against a per-type cutoff, so only overdue pairs are
+        returned. Results are ordered by priority (most overdue first).
+
+        Args:
+            thresholds: Optional mapping of evidence_type -> max age in days
+            default_threshold_days: Threshold for evidence types not in ``thresholds``
+            environment: Optional filter by system environment
+            system_ids: Optional filter by system IDs
+            now: Reference time (defaults to utcnow; useful for tests)
+
+        Returns:
+            List of RecollectionPlanItem sorted by descending priority
+        """
+        thresholds = thresholds or {}
+        now = now or datetime.utcnow()
+
+        latest = func.max(Evidence.collected_at)
+        default_cutoff = now - timedelta(days=default_threshold_days)
+        if thresholds:
+            cutoff = case(
+                {ev_type: now - timedelta(days=days) for ev_type, days in thresholds.items()},
+                value=Evidence.evidence_type,
+                else_=default_cutoff,
+            )
+        else:
+            cutoff = default_cutoff
+
+        query = (
+            select(
+                Evidence.system_id,
+                System.name,
+                System.environment,
+                Evidence.evidence_type,
+                latest.label("last_collected_at"),
+                func.count(Evidence.id).label("artifact_count"),
+            )
+            .join(System, System.id == Evidence.system_id)
+            .group_by(Evidence.system_id, System.name, System.environment, Evidence.evidence_type)
+            .having(latest < cutoff)
+        )
+
+        if environment:
+            query = query.where(System.environment == environment)
+        if system_ids is not None:
+            query = query.where(Evidence.system_id.in_(list(system_ids)))
+
+        plan = []
+        for row in self.session.execute(query):
+            plan.append(
+                RecollectionPlanItem(
+                    system_id=row.system_id,
+                    system_name=row.name,
+                    environment=row.environment,
+                    evidence_type=row.evidence_type,
+                    last_collected_at=row.last_collected_at,
+                    age_days=(now - row.last_collected_at).days,
+                    threshold_days=thresholds.get(row.evidence_type, default_threshold_days),
+                    artifact_count=row.artifact_count,
+                )
+            )
+
+        plan.sort(key=lambda item: (-item.priority, item.system_name, item.evidence_type))
+        return plan
+
     def get_evidence_versions(self, evidence_id: int) -> list[EvidenceVersion]:
         """
         Get all versions of an evidence record, ordered by version number.
@@ -65,6 +178,22 @@ class EvidenceLifecycleManager:
         result = self.session.execute(query)
         return list(result.scalars().all())
 
+    def get_version_data(self, evidence_id: int, version: int) -> dict | None:
+        """
+        Get the full payload of an evidence version.
+
+        Delta-encoded versions are transparently reconstructed from the
+        nearest preceding keyframe.
+
+        Args:
+            evidence_id: Evidence ID
+            version: Version number
+
+        Returns:
+            Reconstructed payload, or None if the version does not exist
+        """
+        return EvidenceVersionStore(self.session).get_version_data(evidence_id, version)
+
     def detect_duplicate_evidence(
         self,
         system_id: int,
@@ -98,17 +227,23 @@ class EvidenceLifecycleManager:
         evidence_id: int,
         version1: int,
         version2: int,
+        max_changes: int | None = 1000,
     ) -> dict[str, object]:
         """
         Compare two versions of evidence to detect configuration drift.
 
+        List elements are matched by natural keys (arn, user_name, instance_id, ...)
+        so the result is a compact, path-level delta rather than two full copies.
+
         Args:
             evidence_id: Evidence ID
             version1: First version number
             version2: Second version number
+            max_changes: Cap on returned change records (None for unlimited)
 
         Returns:
-            Dict with drift analysis
+            Dict with drift analysis: ``changes`` summarizes each top-level key,
+            ``delta`` lists path-level change records
         """
         v1 = self.session.execute(
             select(EvidenceVersion).where(
@@ -127,28 +262,12 @@ class EvidenceLifecycleManager:
         if not v1 or not v2:
             return {"error": "Version not found"}
 
-        # Simple drift detection: compare JSON data
-        data1 = v1.data
-        data2 = v2.data
-
-        # Find changed keys
-        all_keys = set(data1.keys()) | set(data2.keys())
-        changes = {}
-
-        for key in all_keys:
-            val1 = data1.get(key)
-            val2 = data2.get(key)
-
-            if val1 != val2:
-                changes[key] = {
-                    "old": val1,
-                    "new": val2,
-                    "change_type": (
-                        "added"
-                        if key not in data1
-                        else ("removed" if key not in data2 else "modified")
-                    ),
-                }
+        store = EvidenceVersionStore(self.session)
+        diff = diff_documents(
+            store.get_version_data(evidence_id, version1),
+            store.get_version_data(evidence_id, version2),
+            max_changes=max_changes,
+        )
 
         return {
             "evidence_id": evidence_id,
@@ -156,8 +275,11 @@ class EvidenceLifecycleManager:
             "version2": version2,
             "collected_at_v1": v1.collected_at.isoformat(),
             "collected_at_v2": v2.collected_at.isoformat(),
-            "changes": changes,
-            "drift_detected": len(changes) > 0,
+            "changes": diff["summary"],
+            "delta": diff["changes"],
+            "change_count": diff["change_count"],
+            "truncated": diff["truncated"],
+            "drift_detected": diff["change_count"] > 0,
         }
 
     def get_access_log(
@@ -0,0 +1,301 @@
+"""Delta-encoded evidence version storage.
+
+Evidence snapshots change little between collections, so storing every
+``EvidenceVersion.data`` in full duplicates most of the payload. Versions are
+stored as periodic full keyframes with RFC 6902 JSON Patch deltas in between;
+any version is reconstructed from the nearest keyframe at or before it.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from .db.models import Evidence, EvidenceVersion
+
+ENCODING_FULL = "full"
+ENCODING_DELTA = "delta"
+
+DEFAULT_KEYFRAME_INTERVAL = 10
+
+
+# --- JSON Patch (RFC 6902 subset: add, remove, replace) ---
+
+
+def _escape(token: str | int) -> str:
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def make_patch(old: Any, new: Any, path: str = "") -> list[dict[str, Any]]:
+    """
+    Build a JSON Patch that transforms ``old`` into ``new``.
+
+    Dicts are diffed per key. Lists are diffed after trimming their common
+    prefix and suffix, so appends, inserts and deletes of contiguous runs
+    produce small patches.
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: list[dict[str, Any]] = []
+        for key in old:
+            if key not in new:
+                ops.append({"op": "remove", "path": f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({"op": "add", "path": child, "value": value})
+            else:
+                ops.extend(make_patch(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        return _make_list_patch(old, new, path)
+
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _make_list_patch(old: list, new: list, path: str) -> list[dict[str, Any]]:
+    start = 0
+    limit = min(len(old), len(new))
+    while start < limit and old[start] == new[start]:
+        start += 1
+
+    old_end, new_end = len(old), len(new)
+    while old_end > start and new_end > start and old[old_end - 1] == new[new_end - 1]:
+        old_end -= 1
+        new_end -= 1
+
+    ops: list[dict[str, Any]] = []
+    shared = min(old_end, new_end) - start
+    for offset in range(shared):
+        idx = start + offset
+        ops.extend(make_patch(old[idx], new[idx], f"{path}/{idx}"))
+    # Remove surplus old elements from the back so indexes stay valid
+    for idx in range(old_end - 1, start + shared - 1, -1):
+        ops.append({"op": "remove", "path": f"{path}/{idx}"})
+    for idx in range(start + shared, new_end):
+        ops.append({"op": "add", "path": f"{path}/{idx}", "value": new[idx]})
+    return ops
+
+
+def apply_patch(doc: Any, patch: list[dict[str, Any]], *, in_place: bool = False) -> Any:
+    """
+    Apply a JSON Patch produced by :func:`make_patch`.
+
+    Args:
+        doc: Document to patch
+        patch: List of patch operations
+        in_place: Mutate ``doc`` instead of working on a deep copy
+
+    Returns:
+        The patched document
+
+    Raises:
+        ValueError: On unsupported operations or invalid paths
+    """
+    if not in_place:
+        doc = copy.deepcopy(doc)
+
+    for op in patch:
+        kind = op["op"]
+        tokens = [_unescape(t) for t in op["path"].split("/")[1:]] if op["path"] else []
+
+        if not tokens:
+            if kind in ("add", "replace"):
+                doc = copy.deepcopy(op["value"])
+                continue
+            raise ValueError(f"Cannot {kind} document root")
+
+        parent = doc
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            idx = len(parent) if last == "-" else int(last)
+            if kind == "add":
+                parent.insert(idx, copy.deepcopy(op["value"]))
+            elif kind == "remove":
+                del parent[idx]
+            elif kind == "replace":
+                parent[idx] = copy.deepcopy(op["value"])
+            else:
+                raise ValueError(f"Unsupported patch op: {kind}")
+        else:
+            if kind in ("add", "replace"):
+                parent[last] = copy.deepcopy(op["value"])
+            elif kind == "remove":
+                del parent[last]
+            else:
+                raise ValueError(f"Unsupported patch op: {kind}")
+
+    return doc
+
+
+def _json_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), default=str))
+
+
+# --- Version store ---
+
+
+class EvidenceVersionStore:
+    """Store and reconstruct evidence versions as keyframes plus JSON Patch deltas."""
+
+    def __init__(self, session: Session, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL):
+        """
+        Initialize the version store.
+
+        Args:
+            session: Sync SQLAlchemy session
+            keyframe_interval: Store a full snapshot every N versions (1 = always full)
+        """
+        if keyframe_interval < 1:
+            raise ValueError("keyframe_interval must be >= 1")
+        self.session = session
+        self.keyframe_interval = keyframe_interval
+
+    def add_version(
+        self,
+        evidence: Evidence,
+        data: dict[str, Any],
+        collector_version: str | None = None,
+        signature: str | None = None,
+        collected_at: datetime | None = None,
+        attributes: dict | None = None,
+    ) -> EvidenceVersion:
+        """Append a new version, encoded as a keyframe or a delta against the previous one."""
+        previous = None
+        if evidence.id is not None:
+            previous = self.session.execute(
+                select(func.max(EvidenceVersion.version)).where(
+                    EvidenceVersion.evidence_id == evidence.id
+                )
+            ).scalar()
+        next_version = (previous or 0) + 1
+
+        encoding, payload = ENCODING_FULL, data
+        if previous and (next_version - 1) % self.keyframe_interval != 0:
+            patch = make_patch(self.get_version_data(evidence.id, previous), data)
+            # A delta larger than the snapshot is not worth storing
+            if _json_size(patch) < _json_size(data):
+                encoding, payload = ENCODING_DELTA, patch
+
+        version = EvidenceVersion(
+            evidence=evidence,
+            version=next_version,
+            data=payload,
+            encoding=encoding,
+            collected_at=collected_at or datetime.utcnow(),
+            collector_version=collector_version,
+            signature=signature,
+            attributes=attributes or {},
+        )
+        self.session.add(version)
+        self.session.flush()
+        return version
+
+    def get_version_data(self, evidence_id: int, version: int) -> dict[str, Any] | None:
+        """Reconstruct the full payload of a version (None if it does not exist)."""
+        keyframe = self.session.execute(
+            select(func.max(EvidenceVersion.version)).where(
+                EvidenceVersion.evidence_id == evidence_id,
+                EvidenceVersion.version <= version,
+                EvidenceVersion.encoding == ENCODING_FULL,
+            )
+        ).scalar()
+        if keyframe is None:
+            return None
+
+        rows = self.session.execute(
+            select(EvidenceVersion.version, EvidenceVersion.encoding, EvidenceVersion.data)
+            .where(
+                EvidenceVersion.evidence_id == evidence_id,
+                EvidenceVersion.version >= keyframe,
+                EvidenceVersion.version <= version,
+            )
+            .order_by(EvidenceVersion.version.asc())
+        ).all()
+        if not rows or rows[-1].version != version:
+            return None
+
+        doc = copy.deepcopy(rows[0].data)
+        for row in rows[1:]:
+            if row.encoding == ENCODING_DELTA:
+                doc = apply_patch(doc, row.data, in_place=True)
+            else:
+                doc = copy.deepcopy(row.data)
+        return doc
+
+    def compact(self, evidence_id: int | None = None) -> dict[str, Any]:
+        """
+        Re-encode existing version history as keyframes plus deltas.
+
+        Args:
+            evidence_id: Limit compaction to one evidence record (default: all)
+
+        Returns:
+            Stats with version counts and payload bytes before/after
+        """
+        ids_query = select(EvidenceVersion.evidence_id).distinct()
+        if evidence_id is not None:
+            ids_query = ids_query.where(EvidenceVersion.evidence_id == evidence_id)
+        evidence_ids = list(self.session.execute(ids_query).scalars())
+
+        stats = {
+            "evidence_records": len(evidence_ids),
+            "versions": 0,
+            "keyframes": 0,
+            "deltas": 0,
+            "bytes_before": 0,
+            "bytes_after": 0,
+        }
+
+        for ev_id in evidence_ids:
+            rows = list(
+                self.session.execute(
+                    select(EvidenceVersion)
+                    .where(EvidenceVersion.evidence_id == ev_id)
+                    .order_by(EvidenceVersion.version.asc())
+                ).scalars()
+            )
+
+            # Reconstruct the full history first; rows may already be partially encoded
+            full_docs: list[Any] = []
+            for row in rows:
+                stats["bytes_before"] += _json_size(row.data)
+                if row.encoding == ENCODING_DELTA and full_docs:
+                    full_docs.append(apply_patch(full_docs[-1], row.data))
+                else:
+                    full_docs.append(row.data)
+
+            for idx, (row, doc) in enumerate(zip(rows, full_docs, strict=True)):
+                encoding, payload = ENCODING_FULL, doc
+                if idx % self.keyframe_interval != 0:
+                    patch = make_patch(full_docs[idx - 1], doc)
+                    if _json_size(patch) < _json_size(doc):
+                        encoding, payload = ENCODING_DELTA, patch
+                row.encoding = encoding
+                row.data = payload
+                stats["versions"] += 1
+                stats["keyframes" if encoding == ENCODING_FULL else "deltas"] += 1
+                stats["bytes_after"] += _json_size(payload)
+
+        self.session.flush()
+
+        before = stats["bytes_before"]
+        stats["reduction_percent"] = (
+            round(100.0 * (before - stats["bytes_after"]) / before, 2) if before else 0.0
+        )
+        return stats
@@ -0,0 +1,245 @@
+"""Incremental index of staged evidence manifests.
+
+Validation and reporting read the manifests staged in ``.auditly_manifests``
+for an environment. Re-parsing every file on each call gets expensive once
+an environment accumulates thousands of manifests, so the index keeps the
+parsed manifests in memory keyed by (name, mtime, size): a refresh lists the
+directory and stats each file, and only new or modified files are parsed.
+Derived views (the latest artifact per evidence kind, the set fingerprint)
+are recomputed only when the set of manifests changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .evidence import ArtifactRecord, EvidenceManifest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STAGING_DIR = Path(".auditly_manifests")
+
+
+def load_manifest(path: Path | str) -> EvidenceManifest:
+    """
+    Parse a staged manifest file.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+        KeyError: If required manifest fields are missing
+        TypeError: If an artifact record has missing or unknown fields
+    """
+    data = json.loads(Path(path).read_text())
+    return EvidenceManifest(
+        version=data["version"],
+        environment=data["environment"],
+        created_at=data["created_at"],
+        artifacts=[ArtifactRecord(**a) for a in data["artifacts"]],
+        overall_hash=data.get("overall_hash"),
+        notes=data.get("notes"),
+    )
+
+
+@dataclass
+class IndexedManifest:
+    """A parsed manifest and the file stat it was parsed from."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    manifest: EvidenceManifest
+
+    @property
+    def stamp(self) -> tuple[int, int]:
+        """(mtime_ns, size) of the file contents this entry was parsed from."""
+        return (self.mtime_ns, self.size)
+
+
+@dataclass
+class _EnvironmentIndex:
+    entries: dict[str, IndexedManifest] = field(default_factory=dict)
+    # Unreadable files by name -> stamp, so each version is only reported once
+    rejected: dict[str, tuple[int, int]] = field(default_factory=dict)
+    version: int = 0
+    # Derived views, cached as (version, value)
+    latest: tuple[int, dict[str, dict[str, Any]]] | None = None
+    fingerprint: tuple[int, str] | None = None
+
+    def ordered(self) -> list[IndexedManifest]:
+        return [self.entries[name] for name in sorted(self.entries)]
+
+
+class ManifestIndex:
+    """Process-wide index of staged manifests per (staging directory, environment)."""
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._environments: dict[tuple[str, str], _EnvironmentIndex] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _scan(self, root: Path, environment: str) -> dict[str, tuple[int, int]]:
+        """Stat the environment's manifest files (same selection as ``{env}-*.json``)."""
+        prefix = f"{environment}-"
+        found: dict[str, tuple[int, int]] = {}
+        try:
+            with os.scandir(root) as it:
+                for item in it:
+                    if item.name.startswith(prefix) and item.name.endswith(".json"):
+                        try:
+                            if item.is_file():
+                                st = item.stat()
+                                found[item.name] = (st.st_mtime_ns, st.st_size)
+                        except FileNotFoundError:
+                            continue
+        except FileNotFoundError:
+            pass
+        return found
+
+    def _sync(self, environment: str, staging: Path | str | None) -> _EnvironmentIndex:
+        """Bring the environment's entries in line with the directory; parse only changes."""
+        root = Path(staging or DEFAULT_STAGING_DIR).resolve()
+        key = (str(root), environment)
+        current = self._scan(root, environment)
+
+        with self._lock:
+            env_index = self._environments.setdefault(key, _EnvironmentIndex())
+            # Files still unreadable since the last refresh are left out without a reparse
+            env_index.rejected = {
+                name: stamp
+                for name, stamp in env_index.rejected.items()
+                if current.get(name) == stamp
+            }
+            for name in env_index.rejected:
+                del current[name]
+            stale = [
+                name
+                for name, stamp in current.items()
+                if (entry := env_index.entries.get(name)) is None or entry.stamp != stamp
+            ]
+
+        # Parse outside the lock; concurrent refreshes of one file are harmless
+        parsed: dict[str, IndexedManifest] = {}
+        rejected: dict[str, tuple[int, int]] = {}
+        for name in stale:
+            path = root / name
+            try:
+                manifest = load_manifest(path)
+            except FileNotFoundError:
+                current.pop(name)
+                continue
+            except (KeyError, TypeError, json.JSONDecodeError) as e:
+                # One malformed file must not break validation of the rest
+                logger.warning("Skipping unreadable manifest %s: %r", path, e)
+                rejected[name] = current.pop(name)
+                continue
+            mtime_ns, size = current[name]
+            parsed[name] = IndexedManifest(str(path), mtime_ns, size, manifest)
+
+        with self._lock:
+            env_index.rejected.update(rejected)
+            removed = [name for name in env_index.entries if name not in current]
+            for name in removed:
+                del env_index.entries[name]
+            env_index.entries.update(parsed)
+            if parsed or removed:
+                env_index.version += 1
+            self.misses += len(parsed)
+            self.hits += len(current) - len(parsed)
+        return env_index
+
+    def entries(self, environment: str, staging: Path | str | None = None) -> list[IndexedManifest]:
+        """
+        Return the indexed manifests for an environment, ordered by file name.
+
+        Args:
+            environment: Environment key (manifests named ``{environment}-*.json``)
+            staging: Staging directory (default: ``.auditly_manifests``)
+
+        Manifests that cannot be parsed are logged and left out.
+        """
+        env_index = self._sync(environment, staging)
+        with self._lock:
+            return env_index.ordered()
+
+    def manifests(
+        self, environment: str, staging: Path | str | None = None
+    ) -> list[EvidenceManifest]:
+        """Return the parsed manifests for an environment, ordered by file name."""
+        return [e.manifest for e in self.entries(environment, staging)]
+
+    def latest_artifacts(
+        self, environment: str, staging: Path | str | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Map each evidence kind to its most recent artifact.
+
+        Artifacts are keyed by ``metadata.kind`` (``"unknown"`` when absent); the
+        newest manifest by ``created_at`` wins. Callers must not mutate the values.
+
+        Returns:
+            Dict of kind -> {key, filename, sha256, size, metadata, manifest}
+        """
+        env_index = self._sync(environment, staging)
+        with self._lock:
+            if env_index.latest is not None and env_index.latest[0] == env_index.version:
+                return dict(env_index.latest[1])
+            latest: dict[str, dict[str, Any]] = {}
+            ordered = sorted(
+                env_index.entries.items(), key=lambda item: (item[1].manifest.created_at, item[0])
+            )
+            for _, entry in ordered:
+                for artifact in entry.manifest.artifacts:
+                    meta = artifact.metadata or {}
+                    kind = meta.get("kind", "unknown")
+                    if isinstance(kind, str):
+                        latest[kind] = {
+                            "key": artifact.key,
+                            "filename": artifact.filename,
+                            "sha256": artifact.sha256,
+                            "size": artifact.size,
+                            "metadata": meta,
+                            "manifest": entry.path,
+                        }
+            env_index.latest = (env_index.version, latest)
+            return dict(latest)
+
+    def fingerprint(self, environment: str, staging: Path | str | None = None) -> str:
+        """Hash of the (name, mtime, size) of every manifest (useful as a cache key component)."""
+        env_index = self._sync(environment, staging)
+        with self._lock:
+            if env_index.fingerprint is not None and env_index.fingerprint[0] == env_index.version:
+                return env_index.fingerprint[1]
+            prints = sorted((name, e.mtime_ns, e.size) for name, e in env_index.entries.items())
+            digest = hashlib.sha256(json.dumps(prints).encode()).hexdigest()
+            env_index.fingerprint = (env_index.version, digest)
+            return digest
+
+    def stats(self) -> dict[str, object]:
+        """Get index statistics (hits are files served without re-parsing)."""
+        with self._lock:
+            return {
+                "environments": len(self._environments),
+                "manifests": sum(len(e.entries) for e in self._environments.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+    def clear(self) -> None:
+        """Drop all indexed manifests."""
+        with self._lock:
+            self._environments.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global instance shared by the API operations and the CLI
+manifest_index = ManifestIndex()
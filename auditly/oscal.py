@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -14,7 +17,7 @@ class OscalCatalog:
         """Initialize an OscalCatalog from a data dictionary."""
         self.data = data
         self.catalog = data.get("catalog", {})
-        self.catalog = data.get("catalog", {})
+        self._control_index: dict[str, dict[str, Any]] | None = None
 
     def control_ids(self) -> list[str]:
         """Extract all control IDs from the catalog."""
@@ -33,24 +36,26 @@ class OscalCatalog:
             ids.extend(self._extract_control_ids_from_group(subgroup))
         return ids
 
-    def get_control(self, control_id: str) -> dict[str, Any] | None:
-        """Retrieve a specific control by ID."""
-        for group in self.catalog.get("groups", []):
-            if control := self._find_control_in_group(group, control_id):
-                return control
-        return None
+    def control_index(self) -> dict[str, dict[str, Any]]:
+        """Map control ID to control definition (built once, first occurrence wins)."""
+        if self._control_index is None:
+            index: dict[str, dict[str, Any]] = {}
+            for group in self.catalog.get("groups", []):
+                self._index_group(group, index)
+            self._control_index = index
+        return self._control_index
 
-    def _find_control_in_group(
-        self, group: dict[str, Any], control_id: str
-    ) -> dict[str, Any] | None:
-        """Recursively search for a control in a group."""
+    def _index_group(self, group: dict[str, Any], index: dict[str, dict[str, Any]]) -> None:
+        """Recursively add a group's controls and subgroups to the index."""
         for ctl in group.get("controls", []):
-            if ctl.get("id") == control_id:
-                return ctl
+            if (cid := ctl.get("id")) and cid not in index:
+                index[cid] = ctl
         for subgroup in group.get("groups", []):
-            if control := self._find_control_in_group(subgroup, control_id):
-                return control
-        return None
+            self._index_group(subgroup, index)
+
+    def get_control(self, control_id: str) -> dict[str, Any] | None:
+        """Retrieve a specific control by ID."""
+        return self.control_index().get(control_id)
 
     def metadata(self) -> dict[str, Any]:
         """Get catalog metadata."""
@@ -134,3 +139,132 @@ def load_oscal(path: Path | str) -> OscalCatalog | OscalProfile | None:
     elif "profile" in data:
         return OscalProfile(data)
     return None
+
+
+@dataclass
+class CatalogEntry:
+    """A parsed catalog/profile file together with its resolved control IDs."""
+
+    path: str
+    mtime_ns: int
+    size: int
+    document: OscalCatalog | OscalProfile | None
+    control_ids: list[str] = field(default_factory=list)
+
+    @property
+    def fingerprint(self) -> tuple[str, int, int]:
+        """Identity of the file contents this entry was parsed from."""
+        return (self.path, self.mtime_ns, self.size)
+
+    def get_control(self, control_id: str) -> dict[str, Any] | None:
+        """Look up a control definition (catalogs only)."""
+        if isinstance(self.document, OscalCatalog):
+            return self.document.get_control(control_id)
+        return None
+
+
+class CatalogRegistry:
+    """Process-wide cache of parsed OSCAL files keyed by (path, mtime, size).
+
+    Each catalog or profile is parsed once; edits to the file on disk are
+    picked up on the next lookup because its stat no longer matches.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._entries: dict[str, CatalogEntry] = {}
+        self._resolved: dict[tuple, list[str]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, path: Path | str) -> CatalogEntry | None:
+        """
+        Return the parsed entry for a file, re-parsing only if it changed.
+
+        Returns:
+            CatalogEntry (``document`` is None when the JSON has no catalog/profile
+            root), or None if the file does not exist
+
+        Raises:
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        p = Path(path).resolve()
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            return None
+        key = str(p)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.fingerprint == (key, st.st_mtime_ns, st.st_size):
+                self.hits += 1
+                return entry
+
+        # Parse outside the lock; concurrent first loads of one file are harmless
+        data = json.loads(p.read_text(encoding="utf-8"))
+        document: OscalCatalog | OscalProfile | None = None
+        control_ids: list[str] = []
+        if "catalog" in data:
+            document = OscalCatalog(data)
+            control_ids = document.control_ids()
+            document.control_index()
+        elif "profile" in data:
+            document = OscalProfile(data)
+            control_ids = document.imported_control_ids()
+
+        entry = CatalogEntry(key, st.st_mtime_ns, st.st_size, document, control_ids)
+        with self._lock:
+            self.misses += 1
+            if key in self._entries:
+                # File changed on disk; combined resolutions may reference it
+                self._resolved.clear()
+            self._entries[key] = entry
+        return entry
+
+    def load(self, path: Path | str) -> OscalCatalog | OscalProfile | None:
+        """Cached equivalent of :func:`load_oscal`."""
+        entry = self.get(path)
+        return entry.document if entry else None
+
+    def resolve_control_ids(self, paths: Iterable[Path | str]) -> list[str]:
+        """
+        Resolve the de-duplicated control IDs across catalogs/profiles, in order.
+
+        The combined list is cached per set of file fingerprints; callers must
+        not mutate the returned list.
+        """
+        entries = [e for e in (self.get(p) for p in paths) if e is not None]
+        key = tuple(e.fingerprint for e in entries)
+        with self._lock:
+            cached = self._resolved.get(key)
+        if cached is not None:
+            return cached
+
+        seen: set[str] = set()
+        resolved: list[str] = []
+        for entry in entries:
+            for cid in entry.control_ids:
+                if cid not in seen:
+                    seen.add(cid)
+                    resolved.append(cid)
+        with self._lock:
+            self._resolved[key] = resolved
+        return resolved
+
+    def fingerprint(self, paths: Iterable[Path | str]) -> tuple:
+        """Combined fingerprint of the given files (useful as a cache key component)."""
+        return tuple(e.fingerprint for e in (self.get(p) for p in paths) if e is not None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+            self._resolved.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Global instance shared by config validation, the API and the CLI
+catalog_registry = CatalogRegistry()
@@ -206,7 +206,6 @@ class ParallelCollector:
     def __init__(self, max_concurrent: int = 5) -> None:
         """Initialize ParallelCollector with concurrency limit."""
         self.max_concurrent = max_concurrent
-        self.semaphore = asyncio.Semaphore(max_concurrent)
 
     async def collect_parallel(
         self, collectors: dict[str, asyncio.Future], timeout: int = 300
@@ -224,8 +223,11 @@ class ParallelCollector:
         results = {}
         errors = {}
 
+        # Created per run: a semaphore is bound to the event loop that first waits on it
+        semaphore = asyncio.Semaphore(self.max_concurrent)
+
         async def collect_service(name: str, coro):
-            async with self.semaphore:
+            async with semaphore:
                 try:
                     result = await asyncio.wait_for(coro, timeout=timeout)
                     results[name] = result
@@ -0,0 +1,123 @@
+"""In-memory cache of rendered reports keyed by input fingerprints.
+
+A report only depends on the staged manifests, the OSCAL catalogs, the
+waiver and mapping files and the request parameters. The cache key hashes
+cheap fingerprints of those inputs (file stats, plus the content hash of the
+small waiver file), so an unchanged environment is served without
+re-validating or re-rendering. The key doubles as the HTTP ETag.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+
+def file_fingerprint(path: Path | str) -> tuple[str, int, int] | None:
+    """Return (name, mtime_ns, size) for a file, or None if it does not exist."""
+    p = Path(path)
+    try:
+        st = p.stat()
+    except FileNotFoundError:
+        return None
+    return (p.name, st.st_mtime_ns, st.st_size)
+
+
+def file_sha256(path: Path | str) -> str | None:
+    """Return the SHA-256 of a file's contents, or None if it does not exist."""
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def make_report_key(parts: Iterable[Any]) -> str:
+    """Combine key components into a stable hex digest (used as the ETag value)."""
+    return hashlib.sha256(json.dumps(list(parts), sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass
+class CachedReport:
+    """A rendered report and the key it was rendered for."""
+
+    key: str
+    environment: str
+    report_path: str | None
+    html: str | None
+    summary: dict[str, Any]
+    created_at: datetime = field(default_factory=datetime.utcnow)
+
+
+class ReportCache:
+    """Bounded LRU cache of rendered reports."""
+
+    def __init__(self, max_entries: int = 128):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Reports kept before the least recently used is evicted
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CachedReport] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> CachedReport | None:
+        """Return a cached report and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, entry: CachedReport) -> None:
+        """Store a report, evicting the least recently used beyond the limit."""
+        with self._lock:
+            self._entries[entry.key] = entry
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, environment: str | None = None) -> int:
+        """
+        Drop cached reports for an environment (or all of them).
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [
+                k
+                for k, e in self._entries.items()
+                if environment is None or e.environment == environment
+            ]
+            for k in keys:
+                del self._entries[k]
+        return len(keys)
+
+    def stats(self) -> dict[str, object]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+            }
+
+
+# Global instance used by the API report operations
+report_cache = ReportCache()
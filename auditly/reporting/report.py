@@ -36,9 +36,8 @@ def readiness_summary(manifests: list[EvidenceManifest]) -> dict:
     }
 
 
-def write_html(summary: dict, out_path: Path | str) -> None:
-    """Write readiness summary as HTML to output path."""
-    p = Path(out_path)
+def render_html(summary: dict) -> str:
+    """Render readiness summary as an HTML document string."""
     controls = summary.get("controls", {})
     # Build control coverage table
     coverage_html = ""
@@ -80,4 +79,9 @@ def write_html(summary: dict, out_path: Path | str) -> None:
       {coverage_html}
       <h2>Raw Summary</h2>
     """
-    p.write_text(html)
+    return html
+
+
+def write_html(summary: dict, out_path: Path | str) -> None:
+    """Write readiness summary as HTML to output path."""
+    Path(out_path).write_text(render_html(summary))
@@ -32,20 +32,20 @@ def _get_evidence_guidance() -> dict[str, str]:
     }
 
 
-def generate_engineer_report(
+def render_engineer_report(
     results: dict[str, ValidationResult],
     evidence: dict[str, Any],
-    output_path: Path | str,
-) -> None:
+) -> str:
     """
-    Generate an engineer-focused HTML report with failures and remediation steps.
+    Render the engineer-focused HTML report (failures and remediation steps) as a string.
 
     Args:
         results: Dictionary of control_id -> ValidationResult
         evidence: Evidence dict used in validation
-        output_path: Path to write HTML report
+
+    Returns:
+        The complete HTML document
     """
-    p = Path(output_path)
 
     # Get guidance for evidence collection
     evidence_guidance = _get_evidence_guidance()
@@ -377,23 +377,23 @@ def generate_engineer_report(
 </body>
 </html>
 """
-    _write_html(p, html)
+    return html
 
 
-def generate_auditor_report(
+def render_auditor_report(
     results: dict[str, ValidationResult],
     evidence: dict[str, Any],
-    output_path: Path | str,
-) -> None:
+) -> str:
     """
-    Generate an ATO auditor-focused HTML report with evidence traceability.
+    Render the ATO auditor-focused HTML report (evidence traceability) as a string.
 
     Args:
         results: Dictionary of control_id -> ValidationResult
         evidence: Evidence dict used in validation
-        output_path: Path to write HTML report
+
+    Returns:
+        The complete HTML document
     """
-    p = Path(output_path)
 
     # Build detailed control table with evidence
     control_rows = ""
@@ -731,4 +731,36 @@ def generate_auditor_report(
 </body>
 </html>
 """
-    _write_html(p, html)
+    return html
+
+
+def generate_engineer_report(
+    results: dict[str, ValidationResult],
+    evidence: dict[str, Any],
+    output_path: Path | str,
+) -> None:
+    """
+    Generate an engineer-focused HTML report with failures and remediation steps.
+
+    Args:
+        results: Dictionary of control_id -> ValidationResult
+        evidence: Evidence dict used in validation
+        output_path: Path to write HTML report
+    """
+    _write_html(output_path, render_engineer_report(results, evidence))
+
+
+def generate_auditor_report(
+    results: dict[str, ValidationResult],
+    evidence: dict[str, Any],
+    output_path: Path | str,
+) -> None:
+    """
+    Generate an ATO auditor-focused HTML report with evidence traceability.
+
+    Args:
+        results: Dictionary of control_id -> ValidationResult
+        evidence: Evidence dict used in validation
+        output_path: Path to write HTML report
+    """
+    _write_html(output_path, render_auditor_report(results, evidence))
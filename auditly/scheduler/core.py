@@ -8,11 +8,17 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from pathlib import Path
 
-from auditly.config import AppConfig
-from auditly.db import get_async_session, init_db_async
+from auditly.config import load_config
+from auditly.db import (
+    dispose_async_engine,
+    get_async_session,
+    get_sync_session,
+    init_db_async,
+    init_db_sync,
+)
 from auditly.db.repository import Repository
+from auditly.evidence_lifecycle import EvidenceLifecycleManager
 from auditly.validators import validate_controls
 
 logger = logging.getLogger(__name__)
@@ -31,7 +37,7 @@ async def run_validation_job(config_path: str, env_name: str) -> dict:
     Raises:
         ValueError: If environment is not found or misconfigured
     """
-    cfg = AppConfig.load(Path(config_path))
+    cfg = load_config(config_path)
     envcfg = cfg.environments.get(env_name)
 
     if not envcfg:
@@ -40,7 +46,7 @@ async def run_validation_job(config_path: str, env_name: str) -> dict:
     if not envcfg.database_url:
         raise ValueError(f"Environment '{env_name}' has no database_url configured")
 
-    init_db_async(envcfg.database_url)
+    init_db_async(envcfg.database_url, **envcfg.database_pool.model_dump())
 
     session_gen = get_async_session()
     session = await session_gen.__anext__()
@@ -134,6 +140,14 @@ async def run_validation_job(config_path: str, env_name: str) -> dict:
         await session.close()
 
 
+def _database_url(config_path: str, env_name: str) -> str | None:
+    try:
+        envcfg = load_config(config_path).environments.get(env_name)
+    except Exception:
+        return None
+    return envcfg.database_url if envcfg else None
+
+
 def run_validation_job_sync(config_path: str, env_name: str) -> dict:
     """Synchronize validation job execution using run_validation_job.
 
@@ -144,4 +158,74 @@ def run_validation_job_sync(config_path: str, env_name: str) -> dict:
     Returns:
         Dict with job results and metrics
     """
-    return asyncio.run(run_validation_job(config_path, env_name))
+
+    database_url = _database_url(config_path, env_name)
+
+    async def _run() -> dict:
+        try:
+            return await run_validation_job(config_path, env_name)
+        finally:
+            # Connections opened in this event loop cannot outlive it
+            if database_url:
+                await dispose_async_engine(database_url)
+
+    return asyncio.run(_run())
+
+
+def build_recollection_plan(
+    config_path: str,
+    env_name: str,
+    default_threshold_days: int | None = None,
+) -> dict:
+    """Build a prioritized recollection plan for an environment.
+
+    Uses the environment's ``recollection_thresholds`` to decide which
+    (system, evidence_type) pairs are overdue, so collectors can be
+    dispatched only for stale evidence instead of on a fixed cron.
+
+    Args:
+        config_path: Path to environment configuration file
+        env_name: Environment name
+        default_threshold_days: Override for the environment's default threshold
+
+    Returns:
+        Dict with the ordered plan and a per-evidence-type summary
+
+    Raises:
+        ValueError: If environment is not found or misconfigured
+    """
+    cfg = load_config(config_path)
+    envcfg = cfg.environments.get(env_name)
+
+    if not envcfg:
+        raise ValueError(f"Environment '{env_name}' not found in config")
+
+    if not envcfg.database_url:
+        raise ValueError(f"Environment '{env_name}' has no database_url configured")
+
+    init_db_sync(envcfg.database_url, **envcfg.database_pool.model_dump())
+    session = get_sync_session()
+    try:
+        plan = EvidenceLifecycleManager(session).plan_recollection(
+            thresholds=envcfg.recollection_thresholds,
+            default_threshold_days=(
+                default_threshold_days
+                if default_threshold_days is not None
+                else envcfg.default_recollection_days
+            ),
+            environment=env_name,
+        )
+    finally:
+        session.close()
+
+    by_type: dict[str, int] = {}
+    for item in plan:
+        by_type[item.evidence_type] = by_type.get(item.evidence_type, 0) + 1
+
+    logger.info("Recollection plan for '%s': %d stale evidence types", env_name, len(plan))
+
+    return {
+        "environment": env_name,
+        "items": [item.to_dict() for item in plan],
+        "by_evidence_type": by_type,
+    }
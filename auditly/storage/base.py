@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+# Size of each part in streamed multipart uploads (S3 requires at least 5 MiB)
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+
 
 class EvidenceVault(ABC):
     """Abstract base class for evidence vault storage backends."""
@@ -24,6 +30,38 @@ class EvidenceVault(ABC):
         """Upload a JSON string as an object to the evidence vault."""
         raise NotImplementedError
 
+    def put_stream(
+        self,
+        dest_key: str,
+        chunks: Iterable[bytes],
+        metadata: dict[str, Any] | None = None,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+    ) -> dict[str, Any]:
+        """Upload an object produced incrementally, without holding it in memory.
+
+        The default implementation spools the chunks to a temporary file and
+        uploads it with ``put_file``; backends override it with multipart uploads.
+
+        Args:
+            dest_key: Object key
+            chunks: Byte chunks, consumed once in order
+            metadata: Object metadata (optional)
+            content_type: MIME type of the object
+            content_encoding: Content-Encoding of the object, e.g. "gzip" (optional)
+
+        Returns:
+            Dict with bucket, key and size
+        """
+        fd, tmp = tempfile.mkstemp(suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            return self.put_file(tmp, dest_key, metadata=metadata)
+        finally:
+            os.unlink(tmp)
+
     @abstractmethod
     def exists(self, dest_key: str) -> bool:
         """Check if an object exists in the evidence vault."""
@@ -2,13 +2,36 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
 from minio import Minio
 from minio.error import S3Error
 
-from .base import EvidenceVault
+from .base import MULTIPART_PART_SIZE, EvidenceVault
+
+
+class _ChunkReader:
+    """File-like ``read`` over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._buffer = bytearray()
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+            self.size += len(chunk)
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
 
 
 class MinioEvidenceVault(EvidenceVault):
@@ -57,6 +80,30 @@ class MinioEvidenceVault(EvidenceVault):
         )
         return {"bucket": self.bucket, "key": dest_key, "size": len(b)}
 
+    def put_stream(
+        self,
+        dest_key: str,
+        chunks: Iterable[bytes],
+        metadata: dict[str, Any] | None = None,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+    ) -> dict[str, Any]:
+        """Upload chunks to the Minio bucket as a multipart upload of unknown length."""
+        headers = dict(metadata or {})
+        if content_encoding:
+            headers["Content-Encoding"] = content_encoding
+        reader = _ChunkReader(chunks)
+        self.client.put_object(
+            self.bucket,
+            dest_key,
+            reader,
+            length=-1,
+            part_size=MULTIPART_PART_SIZE,
+            content_type=content_type,
+            metadata=headers,
+        )
+        return {"bucket": self.bucket, "key": dest_key, "size": reader.size}
+
     def exists(self, dest_key: str) -> bool:
         """Check if an object exists in the Minio bucket."""
         try:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
 import boto3
 
-from .base import EvidenceVault
+from .base import MULTIPART_PART_SIZE, EvidenceVault
 
 
 class S3EvidenceVault(EvidenceVault):
@@ -55,6 +56,59 @@ class S3EvidenceVault(EvidenceVault):
         )
         return {"bucket": self.bucket, "key": dest_key, "size": len(b)}
 
+    def put_stream(
+        self,
+        dest_key: str,
+        chunks: Iterable[bytes],
+        metadata: dict[str, Any] | None = None,
+        content_type: str = "application/octet-stream",
+        content_encoding: str | None = None,
+    ) -> dict[str, Any]:
+        """Upload chunks to the S3 bucket as a multipart upload.
+
+        Chunks are buffered into parts of ``MULTIPART_PART_SIZE`` bytes, so at
+        most one part is held in memory. The upload is aborted on failure.
+        """
+        extra: dict[str, Any] = {"ContentType": content_type, "Metadata": metadata or {}}
+        if content_encoding:
+            extra["ContentEncoding"] = content_encoding
+        upload_id = self.s3.create_multipart_upload(Bucket=self.bucket, Key=dest_key, **extra)[
+            "UploadId"
+        ]
+        parts: list[dict[str, Any]] = []
+        size = 0
+
+        def _upload(body: bytes) -> None:
+            response = self.s3.upload_part(
+                Bucket=self.bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                PartNumber=len(parts) + 1,
+                Body=body,
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": len(parts) + 1})
+
+        try:
+            buffer = bytearray()
+            for chunk in chunks:
+                buffer += chunk
+                size += len(chunk)
+                if len(buffer) >= MULTIPART_PART_SIZE:
+                    _upload(bytes(buffer))
+                    buffer.clear()
+            if buffer or not parts:
+                _upload(bytes(buffer))
+            self.s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=dest_key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
+            )
+        except Exception:
+            self.s3.abort_multipart_upload(Bucket=self.bucket, Key=dest_key, UploadId=upload_id)
+            raise
+        return {"bucket": self.bucket, "key": dest_key, "size": size}
+
     def exists(self, dest_key: str) -> bool:
         """Check if an object exists in the S3 bucket."""
         try:
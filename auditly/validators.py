@@ -8,9 +8,7 @@ import time
 from dataclasses import dataclass
 from enum import Enum
 
-from .db import get_sync_session, init_db_sync
-from .db.models import Evidence as DBEvidence
-from .evidence_lifecycle import EvidenceLifecycleManager
+from .access_log import AccessLogWriter, get_access_log_writer
 from .performance import incremental_validator, performance_metrics, validation_cache
 
 
@@ -458,6 +456,7 @@ def validate_controls(
     use_cache: bool = True,
     cache_ttl: int | None = None,
     incremental: bool = True,
+    access_log: AccessLogWriter | None = None,
 ) -> dict[str, ValidationResult]:
     """
     Validate multiple controls against available evidence.
@@ -468,6 +467,8 @@ def validate_controls(
         system_state: Optional live system state (unused in simple validator)
         database_url: Optional database URL for access logging
         user_id: User/system identifier for access logs
+        access_log: Optional shared writer; the caller is responsible for
+            flushing it (by default a per-URL writer is flushed in the background)
 
     Returns:
         Dict of control_id -> ValidationResult
@@ -500,37 +501,14 @@ def validate_controls(
     # Respect dependency ordering to avoid blocked validations
     ordered_controls = dependency_graph.get_validation_order(controls_to_validate)
 
-    # Log evidence access if database available
-    if database_url:
-        try:
-            init_db_sync(database_url)
-            session = get_sync_session()
-            lifecycle_mgr = EvidenceLifecycleManager(session)
-
-            # Log access for each evidence artifact used in validation
-            for evidence_type, evidence_data in evidence.items():
-                if isinstance(evidence_data, dict) and "sha256" in evidence_data:
-                    # Find evidence by hash
-                    evidence_records = (
-                        session.query(DBEvidence).filter_by(sha256=evidence_data["sha256"]).all()
-                    )
-
-                    for ev in evidence_records:
-                        lifecycle_mgr.log_evidence_access(
-                            evidence_id=ev.id,
-                            user_id=user_id,
-                            action="validate",
-                            attributes={
-                                "control_ids": control_ids,
-                                "evidence_type": evidence_type,
-                            },
-                        )
-
-            session.commit()
-            session.close()
-        except Exception:
-            # Silently continue if access logging fails
-            pass
+    # Buffer evidence access events; rows are written off the validation path
+    if access_log is None and database_url:
+        access_log = get_access_log_writer(database_url)
+        flush_access_log = True
+    else:
+        flush_access_log = False
+    if access_log is not None:
+        access_log.record_validation(evidence, control_ids, user_id=user_id)
 
     for cid in ordered_controls:
         cid_upper = cid.upper()
@@ -603,4 +581,7 @@ def validate_controls(
     if incremental and previous_evidence is not None:
         incremental_validator.snapshot_evidence(evidence)
 
+    if flush_access_log:
+        access_log.flush_async()
+
     return results
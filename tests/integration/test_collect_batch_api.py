@@ -101,3 +101,66 @@ def test_collect_batch_mixed_success(client, monkeypatch):
     # One result present for terraform, error present for github
     assert any(k.startswith("req-0-terraform") for k in data["results"].keys())
     assert any("github" in k for k in data["errors"].keys())
+
+
+def _stream_payload():
+    return {
+        "requests": [
+            {
+                "config_path": "config.yaml",
+                "environment": "x",
+                "provider": "github",
+                "github_repo": "org/repo",
+                "github_token": "token",
+            },
+            {
+                "config_path": "config.yaml",
+                "environment": "x",
+                "provider": "terraform",
+                "terraform_plan_path": "plan.json",
+            },
+        ],
+        "timeout_seconds": 30,
+    }
+
+
+def _fake_slow_github(**kwargs):
+    import time
+
+    if kwargs["provider"] == "github":
+        time.sleep(0.2)
+        raise Exception("github provider failed")
+    return (3, "manifests/x/terraform-manifest.json", "ok terraform")
+
+
+def test_collect_batch_ndjson_stream(client, monkeypatch):
+    import json
+
+    import auditly.api.operations as ops
+
+    monkeypatch.setattr(ops, "collect_evidence", _fake_slow_github)
+
+    resp = client.post("/collect/batch?stream=ndjson", json=_stream_payload())
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in resp.text.splitlines()]
+
+    # Results arrive in completion order, not request order
+    assert [e["event"] for e in events] == ["result", "result", "done"]
+    assert events[0]["name"] == "req-1-terraform"
+    assert events[0]["artifacts_uploaded"] == 3
+    assert events[1]["status"] == "failed"
+    assert events[1]["error"] == "github provider failed"
+    assert events[2]["succeeded"] == 1 and events[2]["failed"] == 1
+
+
+def test_collect_batch_sse_stream(client, monkeypatch):
+    import auditly.api.operations as ops
+
+    monkeypatch.setattr(ops, "collect_evidence", _fake_slow_github)
+
+    resp = client.post("/collect/batch?stream=sse", json=_stream_payload())
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text.count("event: result") == 2
+    assert resp.text.rstrip().splitlines()[-2] == "event: done"
@@ -0,0 +1,106 @@
+"""Tests for buffered evidence access logging."""
+
+import pytest
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.orm import sessionmaker
+
+from auditly.access_log import AccessLogWriter, close_access_log_writers, get_access_log_writer
+from auditly.db import Base
+from auditly.db.models import Evidence, EvidenceAccessLog, System
+from auditly.validators import validate_controls
+
+
+@pytest.fixture
+def database(tmp_path):
+    """File-backed SQLite database with three evidence rows (two share a hash)."""
+    url = f"sqlite:///{tmp_path / 'access.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as session:
+        system = System(name="sys", environment="test", attributes={})
+        session.add_all(
+            [
+                Evidence(system=system, evidence_type="iam", key="a", sha256="h-iam"),
+                Evidence(system=system, evidence_type="iam", key="b", sha256="h-iam"),
+                Evidence(system=system, evidence_type="kms", key="c", sha256="h-kms"),
+            ]
+        )
+        session.commit()
+    yield url, engine, Session
+    close_access_log_writers()
+    engine.dispose()
+
+
+def _count_logs(Session):
+    with Session() as session:
+        return session.execute(select(EvidenceAccessLog)).scalars().all()
+
+
+def test_flush_batches_hash_lookups(database):
+    """One flush resolves all hashes in a single query and bulk inserts rows."""
+    _, engine, Session = database
+    writer = AccessLogWriter(session_factory=Session)
+    evidence = {
+        "iam": {"sha256": "h-iam"},
+        "kms": {"sha256": "h-kms"},
+        "unknown": {"sha256": "h-missing"},
+        "no-hash": {"path": "x"},
+    }
+    assert writer.record_validation(evidence, ["AC-2"], user_id="tester") == 3
+    assert _count_logs(Session) == []
+
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2].split()[0])
+    )
+
+    assert writer.flush() == 3
+    assert statements.count("SELECT") == 1
+    assert statements.count("INSERT") == 1
+
+    logs = _count_logs(Session)
+    assert {log.user_id for log in logs} == {"tester"}
+    assert {log.attributes["evidence_type"] for log in logs} == {"iam", "kms"}
+    assert writer.flush() == 0
+
+
+def test_validate_controls_logs_in_background(database):
+    """validate_controls buffers access events and flushes them off the hot path."""
+    url, _, Session = database
+    validate_controls(
+        ["AC-2"],
+        {"iam": {"sha256": "h-iam"}},
+        database_url=url,
+        user_id="api-validator",
+        use_cache=False,
+    )
+
+    writer = get_access_log_writer(url)
+    writer.wait()
+    logs = _count_logs(Session)
+    assert len(logs) == 2
+    assert all(log.action == "validate" for log in logs)
+
+
+def test_shared_writer_flushed_by_caller(database):
+    """A caller-supplied writer accumulates events across calls until flushed."""
+    _, _, Session = database
+    writer = AccessLogWriter(session_factory=Session)
+    for _ in range(3):
+        validate_controls(
+            ["AC-2"], {"kms": {"sha256": "h-kms"}}, access_log=writer, use_cache=False
+        )
+    assert _count_logs(Session) == []
+
+    writer.close()
+    assert len(_count_logs(Session)) == 3
+    assert writer.written == 3
+
+
+def test_flush_failure_does_not_raise_in_background(tmp_path):
+    """Background flush errors are logged, not propagated to validation."""
+    writer = AccessLogWriter(f"sqlite:///{tmp_path / 'missing-tables.db'}")
+    writer.record("h", user_id="u", action="validate")
+    assert writer.flush_async().result() == 0
+    writer.close()
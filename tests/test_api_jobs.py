@@ -0,0 +1,133 @@
+"""Tests for the background job queue and /jobs endpoints."""
+
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from auditly import db
+from auditly.api.app import app
+from auditly.api.jobs import (
+    JOB_CANCELLED,
+    JOB_FAILED,
+    JOB_SUCCESS,
+    JobManager,
+    JobManagerClosed,
+    JobQueueFull,
+)
+from auditly.db.models import JobRun
+
+client = TestClient(app)
+
+
+def _wait_for(job_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = client.get(f"/jobs/{job_id}").json()
+        if data["status"] in (JOB_SUCCESS, JOB_FAILED):
+            return data
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
+def test_background_report_returns_job_handle():
+    resp = client.post(
+        "/report?background=true", json={"environment": "testenv", "report_type": "readiness"}
+    )
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["job_type"] == "report"
+    assert body["status_url"] == f"/jobs/{body['job_id']}"
+
+    data = _wait_for(body["job_id"])
+    assert data["status"] == JOB_SUCCESS
+    assert data["result"]["report_html"]
+    assert [p["message"] for p in data["progress"]][:2] == ["queued", "started"]
+
+    listed = client.get("/jobs?job_type=report").json()
+    assert body["job_id"] in {j["job_id"] for j in listed}
+
+
+def test_job_events_stream_ends_with_done():
+    resp = client.post(
+        "/report?background=true", json={"environment": "testenv", "report_type": "readiness"}
+    )
+    job_id = resp.json()["job_id"]
+    with client.stream("GET", f"/jobs/{job_id}/events") as stream:
+        text = "".join(stream.iter_text())
+    assert "event: progress" in text
+    assert text.rstrip().splitlines()[-2] == "event: done"
+
+
+def test_unknown_job_returns_404():
+    assert client.get("/jobs/does-not-exist").status_code == 404
+    assert client.get("/jobs/does-not-exist/events").status_code == 404
+
+
+def test_queue_full_raises():
+    manager = JobManager(max_workers=1, max_pending=1)
+    release = threading.Event()
+    try:
+        running = manager.submit("collection", "dev", lambda job: release.wait(5))
+        while running.status != "running":
+            time.sleep(0.01)
+        manager.submit("collection", "dev", lambda job: None)
+        with pytest.raises(JobQueueFull):
+            manager.submit("collection", "dev", lambda job: None)
+    finally:
+        release.set()
+        manager.shutdown(wait=True)
+
+
+def test_job_run_persisted(tmp_path):
+    url = f"sqlite:///{tmp_path / 'jobs.db'}"
+    db.init_db_sync(url)
+    db.Base.metadata.create_all(db.get_sync_engine())
+    manager = JobManager(max_workers=1)
+    try:
+        ok = manager.submit("report", "dev", lambda job: {"ok": True}, database_url=url)
+        ok.future.result(timeout=5)
+
+        def _fail(job):
+            raise RuntimeError("boom")
+
+        bad = manager.submit("collection", "dev", _fail, database_url=url)
+        with pytest.raises(RuntimeError):
+            bad.future.result(timeout=5)
+    finally:
+        manager.shutdown(wait=True)
+
+    with db.get_sync_session() as session:
+        rows = {r.id: r for r in session.query(JobRun).all()}
+    assert rows[ok.job_run_id].status == JOB_SUCCESS
+    assert rows[ok.job_run_id].attributes["job_id"] == ok.id
+    assert rows[bad.job_run_id].status == JOB_FAILED
+    assert rows[bad.job_run_id].error == "boom"
+    db.dispose_engines()
+
+
+def test_shutdown_cancels_queued_jobs_and_rejects_new_work(tmp_path):
+    url = f"sqlite:///{tmp_path / 'cancel.db'}"
+    db.init_db_sync(url)
+    db.Base.metadata.create_all(db.get_sync_engine())
+    manager = JobManager(max_workers=1)
+    release = threading.Event()
+    running = manager.submit("collection", "dev", lambda job: release.wait(5))
+    while running.status != "running":
+        time.sleep(0.01)
+    queued = manager.submit("collection", "dev", lambda job: None, database_url=url)
+    created = manager.create("validation", "dev")
+
+    manager.shutdown(wait=False)
+    release.set()
+
+    for job in (queued, created):
+        assert job.done and job.status == JOB_CANCELLED
+        assert job.progress[-1]["message"] == JOB_CANCELLED
+    with pytest.raises(JobManagerClosed):
+        manager.submit("collection", "dev", lambda job: None)
+    with db.get_sync_session() as session:
+        row = session.get(JobRun, queued.job_run_id)
+    assert row.status == JOB_CANCELLED and row.finished_at is not None
+    db.dispose_engines()
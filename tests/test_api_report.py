@@ -20,3 +20,95 @@ def test_report_json_endpoint():
     data = resp.json()
     assert isinstance(data, dict)
     assert "artifact_count" in data or "score" in data or "environments" in data
+
+
+def test_report_json_conditional_get():
+    first = client.get("/report/json?environment=testenv&report_type=readiness")
+    etag = first.headers["etag"]
+    assert etag.startswith('"')
+
+    resp = client.get(
+        "/report/json?environment=testenv&report_type=readiness",
+        headers={"If-None-Match": etag},
+    )
+    assert resp.status_code == 304
+    assert resp.headers["etag"] == etag
+
+    # JSON and HTML are different representations with their own tags
+    html = client.get(
+        "/report/html?environment=testenv&report_type=readiness",
+        headers={"If-None-Match": etag},
+    )
+    assert html.status_code == 200
+    assert html.headers["etag"] != etag
+
+
+def test_report_cache_reuses_render_until_manifests_change(tmp_path, monkeypatch):
+    from auditly.api import operations
+    from auditly.reporting.cache import report_cache
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.yaml").write_text(
+        "version: '0.1'\n"
+        "environments:\n"
+        "  dev:\n"
+        "    storage: {type: minio, endpoint: x, bucket: b}\n"
+    )
+    renders = []
+    real_render = operations._render_report
+    monkeypatch.setattr(
+        operations,
+        "_render_report",
+        lambda *a: renders.append(a) or real_render(*a),
+    )
+
+    first = client.get("/report/json?environment=dev")
+    second = client.get("/report/json?environment=dev")
+    assert first.json() == second.json()
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(renders) == 1
+
+    (tmp_path / ".auditly_manifests" / "dev-new.json").write_text(
+        (tmp_path / ".auditly_manifests" / "dev-dummy.json").read_text()
+    )
+    third = client.get("/report/json?environment=dev")
+    assert third.headers["etag"] != first.headers["etag"]
+    assert len(renders) == 2
+
+    assert report_cache.invalidate("dev") >= 1
+    client.get("/report/json?environment=dev")
+    assert len(renders) == 3
+
+
+def test_cached_and_conditional_gets_skip_the_job_queue(tmp_path, monkeypatch):
+    from auditly.api import operations
+    from auditly.api.jobs import job_manager
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.yaml").write_text(
+        "version: '0.1'\n"
+        "environments:\n"
+        "  fresh:\n"
+        "    storage: {type: minio, endpoint: x, bucket: b}\n"
+    )
+    # Computing the key (and ETag) has no side effects
+    operations.report_cache_key("config.yaml", "fresh")
+    assert not (tmp_path / ".auditly_manifests").exists()
+
+    submitted = []
+    real_submit = job_manager.submit
+    monkeypatch.setattr(
+        job_manager, "submit", lambda *a, **kw: submitted.append(a[0]) or real_submit(*a, **kw)
+    )
+
+    first = client.get("/report/json?environment=fresh")
+    assert first.status_code == 200
+    assert submitted == ["report"]
+
+    cached = client.get("/report/json?environment=fresh")
+    assert cached.headers["etag"] == first.headers["etag"]
+    not_modified = client.get(
+        "/report/json?environment=fresh", headers={"If-None-Match": first.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+    assert submitted == ["report"]
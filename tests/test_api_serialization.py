@@ -0,0 +1,160 @@
+"""Tests for ORJSON serialization, response projection and compression."""
+
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from auditly.api import serialization
+from auditly.api.app import app
+from auditly.api.compression import select_encoding
+from auditly.api.operations import validate_evidence
+from auditly.api.serialization import dumps, project, summarize_report
+from auditly.validators import FAMILY_PATTERNS
+
+client = TestClient(app)
+
+# 5k control IDs spread across the known families
+CONTROL_IDS = [f"{f}-{i}" for f in FAMILY_PATTERNS for i in range(1, 300)][:5000]
+EVIDENCE = {"audit-log": True, "terraform-plan": True, "iam-policy": True}
+
+
+@dataclass
+class _Point:
+    x: int
+    at: datetime
+
+
+def test_dumps_matches_stdlib_with_and_without_orjson(monkeypatch):
+    at = datetime(2026, 10, 1, 12, 30, 5, 250, tzinfo=UTC)
+    content = {
+        "b": [1, 2.5, None],
+        "a": {"nested": "é"},
+        "s": {"x"},
+        "at": at,
+        "point": _Point(1, at),
+    }
+    expected = {
+        "b": [1, 2.5, None],
+        "a": {"nested": "é"},
+        "s": ["x"],
+        "at": "2026-10-01T12:30:05.000250+00:00",
+        "point": {"x": 1, "at": "2026-10-01T12:30:05.000250+00:00"},
+    }
+    body = dumps(content)
+    assert json.loads(body) == expected
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+    assert dumps(content) == body
+
+
+def test_projection_helpers():
+    result = {"control_id": "AC-2", "status": "pass", "metadata": {"big": True}}
+    assert project(result, ["status"], keep=("control_id",)) == {
+        "control_id": "AC-2",
+        "status": "pass",
+    }
+    assert project(result, None) is result
+
+    summary = {
+        "score": 10,
+        "manifests": [{}],
+        "controls": {"total": 3, "covered_ids": ["a"], "control_evidence": {"a": []}},
+    }
+    assert summarize_report(summary) == {"score": 10, "controls": {"total": 3}}
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate", "gzip"),
+        ("identity", None),
+        ("gzip;q=0", None),
+        ("*", "gzip"),
+        ("", None),
+    ],
+)
+def test_select_encoding(header, expected, monkeypatch):
+    monkeypatch.setattr("auditly.api.compression.BROTLI_AVAILABLE", False)
+    assert select_encoding(header) == expected
+
+
+def test_validate_fields_and_summary_only():
+    body = {"environment": "testenv", "control_ids": CONTROL_IDS[:50], "evidence_dict": EVIDENCE}
+    full = client.post("/validate", json=body).json()
+    assert set(full["results"]["AC-1"]) >= {"status", "metadata", "remediation"}
+
+    slim = client.post("/validate?fields=status", json=body).json()
+    assert slim["results"]["AC-1"] == {
+        "control_id": "AC-1",
+        "status": full["results"]["AC-1"]["status"],
+    }
+    assert slim["summary"] == full["summary"]
+
+    counts = client.post("/validate?summary_only=true", json=body).json()
+    assert counts["results"] == {}
+    assert counts["controls_validated"] == 50
+    assert counts["summary"] == full["summary"]
+
+
+def test_large_validate_response_is_compressed():
+    body = {"environment": "testenv", "control_ids": CONTROL_IDS[:500], "evidence_dict": EVIDENCE}
+    resp = client.post("/validate", json=body, headers={"Accept-Encoding": "gzip"})
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert "accept-encoding" in resp.headers["vary"].lower()
+    assert resp.json()["controls_validated"] == 500
+
+    plain = client.post("/validate", json=body, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == resp.json()
+
+
+def test_small_and_streamed_responses_are_not_compressed():
+    small = client.get("/", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in small.headers
+
+    job_id = client.post(
+        "/report?background=true", json={"environment": "testenv", "report_type": "readiness"}
+    ).json()["job_id"]
+    with client.stream(
+        "GET", f"/jobs/{job_id}/events", headers={"Accept-Encoding": "gzip"}
+    ) as stream:
+        assert "content-encoding" not in stream.headers
+        assert "event: done" in "".join(stream.iter_text())
+
+
+def test_report_json_summary_only_has_own_etag():
+    url = "/report/json?environment=testenv&report_type=readiness"
+    full = client.get(url)
+    slim = client.get(url + "&summary_only=true")
+    assert "manifests" in full.json()
+    assert "manifests" not in slim.json()
+    assert slim.headers["etag"] != full.headers["etag"]
+
+    picked = client.get(url + "&fields=score")
+    assert picked.json() == {"score": full.json()["score"]}
+    again = client.get(url + "&fields=score", headers={"If-None-Match": picked.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_serialization_benchmark_5k_controls():
+    """Compare encoder output and payload size for a 5k-control /validate body."""
+    results, summary = validate_evidence(
+        "config.yaml", "testenv", control_ids=CONTROL_IDS, evidence_dict=EVIDENCE
+    )
+    assert len(results) == 5000
+    payload = {"success": True, "results": results, "summary": summary}
+
+    stdlib_body = json.dumps(payload).encode()
+    fast_body = dumps(payload)
+    gzipped = gzip.compress(fast_body, compresslevel=6)
+    summary_body = dumps({"success": True, "results": {}, "summary": summary})
+
+    assert json.loads(fast_body) == json.loads(stdlib_body)
+    # Compact separators never produce a larger body than the stdlib defaults
+    assert len(fast_body) <= len(stdlib_body)
+    assert len(gzipped) * 5 < len(fast_body)
+    assert len(summary_body) < 500
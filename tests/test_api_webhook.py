@@ -1,12 +1,58 @@
 """Tests for the /webhook endpoint."""
 
+import json
+import time
+
+import pytest
+import yaml
 from fastapi.testclient import TestClient
 
 from auditly.api.app import app
+from auditly.api.jobs import JobManager
+from auditly.api.webhook_queue import WebhookCoalescer, event_evidence_types, webhook_coalescer
+from auditly.config import clear_config_cache
 
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def _short_debounce(monkeypatch):
+    monkeypatch.setattr(webhook_coalescer, "debounce_seconds", 0.2)
+
+
+@pytest.fixture
+def catalog_config(tmp_path):
+    """Config whose catalog holds controls backed by different evidence types."""
+    controls = [{"id": cid} for cid in ("ac-2", "au-2", "cp-9")]
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text(json.dumps({"catalog": {"groups": [{"controls": controls}]}}))
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        yaml.safe_dump(
+            {
+                "version": "0.1",
+                "catalogs": {"nist_800_53_rev5": str(catalog)},
+                "environments": {
+                    "dev": {"storage": {"type": "minio", "endpoint": "x", "bucket": "b"}}
+                },
+            }
+        )
+    )
+    clear_config_cache()
+    yield cfg
+    clear_config_cache()
+
+
+def _wait_for(job_id: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        data = client.get(f"/jobs/{job_id}").json()
+        if data["status"] in ("success", "failed"):
+            return data
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} did not finish")
+
+
 def test_webhook_triggers_validation():
     payload = {
         "event_type": "evidence_changed",
@@ -18,5 +64,91 @@ def test_webhook_triggers_validation():
     assert resp.status_code == 202
     data = resp.json()
     assert data["success"] is True
-    assert "summary" in data
-    assert isinstance(data["summary"], dict)
+    assert data["full_validation"] is True
+
+    job = _wait_for(data["job_id"])
+    assert job["status"] == "success"
+    assert job["result"]["mode"] == "full"
+    assert isinstance(job["result"]["summary"], dict)
+
+
+def test_webhook_burst_coalesces_into_one_incremental_job(catalog_config, monkeypatch):
+    validated = []
+    monkeypatch.setattr(
+        "auditly.api.webhook_queue.validate_evidence",
+        lambda **kw: validated.append(kw) or ({cid.upper(): {} for cid in kw["control_ids"]}, {}),
+    )
+    job_ids = set()
+    for kind in ["audit-log", "audit-log", "terraform-plan"]:
+        resp = client.post(
+            f"/webhook?config_path={catalog_config}",
+            json={
+                "event_type": "evidence_changed",
+                "environment": "dev",
+                "payload": {"evidence_type": kind},
+            },
+        )
+        assert resp.status_code == 202
+        job_ids.add(resp.json()["job_id"])
+
+    assert len(job_ids) == 1
+    job = _wait_for(job_ids.pop())
+    result = job["result"]
+    assert result["mode"] == "incremental"
+    assert result["events"] == 3
+    assert result["evidence_types"] == ["audit-log", "terraform-plan"]
+    # cp-9 depends on neither evidence type and is skipped
+    assert len(validated) == 1
+    assert validated[0]["control_ids"] == ["ac-2", "au-2"]
+    assert result["control_ids"] == ["AC-2", "AU-2"]
+
+
+def test_webhook_without_affected_controls_skips_validation(catalog_config, monkeypatch):
+    monkeypatch.setattr(
+        "auditly.api.webhook_queue.validate_evidence",
+        lambda **kw: pytest.fail("validation should be skipped"),
+    )
+    resp = client.post(
+        f"/webhook?config_path={catalog_config}",
+        json={
+            "event_type": "evidence_changed",
+            "environment": "dev",
+            "payload": {"evidence_type": "sbom"},
+        },
+    )
+    job = _wait_for(resp.json()["job_id"])
+    assert job["status"] == "success"
+    assert job["result"]["control_ids"] == []
+
+
+def test_event_evidence_types_from_payload():
+    payload = {
+        "evidence_types": ["a"],
+        "evidence_type": "b",
+        "artifacts": [{"metadata": {"kind": "c"}}, {"metadata": None}],
+    }
+    assert event_evidence_types(payload) == {"a", "b", "c"}
+    assert event_evidence_types(None) == set()
+
+
+def test_max_delay_bounds_debounce(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "auditly.api.webhook_queue.validate_evidence",
+        lambda **kw: calls.append(kw) or ({}, {"passed": 0}),
+    )
+    manager = JobManager(max_workers=1)
+    coalescer = WebhookCoalescer(manager, debounce_seconds=0.2, max_delay_seconds=0.3)
+    try:
+        start = time.monotonic()
+        batch = coalescer.submit("testenv", event_type="evidence_changed")
+        # Keep events flowing faster than the debounce window
+        while batch.job.future is None and time.monotonic() - start < 5:
+            coalescer.submit("testenv", event_type="evidence_changed")
+            time.sleep(0.05)
+        batch.job.future.result(timeout=5)
+        assert time.monotonic() - start < 1.0
+        assert len(calls) == 1
+    finally:
+        coalescer.shutdown()
+        manager.shutdown(wait=True)
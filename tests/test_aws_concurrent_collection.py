@@ -0,0 +1,121 @@
+"""Tests for concurrent AWS service collection in ``collect aws``."""
+
+import contextlib
+import json
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip("boto3")
+from botocore.stub import Stubber  # noqa: E402
+
+from auditly import cli_collect  # noqa: E402
+from auditly.collectors.aws import AWSClient  # noqa: E402
+from auditly.collectors.common import finalize_evidence  # noqa: E402
+from auditly.performance import performance_metrics  # noqa: E402
+
+
+def test_caller_identity_is_fetched_once_per_client():
+    client = AWSClient(access_key_id="x", secret_access_key="y")
+    identity = {
+        "Account": "123456789012",
+        "Arn": "arn:aws:iam::123456789012:user/auditor",
+        "UserId": "AIDA",
+    }
+    with Stubber(client.get_client("sts")) as stubber:
+        stubber.add_response("get_caller_identity", identity)
+        threads = [threading.Thread(target=client.get_account_id) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Region views share the cached identity
+        assert client.for_region("eu-west-1").get_account_id() == "123456789012"
+        assert client.get_caller_identity() == identity
+        stubber.assert_no_pending_responses()
+
+
+def _run(monkeypatch, tmp_path, services, service_workers, delays, failing=()):
+    uploads = {}
+
+    class DummyVault:
+        def put_json(self, key, body, metadata=None):
+            uploads[key] = json.loads(body)
+
+        def put_stream(self, key, chunks, metadata=None, content_type=None, content_encoding=None):
+            uploads[key] = json.loads(b"".join(chunks))
+
+    def _collector(service):
+        class _Collector:
+            changes = None
+
+            def __init__(self, client, **kwargs):
+                pass
+
+            def collect_all(self, previous=None):
+                time.sleep(delays[service])
+                if service in failing:
+                    raise RuntimeError(f"{service} failed")
+                return finalize_evidence({"items": []}, collector=f"aws-{service}")
+
+        return _Collector
+
+    fake_client = types.SimpleNamespace(
+        get_account_id=lambda: "123456789012",
+        call_stats=lambda scope=None: {},
+        call_scope=lambda name: contextlib.nullcontext(),
+    )
+    monkeypatch.setattr(
+        "auditly.cli_collect.AppConfig.load",
+        lambda x: types.SimpleNamespace(environments={"dev": {}}),
+    )
+    monkeypatch.setattr(cli_collect, "vault_from_envcfg", lambda x: DummyVault())
+    monkeypatch.setattr(cli_collect, "persist_if_db", lambda *a: None)
+    monkeypatch.setattr("auditly.collectors.aws.client.AWSClient", lambda **kw: fake_client)
+    monkeypatch.setattr("auditly.collectors.aws.iam.IAMCollector", _collector("iam"))
+    monkeypatch.setattr("auditly.collectors.aws.kms.KMSCollector", _collector("kms"))
+    monkeypatch.setattr("auditly.collectors.aws.rds.RDSCollector", _collector("rds"))
+    monkeypatch.setattr(performance_metrics.metrics, "collection_times", {})
+
+    start = time.perf_counter()
+    cli_collect.collect_aws_cmd(
+        config=tmp_path,
+        env="dev",
+        region="us-east-1",
+        profile=None,
+        services=services,
+        output_dir=tmp_path / "out",
+        iam_bulk=False,
+        max_pool_connections=10,
+        service_concurrency=None,
+        max_attempts=10,
+        retry_mode="adaptive",
+        rate_limits=None,
+        cloudtrail_source="api",
+        incremental=False,
+        service_workers=service_workers,
+    )
+    return uploads, time.perf_counter() - start
+
+
+def test_services_run_concurrently_and_report_timings(monkeypatch, tmp_path):
+    delays = {"iam": 0.4, "kms": 0.2, "rds": 0.2}
+    uploads, elapsed = _run(monkeypatch, tmp_path, "iam,kms,rds", 3, delays)
+
+    # Roughly the slowest service, not the sum of all three
+    assert elapsed < 0.7
+    manifest = uploads["manifests/dev/aws-iam-kms-rds-manifest.json"]
+    assert [a["metadata"]["service"] for a in manifest["artifacts"]] == ["iam", "kms", "rds"]
+    times = performance_metrics.get_report()["collection_times"]
+    assert times["aws-iam"][0] >= 0.4
+    assert times["aws-kms"][0] >= 0.2
+
+
+def test_failed_service_does_not_stop_the_others(monkeypatch, tmp_path):
+    delays = {"iam": 0.0, "kms": 0.0, "rds": 0.0}
+    uploads, _ = _run(monkeypatch, tmp_path, "iam,kms,rds", 1, delays, failing=("kms",))
+
+    manifest = uploads["manifests/dev/aws-iam-kms-rds-manifest.json"]
+    assert [a["metadata"]["service"] for a in manifest["artifacts"]] == ["iam", "rds"]
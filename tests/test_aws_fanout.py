@@ -0,0 +1,144 @@
+"""Tests for concurrent per-resource fan-out in AWS collectors."""
+
+import threading
+import time
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from auditly.collectors.aws import (  # noqa: E402
+    AWSClient,
+    CloudTrailCollector,
+    KMSCollector,
+    S3Collector,
+    fan_out,
+)
+
+
+class _ConcurrencyProbe:
+    """Records the peak number of overlapping calls."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, result):
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return result
+
+
+def test_fan_out_preserves_order_and_bounds_workers():
+    probe = _ConcurrencyProbe()
+    assert fan_out(lambda i: probe(i * 2), range(40), max_workers=4) == [i * 2 for i in range(40)]
+    assert probe.peak <= 4
+    assert probe.peak > 1
+
+
+def test_fan_out_runs_serially_with_one_worker():
+    probe = _ConcurrencyProbe(delay=0)
+    assert fan_out(probe, ["a", "b"], max_workers=1) == ["a", "b"]
+    assert probe.peak == 1
+    assert fan_out(probe, [], max_workers=8) == []
+
+
+def test_fan_out_propagates_errors():
+    def _fail(i):
+        if i == 3:
+            raise RuntimeError("boom")
+        return i
+
+    with pytest.raises(RuntimeError, match="boom"):
+        fan_out(_fail, range(6), max_workers=3)
+
+
+def test_client_concurrency_bounded_by_pool():
+    client = AWSClient(
+        access_key_id="x",
+        secret_access_key="y",
+        max_pool_connections=20,
+        service_concurrency={"kms": 4, "s3": 50},
+    )
+    assert client.concurrency_for("kms") == 4
+    assert client.concurrency_for("s3") == 20
+    assert client.concurrency_for("cloudtrail") == 20
+    assert client.get_client("s3").meta.config.max_pool_connections == 20
+
+
+def _mock_client(service_client, concurrency=8):
+    client = Mock(spec=AWSClient)
+    client.get_client.return_value = service_client
+    client.get_account_id.return_value = "123456789012"
+    client.region = "us-east-1"
+    client.concurrency_for.return_value = concurrency
+    return client
+
+
+class _FakeS3:
+    """S3 API stand-in whose detail calls are slow and report their concurrency."""
+
+    def __init__(self, n_buckets, probe):
+        self.probe = probe
+        self.buckets = [
+            {"Name": f"bucket-{i:04d}", "CreationDate": datetime(2024, 1, 1, tzinfo=UTC)}
+            for i in range(n_buckets)
+        ]
+
+    def list_buckets(self):
+        return {"Buckets": self.buckets}
+
+    def get_bucket_location(self, Bucket):
+        return self.probe({"LocationConstraint": "eu-west-1"})
+
+    def __getattr__(self, name):
+        # Remaining get_bucket_* calls return empty configurations
+        return lambda **kwargs: self.probe({})
+
+
+def test_s3_buckets_collected_concurrently_in_order():
+    probe = _ConcurrencyProbe(delay=0.002)
+    s3 = _FakeS3(60, probe)
+    collector = S3Collector(_mock_client(s3, concurrency=8))
+
+    start = time.perf_counter()
+    buckets = collector.collect_buckets()
+    elapsed = time.perf_counter() - start
+
+    assert [b["name"] for b in buckets] == [b["Name"] for b in s3.buckets]
+    assert all(b["region"] == "eu-west-1" for b in buckets)
+    assert 1 < probe.peak <= 8
+    # 60 buckets x 9 calls x 2 ms would take over a second serially
+    assert elapsed < probe.calls * probe.delay
+    collector.client.concurrency_for.assert_called_with("s3")
+
+
+def test_kms_and_cloudtrail_use_fan_out():
+    probe = _ConcurrencyProbe(delay=0.005)
+    kms = Mock()
+    kms.get_paginator.return_value.paginate.return_value = [
+        {"Keys": [{"KeyId": f"k{i}"} for i in range(10)]},
+        {"Keys": [{"KeyId": f"k{i}"} for i in range(10, 20)]},
+    ]
+    kms.describe_key.side_effect = lambda KeyId: probe({"KeyMetadata": {"KeyId": KeyId}})
+    kms.get_key_policy.return_value = {"Policy": "{}"}
+    kms.get_key_rotation_status.return_value = {"KeyRotationEnabled": True}
+    keys = KMSCollector(_mock_client(kms, concurrency=5)).collect_keys()
+    assert [k["key_id"] for k in keys] == [f"k{i}" for i in range(20)]
+    assert 1 < probe.peak <= 5
+
+    trails = Mock()
+    trails.describe_trails.return_value = {"trailList": [{"Name": "a"}, {"Name": "b"}]}
+    trails.get_trail_status.side_effect = lambda Name: {"IsLogging": Name == "a"}
+    collected = CloudTrailCollector(_mock_client(trails)).collect_trails()
+    assert [(t["trail_name"], t["is_logging"]) for t in collected] == [("a", True), ("b", False)]
@@ -0,0 +1,342 @@
+"""Tests for IAM collection modes, using botocore's Stubber for the IAM API."""
+
+import json
+import urllib.parse
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+boto3 = pytest.importorskip("boto3")
+from botocore.stub import Stubber  # noqa: E402
+
+from auditly.collectors.aws import AWSClient, IAMCollector  # noqa: E402
+
+CREATED = datetime(2024, 1, 1, tzinfo=UTC)
+GROUPS = ["admins", "developers", "auditors"]
+TRUST = {"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Action": "sts:AssumeRole"}]}
+POLICY_DOC = {"Version": "2012-10-17", "Statement": [{"Effect": "Allow", "Action": "s3:*"}]}
+ATTACHED = [{"PolicyName": "ReadOnly", "PolicyArn": "arn:aws:iam::aws:policy/ReadOnlyAccess"}]
+
+
+def _encoded(doc):
+    """Policy documents travel URL-encoded; botocore decodes them after each call."""
+    return urllib.parse.quote(json.dumps(doc))
+
+
+class FakeAccount:
+    """Synthetic IAM account with users, roles, groups and customer managed policies."""
+
+    def __init__(self, n_users=20, n_roles=5, n_policies=3):
+        self.users = [
+            {
+                "name": f"user-{i:05d}",
+                "groups": [GROUPS[i % len(GROUPS)]],
+                "mfa": i % 2 == 0,
+                "key": i % 3 != 0,
+            }
+            for i in range(n_users)
+        ]
+        self.roles = [f"role-{i}" for i in range(n_roles)]
+        self.policies = [f"policy-{i}" for i in range(n_policies)]
+
+    def user_arn(self, name):
+        return f"arn:aws:iam::123456789012:user/{name}"
+
+    def user(self, u):
+        return {
+            "Path": "/",
+            "UserName": u["name"],
+            "UserId": f"AID{u['name'].upper():>17}"[:21],
+            "Arn": self.user_arn(u["name"]),
+            "CreateDate": CREATED,
+        }
+
+    def role(self, name):
+        return {
+            "Path": "/",
+            "RoleName": name,
+            "RoleId": f"ARO{name.upper():>17}"[:21],
+            "Arn": f"arn:aws:iam::123456789012:role/{name}",
+            "CreateDate": CREATED,
+        }
+
+    def group(self, name):
+        return {
+            "Path": "/",
+            "GroupName": name,
+            "GroupId": f"AGP{name.upper():>17}"[:21],
+            "Arn": f"arn:aws:iam::123456789012:group/{name}",
+            "CreateDate": CREATED,
+        }
+
+    def policy(self, name):
+        return {
+            "PolicyName": name,
+            "PolicyId": f"ANP{name.upper():>17}"[:21],
+            "Arn": f"arn:aws:iam::123456789012:policy/{name}",
+            "DefaultVersionId": "v2",
+            "AttachmentCount": 1,
+            "IsAttachable": True,
+            "CreateDate": CREATED,
+            "UpdateDate": CREATED,
+        }
+
+    def mfa_device(self, u):
+        return {"SerialNumber": f"arn:aws:iam::123456789012:mfa/{u['name']}", "EnableDate": CREATED}
+
+    def credential_report(self):
+        header = (
+            "user,arn,user_creation_time,password_enabled,password_last_used,mfa_active,"
+            "access_key_1_active,access_key_1_last_rotated,access_key_2_active,"
+            "access_key_2_last_rotated"
+        )
+        lines = [header, "<root_account>,arn:aws:iam::123456789012:root,x,not_supported,N/A,true,"]
+        for u in self.users:
+            rotated = CREATED.isoformat() if u["key"] else "N/A"
+            lines.append(
+                f"{u['name']},{self.user_arn(u['name'])},{CREATED.isoformat()},true,"
+                f"{CREATED.isoformat()},{str(u['mfa']).lower()},"
+                f"{str(u['key']).lower()},{rotated},false,N/A"
+            )
+        return "\n".join(lines).encode()
+
+
+def _collector(iam, bulk):
+    client = Mock(spec=AWSClient)
+    client.get_client.return_value = iam
+    client.get_account_id.return_value = "123456789012"
+    client.region = "us-east-1"
+    return IAMCollector(client, bulk=bulk)
+
+
+def _stub_common(stubber):
+    stubber.add_response(
+        "get_account_password_policy",
+        {"PasswordPolicy": {"MinimumPasswordLength": 14, "RequireSymbols": True}},
+    )
+    stubber.add_response("get_account_summary", {"SummaryMap": {"Users": 1}})
+
+
+def _stub_per_entity(stubber, account):
+    stubber.add_response(
+        "list_users",
+        {
+            "Users": [dict(account.user(u), PasswordLastUsed=CREATED) for u in account.users],
+            "IsTruncated": False,
+        },
+    )
+    for u in account.users:
+        stubber.add_response(
+            "list_mfa_devices",
+            {"MFADevices": ([dict(account.mfa_device(u), UserName=u["name"])] if u["mfa"] else [])},
+        )
+        stubber.add_response(
+            "list_access_keys",
+            {
+                "AccessKeyMetadata": (
+                    [{"AccessKeyId": "AKIAEXAMPLE00000", "Status": "Active", "CreateDate": CREATED}]
+                    if u["key"]
+                    else []
+                )
+            },
+        )
+        stubber.add_response("list_attached_user_policies", {"AttachedPolicies": ATTACHED})
+        stubber.add_response("list_user_policies", {"PolicyNames": ["inline-user"]})
+        stubber.add_response(
+            "list_groups_for_user", {"Groups": [account.group(g) for g in u["groups"]]}
+        )
+
+    stubber.add_response(
+        "list_roles",
+        {
+            "Roles": [
+                dict(
+                    account.role(r),
+                    AssumeRolePolicyDocument=_encoded(TRUST),
+                    MaxSessionDuration=3600,
+                )
+                for r in account.roles
+            ],
+            "IsTruncated": False,
+        },
+    )
+    for _ in account.roles:
+        stubber.add_response("list_attached_role_policies", {"AttachedPolicies": ATTACHED})
+        stubber.add_response("list_role_policies", {"PolicyNames": ["inline-role"]})
+
+    stubber.add_response(
+        "list_policies",
+        {"Policies": [account.policy(p) for p in account.policies], "IsTruncated": False},
+    )
+    for _ in account.policies:
+        stubber.add_response(
+            "get_policy_version",
+            {"PolicyVersion": {"Document": _encoded(POLICY_DOC), "VersionId": "v2"}},
+        )
+
+    stubber.add_response(
+        "list_groups", {"Groups": [account.group(g) for g in GROUPS], "IsTruncated": False}
+    )
+    for g in GROUPS:
+        members = [account.user(u) for u in account.users if g in u["groups"]]
+        stubber.add_response(
+            "get_group", {"Group": account.group(g), "Users": members, "IsTruncated": False}
+        )
+        stubber.add_response("list_attached_group_policies", {"AttachedPolicies": ATTACHED})
+        stubber.add_response("list_group_policies", {"PolicyNames": ["inline-group"]})
+    _stub_common(stubber)
+
+
+def _stub_bulk(stubber, account, *, report_ready=True):
+    users = [
+        dict(
+            account.user(u),
+            UserPolicyList=[{"PolicyName": "inline-user", "PolicyDocument": _encoded(POLICY_DOC)}],
+            GroupList=u["groups"],
+            AttachedManagedPolicies=ATTACHED,
+        )
+        for u in account.users
+    ]
+    roles = [
+        dict(
+            account.role(r),
+            AssumeRolePolicyDocument=_encoded(TRUST),
+            RolePolicyList=[{"PolicyName": "inline-role", "PolicyDocument": _encoded(POLICY_DOC)}],
+            AttachedManagedPolicies=ATTACHED,
+        )
+        for r in account.roles
+    ]
+    groups = [
+        dict(
+            account.group(g),
+            GroupPolicyList=[
+                {"PolicyName": "inline-group", "PolicyDocument": _encoded(POLICY_DOC)}
+            ],
+            AttachedManagedPolicies=ATTACHED,
+        )
+        for g in GROUPS
+    ]
+    policies = [
+        dict(
+            account.policy(p),
+            PolicyVersionList=[
+                {"Document": _encoded({}), "VersionId": "v1", "IsDefaultVersion": False},
+                {"Document": _encoded(POLICY_DOC), "VersionId": "v2", "IsDefaultVersion": True},
+            ],
+        )
+        for p in account.policies
+    ]
+    half = len(users) // 2
+    stubber.add_response(
+        "get_account_authorization_details",
+        {"UserDetailList": users[:half], "IsTruncated": True, "Marker": "page-2"},
+    )
+    stubber.add_response(
+        "get_account_authorization_details",
+        {
+            "UserDetailList": users[half:],
+            "RoleDetailList": roles,
+            "GroupDetailList": groups,
+            "Policies": policies,
+            "IsTruncated": False,
+        },
+    )
+    if report_ready:
+        stubber.add_response("generate_credential_report", {"State": "STARTED"})
+        stubber.add_response("generate_credential_report", {"State": "COMPLETE"})
+        stubber.add_response(
+            "get_credential_report",
+            {"Content": account.credential_report(), "ReportFormat": "text/csv"},
+        )
+    else:
+        stubber.add_client_error("generate_credential_report", "LimitExceeded")
+    stubber.add_response(
+        "list_virtual_mfa_devices",
+        {
+            "VirtualMFADevices": [
+                dict(account.mfa_device(u), User=account.user(u)) for u in account.users if u["mfa"]
+            ],
+            "IsTruncated": False,
+        },
+    )
+    stubber.add_response(
+        "list_roles",
+        {
+            "Roles": [
+                dict(
+                    account.role(r),
+                    AssumeRolePolicyDocument=_encoded(TRUST),
+                    MaxSessionDuration=3600,
+                )
+                for r in account.roles
+            ],
+            "IsTruncated": False,
+        },
+    )
+    if not report_ready:
+        for _ in account.users:
+            stubber.add_response("list_mfa_devices", {"MFADevices": []})
+            stubber.add_response("list_access_keys", {"AccessKeyMetadata": []})
+    _stub_common(stubber)
+
+
+@pytest.fixture(autouse=True)
+def _no_report_polling_delay(monkeypatch):
+    monkeypatch.setattr("auditly.collectors.aws.iam.time.sleep", lambda _s: None)
+
+
+def _iam_client():
+    return boto3.client(
+        "iam", region_name="us-east-1", aws_access_key_id="x", aws_secret_access_key="y"
+    )
+
+
+def _collect(account, bulk):
+    iam = _iam_client()
+    with Stubber(iam) as stubber:
+        (_stub_bulk if bulk else _stub_per_entity)(stubber, account)
+        calls = len(stubber._queue)
+        evidence = _collector(iam, bulk).collect_all()
+        stubber.assert_no_pending_responses()
+    return evidence, calls
+
+
+def _without_key_ids(users):
+    return [
+        dict(u, access_keys=[dict(k, access_key_id=None) for k in u["access_keys"]]) for u in users
+    ]
+
+
+def test_bulk_mode_matches_per_entity_evidence():
+    account = FakeAccount()
+    per_entity, _ = _collect(account, bulk=False)
+    bulk, _ = _collect(account, bulk=True)
+
+    assert bulk["users"] == _without_key_ids(per_entity["users"])
+    assert bulk["roles"] == per_entity["roles"]
+    assert bulk["groups"] == per_entity["groups"]
+    assert bulk["policies"] == per_entity["policies"]
+    assert bulk["password_policy"] == per_entity["password_policy"]
+    assert bulk["roles"][0]["assume_role_policy"] == TRUST
+    assert bulk["policies"][0]["policy_document"] == POLICY_DOC
+
+
+def test_bulk_mode_falls_back_per_user_without_credential_report():
+    account = FakeAccount(n_users=4)
+    iam = _iam_client()
+    with Stubber(iam) as stubber:
+        _stub_bulk(stubber, account, report_ready=False)
+        evidence = _collector(iam, bulk=True).collect_all()
+        stubber.assert_no_pending_responses()
+    assert [u["mfa_enabled"] for u in evidence["users"]] == [False] * 4
+    assert evidence["users"][0]["password_last_used"] is None
+
+
+def test_bulk_collection_benchmark():
+    """Bulk mode issues a constant number of calls however many users the account has."""
+    account = FakeAccount(n_users=500, n_roles=50, n_policies=20)
+    _, per_entity_calls = _collect(account, bulk=False)
+    _, bulk_calls = _collect(account, bulk=True)
+    assert per_entity_calls > 5 * 500
+    assert bulk_calls <= 10
@@ -0,0 +1,329 @@
+"""Tests for change-aware AWS collection driven by AWS Config."""
+
+import json
+import types
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("boto3")
+from botocore.exceptions import ClientError  # noqa: E402
+
+from auditly.collectors.aws import AWSClient, EC2Collector, KMSCollector  # noqa: E402
+from auditly.collectors.aws.changes import (  # noqa: E402
+    FILTER_VALUE_LIMIT,
+    filter_chunks,
+    merge_section,
+    recorded_resource_types,
+)
+
+LAUNCHED = datetime(2026, 1, 1, tzinfo=UTC)
+
+# Response key per EC2 describe call
+EC2_RESULTS = {
+    "describe_instances": "Reservations",
+    "describe_security_groups": "SecurityGroups",
+    "describe_volumes": "Volumes",
+    "describe_snapshots": "Snapshots",
+    "describe_vpcs": "Vpcs",
+    "describe_subnets": "Subnets",
+    "describe_network_acls": "NetworkAcls",
+}
+
+
+class FakeEC2:
+    """EC2 stand-in honouring ID filters and recording each describe call."""
+
+    def __init__(self):
+        self.instances = {}
+        self.groups = {"sg-1": {"GroupId": "sg-1", "GroupName": "web"}}
+        self.calls = []
+        # Operations whose filtered (re-describe) calls fail
+        self.failing = set()
+
+    def add_instance(self, instance_id, state="running"):
+        self.instances[instance_id] = {
+            "InstanceId": instance_id,
+            "InstanceType": "t3.micro",
+            "State": {"Name": state},
+            "LaunchTime": LAUNCHED,
+        }
+
+    def get_paginator(self, operation):
+        return types.SimpleNamespace(paginate=lambda **kw: self._pages(operation, kw))
+
+    def describe_key_pairs(self):
+        self.calls.append(("describe_key_pairs", {}))
+        return {"KeyPairs": []}
+
+    def _pages(self, operation, kwargs):
+        self.calls.append((operation, kwargs))
+        if operation in self.failing and "Filters" in kwargs:
+            raise ClientError({"Error": {"Code": "RequestLimitExceeded"}}, operation)
+        wanted = {v for f in kwargs.get("Filters", []) for v in f["Values"]}
+        if operation == "describe_instances":
+            items = [
+                {"Instances": [i]} for k, i in self.instances.items() if _match(k, kwargs, wanted)
+            ]
+        elif operation == "describe_security_groups":
+            items = [g for k, g in self.groups.items() if _match(k, kwargs, wanted)]
+        else:
+            items = []
+        return [{EC2_RESULTS[operation]: items}]
+
+    def described(self, operation):
+        return [kwargs for op, kwargs in self.calls if op == operation]
+
+
+def _match(resource_id, kwargs, wanted):
+    return "Filters" not in kwargs or resource_id in wanted
+
+
+def _config(changed, resource_type="AWS::EC2::Instance", recording_group=None):
+    config = Mock()
+    config.describe_configuration_recorder_status.return_value = {
+        "ConfigurationRecordersStatus": [
+            {"name": "default", "recording": True, "lastStartTime": LAUNCHED}
+        ]
+    }
+    config.describe_configuration_recorders.return_value = {
+        "ConfigurationRecorders": [
+            {"name": "default", "recordingGroup": recording_group or {"allSupported": True}}
+        ]
+    }
+    config.get_paginator.return_value.paginate.return_value = [
+        {
+            "Results": [
+                json.dumps({"resourceId": rid, "resourceName": rid, "resourceType": resource_type})
+                for rid in changed
+            ]
+        }
+    ]
+    return config
+
+
+def _client(services, region="us-east-1"):
+    client = Mock(spec=AWSClient)
+    client.get_client.side_effect = lambda name: services[name]
+    client.get_account_id.return_value = "123456789012"
+    client.region = region
+    client.concurrency_for.return_value = 4
+    return client
+
+
+def _sections(evidence):
+    return {k: v for k, v in evidence.items() if k != "metadata"}
+
+
+def test_incremental_ec2_matches_full_collection_with_fewer_calls():
+    ec2 = FakeEC2()
+    for instance_id in ("i-1", "i-2", "i-3"):
+        ec2.add_instance(instance_id)
+    config = _config(["i-2", "i-3", "i-4"])
+    client = _client({"ec2": ec2, "config": config})
+    # The vault returns the previous evidence as JSON
+    previous = json.loads(json.dumps(EC2Collector(client).collect_all()))
+
+    ec2.instances["i-2"]["State"]["Name"] = "stopped"
+    del ec2.instances["i-3"]
+    ec2.add_instance("i-4")
+    ec2.calls.clear()
+
+    collector = EC2Collector(client)
+    incremental = collector.collect_all(previous=previous)
+
+    assert collector.changes.count() == 3
+    assert ec2.described("describe_instances") == [
+        {"Filters": [{"Name": "instance-id", "Values": ["i-2", "i-3", "i-4"]}]}
+    ]
+    # Unchanged tracked sections are reused; untracked ones are still collected
+    assert ec2.described("describe_security_groups") == []
+    assert ec2.described("describe_snapshots") == [{"OwnerIds": ["self"]}]
+    expression = config.get_paginator.return_value.paginate.call_args.kwargs["Expression"]
+    since = datetime.fromisoformat(previous["metadata"]["collected_at"]) - timedelta(minutes=15)
+    assert f"configurationItemCaptureTime >= '{since:%Y-%m-%dT%H:%M:%S}.000Z'" in expression
+
+    full = EC2Collector(client).collect_all()
+    assert _sections(incremental) == _sections(full)
+    assert [i["state"] for i in incremental["instances"]] == ["running", "stopped", "running"]
+
+
+def test_falls_back_to_full_collection():
+    ec2 = FakeEC2()
+    ec2.add_instance("i-1")
+    config = _config(["i-1"])
+    previous = EC2Collector(_client({"ec2": ec2, "config": config})).collect_all()
+
+    # Evidence from another region cannot be merged
+    collector = EC2Collector(_client({"ec2": ec2, "config": config}, region="eu-west-1"))
+    collector.collect_all(previous=previous)
+    assert collector.changes is None
+
+    config.describe_configuration_recorder_status.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException"}}, "DescribeConfigurationRecorderStatus"
+    )
+    ec2.calls.clear()
+    collector = EC2Collector(_client({"ec2": ec2, "config": config}))
+    assert _sections(collector.collect_all(previous=previous)) == _sections(previous)
+    assert collector.changes is None
+    assert ec2.described("describe_instances") == [{}]
+
+
+def test_failed_redescribe_collects_the_section_in_full():
+    ec2 = FakeEC2()
+    for instance_id in ("i-1", "i-2"):
+        ec2.add_instance(instance_id)
+    client = _client({"ec2": ec2, "config": _config(["i-2"])})
+    previous = json.loads(json.dumps(EC2Collector(client).collect_all()))
+
+    ec2.instances["i-2"]["State"]["Name"] = "stopped"
+    ec2.failing.add("describe_instances")
+    ec2.calls.clear()
+    evidence = EC2Collector(client).collect_all(previous=previous)
+
+    # The failure is not mistaken for i-2 having been deleted
+    assert ec2.described("describe_instances")[-1] == {}
+    assert [i["state"] for i in evidence["instances"]] == ["running", "stopped"]
+
+
+def test_recorded_resource_types_follow_recorder_settings():
+    since = datetime(2026, 10, 1, tzinfo=UTC)
+    wanted = {"AWS::EC2::Instance", "AWS::EC2::Volume"}
+
+    excluded = _config(
+        [],
+        recording_group={
+            "allSupported": False,
+            "recordingStrategy": {"useOnly": "EXCLUSION_BY_RESOURCE_TYPES"},
+            "exclusionByResourceTypes": {"resourceTypes": ["AWS::EC2::Volume"]},
+        },
+    )
+    assert recorded_resource_types(excluded, wanted, since) == {"AWS::EC2::Instance"}
+
+    listed = _config(
+        [], recording_group={"allSupported": False, "resourceTypes": ["AWS::EC2::Volume"]}
+    )
+    assert recorded_resource_types(listed, wanted, since) == {"AWS::EC2::Volume"}
+
+    # Restarted inside the window: changes before the restart may be missing
+    restarted = _config([])
+    restarted.describe_configuration_recorder_status.return_value = {
+        "ConfigurationRecordersStatus": [
+            {"name": "default", "recording": True, "lastStartTime": since + timedelta(hours=1)}
+        ]
+    }
+    assert recorded_resource_types(restarted, wanted, since) == set()
+
+    # Daily snapshots can lag a change by up to a day
+    daily = _config([])
+    daily.describe_configuration_recorders.return_value["ConfigurationRecorders"][0][
+        "recordingMode"
+    ] = {
+        "recordingFrequency": "DAILY",
+        "recordingModeOverrides": [
+            {"resourceTypes": ["AWS::EC2::Instance"], "recordingFrequency": "CONTINUOUS"}
+        ],
+    }
+    assert recorded_resource_types(daily, wanted, since) == {"AWS::EC2::Instance"}
+    overridden = _config([])
+    overridden.describe_configuration_recorders.return_value["ConfigurationRecorders"][0][
+        "recordingMode"
+    ] = {
+        "recordingFrequency": "CONTINUOUS",
+        "recordingModeOverrides": [
+            {"resourceTypes": ["AWS::EC2::Instance"], "recordingFrequency": "DAILY"}
+        ],
+    }
+    assert recorded_resource_types(overridden, wanted, since) == {"AWS::EC2::Volume"}
+
+
+def test_incremental_kms_describes_only_changed_keys():
+    kms = Mock()
+    kms.get_paginator.side_effect = lambda op: Mock(
+        paginate=Mock(
+            return_value=[{"Keys": [{"KeyId": "k1"}, {"KeyId": "k2"}]}]
+            if op == "list_keys"
+            else [{"Aliases": [], "Grants": []}]
+        )
+    )
+    kms.describe_key.side_effect = lambda KeyId: {
+        "KeyMetadata": {"KeyId": KeyId, "KeyState": "Enabled"}
+    }
+    kms.get_key_policy.return_value = {"Policy": "{}"}
+    kms.get_key_rotation_status.return_value = {"KeyRotationEnabled": True}
+    client = _client({"kms": kms, "config": _config(["k2"], resource_type="AWS::KMS::Key")})
+    previous = KMSCollector(client).collect_all()
+
+    kms.describe_key.reset_mock()
+    kms.get_key_rotation_status.return_value = {"KeyRotationEnabled": False}
+    evidence = KMSCollector(client).collect_all(previous=previous)
+
+    assert [c.kwargs["KeyId"] for c in kms.describe_key.call_args_list] == ["k2"]
+    assert [(k["key_id"], k["rotation_enabled"]) for k in evidence["keys"]] == [
+        ("k1", True),
+        ("k2", False),
+    ]
+
+
+def test_changed_kms_key_that_cannot_be_described_is_not_dropped():
+    kms = Mock()
+    kms.get_paginator.side_effect = lambda op: Mock(
+        paginate=Mock(
+            return_value=[{"Keys": [{"KeyId": "k1"}, {"KeyId": "k2"}]}]
+            if op == "list_keys"
+            else [{"Aliases": [], "Grants": []}]
+        )
+    )
+    kms.describe_key.side_effect = lambda KeyId: {
+        "KeyMetadata": {"KeyId": KeyId, "KeyState": "Enabled"}
+    }
+    kms.get_key_policy.return_value = {"Policy": "{}"}
+    kms.get_key_rotation_status.return_value = {"KeyRotationEnabled": True}
+    client = _client({"kms": kms, "config": _config(["k2"], resource_type="AWS::KMS::Key")})
+    previous = KMSCollector(client).collect_all()
+
+    throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "GetKeyPolicy")
+    kms.get_key_policy.side_effect = [throttled, {"Policy": "{}"}, {"Policy": "{}"}]
+    evidence = KMSCollector(client).collect_all(previous=previous)
+    # The re-describe failed, so the section was listed and described in full
+    assert [k["key_id"] for k in evidence["keys"]] == ["k1", "k2"]
+
+    # A key deleted since the previous run is dropped
+    kms.get_key_policy.side_effect = None
+    kms.describe_key.side_effect = ClientError(
+        {"Error": {"Code": "NotFoundException"}}, "DescribeKey"
+    )
+    evidence = KMSCollector(client).collect_all(previous=previous)
+    assert [k["key_id"] for k in evidence["keys"]] == ["k1"]
+
+
+def test_partial_previous_evidence_is_not_built_on():
+    from auditly.cli_collect import previous_evidence
+
+    evidence = {"instances": [], "metadata": {"collected_at": "2026-10-01T00:00:00"}}
+
+    def _vault(metadata):
+        return types.SimpleNamespace(
+            get_json=lambda key: evidence, get_metadata=lambda key: {"metadata": metadata}
+        )
+
+    assert previous_evidence(_vault({"partial": "False"}), "k") == evidence
+    assert previous_evidence(_vault({"partial": "True"}), "k") is None
+    assert previous_evidence(_vault({"X-Amz-Meta-Partial": "True"}), "k") is None
+
+
+def test_merge_section_and_filter_chunks():
+    previous = [{"id": "a", "v": 1}, {"id": "b", "v": 1}, {"id": "c", "v": 1}]
+    fresh = [{"id": "d", "v": 2}, {"id": "b", "v": 2}]
+    assert merge_section(previous, fresh, "id", {"b", "c", "d"}) == [
+        {"id": "a", "v": 1},
+        {"id": "b", "v": 2},
+        {"id": "d", "v": 2},
+    ]
+
+    ids = [f"i-{n}" for n in range(FILTER_VALUE_LIMIT + 1)]
+    chunks = list(filter_chunks("instance-id", ids, param="Filter"))
+    assert [len(c["Filter"][0]["Values"]) for c in chunks] == [FILTER_VALUE_LIMIT, 1]
+    assert list(filter_chunks("instance-id", None)) == [{}]
+    assert list(filter_chunks("instance-id", [])) == []
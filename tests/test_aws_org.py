@@ -0,0 +1,294 @@
+"""Tests for organization-wide AWS sweeps across accounts and regions."""
+
+import threading
+import time
+import types
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+pytest.importorskip("boto3")
+from botocore.stub import Stubber  # noqa: E402
+
+from auditly import cli_collect  # noqa: E402
+from auditly.collectors.aws import AWSClient, org  # noqa: E402
+from auditly.collectors.registry import CollectorRegistry, CollectorSpec  # noqa: E402
+
+
+def test_plan_partitions_splits_global_and_regional_services():
+    partitions = org.plan_partitions(
+        {"111": ["us-east-1", "eu-west-1"], "222": ["us-east-1"]}, ["iam", "ec2", "s3", "kms"]
+    )
+    assert [(p.key, p.services) for p in partitions] == [
+        ("111/global", ["iam", "s3"]),
+        ("111/us-east-1", ["ec2", "kms"]),
+        ("111/eu-west-1", ["ec2", "kms"]),
+        ("222/global", ["iam", "s3"]),
+        ("222/us-east-1", ["ec2", "kms"]),
+    ]
+    assert [p.key for p in org.plan_partitions({"111": ["us-east-1"]}, ["iam"])] == ["111/global"]
+
+
+def test_assume_role_returns_client_for_target_account():
+    base = AWSClient(access_key_id="x", secret_access_key="y", max_pool_connections=20)
+    with Stubber(base.get_client("sts")) as stubber:
+        stubber.add_response(
+            "assume_role",
+            {
+                "Credentials": {
+                    "AccessKeyId": "ASIATEMPORARYKEY0001",
+                    "SecretAccessKey": "secret",
+                    "SessionToken": "token",
+                    "Expiration": datetime.now(UTC) + timedelta(hours=1),
+                },
+                "AssumedRoleUser": {
+                    "AssumedRoleId": "AROAEXAMPLE:auditly",
+                    "Arn": "arn:aws:sts::222222222222:assumed-role/Audit/auditly",
+                },
+            },
+            {
+                "RoleArn": "arn:aws:iam::222222222222:role/Audit",
+                "RoleSessionName": "auditly",
+                "DurationSeconds": 3600,
+                "ExternalId": "ext",
+            },
+        )
+        assumed = base.assume_role("arn:aws:iam::222222222222:role/Audit", external_id="ext")
+
+    assert assumed.get_account_id() == "222222222222"
+    assert assumed.session.get_credentials().access_key == "ASIATEMPORARYKEY0001"
+    assert assumed.max_pool_connections == 20
+    regional = assumed.for_region("eu-west-1")
+    assert regional.region == "eu-west-1"
+    assert regional.get_client("ec2").meta.region_name == "eu-west-1"
+    assert assumed.region == "us-east-1"
+
+
+class _RecordingCollector:
+    """Stand-in collector recording which (account, region) it ran for."""
+
+    calls: list = []
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, client):
+        self.client = client
+
+    def collect_all(self):
+        cls = _RecordingCollector
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+            cls.calls.append((self.client.account, self.client.region))
+        time.sleep(0.01)
+        with cls.lock:
+            cls.active -= 1
+        if self.client.region == "ap-south-1":
+            raise RuntimeError("region disabled")
+        return {"account": self.client.account, "region": self.client.region}
+
+
+def _fake_account_client(account, region="us-east-1"):
+    client = types.SimpleNamespace(account=account, region=region)
+    client.for_region = lambda r: _fake_account_client(account, r)
+    client.list_regions = lambda: ["us-east-1", "eu-west-1", "ap-south-1"]
+    return client
+
+
+def _use_collectors(monkeypatch, **classes):
+    """Register stand-in collectors (by class name in this module) as the only AWS services."""
+    registry = CollectorRegistry(group=None)
+    for service, cls in classes.items():
+        registry.register(
+            CollectorSpec(
+                "aws",
+                service,
+                f"{__name__}:{cls}",
+                f"aws-{service}",
+                global_service=service in ("iam", "s3"),
+            )
+        )
+    monkeypatch.setattr(org, "collector_registry", registry)
+    monkeypatch.setattr(cli_collect, "collector_registry", registry)
+
+
+@pytest.fixture
+def recording_collectors(monkeypatch):
+    _RecordingCollector.calls = []
+    _RecordingCollector.peak = 0
+    _use_collectors(monkeypatch, iam="_RecordingCollector", ec2="_RecordingCollector")
+
+
+def test_sweep_streams_partitions_within_budget(recording_collectors):
+    base = Mock()
+
+    def _assume(arn, external_id=None):
+        account = arn.split(":")[4]
+        if account == "333":
+            raise RuntimeError("AccessDenied")
+        return _fake_account_client(account)
+
+    base.assume_role.side_effect = _assume
+
+    results = org.sweep(base, ["111", "222", "333"], ["iam", "ec2"], max_concurrency=2)
+    first = next(results)
+    # Failed accounts are reported first; partitions are collected lazily
+    assert first.partition.account_id == "333"
+    assert first.evidence is None
+    assert "AccessDenied" in first.errors["account"]
+    assert len(_RecordingCollector.calls) <= 2
+
+    rest = list(results)
+    assert [r.completed for r in [first, *rest]] == list(range(1, 10))
+    assert {r.total for r in rest} == {9}
+    assert _RecordingCollector.peak <= 2
+
+    by_key = {r.partition.key: r for r in rest}
+    assert set(by_key) == {
+        f"{a}/{r}"
+        for a in ("111", "222")
+        for r in ("global", "us-east-1", "eu-west-1", "ap-south-1")
+    }
+    eu = by_key["111/eu-west-1"].evidence
+    assert eu["services"]["ec2"] == {"account": "111", "region": "eu-west-1"}
+    assert eu["metadata"]["account_id"] == "111"
+    assert eu["metadata"]["region"] == "eu-west-1"
+    assert by_key["222/global"].evidence["services"]["iam"]["region"] == "us-east-1"
+    # A failing service is recorded, and a partition with no successful service has no evidence
+    assert by_key["111/ap-south-1"].evidence is None
+    assert by_key["111/ap-south-1"].errors == {"ec2": "region disabled"}
+
+
+def test_sweep_uses_explicit_regions(recording_collectors):
+    base = Mock()
+    base.assume_role.side_effect = lambda arn, external_id=None: _fake_account_client(
+        arn.split(":")[4]
+    )
+    keys = sorted(r.partition.key for r in org.sweep(base, ["111"], ["ec2"], regions=["us-west-2"]))
+    assert keys == ["111/us-west-2"]
+    with pytest.raises(ValueError, match="Unknown AWS services"):
+        next(org.sweep(base, ["111"], ["lambda"]))
+
+
+def test_collect_aws_org_cmd_uploads_each_partition(monkeypatch, tmp_path, recording_collectors):
+    from auditly.cli_collect import collect_aws_org_cmd
+
+    uploads = []
+
+    class DummyVault:
+        def put_json(self, key, body, metadata=None):
+            uploads.append((key, metadata))
+
+        def put_stream(self, key, chunks, metadata=None, content_type=None, content_encoding=None):
+            # Consuming the stream also writes the local copy
+            b"".join(chunks)
+            uploads.append((key, metadata))
+
+    base = Mock()
+    base.assume_role.side_effect = lambda arn, external_id=None: _fake_account_client(
+        arn.split(":")[4]
+    )
+    monkeypatch.setattr(
+        "auditly.cli_collect.AppConfig.load",
+        lambda x: types.SimpleNamespace(environments={"dev": {}}),
+    )
+    monkeypatch.setattr("auditly.cli_collect.vault_from_envcfg", lambda x: DummyVault())
+    monkeypatch.setattr("auditly.cli_collect.persist_if_db", lambda *a: None)
+    monkeypatch.setattr("auditly.collectors.aws.client.AWSClient", lambda **kw: base)
+
+    collect_aws_org_cmd(
+        config=tmp_path,
+        env="dev",
+        accounts="111,222",
+        role_name="Audit",
+        external_id=None,
+        regions="us-east-1",
+        region="us-east-1",
+        profile=None,
+        services="iam,ec2",
+        max_concurrency=4,
+        output_dir=tmp_path / "out",
+    )
+
+    keys = [k for k, _ in uploads]
+    assert keys[-1] == "manifests/dev/aws-org-manifest.json"
+    assert sorted(keys[:-1]) == [
+        "evidence/dev/aws/111/global.json",
+        "evidence/dev/aws/111/us-east-1.json",
+        "evidence/dev/aws/222/global.json",
+        "evidence/dev/aws/222/us-east-1.json",
+    ]
+    assert uploads[0][1]["kind"] == "aws-partition"
+    assert len(list((tmp_path / "out").glob("*.json"))) == 4
+
+
+class _StreamingCloudTrail:
+    """Stand-in CloudTrail collector that hands one event to its sink."""
+
+    def __init__(self, client):
+        self.client = client
+        self.cursors = {}
+
+    def collect_all(self, event_sink=None, checkpoints=None):
+        assert event_sink is not None and checkpoints == {}
+        event = {"EventId": f"{self.client.account}-{self.client.region}"}
+        return {"trails": [], "event_history": event_sink("event_history", iter([event]))}
+
+
+def test_collect_aws_org_cmd_streams_cloudtrail_events(monkeypatch, tmp_path):
+    import json
+
+    from auditly.cli_collect import collect_aws_org_cmd
+
+    uploads = {}
+
+    class DummyVault:
+        def put_json(self, key, body, metadata=None):
+            uploads[key] = body
+
+        def put_stream(self, key, chunks, metadata=None, content_type=None, content_encoding=None):
+            uploads[key] = b"".join(chunks)
+
+    base = Mock()
+    base.assume_role.side_effect = lambda arn, external_id=None: _fake_account_client(
+        arn.split(":")[4]
+    )
+    _use_collectors(monkeypatch, cloudtrail="_StreamingCloudTrail")
+    monkeypatch.setattr(
+        "auditly.cli_collect.AppConfig.load",
+        lambda x: types.SimpleNamespace(environments={"dev": {}}),
+    )
+    monkeypatch.setattr("auditly.cli_collect.vault_from_envcfg", lambda x: DummyVault())
+    monkeypatch.setattr("auditly.cli_collect.persist_if_db", lambda *a: None)
+    monkeypatch.setattr("auditly.collectors.aws.client.AWSClient", lambda **kw: base)
+
+    collect_aws_org_cmd(
+        config=tmp_path,
+        env="dev",
+        accounts="111",
+        role_name="Audit",
+        external_id=None,
+        regions="us-east-1,eu-west-1",
+        region="us-east-1",
+        profile=None,
+        services="cloudtrail",
+        max_concurrency=2,
+        output_dir=None,
+    )
+
+    streams = sorted(k for k in uploads if "/cloudtrail-events/" in k)
+    assert [k.rsplit("/", 3)[1:3] for k in streams] == [
+        ["eu-west-1", "event_history"],
+        ["us-east-1", "event_history"],
+    ]
+    partition = json.loads(uploads["evidence/dev/aws/111/eu-west-1.json"])
+    history = partition["services"]["cloudtrail"]["event_history"]
+    assert history["key"] in streams and history["records"] == 1
+    manifest = json.loads(uploads["manifests/dev/aws-org-manifest.json"])
+    assert {a["metadata"]["kind"] for a in manifest["artifacts"]} == {
+        "aws-partition",
+        "aws-cloudtrail-events",
+    }
+    assert len(manifest["artifacts"]) == 4
@@ -0,0 +1,222 @@
+"""Tests for AWS retry configuration, rate limits and throttle accounting."""
+
+import contextlib
+import json
+import threading
+import time
+import types
+
+import pytest
+
+pytest.importorskip("boto3")
+from botocore.awsrequest import AWSResponse  # noqa: E402
+from botocore.exceptions import ClientError  # noqa: E402
+
+from auditly.collectors.aws import AWSClient, fan_out  # noqa: E402
+from auditly.collectors.aws.throttle import TokenBucket, total_calls  # noqa: E402
+from auditly.collectors.common import finalize_evidence  # noqa: E402
+
+
+class _Raw:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def stream(self, **kwargs):
+        yield self.body
+
+
+class _FakeKMSEndpoint:
+    """Answers KMS requests from a script of status codes without network access."""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.sent = 0
+
+    def __call__(self, request, **kwargs):
+        self.sent += 1
+        status = self.statuses.pop(0) if self.statuses else 200
+        if status == 200:
+            body = {"Keys": [], "Truncated": False}
+        else:
+            body = {"__type": "ThrottlingException", "message": "Rate exceeded"}
+        return AWSResponse(
+            request.url,
+            status,
+            {"Content-Type": "application/x-amz-json-1.1"},
+            _Raw(json.dumps(body).encode()),
+        )
+
+
+@pytest.fixture
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(
+        "botocore.retries.standard.ExponentialBackoff.delay_amount", lambda self, ctx: 0
+    )
+
+
+def _kms(client, statuses):
+    kms = client.get_client("kms")
+    endpoint = _FakeKMSEndpoint(statuses)
+    kms.meta.events.register("before-send", endpoint)
+    return kms, endpoint
+
+
+def test_clients_use_adaptive_retries_by_default():
+    client = AWSClient(access_key_id="x", secret_access_key="y")
+    assert client.get_client("kms").meta.config.retries["mode"] == "adaptive"
+    custom = AWSClient(access_key_id="x", secret_access_key="y", max_attempts=4)
+    assert custom.get_client("kms").meta.config.retries["total_max_attempts"] == 4
+    # Region views share the tracker and rate limits
+    assert custom.for_region("eu-west-1").calls is custom.calls
+
+
+def test_retries_and_throttles_are_counted(no_backoff):
+    client = AWSClient(
+        access_key_id="x", secret_access_key="y", retry_mode="standard", max_attempts=3
+    )
+    kms, endpoint = _kms(client, [400, 400, 200])
+    kms.list_keys()
+    assert endpoint.sent == 3
+    assert client.call_stats()["kms"] == {
+        "calls": 1,
+        "retries": 2,
+        "throttles": 2,
+        "exhausted": 0,
+        "rate_limited_seconds": 0.0,
+    }
+
+    endpoint.statuses = [400, 400, 400]
+    with pytest.raises(ClientError):
+        kms.list_keys()
+    stats = client.call_stats()["kms"]
+    assert (stats["calls"], stats["retries"], stats["throttles"], stats["exhausted"]) == (
+        2,
+        4,
+        5,
+        1,
+    )
+
+
+def test_rate_limit_is_shared_across_threads():
+    client = AWSClient(access_key_id="x", secret_access_key="y", rate_limits={"kms": 20})
+    kms, endpoint = _kms(client, [])
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=kms.list_keys) for _ in range(30)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    # A burst of 20, then 10 more at 20/s
+    assert endpoint.sent == 30
+    assert elapsed >= 0.45
+    assert client.call_stats()["kms"]["rate_limited_seconds"] > 0
+
+
+def test_calls_are_attributed_to_the_calling_scope():
+    client = AWSClient(access_key_id="x", secret_access_key="y")
+    kms, endpoint = _kms(client, [])
+
+    def _collect(scope, calls):
+        with client.call_scope(scope):
+            # Fan-out workers inherit the scope of the thread that started them
+            fan_out(lambda _: kms.list_keys(), range(calls), max_workers=4)
+
+    threads = [
+        threading.Thread(target=_collect, args=("ec2", 3)),
+        threading.Thread(target=_collect, args=("vpc", 5)),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    kms.list_keys()
+
+    assert endpoint.sent == 9
+    assert client.call_stats()["kms"]["calls"] == 9
+    assert client.call_stats("ec2")["kms"]["calls"] == 3
+    assert total_calls(client.call_stats("vpc"))["calls"] == 5
+    assert client.call_stats("rds") == {}
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    bucket = TokenBucket(1000, burst=2)
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() > 0
+
+
+def test_collect_aws_marks_partial_artifacts(monkeypatch, tmp_path):
+    from auditly import cli_collect
+
+    scoped = {
+        "kms": {"kms": {"calls": 12, "retries": 9, "throttles": 9, "exhausted": 1}},
+        "rds": {"rds": {"calls": 2, "retries": 0, "throttles": 0, "exhausted": 0}},
+    }
+    fake_client = types.SimpleNamespace(
+        get_account_id=lambda: "123456789012",
+        call_stats=lambda scope=None: scoped[scope],
+        call_scope=lambda name: contextlib.nullcontext(),
+    )
+
+    class _Collector:
+        changes = None
+
+        def __init__(self, client):
+            pass
+
+        def collect_all(self, previous=None):
+            return finalize_evidence({"keys": [], "instances": []}, collector="test")
+
+    uploads = {}
+
+    class DummyVault:
+        def put_json(self, key, body, metadata=None):
+            uploads[key] = (json.loads(body), metadata)
+
+        def put_stream(self, key, chunks, metadata=None, content_type=None, content_encoding=None):
+            uploads[key] = (json.loads(b"".join(chunks)), metadata)
+
+    monkeypatch.setattr(
+        "auditly.cli_collect.AppConfig.load",
+        lambda x: types.SimpleNamespace(environments={"dev": {}}),
+    )
+    monkeypatch.setattr(cli_collect, "vault_from_envcfg", lambda x: DummyVault())
+    monkeypatch.setattr(cli_collect, "persist_if_db", lambda *a: None)
+    monkeypatch.setattr("auditly.collectors.aws.client.AWSClient", lambda **kw: fake_client)
+    monkeypatch.setattr("auditly.collectors.aws.kms.KMSCollector", _Collector)
+    monkeypatch.setattr("auditly.collectors.aws.rds.RDSCollector", _Collector)
+
+    cli_collect.collect_aws_cmd(
+        config=tmp_path,
+        env="dev",
+        region="us-east-1",
+        profile=None,
+        services="kms,rds",
+        output_dir=None,
+        iam_bulk=False,
+        max_pool_connections=10,
+        service_concurrency=None,
+        max_attempts=10,
+        retry_mode="adaptive",
+        rate_limits="kms=5",
+        cloudtrail_source="api",
+        incremental=False,
+        service_workers=2,
+    )
+
+    manifest, _ = uploads["manifests/dev/aws-kms-rds-manifest.json"]
+    kms, rds = (artifact["metadata"] for artifact in manifest["artifacts"])
+    assert kms["partial"] is True
+    assert kms["api_calls"]["throttles"] == 9
+    assert rds["partial"] is False
+    assert rds["api_calls"]["calls"] == 2
+    # Object metadata only carries string values
+    assert uploads["evidence/dev/aws-kms-123456789012.json"][1]["partial"] == "True"
+    assert "api_calls" not in uploads["evidence/dev/aws-kms-123456789012.json"][1]
+    # Without --output-dir nothing is written locally
+    assert "_local_path" not in kms
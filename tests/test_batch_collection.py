@@ -0,0 +1,163 @@
+"""Tests for the bounded batch collection scheduler."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from auditly.api.operations import collect_evidence_batch
+from auditly.batch_collection import BatchLimits, parse_provider_limits, run_batch
+
+
+class _Tracker:
+    """Record peak concurrency overall and per provider."""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+        self.threads: set[str] = set()
+        self.starts: list[tuple[str, float]] = []
+
+    def __call__(self, provider: str, **_):
+        with self.lock:
+            self.active[provider] = self.active.get(provider, 0) + 1
+            self.active["*"] = self.active.get("*", 0) + 1
+            for key in (provider, "*"):
+                self.peak[key] = max(self.peak.get(key, 0), self.active[key])
+            self.threads.add(threading.current_thread().name)
+            self.starts.append((provider, time.monotonic()))
+        time.sleep(self.delay)
+        with self.lock:
+            self.active[provider] -= 1
+            self.active["*"] -= 1
+        return provider
+
+
+def _run(requests, fn, **kwargs):
+    async def _collect():
+        return [e async for e in run_batch(requests, fn, **kwargs)]
+
+    return asyncio.run(_collect())
+
+
+def test_global_and_provider_limits_bound_work():
+    tracker = _Tracker()
+    requests = [{"provider": "github"} for _ in range(10)] + [
+        {"provider": "gitlab"} for _ in range(10)
+    ]
+    limits = BatchLimits(max_concurrency=4, provider_concurrency={"github": 1})
+
+    events = _run(requests, tracker, limits=limits)
+
+    assert len(events) == 20
+    assert all(e["status"] == "success" for e in events)
+    assert [e["completed"] for e in events] == list(range(1, 21))
+    assert tracker.peak["*"] <= 4
+    assert tracker.peak["github"] == 1
+    assert len(tracker.threads) <= 4
+
+
+def test_large_batch_starts_bounded_number_of_threads():
+    tracker = _Tracker(delay=0.001)
+    before = threading.active_count()
+    peak_threads = 0
+
+    async def _collect():
+        nonlocal peak_threads
+        count = 0
+        async for _ in run_batch(
+            [{"provider": "terraform"} for _ in range(500)],
+            tracker,
+            limits=BatchLimits(max_concurrency=8),
+        ):
+            count += 1
+            peak_threads = max(peak_threads, threading.active_count() - before)
+        return count
+
+    assert asyncio.run(_collect()) == 500
+    assert peak_threads <= 8
+    assert tracker.peak["*"] <= 8
+
+
+def test_rate_limit_spaces_out_starts():
+    tracker = _Tracker(delay=0)
+    limits = BatchLimits(max_concurrency=5, provider_rate_limits={"github": 20.0})
+
+    _run([{"provider": "github"} for _ in range(4)], tracker, limits=limits)
+
+    starts = sorted(t for _, t in tracker.starts)
+    gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+    assert min(gaps) >= 0.04
+
+
+def test_timeout_and_errors_are_reported_per_request():
+    def fn(provider, name):
+        if name == "slow":
+            time.sleep(0.3)
+        if name == "broken":
+            raise RuntimeError("boom")
+        return name
+
+    requests = [
+        {"provider": "a", "name": "slow"},
+        {"provider": "a", "name": "broken"},
+        {"provider": "a", "name": "ok"},
+    ]
+    events = {e["name"]: e for e in _run(requests, fn, timeout=0.1)}
+
+    assert events["ok"]["result"] == "ok"
+    assert events["broken"]["error"] == "boom"
+    assert events["slow"]["error"] == "Timeout after 0.1s"
+
+
+def test_timed_out_request_keeps_its_slot_until_it_returns():
+    """A timeout is reported at once, but the slot is held until the thread returns."""
+    spans = {}
+
+    def fn(provider, name):
+        start = time.monotonic()
+        time.sleep(0.5 if name == "slow" else 0.01)
+        spans[name] = (start, time.monotonic())
+        return name
+
+    requests = [
+        {"provider": "a", "name": "slow"},
+        {"provider": "a", "name": "next"},
+        {"provider": "b", "name": "other"},
+    ]
+    limits = BatchLimits(max_concurrency=2, provider_concurrency={"a": 1})
+    events = _run(requests, fn, limits=limits, timeout=0.2)
+
+    assert [(e["name"], e["status"]) for e in events] == [
+        ("other", "success"),
+        ("slow", "failed"),
+        # Queued behind the slow request; timed from its own start, so it still runs
+        ("next", "success"),
+    ]
+    # Provider "a" never ran two requests at once
+    assert spans["next"][0] >= spans["slow"][1]
+
+
+def test_repeated_batches_do_not_share_loop_state(monkeypatch):
+    """Each asyncio.run gets fresh scheduling primitives (no cross-loop semaphore)."""
+    monkeypatch.setattr(
+        "auditly.api.operations.collect_evidence",
+        lambda **kw: (time.sleep(0.01), (1, "k", "ok"))[1],
+    )
+    requests = [{"provider": "terraform", "name": f"r{i}"} for i in range(6)]
+    for _ in range(2):
+        result = collect_evidence_batch(requests, limits=BatchLimits(max_concurrency=2))
+        assert result["success"] == 6
+
+
+def test_parse_provider_limits():
+    assert parse_provider_limits("GitHub=2, gitlab=1") == {"github": 2, "gitlab": 1}
+    assert parse_provider_limits("github=0.5", float) == {"github": 0.5}
+    assert parse_provider_limits("") == {}
+    with pytest.raises(ValueError):
+        parse_provider_limits("github")
+    with pytest.raises(ValueError):
+        BatchLimits(provider_concurrency={"github": 0})
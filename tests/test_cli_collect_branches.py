@@ -102,3 +102,39 @@ def test_collect_argo_cmd_invalid_local_path(monkeypatch, tmp_path):
     monkeypatch.setattr("auditly.cli_collect.vault_from_envcfg", lambda x: DummyVault())
     monkeypatch.setattr("auditly.cli_collect.collect_argo", dummy_collect_argo)
     collect_argo_cmd(tmp_path, "dev", "https://argo", "argo")
+
+
+def test_collect_batch_cmd_prints_each_result(monkeypatch, tmp_path, capsys):
+    import json
+
+    from auditly.cli_collect import collect_batch_cmd
+
+    def fake_collect_evidence(**kwargs):
+        if kwargs["provider"] == "github":
+            raise Exception("bad token")
+        return (2, "manifests/dev/terraform-manifest.json", "ok")
+
+    monkeypatch.setattr("auditly.api.operations.collect_evidence", fake_collect_evidence)
+    requests_file = tmp_path / "batch.json"
+    requests_file.write_text(
+        json.dumps(
+            [
+                {"name": "tf", "config_path": "c", "environment": "dev", "provider": "terraform"},
+                {"name": "gh", "config_path": "c", "environment": "dev", "provider": "github"},
+            ]
+        )
+    )
+
+    collect_batch_cmd(
+        requests_file,
+        timeout=30,
+        json_lines=True,
+        max_concurrency=2,
+        provider_concurrency="github=1",
+        rate_limit="",
+    )
+    out = capsys.readouterr().out.splitlines()
+    events = {e["name"]: e for e in map(json.loads, out[:2])}
+    assert events["tf"]["manifest_key"] == "manifests/dev/terraform-manifest.json"
+    assert events["gh"]["error"] == "bad token"
+    assert out[-1] == "Succeeded: 1 | Failed: 1"
@@ -0,0 +1,286 @@
+"""Tests for incremental CloudTrail collection with persisted checkpoints."""
+
+import gzip
+import json
+from datetime import UTC, datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from auditly.cli_collect import cloudtrail_event_sink
+from auditly.collection_checkpoints import CheckpointStore
+from auditly.db import Base
+
+pytest.importorskip("boto3")
+from botocore.exceptions import ClientError  # noqa: E402
+
+from auditly.collectors.aws import AWSClient, CloudTrailCollector  # noqa: E402
+from auditly.collectors.aws.cloudtrail import (  # noqa: E402
+    EVENT_HISTORY_STREAM,
+    LATE_DELIVERY_WINDOW,
+    EventCursor,
+)
+
+T0 = datetime(2026, 10, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def store():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield CheckpointStore(session)
+    session.close()
+
+
+class StreamingVault:
+    def __init__(self):
+        self.objects = {}
+
+    def put_stream(self, dest_key, chunks, metadata=None, content_type=None, content_encoding=None):
+        self.objects[dest_key] = gzip.decompress(b"".join(chunks)).decode().splitlines()
+
+
+def _event(event_id, at):
+    return {"EventId": event_id, "EventName": "Login", "EventTime": at.replace(tzinfo=UTC)}
+
+
+def _client(services):
+    client = Mock(spec=AWSClient)
+    client.get_client.side_effect = lambda name: services.get(name, Mock())
+    client.get_account_id.return_value = "123456789012"
+    client.region = "us-east-1"
+    client.concurrency_for.return_value = 4
+    return client
+
+
+def _cloudtrail(pages):
+    cloudtrail = Mock()
+    cloudtrail.describe_trails.return_value = {"trailList": []}
+    cloudtrail.get_paginator.return_value.paginate.side_effect = lambda **kw: iter(pages)
+    return cloudtrail
+
+
+def test_checkpoint_store_upserts_per_stream(store):
+    assert store.get("aws-cloudtrail", "1", "us-east-1", "event-history") is None
+    store.save("aws-cloudtrail", "1", "us-east-1", "event-history", last_event_time=T0)
+    store.save(
+        "aws-cloudtrail",
+        "1",
+        "us-east-1",
+        "event-history",
+        last_event_time=T0 + timedelta(hours=1),
+        last_event_id="e9",
+        position={"seen_ids": ["e9"]},
+    )
+    store.save("aws-cloudtrail", "1", "us-east-1", "main-trail", last_event_time=T0)
+
+    checkpoint = store.get("aws-cloudtrail", "1", "us-east-1", "event-history")
+    assert checkpoint.last_event_time == T0 + timedelta(hours=1)
+    # Checkpoints saved before seen IDs carried their event times
+    assert EventCursor.from_checkpoint(checkpoint).seen_ids == {"e9": T0 + timedelta(hours=1)}
+    assert sorted(c.stream for c in store.list_streams("aws-cloudtrail", "1", "us-east-1")) == [
+        "event-history",
+        "main-trail",
+    ]
+    assert store.list_streams("aws-cloudtrail", "1", "eu-west-1") == []
+
+
+def test_event_history_resumes_after_cursor():
+    t1, t2, t3 = T0, T0 + timedelta(minutes=5), T0 + timedelta(minutes=9)
+    # LookupEvents returns newest first; e2 was read by the previous run
+    cloudtrail = _cloudtrail(
+        [
+            {"Events": [_event("e5", t3), _event("e4", t2)]},
+            {"Events": [_event("e3", t1), _event("e2", t1)]},
+        ]
+    )
+    collector = CloudTrailCollector(_client({"cloudtrail": cloudtrail}))
+    since = EventCursor(t1, "e2", {"e2": t1})
+
+    events = list(collector.iter_event_history(since=since))
+
+    assert [e["event_id"] for e in events] == ["e5", "e4", "e3"]
+    kwargs = cloudtrail.get_paginator.return_value.paginate.call_args.kwargs
+    assert kwargs["StartTime"] == t1 - LATE_DELIVERY_WINDOW
+    assert collector.cursors[EVENT_HISTORY_STREAM] == EventCursor(
+        t3, "e5", {"e5": t3, "e4": t2, "e3": t1, "e2": t1}
+    )
+
+
+def test_event_history_picks_up_late_deliveries():
+    t_cursor = T0 + timedelta(minutes=30)
+    # e1 was read long before the window; e2 was read at the cursor; e0 arrived late
+    since = EventCursor(t_cursor, "e2", {"e1": T0 + timedelta(minutes=15), "e2": t_cursor})
+    late = T0 + timedelta(minutes=12)
+    cloudtrail = _cloudtrail(
+        [
+            {"Events": [_event("e3", T0 + timedelta(minutes=40)), _event("e2", t_cursor)]},
+            {"Events": [_event("e1", T0 + timedelta(minutes=15)), _event("e0", late)]},
+        ]
+    )
+    collector = CloudTrailCollector(_client({"cloudtrail": cloudtrail}))
+
+    events = list(collector.iter_event_history(since=since))
+
+    assert [e["event_id"] for e in events] == ["e3", "e0"]
+    # Only IDs still inside the window of the new cursor are kept
+    cursor = collector.cursors[EVENT_HISTORY_STREAM]
+    assert (cursor.event_time, cursor.event_id) == (T0 + timedelta(minutes=40), "e3")
+    assert cursor.seen_ids == {"e3": T0 + timedelta(minutes=40), "e2": t_cursor}
+
+    # A late event alone does not move the cursor back
+    collector = CloudTrailCollector(
+        _client({"cloudtrail": _cloudtrail([{"Events": [_event("e9", late)]}])})
+    )
+    assert [e["event_id"] for e in collector.iter_event_history(since=since)] == ["e9"]
+    cursor = collector.cursors[EVENT_HISTORY_STREAM]
+    assert (cursor.event_time, cursor.event_id) == (t_cursor, "e2")
+    assert set(cursor.seen_ids) == {"e2", "e1", "e9"}
+
+
+def test_event_history_failure_leaves_no_cursor():
+    def _pages(**kwargs):
+        yield {"Events": [_event("e1", T0)]}
+        raise ClientError({"Error": {"Code": "ThrottlingException"}}, "LookupEvents")
+
+    cloudtrail = Mock()
+    cloudtrail.get_paginator.return_value.paginate.side_effect = _pages
+    collector = CloudTrailCollector(_client({"cloudtrail": cloudtrail}))
+
+    assert [e["event_id"] for e in collector.iter_event_history()] == ["e1"]
+    assert collector.cursors == {}
+
+
+def _run(pages, store, vault):
+    collector = CloudTrailCollector(_client({"cloudtrail": _cloudtrail(pages)}))
+    checkpoints = {
+        cp.stream: EventCursor.from_checkpoint(cp)
+        for cp in store.list_streams("aws-cloudtrail", "123456789012", "us-east-1")
+    }
+    artifacts = []
+    sink = cloudtrail_event_sink(
+        collector, vault, "dev", "123456789012", "us-east-1", artifacts, checkpoints, store=store
+    )
+    evidence = collector.collect_all(event_sink=sink, checkpoints=checkpoints)
+    return evidence, artifacts
+
+
+def test_second_run_uploads_only_new_events(store):
+    vault = StreamingVault()
+    first_page = {"Events": [_event("e2", T0 + timedelta(minutes=1)), _event("e1", T0)]}
+
+    evidence, artifacts = _run([first_page], store, vault)
+    assert evidence["event_history"]["records"] == 2
+    checkpoint = store.get("aws-cloudtrail", "123456789012", "us-east-1", EVENT_HISTORY_STREAM)
+    assert (checkpoint.last_event_time, checkpoint.last_event_id) == (
+        T0 + timedelta(minutes=1),
+        "e2",
+    )
+
+    # The API repeats events at the checkpoint time; they are skipped
+    new_page = {"Events": [_event("e3", T0 + timedelta(minutes=7)), first_page["Events"][0]]}
+    evidence, second = _run([new_page], store, vault)
+    assert evidence["event_history"]["records"] == 1
+    assert second[0].key != artifacts[0].key
+    # The partition window covers the late delivery window before the checkpoint
+    assert "/event-history/20261001T114100Z-" in second[0].key
+    assert [json.loads(line)["event_id"] for line in vault.objects[second[0].key]] == ["e3"]
+
+    evidence, third = _run([{"Events": [new_page["Events"][0]]}], store, vault)
+    assert evidence["event_history"] == {"records": 0}
+    assert third == []
+    assert len(vault.objects) == 2
+
+
+def _log_object(*records):
+    return {
+        "Body": Mock(
+            read=Mock(return_value=gzip.compress(json.dumps({"Records": records}).encode()))
+        )
+    }
+
+
+def test_trail_logs_are_read_from_s3_after_last_key():
+    prefix = "org/AWSLogs/123456789012/CloudTrail/us-east-1/"
+    keys = [f"{prefix}2026/10/01/a_{i}.json.gz" for i in range(3)]
+    objects = {
+        key: _log_object(
+            {
+                "eventID": f"e{i}",
+                "eventName": "GetObject",
+                "eventTime": f"2026-10-01T12:0{i}:00Z",
+                "eventSource": "s3.amazonaws.com",
+                "userIdentity": {"arn": "arn:aws:iam::1:user/alice", "accessKeyId": "AKIA"},
+            }
+        )
+        for i, key in enumerate(keys)
+    }
+    s3 = Mock()
+    s3.get_paginator.return_value.paginate.side_effect = lambda **kw: iter(
+        [{"Contents": [{"Key": k} for k in keys if k > kw["StartAfter"]] + [{"Key": "x.txt"}]}]
+    )
+    s3.get_object.side_effect = lambda Bucket, Key: objects[Key]
+    collector = CloudTrailCollector(_client({"s3": s3}))
+    trail = {"trail_name": "main", "s3_bucket_name": "logs", "s3_key_prefix": "org"}
+
+    events = list(collector.iter_trail_log_events(trail, since=EventCursor(last_key=keys[0])))
+
+    assert [e["event_id"] for e in events] == ["e1", "e2"]
+    assert events[0]["username"] == "arn:aws:iam::1:user/alice"
+    assert json.loads(events[0]["cloud_trail_event"])["eventName"] == "GetObject"
+    cursor = collector.cursors["main"]
+    assert cursor.last_key == keys[2]
+    assert cursor.event_time == datetime(2026, 10, 1, 12, 2)
+    assert cursor.event_id == "e2"
+
+    # Without a cursor, the listing starts at the beginning of the window
+    list(collector.iter_trail_log_events(trail, days=1))
+    start_after = s3.get_paginator.return_value.paginate.call_args.kwargs["StartAfter"]
+    assert start_after.startswith(prefix) and start_after.endswith("/~")
+
+
+def test_trail_logs_pick_up_late_objects():
+    prefix = "AWSLogs/123456789012/CloudTrail/us-east-1/"
+    old, k0, k1, k2 = (
+        f"{prefix}2026/09/29/old.json.gz",
+        f"{prefix}2026/10/01/a_0.json.gz",
+        f"{prefix}2026/10/01/a_1.json.gz",
+        f"{prefix}2026/10/01/a_2.json.gz",
+    )
+    objects = {
+        key: _log_object({"eventID": f"e{i}", "eventTime": f"2026-10-01T12:0{i}:00Z"})
+        for i, key in enumerate([k0, k1, k2])
+    }
+    listed = [old, k0, k2]
+    s3 = Mock()
+    s3.get_paginator.return_value.paginate.side_effect = lambda **kw: iter(
+        [{"Contents": [{"Key": k} for k in sorted(listed) if k > kw["StartAfter"]]}]
+    )
+    s3.get_object.side_effect = lambda Bucket, Key: objects[Key]
+    trail = {"trail_name": "main", "s3_bucket_name": "logs"}
+    since = EventCursor(T0, "e0", last_key=k0, read_keys={old, k0})
+
+    collector = CloudTrailCollector(_client({"s3": s3}))
+    assert [e["event_id"] for e in collector.iter_trail_log_events(trail, since=since)] == ["e2"]
+    # The listing re-reads the day of the late delivery window before the cursor
+    start_after = s3.get_paginator.return_value.paginate.call_args.kwargs["StartAfter"]
+    assert start_after == f"{prefix}2026/09/30/~"
+    cursor = collector.cursors["main"]
+    assert (cursor.last_key, cursor.read_keys) == (k2, {k0, k2})
+
+    # a_1 lands after a_2 was listed; the next run reads it and keeps last_key
+    listed.append(k1)
+    checkpoint = Mock(
+        last_event_time=cursor.event_time,
+        last_event_id=cursor.event_id,
+        position=json.loads(json.dumps(cursor.to_position())),
+    )
+    collector = CloudTrailCollector(_client({"s3": s3}))
+    resumed = EventCursor.from_checkpoint(checkpoint)
+    assert [e["event_id"] for e in collector.iter_trail_log_events(trail, since=resumed)] == ["e1"]
+    cursor = collector.cursors["main"]
+    assert (cursor.last_key, cursor.read_keys) == (k2, {k0, k1, k2})
+    assert (cursor.event_time, cursor.event_id) == (datetime(2026, 10, 1, 12, 2), "e2")
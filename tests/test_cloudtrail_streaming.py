@@ -0,0 +1,252 @@
+"""Tests for streaming CloudTrail events to the vault as gzip NDJSON."""
+
+import gzip
+import hashlib
+import json
+import tracemalloc
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from auditly.cli_collect import upload_event_stream
+from auditly.collectors.common import GzipNDJSONStream
+from auditly.storage.base import EvidenceVault
+
+
+class StreamingVault:
+    """Vault stand-in that hashes streamed uploads instead of keeping them."""
+
+    def __init__(self, keep=True):
+        self.keep = keep
+        self.objects = {}
+
+    def put_stream(self, dest_key, chunks, metadata=None, content_type=None, content_encoding=None):
+        digest, size, body = hashlib.sha256(), 0, []
+        for chunk in chunks:
+            digest.update(chunk)
+            size += len(chunk)
+            if self.keep:
+                body.append(chunk)
+        self.objects[dest_key] = {
+            "sha256": digest.hexdigest(),
+            "size": size,
+            "body": b"".join(body),
+            "metadata": metadata,
+            "content_encoding": content_encoding,
+        }
+        return {"key": dest_key, "size": size}
+
+
+def _events(n, payload_size=64):
+    for i in range(n):
+        # Distinct payloads so the compressed stream spans several chunks
+        digest = hashlib.sha256(str(i).encode()).hexdigest()
+        yield {"event_id": f"e{i}", "cloud_trail_event": digest * (payload_size // 64)}
+
+
+def test_gzip_ndjson_stream_hashes_while_writing():
+    stream = GzipNDJSONStream(_events(2000), chunk_size=4096)
+    chunks = list(stream)
+
+    assert len(chunks) > 1
+    body = b"".join(chunks)
+    content = gzip.decompress(body)
+    assert [json.loads(line)["event_id"] for line in content.splitlines()] == [
+        f"e{i}" for i in range(2000)
+    ]
+    assert stream.records == 2000
+    assert stream.size == len(body)
+    assert stream.sha256 == hashlib.sha256(body).hexdigest()
+    assert stream.content_sha256 == hashlib.sha256(content).hexdigest()
+    assert stream.content_size == len(content)
+
+
+def test_gzip_ndjson_stream_of_no_records_is_valid_gzip():
+    stream = GzipNDJSONStream([])
+    assert gzip.decompress(b"".join(stream)) == b""
+    assert stream.records == 0
+
+
+def test_upload_event_stream_records_artifact(tmp_path):
+    vault = StreamingVault()
+    artifact = upload_event_stream(
+        vault,
+        "evidence/dev/aws-cloudtrail-events-1.ndjson.gz",
+        _events(10),
+        metadata={"kind": "aws-cloudtrail-events", "account_id": "1"},
+        local_path=tmp_path / "events.ndjson.gz",
+    )
+
+    stored = vault.objects[artifact.key]
+    assert artifact.sha256 == stored["sha256"]
+    assert artifact.size == stored["size"]
+    assert artifact.metadata["records"] == 10
+    assert artifact.filename == "aws-cloudtrail-events-1.ndjson.gz"
+    assert stored["content_encoding"] == "gzip"
+    assert stored["metadata"] == {"kind": "aws-cloudtrail-events", "account_id": "1"}
+    assert (tmp_path / "events.ndjson.gz").read_bytes() == stored["body"]
+    assert artifact.metadata["_local_path"] == str(tmp_path / "events.ndjson.gz")
+
+
+def test_streaming_memory_is_flat():
+    n, payload = 20_000, 2048
+    tracemalloc.start()
+    try:
+        upload_event_stream(
+            StreamingVault(keep=False), "k", _events(n, payload), metadata={"kind": "x"}
+        )
+        _, streamed_peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The events alone are ~40 MB; streaming holds about one compressed chunk
+    assert streamed_peak < 8 * 1024 * 1024
+
+
+def test_cloudtrail_collector_hands_events_to_sink():
+    pytest.importorskip("boto3")
+    from auditly.collectors.aws import AWSClient, CloudTrailCollector
+
+    cloudtrail = Mock()
+    cloudtrail.describe_trails.return_value = {"trailList": []}
+    cloudtrail.get_paginator.return_value.paginate.return_value = [
+        {
+            "Events": [
+                {
+                    "EventId": f"e{i}",
+                    "EventName": "ConsoleLogin",
+                    "EventTime": datetime(2026, 1, 1, tzinfo=UTC),
+                }
+                for i in range(3)
+            ]
+        }
+    ]
+    client = Mock(spec=AWSClient)
+    client.get_client.return_value = cloudtrail
+    client.get_account_id.return_value = "123456789012"
+    client.region = "us-east-1"
+    client.concurrency_for.return_value = 4
+
+    received = []
+
+    def _sink(stream, events):
+        assert stream == "event-history"
+        received.extend(e["event_id"] for e in events)
+        return {"key": "k", "records": len(received)}
+
+    evidence = CloudTrailCollector(client).collect_all(event_sink=_sink)
+    assert received == ["e0", "e1", "e2"]
+    assert evidence["event_history"] == {"key": "k", "records": 3}
+    assert [e["event_id"] for e in CloudTrailCollector(client).collect_event_history()] == [
+        "e0",
+        "e1",
+        "e2",
+    ]
+
+
+def test_s3_vault_streams_multipart_upload(monkeypatch):
+    boto3 = pytest.importorskip("boto3")
+    from botocore.stub import ANY, Stubber
+
+    from auditly.storage import s3_backend
+
+    monkeypatch.setattr(s3_backend, "MULTIPART_PART_SIZE", 10)
+    vault = object.__new__(s3_backend.S3EvidenceVault)
+    vault.bucket = "vault"
+    vault.s3 = boto3.client(
+        "s3", region_name="us-east-1", aws_access_key_id="x", aws_secret_access_key="y"
+    )
+
+    with Stubber(vault.s3) as stubber:
+        stubber.add_response(
+            "create_multipart_upload",
+            {"UploadId": "u1"},
+            {
+                "Bucket": "vault",
+                "Key": "k.ndjson.gz",
+                "ContentType": "application/x-ndjson",
+                "ContentEncoding": "gzip",
+                "Metadata": {"kind": "x"},
+            },
+        )
+        for part in (1, 2):
+            stubber.add_response(
+                "upload_part",
+                {"ETag": f'"etag{part}"'},
+                {
+                    "Bucket": "vault",
+                    "Key": "k.ndjson.gz",
+                    "UploadId": "u1",
+                    "PartNumber": part,
+                    "Body": ANY,
+                },
+            )
+        stubber.add_response(
+            "complete_multipart_upload",
+            {},
+            {
+                "Bucket": "vault",
+                "Key": "k.ndjson.gz",
+                "UploadId": "u1",
+                "MultipartUpload": {
+                    "Parts": [
+                        {"ETag": '"etag1"', "PartNumber": 1},
+                        {"ETag": '"etag2"', "PartNumber": 2},
+                    ]
+                },
+            },
+        )
+        result = vault.put_stream(
+            "k.ndjson.gz",
+            [b"abcdef", b"ghijkl", b"mno"],
+            metadata={"kind": "x"},
+            content_type="application/x-ndjson",
+            content_encoding="gzip",
+        )
+        stubber.assert_no_pending_responses()
+    assert result["size"] == 15
+
+    with Stubber(vault.s3) as stubber:
+        stubber.add_response("create_multipart_upload", {"UploadId": "u2"})
+        stubber.add_response(
+            "abort_multipart_upload",
+            {},
+            {"Bucket": "vault", "Key": "k", "UploadId": "u2"},
+        )
+
+        def _failing():
+            yield b"abc"
+            raise RuntimeError("source failed")
+
+        with pytest.raises(RuntimeError, match="source failed"):
+            vault.put_stream("k", _failing())
+        stubber.assert_no_pending_responses()
+
+
+def test_default_put_stream_spools_to_put_file():
+    class FileVault(EvidenceVault):
+        def __init__(self):
+            self.files = {}
+
+        def put_file(self, src_path, dest_key, metadata=None):
+            with open(src_path, "rb") as f:
+                self.files[dest_key] = f.read()
+            return {"key": dest_key, "size": len(self.files[dest_key])}
+
+        put_json = exists = list = fetch = get_json = get_metadata = None
+
+    vault = FileVault()
+    assert vault.put_stream("k", iter([b"ab", b"cd"]))["size"] == 4
+    assert vault.files["k"] == b"abcd"
+
+
+def test_minio_chunk_reader_reads_across_chunks():
+    pytest.importorskip("minio")
+    from auditly.storage.minio_backend import _ChunkReader
+
+    reader = _ChunkReader([b"abc", b"defg", b"h"])
+    assert reader.read(2) == b"ab"
+    assert reader.read(5) == b"cdefg"
+    assert reader.read(-1) == b"h"
+    assert reader.read(4) == b""
+    assert reader.size == 8
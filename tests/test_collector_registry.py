@@ -0,0 +1,136 @@
+"""Tests for the lazily imported collector registry."""
+
+import json
+import subprocess
+import sys
+import types
+
+import pytest
+import typer
+
+from auditly import cli_collect
+from auditly.collectors.registry import CollectorRegistry, CollectorSpec, collector_registry
+
+HEAVY_MODULES = ("boto3", "botocore", "google", "fastapi", "minio")
+
+IMPORT_BENCHMARK = """
+import json, sys, time
+start = time.perf_counter()
+import auditly.cli
+from auditly.collectors.registry import collector_registry
+specs = collector_registry.specs()
+cli_seconds = time.perf_counter() - start
+loaded = sorted({m.split(".")[0] for m in sys.modules} & set(HEAVY))
+start = time.perf_counter()
+collector_registry.get("aws", "ec2").load()
+print(json.dumps({
+    "cli_seconds": cli_seconds,
+    "collector_seconds": time.perf_counter() - start,
+    "loaded": loaded,
+    "specs": len(specs),
+    "boto3_after_load": "boto3" in sys.modules,
+}))
+"""
+
+
+def test_cli_startup_imports_no_cloud_sdk(record_property):
+    result = subprocess.run(
+        [sys.executable, "-c", f"HEAVY = {HEAVY_MODULES!r}\n{IMPORT_BENCHMARK}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = json.loads(result.stdout.splitlines()[-1])
+    record_property("cli_seconds", round(timings["cli_seconds"], 3))
+    record_property("collector_seconds", round(timings["collector_seconds"], 3))
+
+    assert timings["loaded"] == [], timings
+    # Loose ceilings: startup without the SDKs takes about a second here
+    assert timings["cli_seconds"] < 10, timings
+    assert timings["collector_seconds"] < 10, timings
+    assert timings["specs"] >= 14
+    # Selecting a collector is what pays for its SDK
+    pytest.importorskip("boto3")
+    assert timings["boto3_after_load"]
+
+
+def test_builtin_specs_describe_collectors_without_importing_them():
+    spec = collector_registry.get("aws", "ec2")
+    assert spec.kind == "aws-ec2"
+    assert spec.incremental and "config" in spec.api_services
+    assert [s.service for s in collector_registry.specs("aws") if s.global_service] == [
+        "iam",
+        "s3",
+    ]
+    assert collector_registry.services("gcp") == [
+        "iam",
+        "compute",
+        "storage",
+        "sql",
+        "vpc",
+        "kms",
+        "logging",
+    ]
+    assert spec.summarize({"instances": [1, 2], "volumes": [3]}) == "instances=2, sg=0, volumes=1"
+    with pytest.raises(KeyError):
+        collector_registry.get("aws", "lambda")
+
+
+def test_load_imports_the_target_class():
+    spec = CollectorSpec("test", "json", "json:JSONDecoder", "test-json", requires=("json",))
+    assert spec.load() is json.JSONDecoder
+    assert spec.missing_requirements() == []
+
+    missing = CollectorSpec("test", "x", "json:Nope", "test-x", requires=("no_such_sdk.client",))
+    assert missing.missing_requirements() == ["no_such_sdk.client"]
+    with pytest.raises(ImportError):
+        missing.load()
+
+
+def test_entry_point_plugins_are_discovered_once(monkeypatch):
+    plugin = CollectorSpec("acme", "audit", "json:JSONDecoder", "acme-audit")
+
+    def _entry_point(name, value):
+        def _load():
+            if isinstance(value, Exception):
+                raise value
+            return value
+
+        return types.SimpleNamespace(name=name, load=_load)
+
+    calls = []
+
+    def _entry_points(group):
+        calls.append(group)
+        return [_entry_point("acme", [plugin]), _entry_point("broken", ImportError("no module"))]
+
+    monkeypatch.setattr("auditly.collectors.registry.entry_points", _entry_points)
+    registry = CollectorRegistry()
+    registry.register(CollectorSpec("aws", "ec2", "json:JSONDecoder", "aws-ec2"))
+
+    assert registry.services("acme") == ["audit"]
+    assert registry.get("acme", "audit") is plugin
+    assert registry.services("aws") == ["ec2"]
+    assert calls == ["auditly.collectors"]
+
+    registry.register(plugin)
+    with pytest.raises(ValueError):
+        registry.register(CollectorSpec("acme", "audit", "json:JSONEncoder", "acme-audit"))
+
+
+def test_cli_rejects_unknown_and_uninstalled_services(monkeypatch, capsys):
+    registry = CollectorRegistry(group=None)
+    registry.register(CollectorSpec("aws", "ec2", "json:JSONDecoder", "aws-ec2"))
+    registry.register(
+        CollectorSpec("aws", "kms", "json:JSONDecoder", "aws-kms", requires=("no_such_sdk",))
+    )
+    monkeypatch.setattr(cli_collect, "collector_registry", registry)
+
+    specs = cli_collect.selected_collectors("aws", "EC2, ec2", "install it")
+    assert [s.service for s in specs] == ["ec2"]
+    with pytest.raises(typer.Exit):
+        cli_collect.selected_collectors("aws", "ec2,lambda", "install it")
+    assert "Invalid services ['lambda']. Valid: ec2, kms" in capsys.readouterr().err
+    with pytest.raises(typer.Exit):
+        cli_collect.selected_collectors("aws", "kms", "install it")
+    assert "Error: install it" in capsys.readouterr().err
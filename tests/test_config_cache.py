@@ -0,0 +1,97 @@
+"""Tests for memoized config loading and deferred catalog validation."""
+
+import json
+import os
+
+import pytest
+import typer
+import yaml
+
+from auditly.cli import check_catalogs
+from auditly.config import AppConfig, clear_config_cache, load_config
+from auditly.oscal import catalog_registry
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Config with one valid catalog and one JSON file lacking an OSCAL root."""
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"catalog": {"groups": [{"controls": [{"id": "ac-1"}]}]}}))
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"not": "oscal"}))
+    cfg = tmp_path / "config.yaml"
+    cfg.write_text(
+        yaml.safe_dump(
+            {
+                "version": "0.1",
+                "catalogs": {"nist_800_53_rev5": str(good), "fedramp_high": str(bad)},
+                "environments": {
+                    "dev": {"storage": {"type": "minio", "endpoint": "x", "bucket": "b"}}
+                },
+            }
+        )
+    )
+    clear_config_cache()
+    catalog_registry.clear()
+    yield cfg
+    clear_config_cache()
+
+
+def _touch(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_eager_load_validates_catalogs(config_file):
+    """AppConfig.load keeps deep validation by default."""
+    with pytest.raises(ValueError, match="must contain 'catalog' or 'profile'"):
+        AppConfig.load(config_file)
+
+
+def test_deferred_load_skips_catalog_parsing(config_file):
+    """Deferred loads only check paths; catalogs are parsed on first use."""
+    cfg = AppConfig.load(config_file, defer_catalog_validation=True)
+    assert catalog_registry.misses == 0
+
+    with pytest.raises(ValueError, match="must contain 'catalog' or 'profile'"):
+        cfg.catalogs.validate_catalogs()
+
+
+def test_deferred_validation_runs_on_first_resolution(config_file, tmp_path):
+    """A broken catalog that skipped validation fails its first resolution."""
+    cfg = load_config(config_file, defer_catalog_validation=True)
+    with pytest.raises(ValueError, match="must contain 'catalog' or 'profile'"):
+        cfg.catalogs.resolve_control_ids()
+    # Still pending: every later resolution fails the same way
+    with pytest.raises(ValueError, match="must contain 'catalog' or 'profile'"):
+        cfg.catalogs.resolve_control_ids()
+
+    bad = tmp_path / "bad.json"
+    bad.write_text(json.dumps({"catalog": {"groups": [{"controls": [{"id": "ac-2"}]}]}}))
+    _touch(bad)
+    assert cfg.catalogs.resolve_control_ids() == ["ac-1", "ac-2"]
+
+
+def test_load_config_memoized_on_stat(config_file):
+    """load_config reuses the parsed config until the file changes."""
+    first = load_config(config_file)
+    assert load_config(str(config_file)) is first
+
+    data = yaml.safe_load(config_file.read_text())
+    data["organization"] = "Changed Org"
+    config_file.write_text(yaml.safe_dump(data))
+    _touch(config_file)
+
+    second = load_config(config_file)
+    assert second is not first
+    assert second.organization == "Changed Org"
+
+
+def test_check_catalogs_reports_each_catalog(config_file, capsys):
+    """check-catalogs validates explicitly and reports the invalid catalog."""
+    with pytest.raises(typer.Exit) as exc:
+        check_catalogs(config=config_file, verbose=False)
+    assert exc.value.exit_code == 1
+    output = capsys.readouterr().out
+    assert "Valid: 1" in output
+    assert "Invalid: 1" in output
@@ -0,0 +1,90 @@
+"""Tests for structural, identity-aware evidence diffs."""
+
+from auditly.evidence_diff import IdentitySelector, diff_documents, iter_changes
+
+
+def _iam(users):
+    return {"users": users, "metadata": {"collector": "aws-iam"}}
+
+
+def test_list_elements_matched_by_natural_key():
+    """Reordering users produces no changes; a field change is pinpointed."""
+    old = _iam(
+        [
+            {"user_name": "alice", "mfa_enabled": True, "groups": ["admins"]},
+            {"user_name": "bob", "mfa_enabled": False, "groups": []},
+        ]
+    )
+    new = _iam(
+        [
+            {"user_name": "bob", "mfa_enabled": True, "groups": []},
+            {"user_name": "alice", "mfa_enabled": True, "groups": ["admins"]},
+        ]
+    )
+
+    changes = list(iter_changes(old, new))
+
+    assert len(changes) == 1
+    change = changes[0]
+    assert change.path == ("users", IdentitySelector("user_name", "bob"), "mfa_enabled")
+    assert change.path_str == "users[user_name=bob].mfa_enabled"
+    assert change.change_type == "modified"
+    assert (change.old, change.new) == (False, True)
+
+
+def test_added_and_removed_elements():
+    """Added/removed list elements are reported once, with only the relevant side."""
+    old = {"instances": [{"instance_id": "i-1", "state": "running"}]}
+    new = {"instances": [{"instance_id": "i-2", "state": "running"}]}
+
+    delta = diff_documents(old, new)
+
+    records = {r["path"]: r for r in delta["changes"]}
+    assert records["instances[instance_id=i-2]"]["change_type"] == "added"
+    assert "old" not in records["instances[instance_id=i-2]"]
+    assert records["instances[instance_id=i-1]"]["change_type"] == "removed"
+    assert "new" not in records["instances[instance_id=i-1]"]
+    assert delta["summary"]["instances"] == {"change_type": "modified", "change_count": 2}
+
+
+def test_scalar_lists_compared_as_multisets():
+    """Scalar list reorders are ignored; membership changes are reported."""
+    old = {"groups": ["a", "b", "c"]}
+    new = {"groups": ["c", "a", "d"]}
+
+    changes = [c.to_dict() for c in iter_changes(old, new)]
+
+    assert {"path": "groups[value=b]", "change_type": "removed", "old": "b"} in changes
+    assert {"path": "groups[value=d]", "change_type": "added", "new": "d"} in changes
+    assert len(changes) == 2
+
+
+def test_positional_fallback_without_identity():
+    """Lists without a usable natural key fall back to index comparison."""
+    old = {"rules": [{"port": 22}, {"port": 443}]}
+    new = {"rules": [{"port": 22}, {"port": 8443}, {"port": 80}]}
+
+    paths = {c.path_str: c.change_type for c in iter_changes(old, new)}
+
+    assert paths == {"rules[1].port": "modified", "rules[2]": "added"}
+
+
+def test_max_changes_truncates_but_counts_everything():
+    """Capped deltas keep an accurate total and summary."""
+    old = {"users": [{"user_name": f"u{i}", "active": True} for i in range(50)]}
+    new = {"users": [{"user_name": f"u{i}", "active": False} for i in range(50)]}
+
+    delta = diff_documents(old, new, max_changes=10)
+
+    assert len(delta["changes"]) == 10
+    assert delta["change_count"] == 50
+    assert delta["truncated"] is True
+    assert delta["summary"]["users"]["change_count"] == 50
+
+
+def test_identical_documents():
+    """Identical documents yield no changes."""
+    doc = {"users": [{"user_name": "alice"}], "count": 1}
+    delta = diff_documents(doc, {"users": [{"user_name": "alice"}], "count": 1})
+    assert delta["change_count"] == 0
+    assert delta["changes"] == []
@@ -132,6 +132,48 @@ def test_drift_detection(db_session, test_evidence):
     assert drift["changes"]["key3"]["change_type"] == "added"
 
 
+def test_drift_detection_compact_delta(db_session, test_evidence):
+    """Drift on list evidence returns path-level records, not full copies."""
+    mgr = EvidenceLifecycleManager(db_session)
+
+    users_v1 = [{"user_name": f"user{i}", "mfa_enabled": True} for i in range(100)]
+    users_v2 = [dict(u) for u in users_v1]
+    users_v2[42]["mfa_enabled"] = False
+
+    db_session.add_all(
+        [
+            EvidenceVersion(
+                evidence=test_evidence,
+                version=1,
+                data={"users": users_v1},
+                collected_at=datetime.utcnow() - timedelta(days=1),
+                attributes={},
+            ),
+            EvidenceVersion(
+                evidence=test_evidence,
+                version=2,
+                data={"users": users_v2},
+                collected_at=datetime.utcnow(),
+                attributes={},
+            ),
+        ]
+    )
+    db_session.flush()
+
+    drift = mgr.get_evidence_drift(test_evidence.id, version1=1, version2=2)
+
+    assert drift["drift_detected"] is True
+    assert drift["changes"]["users"] == {"change_type": "modified", "change_count": 1}
+    assert drift["delta"] == [
+        {
+            "path": "users[user_name=user42].mfa_enabled",
+            "change_type": "modified",
+            "old": True,
+            "new": False,
+        }
+    ]
+
+
 def test_duplicate_detection(db_session, test_system):
     """Test duplicate evidence detection by hash."""
     mgr = EvidenceLifecycleManager(db_session)
@@ -268,5 +310,59 @@ def test_mark_expired(db_session, test_evidence):
     assert evidence.expires_at == expire_date
 
 
+def test_plan_recollection(db_session, test_system):
+    """Test fleet-wide recollection planning with per-type thresholds."""
+    mgr = EvidenceLifecycleManager(db_session)
+    now = datetime.utcnow()
+
+    other = System(name="other-system", environment="prod", attributes={})
+    db_session.add(other)
+    db_session.flush()
+
+    def add(system, ev_type, age_days):
+        db_session.add(
+            Evidence(
+                system=system,
+                evidence_type=ev_type,
+                key=f"{system.name}/{ev_type}/{age_days}",
+                sha256=f"{ev_type}-{age_days}",
+                collected_at=now - timedelta(days=age_days),
+                attributes={},
+            )
+        )
+
+    # Newest aws-iam is 3 days old -> fresh despite older rows
+    add(test_system, "aws-iam", 40)
+    add(test_system, "aws-iam", 3)
+    # audit-log has a tight 1 day threshold
+    add(test_system, "audit-log", 2)
+    # terraform-plan uses default threshold (30)
+    add(other, "terraform-plan", 45)
+    add(other, "terraform-plan", 90)
+    add(other, "aws-iam", 10)
+    db_session.flush()
+
+    plan = mgr.plan_recollection(
+        thresholds={"aws-iam": 7, "audit-log": 1}, default_threshold_days=30, now=now
+    )
+
+    pairs = [(p.system_name, p.evidence_type) for p in plan]
+    assert ("test-system", "aws-iam") not in pairs
+    assert ("test-system", "audit-log") in pairs
+    assert ("other-system", "terraform-plan") in pairs
+    assert ("other-system", "aws-iam") in pairs
+
+    # Sorted by priority: audit-log (2/1) first
+    assert plan[0].evidence_type == "audit-log"
+    tf = next(p for p in plan if p.evidence_type == "terraform-plan")
+    assert tf.age_days == 45
+    assert tf.threshold_days == 30
+    assert tf.artifact_count == 2
+
+    # Environment filter
+    prod_plan = mgr.plan_recollection(thresholds={"aws-iam": 7}, environment="prod", now=now)
+    assert {p.system_name for p in prod_plan} == {"other-system"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,105 @@
+"""Tests for single-pass canonical evidence serialization."""
+
+import hashlib
+import json
+import tracemalloc
+from datetime import datetime
+
+from auditly.cli_collect import upload_evidence_json
+from auditly.collectors.common import (
+    CanonicalJSONStream,
+    finalize_evidence,
+    iter_canonical_json,
+)
+
+
+class StreamingVault:
+    def __init__(self, keep=True):
+        self.keep = keep
+        self.objects = {}
+
+    def put_stream(self, dest_key, chunks, metadata=None, content_type=None, content_encoding=None):
+        digest, body = hashlib.sha256(), []
+        for chunk in chunks:
+            digest.update(chunk)
+            if self.keep:
+                body.append(chunk)
+        self.objects[dest_key] = {
+            "sha256": digest.hexdigest(),
+            "body": b"".join(body),
+            "metadata": metadata,
+            "content_type": content_type,
+        }
+
+
+def _evidence(n, payload=""):
+    return finalize_evidence(
+        {
+            "instances": [
+                {"instance_id": f"i-{i}", "launched": datetime(2026, 1, 1), "note": payload}
+                for i in range(n)
+            ],
+            "tags": {"owner": "sécurité", "empty": []},
+            "key_pairs": [],
+        },
+        collector="aws-ec2",
+        account_id="123456789012",
+        region="us-east-1",
+    )
+
+
+def test_canonical_encoding_matches_json_dumps():
+    evidence = _evidence(50)
+    expected = json.dumps(evidence, sort_keys=True, default=str)
+
+    assert "".join(iter_canonical_json(evidence)) == expected
+    stream = CanonicalJSONStream(evidence, chunk_size=256)
+    chunks = list(stream)
+    assert len(chunks) > 1
+    assert b"".join(chunks) == expected.encode()
+    assert stream.sha256 == hashlib.sha256(expected.encode()).hexdigest()
+    assert stream.size == len(expected)
+
+
+def test_finalize_evidence_hash_is_unchanged():
+    evidence = _evidence(3)
+    sha256 = evidence["metadata"].pop("sha256")
+    legacy = hashlib.sha256(json.dumps(evidence, sort_keys=True, default=str).encode())
+    assert sha256 == legacy.hexdigest()
+
+
+def test_artifact_hash_covers_uploaded_bytes(tmp_path):
+    vault = StreamingVault()
+    evidence = _evidence(10)
+    artifact = upload_evidence_json(
+        vault,
+        "evidence/dev/aws-ec2-123456789012.json",
+        evidence,
+        {"kind": "aws-ec2", "partial": False, "api_calls": {"calls": 3}},
+        local_path=tmp_path / "out" / "aws-ec2.json",
+    )
+
+    stored = vault.objects[artifact.key]
+    local = (tmp_path / "out" / "aws-ec2.json").read_bytes()
+    assert artifact.sha256 == stored["sha256"] == hashlib.sha256(local).hexdigest()
+    assert artifact.size == len(stored["body"]) == len(local)
+    assert json.loads(stored["body"]) == json.loads(json.dumps(evidence, default=str))
+    assert stored["content_type"] == "application/json"
+    assert stored["metadata"] == {"kind": "aws-ec2", "partial": "False"}
+    assert artifact.filename == "aws-ec2-123456789012.json"
+    assert artifact.metadata["_local_path"] == str(tmp_path / "out" / "aws-ec2.json")
+
+
+def test_serialization_memory_stays_below_document_size():
+    evidence = _evidence(20_000, payload="x" * 400)
+    document_size = len(json.dumps(evidence, sort_keys=True, default=str))
+
+    tracemalloc.start()
+    try:
+        upload_evidence_json(StreamingVault(keep=False), "k", evidence, {"kind": "x"})
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # The document is ~9 MB; streaming holds about one chunk at a time
+    assert document_size > 8 * 1024 * 1024
+    assert peak < document_size / 8
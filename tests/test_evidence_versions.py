@@ -0,0 +1,184 @@
+"""Tests for delta-encoded evidence version storage."""
+
+import time
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+
+from auditly.db import Base
+from auditly.db.models import Evidence, EvidenceVersion, System
+from auditly.evidence_lifecycle import EvidenceLifecycleManager
+from auditly.evidence_versions import (
+    ENCODING_DELTA,
+    ENCODING_FULL,
+    EvidenceVersionStore,
+    apply_patch,
+    make_patch,
+)
+
+
+@pytest.fixture
+def db_session():
+    """Create in-memory test database session."""
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    session = Session()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def test_evidence(db_session):
+    """Create test evidence."""
+    system = System(name="test-system", environment="test", attributes={})
+    evidence = Evidence(
+        system=system, evidence_type="aws-iam", key="iam.json", sha256="abc", attributes={}
+    )
+    db_session.add(evidence)
+    db_session.flush()
+    return evidence
+
+
+def _snapshot(version: int, users: int = 200) -> dict:
+    """IAM-like document where one user changes per version."""
+    return {
+        "account_id": "123456789012",
+        "users": [
+            {
+                "user_name": f"user{i}",
+                "arn": f"arn:aws:iam::123456789012:user/user{i}",
+                "mfa_enabled": i != version % users,
+                "groups": ["engineering", "readonly"],
+            }
+            for i in range(users)
+        ],
+        "collected_version": version,
+    }
+
+
+@pytest.mark.parametrize(
+    ("old", "new"),
+    [
+        ({"a": 1, "b": {"c": [1, 2, 3]}}, {"a": 2, "b": {"c": [1, 3]}, "d/e~": None}),
+        ({"items": [1, 2, 3, 4]}, {"items": [0, 1, 2, 3, 4, 5]}),
+        ({"items": [{"id": 1}, {"id": 2}]}, {"items": [{"id": 2, "x": True}]}),
+        ([1, 2], {"now": "a dict"}),
+        ({"same": [1]}, {"same": [1]}),
+    ],
+)
+def test_patch_round_trip(old, new):
+    """Applying make_patch(old, new) to old yields new without mutating old."""
+    before = repr(old)
+    assert apply_patch(old, make_patch(old, new)) == new
+    assert repr(old) == before
+
+
+def test_add_version_uses_keyframes_and_deltas(db_session, test_evidence):
+    """Versions between keyframes are stored as small deltas and reconstruct exactly."""
+    store = EvidenceVersionStore(db_session, keyframe_interval=4)
+    snapshots = [_snapshot(v) for v in range(1, 10)]
+    for doc in snapshots:
+        store.add_version(test_evidence, doc, collected_at=datetime.utcnow())
+
+    rows = (
+        db_session.execute(select(EvidenceVersion).order_by(EvidenceVersion.version))
+        .scalars()
+        .all()
+    )
+    assert [r.encoding for r in rows] == [
+        ENCODING_FULL if (r.version - 1) % 4 == 0 else ENCODING_DELTA for r in rows
+    ]
+    assert len(rows[1].data) <= 4
+
+    for idx, doc in enumerate(snapshots, start=1):
+        assert store.get_version_data(test_evidence.id, idx) == doc
+    assert store.get_version_data(test_evidence.id, 99) is None
+
+
+def test_drift_reads_reconstructed_versions(db_session, test_evidence):
+    """Drift analysis works transparently on delta-encoded versions."""
+    store = EvidenceVersionStore(db_session, keyframe_interval=10)
+    store.add_version(test_evidence, _snapshot(1))
+    store.add_version(test_evidence, _snapshot(2))
+
+    mgr = EvidenceLifecycleManager(db_session)
+    assert mgr.get_version_data(test_evidence.id, 2) == _snapshot(2)
+
+    drift = mgr.get_evidence_drift(test_evidence.id, version1=1, version2=2)
+    paths = {c["path"] for c in drift["delta"]}
+    assert "users[arn=arn:aws:iam::123456789012:user/user1].mfa_enabled" in paths
+    assert "collected_version" in paths
+
+
+def test_compact_existing_history(db_session, test_evidence):
+    """Compaction re-encodes full-snapshot history and reports the reduction."""
+    snapshots = [_snapshot(v) for v in range(1, 21)]
+    for version, doc in enumerate(snapshots, start=1):
+        db_session.add(
+            EvidenceVersion(
+                evidence=test_evidence,
+                version=version,
+                data=doc,
+                collected_at=datetime.utcnow(),
+                attributes={},
+            )
+        )
+    db_session.flush()
+
+    stats = EvidenceVersionStore(db_session, keyframe_interval=10).compact()
+
+    assert stats["versions"] == 20
+    assert stats["keyframes"] == 2
+    assert stats["deltas"] == 18
+    assert stats["bytes_after"] < stats["bytes_before"]
+    assert stats["reduction_percent"] > 80
+
+    # Re-compacting with a different interval starts from the encoded history
+    store = EvidenceVersionStore(db_session, keyframe_interval=5)
+    assert store.compact()["keyframes"] == 4
+    for version, doc in enumerate(snapshots, start=1):
+        assert store.get_version_data(test_evidence.id, version) == doc
+
+
+def test_reconstruction_latency_by_keyframe_interval(db_session, test_evidence, record_property):
+    """Benchmark: storage size and reconstruction latency per keyframe interval."""
+    versions = 30
+    for version in range(1, versions + 1):
+        db_session.add(
+            EvidenceVersion(
+                evidence=test_evidence,
+                version=version,
+                data=_snapshot(version, users=500),
+                collected_at=datetime.utcnow(),
+                attributes={},
+            )
+        )
+    db_session.flush()
+
+    results = {}
+    for interval in (1, 5, 10, 30):
+        store = EvidenceVersionStore(db_session, keyframe_interval=interval)
+        stats = store.compact()
+        timings = []
+        for _ in range(3):
+            start = time.perf_counter()
+            for version in range(1, versions + 1):
+                store.get_version_data(test_evidence.id, version)
+            timings.append(time.perf_counter() - start)
+        # Best of three passes, to damp scheduler and GC noise
+        avg_ms = min(timings) * 1000 / versions
+        results[interval] = (stats["bytes_after"], avg_ms)
+        record_property(f"keyframe_{interval}_bytes", stats["bytes_after"])
+        record_property(f"keyframe_{interval}_avg_ms", round(avg_ms, 3))
+
+    # Storage shrinks monotonically as keyframes become sparser
+    sizes = [size for size, _ in results.values()]
+    assert sizes == sorted(sizes, reverse=True)
+    # Sparser keyframes trade patch replay for smaller rows; neither end of the
+    # range may cost more than a small multiple of the best layout
+    latencies = [avg_ms for _, avg_ms in results.values()]
+    assert max(latencies) <= 4 * min(latencies) + 2, results
+    assert all(avg_ms < 1000 for _, avg_ms in results.values())
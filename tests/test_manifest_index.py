@@ -0,0 +1,142 @@
+"""Tests for the incremental staged-manifest index."""
+
+import os
+
+import pytest
+
+from auditly.api import operations
+from auditly.evidence import ArtifactRecord, EvidenceManifest
+from auditly.manifest_index import ManifestIndex, manifest_index
+
+
+def _write(staging, name, kinds, created_at=None, env="dev"):
+    manifest = EvidenceManifest.create(
+        env,
+        [
+            ArtifactRecord(key=f"{name}/{k}", filename=k, sha256="0", size=1, metadata={"kind": k})
+            for k in kinds
+        ],
+    )
+    if created_at is not None:
+        manifest.created_at = created_at
+    path = staging / f"{env}-{name}.json"
+    path.write_text(manifest.to_json())
+    return path
+
+
+def _touch_later(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+def test_only_new_or_changed_manifests_are_parsed(tmp_path):
+    index = ManifestIndex()
+    _write(tmp_path, "a", ["audit-log"])
+    b = _write(tmp_path, "b", ["sbom"])
+    _write(tmp_path, "a", ["ignored"], env="prod")
+
+    assert [m.artifacts[0].filename for m in index.manifests("dev", tmp_path)] == [
+        "audit-log",
+        "sbom",
+    ]
+    assert index.misses == 2
+
+    index.manifests("dev", tmp_path)
+    assert index.misses == 2
+    assert index.hits == 2
+
+    _write(tmp_path, "b", ["terraform-plan"])
+    _touch_later(b)
+    _write(tmp_path, "c", ["iam-policy"])
+    kinds = [m.artifacts[0].filename for m in index.manifests("dev", tmp_path)]
+    assert kinds == ["audit-log", "terraform-plan", "iam-policy"]
+    assert index.misses == 4
+
+    (tmp_path / "dev-a.json").unlink()
+    assert len(index.manifests("dev", tmp_path)) == 2
+
+
+def test_latest_artifacts_prefers_newest_manifest(tmp_path):
+    index = ManifestIndex()
+    _write(tmp_path, "z-old", ["audit-log"], created_at=100.0)
+    _write(tmp_path, "a-new", ["audit-log", "sbom"], created_at=200.0)
+
+    latest = index.latest_artifacts("dev", tmp_path)
+    assert set(latest) == {"audit-log", "sbom"}
+    assert latest["audit-log"]["key"] == "a-new/audit-log"
+    assert latest["audit-log"]["manifest"].endswith("dev-a-new.json")
+
+
+def test_fingerprint_tracks_changes(tmp_path):
+    index = ManifestIndex()
+    empty = index.fingerprint("dev", tmp_path)
+    path = _write(tmp_path, "a", ["audit-log"])
+    first = index.fingerprint("dev", tmp_path)
+    assert first != empty
+    assert index.fingerprint("dev", tmp_path) == first
+    _touch_later(path)
+    assert index.fingerprint("dev", tmp_path) != first
+
+
+def test_missing_staging_dir_is_empty(tmp_path):
+    index = ManifestIndex()
+    assert index.manifests("dev", tmp_path / "missing") == []
+    assert index.latest_artifacts("dev", tmp_path / "missing") == {}
+
+
+@pytest.fixture
+def staged_env(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "config.yaml").write_text(
+        "version: '0.1'\n"
+        "environments:\n"
+        "  dev:\n"
+        "    storage: {type: minio, endpoint: x, bucket: b}\n"
+    )
+    staging = tmp_path / ".auditly_manifests"
+    staging.mkdir()
+    manifest_index.clear()
+    yield staging
+    manifest_index.clear()
+
+
+def test_validate_and_reports_reuse_index_for_10k_manifests(staged_env):
+    kinds = ["audit-log", "terraform-plan", "sbom", "iam-policy"]
+    for i in range(10_000):
+        _write(staged_env, f"{i:05d}", [kinds[i % len(kinds)]], created_at=float(i))
+
+    operations.validate_evidence("config.yaml", "dev", control_ids=["AC-2", "AU-2"])
+    assert manifest_index.misses == 10_000
+
+    operations.validate_evidence("config.yaml", "dev", control_ids=["AC-2", "AU-2"])
+    for report_type in ("engineer", "auditor", "readiness"):
+        operations.generate_report("config.yaml", "dev", report_type, control_ids=["AC-2"])
+
+    # Every later call is served from the index without re-reading any manifest
+    assert manifest_index.misses == 10_000
+    latest = manifest_index.latest_artifacts("dev")
+    assert latest["sbom"]["key"] == "09998/sbom"
+
+
+def test_malformed_manifest_is_skipped(tmp_path, caplog):
+    index = ManifestIndex()
+    _write(tmp_path, "a", ["audit-log"])
+    b = _write(tmp_path, "b", ["sbom"])
+    (tmp_path / "dev-c.json").write_text("{not json")
+    (tmp_path / "dev-d.json").write_text('{"environment": "dev", "artifacts": []}')
+    (tmp_path / "dev-e.json").write_text(
+        b.read_text().replace('"metadata"', '"unexpected": 1, "metadata"')
+    )
+
+    with caplog.at_level("WARNING", logger="auditly.manifest_index"):
+        manifests = index.manifests("dev", tmp_path)
+    assert [m.artifacts[0].filename for m in manifests] == ["audit-log", "sbom"]
+    assert len([r for r in caplog.records if "Skipping" in r.message]) == 3
+
+    # Unchanged bad files are not re-parsed or re-reported
+    caplog.clear()
+    assert len(index.manifests("dev", tmp_path)) == 2
+    assert not caplog.records
+
+    _write(tmp_path, "c", ["iam-policy"])
+    assert len(index.manifests("dev", tmp_path)) == 3
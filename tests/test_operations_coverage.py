@@ -1,6 +1,7 @@
 import pytest
 
 from auditly.api import operations
+from auditly.config import CatalogsConfig
 
 
 def test_get_evidence_not_found():
@@ -54,32 +55,44 @@ def test_collect_evidence_missing_params(monkeypatch):
     class DummyCfg:
         environments = {"env": DummyEnvCfg()}
 
-    monkeypatch.setattr("auditly.api.operations.AppConfig.load", lambda x: DummyCfg())
+    monkeypatch.setattr("auditly.api.operations.load_config", lambda *a, **k: DummyCfg())
     with pytest.raises(ValueError):
         operations.collect_evidence("config.yaml", "env", "terraform")
 
 
-def test_validate_evidence_dedup(monkeypatch):
-    class DummyCatalog:
-        def control_ids(self):
-            return ["A", "A", "B"]
+def test_validate_evidence_dedup(monkeypatch, tmp_path):
+    import json
+
+    catalog = tmp_path / "catalog.json"
+    catalog.write_text(
+        json.dumps(
+            {
+                "catalog": {
+                    "groups": [
+                        {"controls": [{"id": "A"}, {"id": "A"}]},
+                        {"controls": [{"id": "B"}]},
+                    ]
+                }
+            }
+        )
+    )
 
     class DummyCfg:
         environments = {"env": type("E", (), {})()}
-        catalogs = type("C", (), {"get_all_catalogs": lambda self: {"c": "dummy"}})()
+        catalogs = CatalogsConfig(nist_800_53_rev5=str(catalog))
 
-    monkeypatch.setattr("auditly.api.operations.AppConfig.load", lambda x: DummyCfg())
-    monkeypatch.setattr("auditly.api.operations.load_oscal", lambda x: DummyCatalog())
+    monkeypatch.setattr("auditly.api.operations.load_config", lambda *a, **k: DummyCfg())
     results, summary = operations.validate_evidence("dummy", "env")
     assert isinstance(results, dict)
     assert isinstance(summary, dict)
+    assert set(results) == {"A", "B"}
 
 
 def test_generate_report_unsupported_type(monkeypatch):
     class DummyCfg:
         pass
 
-    monkeypatch.setattr("auditly.api.operations.AppConfig.load", lambda x: DummyCfg())
+    monkeypatch.setattr("auditly.api.operations.load_config", lambda *a, **k: DummyCfg())
     with pytest.raises(ValueError):
         operations.generate_report("dummy", "env", report_type="notreal")
 
@@ -90,14 +103,11 @@ def test__generate_readiness_report_error(monkeypatch, tmp_path):
     class DummyCfg:
         catalogs = type("C", (), {"get_all_catalogs": lambda self: {"c": "dummy"}})()
 
-    monkeypatch.setattr("auditly.api.operations.OscalCatalog", object)
-    monkeypatch.setattr("auditly.api.operations.OscalProfile", object)
-
     def raise_fail(*args, **kwargs):
         # Directly raise the exception for test error simulation
         raise RuntimeError("fail")
 
-    monkeypatch.setattr("auditly.api.operations.load_oscal", raise_fail)
+    monkeypatch.setattr("auditly.api.operations.catalog_registry.resolve_control_ids", raise_fail)
 
     def dummy_create(environment, artifacts):
         return type("M", (), {"to_json": lambda self: "{}", "artifacts": []})()
@@ -0,0 +1,100 @@
+"""Tests for the process-wide OSCAL catalog registry."""
+
+import json
+import os
+
+import pytest
+
+from auditly.config import CatalogsConfig
+from auditly.oscal import CatalogRegistry, OscalCatalog, OscalProfile, catalog_registry
+
+
+def _write_catalog(path, ids):
+    path.write_text(
+        json.dumps(
+            {
+                "catalog": {
+                    "metadata": {"title": "Test"},
+                    "groups": [
+                        {
+                            "id": "ac",
+                            "controls": [{"id": cid, "title": cid.upper()} for cid in ids],
+                            "groups": [{"controls": [{"id": "sub-1"}]}],
+                        }
+                    ],
+                }
+            }
+        )
+    )
+
+
+def _write_profile(path, ids):
+    path.write_text(
+        json.dumps({"profile": {"imports": [{"include-controls": [{"with-ids": ids}]}]}})
+    )
+
+
+def test_parses_once_until_file_changes(tmp_path):
+    """Repeated lookups hit the cache; a modified file is re-parsed."""
+    registry = CatalogRegistry()
+    catalog = tmp_path / "cat.json"
+    _write_catalog(catalog, ["ac-1", "ac-2"])
+
+    first = registry.get(catalog)
+    assert isinstance(first.document, OscalCatalog)
+    assert first.control_ids == ["ac-1", "ac-2", "sub-1"]
+    assert registry.get(str(catalog)) is first
+    assert (registry.hits, registry.misses) == (1, 1)
+
+    _write_catalog(catalog, ["ac-1", "ac-2", "ac-3"])
+    st = catalog.stat()
+    os.utime(catalog, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    second = registry.get(catalog)
+    assert second is not first
+    assert "ac-3" in second.control_ids
+    assert registry.get(tmp_path / "missing.json") is None
+
+
+def test_control_index_lookup(tmp_path):
+    """Entries expose an indexed control lookup, including nested groups."""
+    registry = CatalogRegistry()
+    catalog = tmp_path / "cat.json"
+    _write_catalog(catalog, ["ac-1"])
+
+    entry = registry.get(catalog)
+    assert entry.get_control("ac-1")["title"] == "AC-1"
+    assert entry.get_control("sub-1") == {"id": "sub-1"}
+    assert entry.get_control("zz-9") is None
+
+
+def test_resolve_control_ids_dedupes_across_files(tmp_path):
+    """Resolved control IDs are de-duplicated in order and cached per fingerprint."""
+    registry = CatalogRegistry()
+    catalog = tmp_path / "cat.json"
+    profile = tmp_path / "profile.json"
+    _write_catalog(catalog, ["ac-1", "ac-2"])
+    _write_profile(profile, ["ac-2", "au-2"])
+
+    ids = registry.resolve_control_ids([catalog, profile])
+    assert ids == ["ac-1", "ac-2", "sub-1", "au-2"]
+    assert registry.resolve_control_ids([catalog, profile]) is ids
+    assert isinstance(registry.load(profile), OscalProfile)
+
+
+def test_config_validation_shares_registry(tmp_path):
+    """Config validation populates the shared registry and rejects non-OSCAL JSON."""
+    catalog = tmp_path / "cat.json"
+    _write_catalog(catalog, ["ac-1"])
+
+    cfg = CatalogsConfig(nist_800_53_rev5=str(catalog))
+    misses = catalog_registry.misses
+    assert catalog_registry.resolve_control_ids(cfg.get_all_catalogs().values()) == [
+        "ac-1",
+        "sub-1",
+    ]
+    assert catalog_registry.misses == misses
+
+    bogus = tmp_path / "bogus.json"
+    bogus.write_text(json.dumps({"not": "oscal"}))
+    with pytest.raises(ValueError, match="must contain 'catalog' or 'profile'"):
+        CatalogsConfig(fedramp_high=str(bogus))
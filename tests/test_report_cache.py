@@ -0,0 +1,32 @@
+"""Tests for the rendered report cache."""
+
+from auditly.reporting.cache import CachedReport, ReportCache
+
+
+def _entry(key, environment="dev"):
+    return CachedReport(key=key, environment=environment, report_path=None, html="", summary={})
+
+
+def test_lru_eviction_and_stats():
+    cache = ReportCache(max_entries=2)
+    cache.put(_entry("a"))
+    cache.put(_entry("b"))
+    assert cache.get("a") is not None
+    cache.put(_entry("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["entries"] == 2
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_invalidate_by_environment():
+    cache = ReportCache()
+    cache.put(_entry("a", "dev"))
+    cache.put(_entry("b", "prod"))
+
+    assert cache.invalidate("dev") == 1
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.invalidate() == 1
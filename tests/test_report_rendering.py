@@ -0,0 +1,55 @@
+"""Tests for in-memory report rendering and optional persistence."""
+
+import pytest
+
+from auditly.api import operations
+from auditly.api.routers.report import HTML_CHUNK_SIZE, _html_chunks
+from auditly.reporting.report import render_html, write_html
+from auditly.reporting.validation_reports import (
+    generate_auditor_report,
+    generate_engineer_report,
+    render_auditor_report,
+    render_engineer_report,
+)
+from auditly.validators import validate_controls
+
+SUMMARY = {"environments": ["dev"], "artifact_count": 1, "score": 10, "controls": {}}
+
+
+def test_write_functions_persist_rendered_html(tmp_path):
+    write_html(SUMMARY, tmp_path / "r.html")
+    assert (tmp_path / "r.html").read_text() == render_html(SUMMARY)
+
+    results = validate_controls(["AC-2", "AU-2"], {"audit-log": True}, use_cache=False)
+    generate_engineer_report(results, {"audit-log": True}, tmp_path / "e.html")
+    generate_auditor_report(results, {"audit-log": True}, tmp_path / "a.html")
+    engineer = render_engineer_report(results, {"audit-log": True})
+    auditor = render_auditor_report(results, {"audit-log": True})
+    assert "AC-2" in engineer and "AC-2" in auditor
+    # Reports embed a generation timestamp, so compare structure rather than bytes
+    assert (tmp_path / "e.html").read_text(encoding="utf-8").startswith(engineer[:200])
+    assert (tmp_path / "a.html").read_text(encoding="utf-8").startswith(auditor[:200])
+
+
+@pytest.mark.parametrize("report_type", ["readiness", "engineer", "auditor"])
+def test_reports_render_without_touching_disk(report_type, tmp_path):
+    path, html, summary = operations._render_report(
+        "config.yaml", "testenv", report_type, ["AC-2"], {"audit-log": True}, None
+    )
+    assert path is None
+    assert "<html" in html.lower()
+
+    out = tmp_path / f"{report_type}.html"
+    path, html, _ = operations._render_report(
+        "config.yaml", "testenv", report_type, ["AC-2"], {"audit-log": True}, str(out)
+    )
+    assert path == str(out)
+    assert out.read_text(encoding="utf-8") == html
+
+
+def test_html_chunks_round_trip():
+    html = "é" * (HTML_CHUNK_SIZE + 10)
+    chunks = list(_html_chunks(html))
+    assert len(chunks) == 3
+    assert all(len(c) <= HTML_CHUNK_SIZE for c in chunks)
+    assert b"".join(chunks).decode("utf-8") == html